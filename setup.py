@@ -58,8 +58,10 @@ setup(
         'Programming Language :: Python :: 3.6',
     ],
     scripts=[
+        'src/scs_dev/archive_reader.py',
         'src/scs_dev/aws_mqtt_client.py',
         'src/scs_dev/aws_topic_publisher.py',
+        'src/scs_dev/aws_topic_router.py',
         'src/scs_dev/aws_topic_subscriber.py',
         'src/scs_dev/climate_sampler.py',
         'src/scs_dev/control_receiver.py',
@@ -71,6 +73,7 @@ setup(
         'src/scs_dev/disk_volume.py',
         'src/scs_dev/display.py',
         'src/scs_dev/gases_sampler.py',
+        'src/scs_dev/inference_replay.py',
         'src/scs_dev/interface_power.py',
         'src/scs_dev/led.py',
         'src/scs_dev/led_controller.py',
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+DESCRIPTION
+The archive_reader utility is used to export the binary columnar archives written by the csv_logger (with the --sink
+columnar or --sink both options) to JSON format.
+
+Archives are written in blocks. Each block carries its own schema, so - unlike CSV log files - documents are not
+limited to the fields of the first document in the file. The rec field is stored as epoch milliseconds, and is
+reproduced in its original form. Other values are reproduced exactly, except that floats are stored as 32-bit values
+only where this is lossless at seven significant digits.
+
+The --start and --end options restrict output to documents whose rec field lies in the interval START <= rec < END.
+Blocks whose rec range lies outside the interval are skipped without decoding. Each file is memory-mapped.
+
+A block that was incompletely written - for example, on power failure - ends the file.
+
+By default, output is in the form of a sequence of JSON documents, separated by newlines. If the array (-a) option is
+selected, output is in the form of a JSON array. Output is written in chunks, flushed every FLUSH_ROWS documents.
+
+SYNOPSIS
+archive_reader.py [--start START] [--end END] [-l LIMIT] [-r FLUSH_ROWS] [-a] [-v] FILENAME_1 [.. FILENAME_N]
+
+EXAMPLES
+archive_reader.py -v scs-bgx-431-particulates-2023-07-*.sca > particulates-2023-07.jstr
+
+archive_reader.py --start 2023-07-14T13:00:00Z --end 2023-07-14T18:00:00Z scs-bgx-431-particulates-2023-07-14.sca
+
+DOCUMENT EXAMPLE - OUTPUT
+{"tag": "scs-ap1-6", "rec": "2018-04-04T14:50:38.394+00:00", "val": {"hmd": 59.7, "tmp": 23.8}}
+{"tag": "scs-ap1-6", "rec": "2018-04-04T14:55:38.394+00:00", "val": {"hmd": 59.8, "tmp": 23.9}}
+
+SEE ALSO
+scs_dev/csv_logger
+scs_dev/csv_reader
+"""
+
+import sys
+
+from scs_dev.cmd.cmd_archive_reader import CmdArchiveReader
+
+from scs_dev.reader.column_archive_reader import ColumnArchiveReader, ColumnArchiveException
+from scs_dev.writer.output_buffer import OutputBuffer
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    file_count = 0
+    total_rows = 0
+    output_count = 0
+
+    reader = None
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdArchiveReader()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    if cmd.verbose:
+        print("archive_reader: %s" % cmd, file=sys.stderr)
+
+    # output...
+    output = OutputBuffer(sys.stdout, max_count=cmd.flush_rows)
+
+    if cmd.array:
+        output.write('[')
+
+    try:
+        for filename in cmd.filenames:
+            file_count += 1
+            rows = 0
+
+            # --------------------------------------------------------------------------------------------------------
+            # resources...
+
+            try:
+                reader = ColumnArchiveReader.construct_for_file(filename, start=cmd.start, end=cmd.end)
+
+            except FileNotFoundError:
+                print("archive_reader: file not found: %s" % filename, file=sys.stderr)
+                exit(1)
+
+            except ColumnArchiveException as ex:
+                print("archive_reader: %s" % ex, file=sys.stderr)
+                exit(1)
+
+            if cmd.verbose:
+                print("archive_reader: %s" % reader, file=sys.stderr)
+                sys.stderr.flush()
+
+
+            # --------------------------------------------------------------------------------------------------------
+            # run...
+
+            try:
+                for datum in reader.rows():
+                    if cmd.limit is not None and rows >= cmd.limit:
+                        break
+
+                    if cmd.array:
+                        output.write(datum if output_count == 0 else ", %s" % datum)
+                    else:
+                        output.print(datum)
+
+                    rows += 1
+                    output_count += 1
+
+            finally:
+                reader.close()
+
+            if cmd.verbose:
+                print("archive_reader: blocks: %d rows: %d" % (reader.block_count, rows), file=sys.stderr)
+
+            total_rows += rows
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # end...
+
+    except KeyboardInterrupt:
+        print(file=sys.stderr)
+
+    finally:
+        if cmd.array:
+            output.print(']')
+
+        output.flush()
+
+        if cmd.verbose and file_count > 1:
+            print("archive_reader: files: %d total rows: %d" % (file_count, total_rows), file=sys.stderr)
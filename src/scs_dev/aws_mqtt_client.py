@@ -10,13 +10,56 @@ The aws_mqtt_client utility is used to subscribe or publish using the South Coas
 infrastructure.
 
 Documents for publication are gained from stdin by default, otherwise from the specified Unix domain socket (UDS).
-Likewise, documents gained from subscription are written to stdout, or a specified UDS.
+Likewise, documents gained from subscription are written to stdout, or a specified UDS. If the --persistent (-k) flag
+is set, the publication UDS accepts persistent connections, carrying newline-framed documents, as written by
+aws_topic_publisher in its persistent mode. Subscription UDSs are then also written with persistent connections - their
+readers must accept these, for example aws_topic_subscriber -k.
+
+The persistent publication UDS also accepts length-prefixed publication frames, as written by aws_topic_publisher -f.
+The payload of a frame is published as it stands - it is not parsed or encoded again. If the --framed (-f) flag is
+set, documents gained from subscription are likewise written to their UDSs as frames, without being parsed.
+
+Documents gained from subscription are queued for each subscription, so that the MQTT client is never held up by a
+slow or absent reader. Up to 1000 documents are queued - if the queue is full, the oldest document is dropped.
 
 Subscriptions can be specified either by a project channel name, or by an explicit messaging topic path. Documents
 gained by subscription may be delivered either to stdout, or to a specified Unix domain socket.
 
 In order to operate effectively in environments with unreliable communications, the aws_mqtt_client buffers messages
-prior to publication. The size of the buffer is set by the scs_mfr/mqtt_conf utility.
+prior to publication. The size of the buffer is set by the scs_mfr/mqtt_conf utility. By default, the buffer is held
+in volatile memory.
+
+If a QUEUE_DIR is specified with the --queue (-q) option, messages are first appended to a durable queue in that
+directory, and are published from the queue. The queue is held in checksummed, memory-mapped segment files, which are
+synced in groups. The consumer position is committed about once a second, up to the oldest publication that awaits its
+PUBACK, so a restart resumes where publication stopped - messages may be published more than once, but none are
+lost. Publications held by the SDK while the client is offline are not counted as acknowledged - they are published
+again until a PUBACK is received. The queue report then gives the length of the backlog. Echoed messages are echoed
+as they are published.
+
+By default, each publication waits for its PUBACK before the next is published. If the --window (-w) option is set,
+up to MAX_IN_FLIGHT publications may await their PUBACK at any one time, and any publication whose PUBACK times out is
+published again. This keeps throughput up where broker round-trips are slow.
+
+If the --batch (-b) option is set, the documents for each topic are coalesced, and are published together every
+INTERVAL seconds, as a single document on the topic: {"batch": {"ver": 1, "enc": "json", "count": N, "docs": [..]}}.
+Batches are limited to 64 KB. If --compress (-z) is also set, docs is given as the zlib-compressed, base64-encoded
+JSON list of documents, and enc is "zlib+base64". This reduces per-message overhead on cellular links. Where a durable
+queue is used, its position is committed only once each batch window has been published - otherwise, documents in an
+open batch window are lost if the client is terminated. Without a durable queue, up to 1000 documents are held while
+they await the batcher - when these are held, reading stops, so that upstream writers are blocked.
+
+If the --priority (-r) option is set, documents are held in priority lanes, each holding up to CAPACITY documents:
+control, then status, then live samples, then backlog - samples more than a minute old. The lane is set by the last node
+of the topic path. Control and status documents are published as soon as they are received, and are not batched. When
+a lane is full, reading stops until it has space, so that upstream writers are blocked. Where a durable queue is used,
+control and status documents bypass it, and samples are published from the queue in order.
+
+The aws_mqtt_client utility maintains publication metrics over a rolling five-minute window: histograms of publish
+latency - to the PUBACK - and of the time that each document waits in aws_mqtt_client before publication, messages
+and bytes sent per second, reconnects and downtime. A snapshot of the metrics is saved every minute, in the file
+mqtt_metrics.json, next to the queue report. If the --metrics (-m) option is set, the current metrics are also
+written to each process that connects to METRICS_UDS.
 
 The aws_mqtt_client utility requires the AWS client authorisation to operate.
 
@@ -24,12 +67,15 @@ Only one MQTT client should run at any one time, per TCP/IP host.
 
 SYNOPSIS
 aws_mqtt_client.py [-p UDS_PUB] [-s] { -c { C | G | P | S | X } (UDS_SUB_1) | \
-[SUB_TOPIC_1 (UDS_SUB_1) .. SUB_TOPIC_N (UDS_SUB_N)] } [-e] [-l LED_UDS] [-v]
+[SUB_TOPIC_1 (UDS_SUB_1) .. SUB_TOPIC_N (UDS_SUB_N)] } [-w MAX_IN_FLIGHT] [-q QUEUE_DIR] [-b INTERVAL [-z]] \
+[-r CAPACITY] [-k [-f]] [-e] [-l LED_UDS] [-m METRICS_UDS] [-v]
 
 EXAMPLES
 ( cat < /home/pi/SCS/pipes/mqtt_publication_pipe & ) | \
 /home/pi/SCS/scs_dev/src/scs_dev/aws_mqtt_client.py -v -cX  > /home/pi/SCS/pipes/control_subscription_pipe
 
+socat - UNIX-CONNECT:/home/pi/SCS/pipes/mqtt_metrics.uds
+
 FILES
 ~/SCS/aws/aws_client_auth.json
 ~/SCS/aws/certs/NNNNNNNNNN-certificate.pem.crt
@@ -49,9 +95,14 @@ When run as a background process, aws_mqtt_client will exit if it has no stdin s
 
 import json
 import sys
+import time
+
+from collections import deque
+from queue import Empty
+from threading import Thread
 
 from scs_core.aws.client.client_auth import ClientAuth
-from scs_core.aws.client.mqtt_client import MQTTClient, MQTTSubscriber
+from scs_core.aws.client.mqtt_client import MQTTSubscriber
 from scs_core.aws.config.project import Project
 
 from scs_core.comms.mqtt_conf import MQTTConf
@@ -66,22 +117,132 @@ from scs_core.sys.system_id import SystemID
 
 from scs_dev.cmd.cmd_mqtt_client import CmdMQTTClient
 
+from scs_dev.comms.domain_stream import DomainStreamReader, DomainStreamWriter
+from scs_dev.comms.publication_frame import PublicationFrame
+
 from scs_dev.handler.mqtt_reporter import MQTTReporter
 from scs_dev.handler.aws_mqtt_publisher import AWSMQTTPublisher
 from scs_dev.handler.aws_mqtt_subscription_handler import AWSMQTTSubscriptionHandler
+from scs_dev.handler.mqtt_client import MQTTClient
+from scs_dev.handler.mqtt_metrics import MQTTMetrics, MQTTMetricsMonitor
+from scs_dev.handler.publication_batcher import PublicationBatcher
+from scs_dev.handler.publication_lanes import PublicationLanes
+from scs_dev.handler.publication_queue import PublicationQueue
+from scs_dev.handler.timed_queue import TimedQueue
 
 from scs_host.comms.domain_socket import DomainSocket
 from scs_host.sys.host import Host
 
 
+# --------------------------------------------------------------------------------------------------------------------
+
+def enqueue(messages, queue: PublicationQueue, lanes=None):
+    for message in messages:
+        if not message:
+            continue
+
+        if lanes is not None:
+            lane = PublicationLanes.lane(message)
+
+            if PublicationLanes.is_urgent(lane):
+                lanes.put(message, lane=lane)           # control and status documents bypass the queue
+                continue
+
+        queue.append(message)
+
+
+def dequeue(queue: PublicationQueue, publisher: AWSMQTTPublisher, producer: Thread, metrics: MQTTMetrics,
+            batcher=None, lanes=None):
+    commit_time = time.time()
+    checkpoints = deque()                               # of (publisher presented_count, queue position)
+
+    while True:
+        urgent = None if lanes is None else lanes.get_urgent()
+
+        if urgent is not None:
+            metrics.record_wait(lanes.last_wait)
+            yield urgent
+            continue
+
+        if batcher is not None and batcher.is_due():
+            yield None                                  # on resumption, the batches have been presented to publisher
+            message = None
+
+        else:
+            message = queue.next(timeout=PublicationQueue.DEFAULT_COMMIT_INTERVAL)
+
+            if message is not None:
+                metrics.record_wait(queue.last_wait)
+                yield message                           # on resumption, the message has been presented to publisher
+
+        # checkpoint...
+        if batcher is None or batcher.is_empty():       # messages read so far are not held in a batch
+            checkpoint = (publisher.presented_count, queue.position)
+
+            if not checkpoints or checkpoints[-1] != checkpoint:
+                checkpoints.append(checkpoint)
+
+        # commit...
+        now = time.time()
+
+        if message is None or now - commit_time >= PublicationQueue.OFFSET_INTERVAL:
+            queue.sync_if_due()
+            publisher.retry_expired()
+
+            acknowledged_count = publisher.acknowledged_count
+            position = None
+
+            while checkpoints and checkpoints[0][0] <= acknowledged_count:
+                _, position = checkpoints.popleft()
+
+            if position is not None:
+                queue.commit(position)                  # publications up to the position have been acknowledged
+
+            publisher.report_length(queue.length)
+            commit_time = now
+
+        if message is None and not producer.is_alive() and not queue.length:
+            return
+
+
+def receive(messages, received):                        # received is a TimedQueue or PublicationLanes
+    for message in messages:
+        received.put(message)                           # may block - backpressure
+
+    received.put(None)
+
+
+def pending(received, metrics: MQTTMetrics, batcher=None):
+    while True:
+        if batcher is not None and batcher.is_due():
+            yield None                                  # on resumption, the batches have been presented to publisher
+
+        try:
+            message = received.get(timeout=None if batcher is None else batcher.wait_time())
+
+        except Empty:
+            continue
+
+        if message is None:
+            return
+
+        metrics.record_wait(received.last_wait)
+        yield message
+
+
 # --------------------------------------------------------------------------------------------------------------------
 
 if __name__ == '__main__':
 
     conf = None
     source = None
+    queue = None
+    batcher = None
+    lanes = None
     reporter = None
     publisher = None
+    monitor = None
+    handlers = []
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -118,14 +279,39 @@ if __name__ == '__main__':
             exit(1)
 
         # comms...
-        source = UDSReader(DomainSocket, cmd.uds_pub)
+        if cmd.persistent and cmd.uds_pub:
+            source = DomainStreamReader(cmd.uds_pub)
+
+        else:
+            source = UDSReader(DomainSocket, cmd.uds_pub)
 
         if cmd.verbose:
             print("aws_mqtt_client: %s" % source, file=sys.stderr)
 
+        # queue...
+        if cmd.queue_dir:
+            queue = PublicationQueue.open(cmd.queue_dir)
+
+            if cmd.verbose:
+                print("aws_mqtt_client: %s" % queue, file=sys.stderr)
+
+        # batcher...
+        if cmd.batch_interval:
+            batcher = PublicationBatcher(cmd.batch_interval, compress=cmd.compress)
+
+            if cmd.verbose:
+                print("aws_mqtt_client: %s" % batcher, file=sys.stderr)
+
         # reporter...
         reporter = MQTTReporter(cmd.verbose, cmd.led_uds)
 
+        # lanes...
+        if cmd.lane_capacity:
+            lanes = PublicationLanes(cmd.lane_capacity, reporter=reporter)
+
+            if cmd.verbose:
+                print("aws_mqtt_client: %s" % lanes, file=sys.stderr)
+
         # subscribers...
         subscribers = []
 
@@ -153,27 +339,38 @@ if __name__ == '__main__':
             topic = project.channel_path(cmd.channel, system_id)
 
             # subscriber...
-            sub_comms = UDSWriter(DomainSocket, cmd.channel_uds)
+            sub_comms = UDSWriter(DomainStreamWriter if cmd.persistent else DomainSocket, cmd.channel_uds)
 
-            handler = AWSMQTTSubscriptionHandler(reporter, sub_comms, cmd.echo)
+            handler = AWSMQTTSubscriptionHandler(reporter, sub_comms, cmd.echo, persistent=cmd.persistent,
+                                                 framed=cmd.framed)
+            handlers.append(handler)
 
             subscribers.append(MQTTSubscriber(topic, handler.handle))
 
         else:
             for subscription in cmd.subscriptions:
-                sub_comms = UDSWriter(DomainSocket, subscription.address)
+                sub_comms = UDSWriter(DomainStreamWriter if cmd.persistent else DomainSocket, subscription.address)
 
                 # subscriber...
-                handler = AWSMQTTSubscriptionHandler(reporter, sub_comms, cmd.echo)
+                handler = AWSMQTTSubscriptionHandler(reporter, sub_comms, cmd.echo, persistent=cmd.persistent,
+                                                     framed=cmd.framed)
+                handlers.append(handler)
 
                 if cmd.verbose:
                     print("aws_mqtt_client: %s" % handler, file=sys.stderr)
 
                 subscribers.append(MQTTSubscriber(subscription.topic, handler.handle))
 
+        # metrics...
+        metrics = MQTTMetrics()
+        monitor = MQTTMetricsMonitor(metrics, MQTTMetrics.filename(conf.report_file), uds_path=cmd.metrics_uds)
+
+        if cmd.verbose:
+            print("aws_mqtt_client: %s" % monitor, file=sys.stderr)
+
         # client...
-        client = MQTTClient(*subscribers)
-        publisher = AWSMQTTPublisher(conf, auth, client, reporter)
+        client = MQTTClient(*subscribers, metrics=metrics)
+        publisher = AWSMQTTPublisher(conf, auth, client, reporter, max_in_flight=cmd.max_in_flight, metrics=metrics)
 
         if cmd.verbose:
             print("aws_mqtt_client: %s" % publisher, file=sys.stderr)
@@ -186,6 +383,13 @@ if __name__ == '__main__':
         # signal handler...
         SignalledExit.construct()
 
+        # subscription handlers...
+        for handler in handlers:
+            handler.start()
+
+        # metrics...
+        monitor.start()
+
         # client...
         if not conf.inhibit_publishing:
             publisher.connect()
@@ -193,30 +397,76 @@ if __name__ == '__main__':
         # data source...
         source.connect()
 
+        if queue is None:
+            if batcher is None and lanes is None:
+                messages = source.messages()                # documents are not held, so do not wait
+
+            else:
+                received = TimedQueue(maxsize=PublicationLanes.DEFAULT_CAPACITY) if lanes is None else lanes
+
+                receiver = Thread(target=receive, args=(source.messages(), received), daemon=True)
+                receiver.start()
+
+                messages = pending(received, metrics, batcher=batcher)
+
+        else:
+            producer = Thread(target=enqueue, args=(source.messages(), queue, lanes), daemon=True)
+            producer.start()
+
+            messages = dequeue(queue, publisher, producer, metrics, batcher=batcher, lanes=lanes)
+
         # process input...
-        for message in source.messages():
-            # receive...
-            try:
-                jdict = json.loads(message)
+        for message in messages:
+            # batch window closed...
+            if message is None:
+                for batch in batcher.flush():
+                    publisher.publish(batch)
 
-            except (TypeError, ValueError) as ex:
-                reporter.print("%s: %s" % (ex, message))
                 continue
 
+            # receive...
+            frame = message if isinstance(message, PublicationFrame) else None
+
+            if frame is None:
+                try:
+                    jdict = json.loads(message)
+
+                except (TypeError, ValueError) as ex:
+                    reporter.print("%s: %s" % (ex, message))
+                    continue
+
             if cmd.echo:
-                print(message)
+                print(message if frame is None else frame.as_message())
                 sys.stdout.flush()
 
             if conf.inhibit_publishing:
                 continue
 
-            publication = Publication.construct_from_jdict(jdict)
+            publication = frame if frame is not None else Publication.construct_from_jdict(jdict)
 
             if publication is None:
                 continue
 
             # publish...
-            publisher.publish(publication)
+            if batcher is None or (lanes is not None and PublicationLanes.subject_lane(publication.topic) is not None):
+                publisher.publish(publication)              # a frame's payload is published as it stands
+                continue
+
+            if frame is not None:
+                try:
+                    publication = frame.as_publication()    # documents are encoded together in the batch
+
+                except ValueError as ex:
+                    reporter.print("%s: %s" % (ex, frame))
+                    continue
+
+            for batch in batcher.append(publication):
+                publisher.publish(batch)
+
+        # remaining batches...
+        if batcher is not None:
+            for batch in batcher.flush():
+                publisher.publish(batch)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -238,6 +488,15 @@ if __name__ == '__main__':
         if publisher:
             publisher.disconnect()
 
+        for handler in handlers:
+            handler.stop()
+
+        if monitor:
+            monitor.stop()
+
+        if queue:
+            queue.close()
+
         if conf:
             Filesystem.rm(conf.report_file)
 
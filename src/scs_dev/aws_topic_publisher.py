@@ -13,13 +13,24 @@ the given topic, and presenting the result on stdout.
 Messaging topics can be specified either by a project channel name, or by an explicit topic path. If a project channel
 name is used, the aws_topic_publisher utility requires system ID and AWS project configurations to be set.
 
+By default, a new connection is made to the UDS for each publication. If the --persistent (-k) flag is set, a single
+connection is held open - and re-established if lost - and publications are framed by newlines. The reader must then
+accept persistent connections, for example aws_mqtt_client -k. If a BUFFER_SIZE is also given, publications are sent
+together, once BUFFER_SIZE bytes are waiting, or once the oldest has waited for 50 milliseconds.
+
+If the --framed (-f) flag is also set, publications are written as length-prefixed frames - a topic header, then the
+payload. Each document is parsed and encoded once, here: aws_mqtt_client publishes the payload as it stands.
+
 SYNOPSIS
-aws_topic_publisher.py { -t TOPIC | -c { C | G | P | S | X } } [-p UDS_PUB] [-v]
+aws_topic_publisher.py { -t TOPIC | -c { C | G | P | S | X } } [-p UDS_PUB [-k [-f] [-b BUFFER_SIZE]]] [-v]
 
 EXAMPLES
 ./climate_sampler.py -v -s scs-climate | \
 /home/pi/SCS/scs_dev/src/scs_dev/aws_topic_publisher.py -v -cC -p /home/pi/SCS/pipes/mqtt_publication.uds
 
+./particulates_sampler.py -v -i1 | \
+/home/pi/SCS/scs_dev/src/scs_dev/aws_topic_publisher.py -v -cP -p /home/pi/SCS/pipes/mqtt_publication.uds -k -b 4096
+
 FILES
 ~/SCS/aws/aws_project.json
 ~/SCS/conf/system_id.json
@@ -51,6 +62,7 @@ import json
 import sys
 
 from collections import OrderedDict
+from functools import partial
 
 from scs_core.aws.config.project import Project
 
@@ -64,6 +76,9 @@ from scs_core.sys.system_id import SystemID
 
 from scs_dev.cmd.cmd_aws_topic_publisher import CmdAWSTopicPublisher
 
+from scs_dev.comms.domain_stream import DomainStreamWriter
+from scs_dev.comms.publication_frame import PublicationFrame
+
 from scs_host.comms.domain_socket import DomainSocket
 from scs_host.sys.host import Host
 
@@ -73,6 +88,7 @@ from scs_host.sys.host import Host
 if __name__ == '__main__':
 
     topic = None
+    writer = None
 
     # ----------------------------------------------------------------------------------------------------------------
     # cmd...
@@ -119,7 +135,11 @@ if __name__ == '__main__':
             sys.stderr.flush()
 
         # comms...
-        writer = UDSWriter(DomainSocket, cmd.uds_pub)
+        if cmd.persistent:
+            writer = UDSWriter(partial(DomainStreamWriter, buffer_size=cmd.buffer_size), cmd.uds_pub)
+
+        else:
+            writer = UDSWriter(DomainSocket, cmd.uds_pub)
 
         if cmd.verbose and cmd.uds_pub:
             print("aws_topic_publisher: %s" % cmd.uds_pub, file=sys.stderr)
@@ -131,6 +151,9 @@ if __name__ == '__main__':
         # signal handler...
         SignalledExit.construct()
 
+        if cmd.persistent:
+            writer.connect()
+
         for line in sys.stdin:
             try:
                 jdict = json.loads(line, object_hook=OrderedDict)
@@ -139,8 +162,16 @@ if __name__ == '__main__':
 
             payload = jdict
 
+            if cmd.framed:
+                writer.write(PublicationFrame(topic, JSONify.dumps(payload).encode()))
+                continue
+
             publication = Publication(topic, payload)
 
+            if cmd.persistent:
+                writer.write(JSONify.dumps(publication))        # the connection is held open
+                continue
+
             try:
                 writer.connect()
                 writer.write(JSONify.dumps(publication))
@@ -161,3 +192,6 @@ if __name__ == '__main__':
     finally:
         if cmd and cmd.verbose:
             print("aws_topic_publisher (%s): finishing" % topic, file=sys.stderr)
+
+        if cmd.persistent and writer:
+            writer.close()
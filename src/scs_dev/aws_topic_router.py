@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+DESCRIPTION
+The aws_topic_router utility is used to distribute subscribed data from the output of the aws_mqtt_client script to
+any number of listening processes. It may be used in place of a number of aws_topic_subscriber processes, each of
+which would read - and parse - every subscribed message.
+
+Each route is of the form TOPIC=SINK. The topic may be given either by a project channel name, or by an explicit topic
+path. A topic path ending in '/#' matches every topic below it. If a project channel name is used, the
+aws_topic_router utility requires system ID and AWS project configurations to be set. The sink may be '-' for stdout,
+the path of a FIFO, or the path of a Unix domain socket. A topic may have several sinks, and a sink several topics.
+
+The topic of each message is read without parsing the message's payload. Only the payloads of messages whose topic
+has a route are parsed - each is parsed once, however many sinks it is written to. Each sink receives documents in
+the form provided by aws_topic_subscriber.
+
+A sink that has no listening process does not hold up the other sinks - its documents are dropped, and a warning is
+reported.
+
+If the --persistent (-k) flag is set, the UDS_SUB accepts persistent connections, carrying newline-framed documents, as
+written by aws_mqtt_client -k, or length-prefixed publication frames, as written by aws_mqtt_client -k -f - the payload
+of a frame is never parsed. UDS sinks then hold their connections open, writing newline-framed documents.
+
+SYNOPSIS
+aws_topic_router.py [-s UDS_SUB] [-k] { TOPIC_PATH | C | G | P | S | X }=SINK_1
+[.. { TOPIC_PATH | C | G | P | S | X }=SINK_N] [-v]
+
+EXAMPLES
+/home/pi/SCS/scs_dev/src/scs_dev/aws_topic_router.py -s /home/pi/SCS/pipes/mqtt_subscription.uds \
+X=/home/pi/SCS/pipes/control_subscription.uds \
+south-coast-science-dev/development/loc/1/#=/home/pi/SCS/pipes/loc_1.fifo
+
+SEE ALSO
+scs_dev/aws_mqtt_client
+scs_dev/aws_topic_subscriber
+scs_mfr/aws_project
+scs_mfr/system_id
+"""
+
+import json
+import sys
+
+from collections import OrderedDict
+
+from scs_core.aws.config.project import Project
+
+from scs_core.comms.uds_reader import UDSReader
+
+from scs_core.data.json import JSONify
+
+from scs_core.sys.logging import Logging
+from scs_core.sys.signalled_exit import SignalledExit
+from scs_core.sys.system_id import SystemID
+
+from scs_dev.cmd.cmd_aws_topic_router import CmdAWSTopicRouter
+
+from scs_dev.comms.domain_stream import DomainStreamReader
+from scs_dev.comms.publication_frame import PublicationFrame
+from scs_dev.comms.topic_router import TopicRouter, TopicSink
+
+from scs_host.comms.domain_socket import DomainSocket
+from scs_host.sys.host import Host
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    source = None
+    router = None
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdAWSTopicRouter()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    # logging...
+    Logging.config('aws_topic_router', verbose=cmd.verbose)
+    logger = Logging.getLogger()
+
+    logger.info(cmd)
+
+    try:
+        # ------------------------------------------------------------------------------------------------------------
+        # resources...
+
+        # comms...
+        if cmd.persistent and cmd.uds_sub:
+            source = DomainStreamReader(cmd.uds_sub)
+
+        else:
+            source = UDSReader(DomainSocket, cmd.uds_sub)
+
+        logger.info(source)
+
+        # topics...
+        system_id = None
+        project = None
+
+        if cmd.channels:
+            # SystemID...
+            system_id = SystemID.load(Host)
+
+            if system_id is None:
+                logger.error("SystemID not available.")
+                exit(1)
+
+            logger.info(system_id)
+
+            # Project...
+            project = Project.load(Host)
+
+            if project is None:
+                logger.error("Project not available.")
+                exit(1)
+
+        # routes...
+        router = TopicRouter()
+        sinks = {}
+
+        for topic, name in cmd.routes:
+            if Project.is_valid_channel(topic):
+                topic = project.channel_path(topic, system_id)
+
+            if name not in sinks:
+                sinks[name] = TopicSink.construct(name, persistent=cmd.persistent)
+
+            router.add(topic, sinks[name])
+
+        logger.info(router)
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
+
+        # signal handler...
+        SignalledExit.construct()
+
+        # data source...
+        source.connect()
+
+        for message in source.messages():
+            frame = message if isinstance(message, PublicationFrame) else None
+
+            if frame is None:
+                try:
+                    topic, payload = TopicRouter.split(message)
+                except ValueError:
+                    continue
+
+            else:
+                topic, payload = frame.topic, None
+
+            routed_sinks = router.sinks(topic)
+
+            if not routed_sinks:
+                continue
+
+            if frame is None:
+                try:
+                    document = JSONify.dumps(json.loads(payload, object_hook=OrderedDict))
+                except ValueError:
+                    continue
+
+            else:
+                document = frame.text                       # the payload is written as it stands
+
+            for sink in routed_sinks:
+                was_available = sink.available
+
+                if not sink.write(document) and was_available:
+                    logger.warning("%s not available - dropping documents." % sink.path)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # end...
+
+    except ConnectionError as ex:
+        logger.error(repr(ex))
+
+    except (KeyboardInterrupt, SystemExit):
+        pass
+
+    finally:
+        logger.info("finishing")
+
+        if source:
+            source.close()
+
+        if router:
+            router.close()
+            logger.info(router)
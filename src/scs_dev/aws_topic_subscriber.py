@@ -17,8 +17,12 @@ whose field name matches the topic name.
 Messaging topics can be specified either by a project channel name, or by an explicit topic path. If a project channel
 name is used, the aws_topic_subscriber utility requires system ID and AWS project configurations to be set.
 
+If the --persistent (-k) flag is set, the UDS accepts persistent connections, carrying newline-framed documents, as
+written by aws_mqtt_client -k, or length-prefixed publication frames, as written by aws_mqtt_client -k -f. The payload
+of a frame is written as it stands, without being parsed.
+
 SYNOPSIS
-aws_topic_subscriber.py { -t TOPIC | -c { C | G | P | S | X } } [-s UDS_SUB] [-v]
+aws_topic_subscriber.py { -t TOPIC | -c { C | G | P | S | X } } [-s UDS_SUB [-k]] [-v]
 
 EXAMPLES
 /home/pi/SCS/scs_dev/src/scs_dev/aws_topic_subscriber.py -cX -s /home/pi/SCS/pipes/mqtt_control_subscription.uds | \
@@ -65,6 +69,9 @@ from scs_core.sys.system_id import SystemID
 
 from scs_dev.cmd.cmd_aws_topic_subscriber import CmdAWSTopicSubscriber
 
+from scs_dev.comms.domain_stream import DomainStreamReader
+from scs_dev.comms.publication_frame import PublicationFrame
+
 from scs_host.comms.domain_socket import DomainSocket
 from scs_host.sys.host import Host
 
@@ -95,7 +102,12 @@ if __name__ == '__main__':
         # resources...
 
         # comms...
-        source = UDSReader(DomainSocket, cmd.uds_sub)
+        if cmd.persistent:
+            source = DomainStreamReader(cmd.uds_sub)
+
+        else:
+            source = UDSReader(DomainSocket, cmd.uds_sub)
+
         logger.info(source)
 
         # topic...
@@ -134,6 +146,13 @@ if __name__ == '__main__':
         source.connect()
 
         for message in source.messages():
+            if isinstance(message, PublicationFrame):
+                if message.topic == topic:
+                    print(message.text)
+                    sys.stdout.flush()
+
+                continue
+
             try:
                 jdict = json.loads(message, object_hook=OrderedDict)
             except ValueError:
@@ -23,15 +23,22 @@ with fields for:
 Command-line options allow for single-shot reading, multiple readings with specified time intervals, or readings
 controlled by an independent scheduling process via a Unix semaphore.
 
+If the --pre-sample (-p) option is set, the sensors are read in the background, every PRE_SAMPLE_INTERVAL seconds,
+and each sample takes their latest values. Each sample is then produced as soon as it is scheduled, and its recording
+time does not vary with I2C contention. Values more than two pre-sample intervals old are not used - the sensors are
+then read directly. In debug mode, the age of each sensor's reading is reported for each sample.
+
 South Coast Science equipment may carry one or two SHT sensors. The configuration is specified by the
 scs_mfr/sht_conf utility.
 
 SYNOPSIS
-climate_sampler.py [{ -s SEMAPHORE | -i INTERVAL [-n SAMPLES] }] [{ -v | -d }]
+climate_sampler.py [{ -s SEMAPHORE | -i INTERVAL [-n SAMPLES] }] [-p PRE_SAMPLE_INTERVAL] [{ -v | -d }]
 
 EXAMPLES
 ./climate_sampler.py -i10
 
+./climate_sampler.py -s scs-climate -p10
+
 FILES
 ~/SCS/conf/mpl115a2_calib.json
 ~/SCS/conf/mpl115a2_conf.json
@@ -90,11 +97,12 @@ if __name__ == '__main__':
 
     barometer = None
     altitude = None
+    sampler = None
 
     # ----------------------------------------------------------------------------------------------------------------
     # cmd...
 
-    cmd = CmdSampler()
+    cmd = CmdSampler(pre_sample=True)
 
     if not cmd.is_valid():
         cmd.print_help(sys.stderr)
@@ -165,7 +173,7 @@ if __name__ == '__main__':
         runner = TimedRunner(cmd.interval, cmd.samples) if cmd.semaphore is None \
             else ScheduleRunner(cmd.semaphore)
 
-        sampler = ClimateSampler(runner, tag, sht, barometer, altitude)
+        sampler = ClimateSampler(runner, tag, sht, barometer, altitude, pre_sample_interval=cmd.pre_sample_interval)
         logger.info(sampler)
 
 
@@ -178,8 +186,12 @@ if __name__ == '__main__':
         if barometer is not None:
             barometer.init()
 
+        sampler.start()
+
         for sample in sampler.samples():
             logger.info("     rec: %s" % sample.rec.as_time())
+            logger.debug("acquired: %s" % ', '.join("%s: -%0.3f" % (name, acquisition.age())
+                                                    for name, acquisition in sampler.acquisitions.items()))
 
             print(JSONify.dumps(sample))
             sys.stdout.flush()
@@ -197,4 +209,7 @@ if __name__ == '__main__':
     finally:
         logger.info("finishing")
 
+        if sampler:
+            sampler.stop()
+
         I2C.Sensors.close()
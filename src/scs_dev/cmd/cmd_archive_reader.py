@@ -0,0 +1,123 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import optparse
+
+from scs_core.data.datetime import LocalizedDatetime
+
+from scs_dev import version
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CmdArchiveReader(object):
+    """unix command line handler"""
+
+    __DEFAULT_FLUSH_ROWS = 10000
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__parser = optparse.OptionParser(usage="%prog [--start START] [--end END] [-l LIMIT] [-r FLUSH_ROWS] "
+                                                    "[-a] [-v] FILENAME_1 [.. FILENAME_N]", version=version())
+
+        # window...
+        self.__parser.add_option("--start", type="string", action="store", dest="start",
+                                 help="output documents with rec on or after ISO 8601 START")
+
+        self.__parser.add_option("--end", type="string", action="store", dest="end",
+                                 help="output documents with rec before ISO 8601 END")
+
+        self.__parser.add_option("--limit", "-l", type="int", action="store", dest="limit",
+                                 help="output a maximum of LIMIT documents from each file")
+
+        # output...
+        self.__parser.add_option("--flush-rows", "-r", type="int", action="store", dest="flush_rows",
+                                 default=self.__DEFAULT_FLUSH_ROWS,
+                                 help="flush output every FLUSH_ROWS documents (default %d)" %
+                                      self.__DEFAULT_FLUSH_ROWS)
+
+        self.__parser.add_option("--array", "-a", action="store_true", dest="array", default=False,
+                                 help="output JSON documents as array instead of a sequence")
+
+        self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
+                                 help="report narrative to stderr")
+
+        self.__opts, self.__args = self.__parser.parse_args()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        if len(self.__args) < 1:
+            return False
+
+        if self.flush_rows < 1:
+            return False
+
+        if self.limit is not None and self.limit < 0:
+            return False
+
+        if self.__opts.start is not None and self.start is None:
+            return False
+
+        if self.__opts.end is not None and self.end is None:
+            return False
+
+        if self.start is not None and self.end is not None and self.start >= self.end:
+            return False
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def start(self):
+        return LocalizedDatetime.construct_from_iso8601(self.__opts.start)
+
+
+    @property
+    def end(self):
+        return LocalizedDatetime.construct_from_iso8601(self.__opts.end)
+
+
+    @property
+    def limit(self):
+        return self.__opts.limit
+
+
+    @property
+    def flush_rows(self):
+        return self.__opts.flush_rows
+
+
+    @property
+    def array(self):
+        return self.__opts.array
+
+
+    @property
+    def verbose(self):
+        return self.__opts.verbose
+
+
+    @property
+    def filenames(self):
+        return self.__args
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def print_help(self, file):
+        self.__parser.print_help(file)
+
+
+    def __str__(self, *args, **kwargs):
+        return "CmdArchiveReader:{start:%s, end:%s, limit:%s, flush_rows:%s, array:%s, verbose:%s, filenames:%s}" % \
+               (self.__opts.start, self.__opts.end, self.limit, self.flush_rows, self.array, self.verbose,
+                self.filenames)
@@ -20,7 +20,7 @@ class CmdAWSTopicPublisher(object):
         Constructor
         """
         self.__parser = optparse.OptionParser(usage="%prog { -t TOPIC_PATH | -c { C | G | P | S | X } } "
-                                                    "[-p UDS_PUB] [-v]", version=version())
+                                                    "[-p UDS_PUB [-k [-f] [-b BUFFER_SIZE]]] [-v]", version=version())
 
         # compulsory...
         self.__parser.add_option("--topic", "-t", type="string", action="store", dest="topic",
@@ -33,6 +33,15 @@ class CmdAWSTopicPublisher(object):
         self.__parser.add_option("--pub", "-p", type="string", action="store", dest="uds_pub",
                                  default=None, help="write publications to UDS instead of stdout")
 
+        self.__parser.add_option("--persistent", "-k", action="store_true", dest="persistent", default=False,
+                                 help="hold the UDS connection open, with newline-framed publications")
+
+        self.__parser.add_option("--framed", "-f", action="store_true", dest="framed", default=False,
+                                 help="write length-prefixed publication frames, in place of newline framing")
+
+        self.__parser.add_option("--buffer", "-b", type="int", action="store", dest="buffer_size", default=0,
+                                 help="send publications together, up to BUFFER_SIZE bytes (default 0)")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -51,6 +60,15 @@ class CmdAWSTopicPublisher(object):
         if self.channel and not Project.is_valid_channel(self.channel):
             return False
 
+        if self.persistent and self.uds_pub is None:
+            return False
+
+        if self.framed and not self.persistent:
+            return False
+
+        if self.buffer_size < 0 or (self.buffer_size and not self.persistent):
+            return False
+
         return True
 
 
@@ -71,6 +89,21 @@ class CmdAWSTopicPublisher(object):
         return self.__opts.uds_pub
 
 
+    @property
+    def persistent(self):
+        return self.__opts.persistent
+
+
+    @property
+    def framed(self):
+        return self.__opts.framed
+
+
+    @property
+    def buffer_size(self):
+        return self.__opts.buffer_size
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -83,4 +116,6 @@ class CmdAWSTopicPublisher(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdAWSTopicPublisher:{topic:%s, channel:%s, verbose:%s}" % (self.topic, self.channel, self.verbose)
+        return "CmdAWSTopicPublisher:{topic:%s, channel:%s, uds_pub:%s, persistent:%s, framed:%s, buffer_size:%s, " \
+               "verbose:%s}" % \
+               (self.topic, self.channel, self.uds_pub, self.persistent, self.framed, self.buffer_size, self.verbose)
@@ -0,0 +1,97 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import optparse
+
+from scs_core.aws.config.project import Project
+from scs_dev import version
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CmdAWSTopicRouter(object):
+    """unix command line handler"""
+
+    __SEPARATOR =       '='
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__parser = optparse.OptionParser(usage="%prog [-s UDS_SUB] [-k] { TOPIC_PATH | C | G | P | S | X }=SINK_1 "
+                                                    "[.. { TOPIC_PATH | C | G | P | S | X }=SINK_N] [-v]",
+                                              version=version())
+
+        # optional...
+        self.__parser.add_option("--sub", "-s", type="string", action="store", dest="uds_sub",
+                                 help="read subscriptions from UDS instead of stdin")
+
+        self.__parser.add_option("--persistent", "-k", action="store_true", dest="persistent", default=False,
+                                 help="use persistent, newline-framed connections on UDS_SUB and UDS sinks")
+
+        # output...
+        self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
+                                 help="report narrative to stderr")
+
+        self.__opts, self.__args = self.__parser.parse_args()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        if not self.__args:
+            return False
+
+        for arg in self.__args:
+            if arg.count(self.__SEPARATOR) != 1:
+                return False
+
+            topic, sink = arg.split(self.__SEPARATOR)
+
+            if not topic or not sink:
+                return False
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def routes(self):
+        return [tuple(arg.split(self.__SEPARATOR)) for arg in self.__args]
+
+
+    @property
+    def channels(self):
+        return [topic for topic, _ in self.routes if Project.is_valid_channel(topic)]
+
+
+    @property
+    def uds_sub(self):
+        return self.__opts.uds_sub
+
+
+    @property
+    def persistent(self):
+        return self.__opts.persistent
+
+
+    @property
+    def verbose(self):
+        return self.__opts.verbose
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def print_help(self, file):
+        self.__parser.print_help(file)
+
+
+    def __str__(self, *args, **kwargs):
+        return "CmdAWSTopicRouter:{routes:%s, uds_sub:%s, persistent:%s, verbose:%s}" % \
+               (self.routes, self.uds_sub, self.persistent, self.verbose)
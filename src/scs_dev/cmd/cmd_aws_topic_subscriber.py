@@ -19,8 +19,8 @@ class CmdAWSTopicSubscriber(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog { -t TOPIC_PATH | -c { C | G | P | S | X } } [-s UDS_SUB] "
-                                                    "[-v]", version=version())
+        self.__parser = optparse.OptionParser(usage="%prog { -t TOPIC_PATH | -c { C | G | P | S | X } } [-s UDS_SUB "
+                                                    "[-k]] [-v]", version=version())
 
         # compulsory...
         self.__parser.add_option("--topic", "-t", type="string", action="store", dest="topic",
@@ -33,6 +33,10 @@ class CmdAWSTopicSubscriber(object):
         self.__parser.add_option("--sub", "-s", type="string", action="store", dest="uds_sub",
                                  help="read subscriptions from UDS instead of stdin")
 
+        self.__parser.add_option("--persistent", "-k", action="store_true", dest="persistent", default=False,
+                                 help="accept persistent connections on UDS_SUB, with newline framing or "
+                                      "publication frames")
+
         # output...
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
@@ -49,6 +53,9 @@ class CmdAWSTopicSubscriber(object):
         if self.channel and not Project.is_valid_channel(self.channel):
             return False
 
+        if self.persistent and self.uds_sub is None:
+            return False
+
         return True
 
 
@@ -69,6 +76,11 @@ class CmdAWSTopicSubscriber(object):
         return self.__opts.uds_sub
 
 
+    @property
+    def persistent(self):
+        return self.__opts.persistent
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -81,5 +93,5 @@ class CmdAWSTopicSubscriber(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdAWSTopicSubscriber:{topic:%s, channel:%s, uds_sub:%s, verbose:%s}" % \
-               (self.topic, self.channel, self.uds_sub, self.verbose)
+        return "CmdAWSTopicSubscriber:{topic:%s, channel:%s, uds_sub:%s, persistent:%s, verbose:%s}" % \
+               (self.topic, self.channel, self.uds_sub, self.persistent, self.verbose)
@@ -14,20 +14,49 @@ from scs_dev import version
 class CmdCSVLogger(object):
     """unix command line handler"""
 
+    SINKS = ('csv', 'columnar', 'both')
+
+    __DEFAULT_CATCH_UP_BATCH = 100
+
     def __init__(self):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-a] [-e] [-v] TOPIC", version=version())
+        self.__parser = optparse.OptionParser(usage="%prog [-a] [-f FLUSH_ROWS] [-t FLUSH_INTERVAL] "
+                                                    "[-s { csv | columnar | both }] [-e [-c [-r RATE] [-b BATCH]]] "
+                                                    "[-v] TOPIC",
+                                              version=version())
 
         # mode...
         self.__parser.add_option("--absolute", "-a", action="store_true", dest="absolute", default=False,
                                  help="absolute topic path (default is find from AWS project)")
 
+        # buffer...
+        self.__parser.add_option("--flush-rows", "-f", type="int", action="store", dest="flush_rows",
+                                 help="write to storage every FLUSH_ROWS documents")
+
+        self.__parser.add_option("--flush-interval", "-t", type="float", action="store", dest="flush_interval",
+                                 help="write to storage at least every FLUSH_INTERVAL seconds "
+                                      "(default is conf write-interval)")
+
+        # sink...
+        self.__parser.add_option("--sink", "-s", type="choice", choices=self.SINKS, action="store", dest="sink",
+                                 default='csv', help="write to csv, columnar archive or both (default csv)")
+
         # output...
         self.__parser.add_option("--echo", "-e", action="store_true", dest="echo", default=False,
                                  help="echo stdin to stdout (mediated by storage and byline)")
 
+        self.__parser.add_option("--catch-up", "-c", action="store_true", dest="catch_up", default=False,
+                                 help="replay backlog in batches, resuming from checkpoint, behind live documents")
+
+        self.__parser.add_option("--catch-up-rate", "-r", type="float", action="store", dest="catch_up_rate",
+                                 help="replay at most RATE backlog documents per second (default unlimited)")
+
+        self.__parser.add_option("--catch-up-batch", "-b", type="int", action="store", dest="catch_up_batch",
+                                 help="replay at most BATCH backlog documents at a time (default %d)" %
+                                      self.__DEFAULT_CATCH_UP_BATCH)
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -40,9 +69,38 @@ class CmdCSVLogger(object):
         if len(self.__args) < 1:
             return False
 
+        if self.flush_rows is not None and self.flush_rows < 1:
+            return False
+
+        if self.flush_interval is not None and self.flush_interval < 0:
+            return False
+
+        if self.echo and not self.writes_csv():
+            return False
+
+        if self.catch_up and not self.echo:
+            return False
+
+        if (self.catch_up_rate is not None or self.__opts.catch_up_batch is not None) and not self.catch_up:
+            return False
+
+        if self.catch_up_rate is not None and self.catch_up_rate <= 0:
+            return False
+
+        if self.catch_up_batch is not None and self.catch_up_batch < 1:
+            return False
+
         return True
 
 
+    def writes_csv(self):
+        return self.sink in ('csv', 'both')
+
+
+    def writes_columnar(self):
+        return self.sink in ('columnar', 'both')
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @property
@@ -50,11 +108,41 @@ class CmdCSVLogger(object):
         return self.__opts.absolute
 
 
+    @property
+    def flush_rows(self):
+        return self.__opts.flush_rows
+
+
+    @property
+    def flush_interval(self):
+        return self.__opts.flush_interval
+
+
+    @property
+    def sink(self):
+        return self.__opts.sink
+
+
     @property
     def echo(self):
         return self.__opts.echo
 
 
+    @property
+    def catch_up(self):
+        return self.__opts.catch_up
+
+
+    @property
+    def catch_up_rate(self):
+        return self.__opts.catch_up_rate
+
+
+    @property
+    def catch_up_batch(self):
+        return self.__DEFAULT_CATCH_UP_BATCH if self.__opts.catch_up_batch is None else self.__opts.catch_up_batch
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -72,5 +160,7 @@ class CmdCSVLogger(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdCSVLogger:{absolute:%s, echo:%s, verbose:%s, topic_subject:%s}" % \
-               (self.absolute, self.echo, self.verbose, self.topic)
+        return "CmdCSVLogger:{absolute:%s, flush_rows:%s, flush_interval:%s, sink:%s, echo:%s, catch_up:%s, " \
+               "catch_up_rate:%s, catch_up_batch:%s, verbose:%s, topic_subject:%s}" % \
+               (self.absolute, self.flush_rows, self.flush_interval, self.sink, self.echo, self.catch_up,
+                self.catch_up_rate, self.catch_up_batch, self.verbose, self.topic)
@@ -6,6 +6,8 @@ Created on 2 Aug 2016
 
 import optparse
 
+from scs_core.data.datetime import LocalizedDatetime
+
 from scs_dev import version
 
 
@@ -14,12 +16,16 @@ from scs_dev import version
 class CmdCSVReader(object):
     """unix command line handler"""
 
+    __DEFAULT_FLUSH_ROWS = 10000
+
     def __init__(self):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-s] [-n] [-l LIMIT] [-a] [-v] [FILENAME_1 .. FILENAME_N]",
-                                              version=version())
+        self.__parser = optparse.OptionParser(usage="%prog [-s] [-n] [-l LIMIT] "
+                                                    "[-b [-r FLUSH_ROWS] [-t FLUSH_INTERVAL]] "
+                                                    "{ [-j JOBS [-m]] | [--start START] [--end END] [-i] } "
+                                                    "[-a] [-v] [FILENAME_1 .. FILENAME_N]", version=version())
 
         # mode...
         self.__parser.add_option("--string", "-s", action="store_true", dest="string", default=False,
@@ -31,6 +37,34 @@ class CmdCSVReader(object):
         self.__parser.add_option("--limit", "-l", type="int", action="store", dest="limit",
                                  help="output a maximum of LIMIT rows")
 
+        # batch...
+        self.__parser.add_option("--batch", "-b", action="store_true", dest="batch", default=False,
+                                 help="compile the header once, and buffer output")
+
+        self.__parser.add_option("--flush-rows", "-r", type="int", action="store", dest="flush_rows",
+                                 help="in batch mode, flush output every FLUSH_ROWS documents (default %d)" %
+                                      self.__DEFAULT_FLUSH_ROWS)
+
+        self.__parser.add_option("--flush-interval", "-t", type="float", action="store", dest="flush_interval",
+                                 help="in batch mode, flush output at least every FLUSH_INTERVAL seconds")
+
+        # parallel...
+        self.__parser.add_option("--jobs", "-j", type="int", action="store", dest="jobs",
+                                 help="convert files in a pool of JOBS processes")
+
+        self.__parser.add_option("--merge", "-m", action="store_true", dest="merge", default=False,
+                                 help="merge documents from all files in rec order (default is file order)")
+
+        # window...
+        self.__parser.add_option("--start", type="string", action="store", dest="start",
+                                 help="output rows with rec on or after ISO 8601 START")
+
+        self.__parser.add_option("--end", type="string", action="store", dest="end",
+                                 help="output rows with rec before ISO 8601 END")
+
+        self.__parser.add_option("--index", "-i", action="store_true", dest="index", default=False,
+                                 help="cache the rec index beside each file")
+
         # output...
         self.__parser.add_option("--array", "-a", action="store_true", dest="array", default=False,
                                  help="output JSON documents as array instead of a sequence")
@@ -41,6 +75,46 @@ class CmdCSVReader(object):
         self.__opts, self.__args = self.__parser.parse_args()
 
 
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        if not self.batch and (self.__opts.flush_rows is not None or self.flush_interval is not None):
+            return False
+
+        if self.__opts.flush_rows is not None and self.__opts.flush_rows < 1:
+            return False
+
+        if self.flush_interval is not None and self.flush_interval <= 0:
+            return False
+
+        if self.jobs is not None and (self.jobs < 1 or self.__args == []):
+            return False
+
+        if self.merge and self.jobs is None:
+            return False
+
+        if self.__opts.start is not None and self.start is None:
+            return False
+
+        if self.__opts.end is not None and self.end is None:
+            return False
+
+        if self.start is not None and self.end is not None and self.start >= self.end:
+            return False
+
+        if self.has_window() and self.jobs is not None:
+            return False
+
+        if self.index and (not self.has_window() or self.__args == []):
+            return False
+
+        return True
+
+
+    def has_window(self):
+        return self.__opts.start is not None or self.__opts.end is not None
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @property
@@ -48,6 +122,14 @@ class CmdCSVReader(object):
         return not self.string
 
 
+    @property
+    def flush_rows(self):
+        if not self.batch:
+            return 1
+
+        return self.__DEFAULT_FLUSH_ROWS if self.__opts.flush_rows is None else self.__opts.flush_rows
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @property
@@ -65,6 +147,41 @@ class CmdCSVReader(object):
         return self.__opts.limit
 
 
+    @property
+    def batch(self):
+        return self.__opts.batch
+
+
+    @property
+    def flush_interval(self):
+        return self.__opts.flush_interval
+
+
+    @property
+    def jobs(self):
+        return self.__opts.jobs
+
+
+    @property
+    def merge(self):
+        return self.__opts.merge
+
+
+    @property
+    def start(self):
+        return LocalizedDatetime.construct_from_iso8601(self.__opts.start)
+
+
+    @property
+    def end(self):
+        return LocalizedDatetime.construct_from_iso8601(self.__opts.end)
+
+
+    @property
+    def index(self):
+        return self.__opts.index
+
+
     @property
     def array(self):
         return self.__opts.array
@@ -87,5 +204,8 @@ class CmdCSVReader(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdCSVReader:{string:%s, nullify:%s, limit:%s, array:%s, verbose:%s, filenames:%s}" % \
-               (self.string, self.nullify, self.limit, self.array, self.verbose, self.filenames)
+        return "CmdCSVReader:{string:%s, nullify:%s, limit:%s, batch:%s, flush_rows:%s, flush_interval:%s, " \
+               "jobs:%s, merge:%s, start:%s, end:%s, index:%s, array:%s, verbose:%s, filenames:%s}" % \
+               (self.string, self.nullify, self.limit, self.batch, self.flush_rows, self.flush_interval,
+                self.jobs, self.merge, self.__opts.start, self.__opts.end, self.index, self.array, self.verbose,
+                self.filenames)
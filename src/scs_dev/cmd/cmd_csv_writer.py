@@ -20,12 +20,20 @@ class CmdCSVWriter(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [{ -a | -x }] [-e] [-v] [FILENAME]", version=version())
+        self.__parser = optparse.OptionParser(usage="%prog [{ -a | -u | -r }] [-x] [-e [-f FLUSH_ROWS] "
+                                                    "[-t FLUSH_INTERVAL]] [-v] [FILENAME]",
+                                              version=version())
 
         # mode...
         self.__parser.add_option("--append", "-a", action="store_true", dest="append", default=False,
                                  help="append rows to existing file")
 
+        self.__parser.add_option("--union", "-u", action="store_true", dest="union", default=False,
+                                 help="spool rows, and write the union of all fields at close")
+
+        self.__parser.add_option("--roll", "-r", action="store_true", dest="roll", default=False,
+                                 help="start a new FILENAME.N segment whenever new fields appear")
+
         # output...
         self.__parser.add_option("--exclude-header", "-x", action="store_true", dest="exclude_header", default=False,
                                  help="do not write the header row to stdout")
@@ -33,6 +41,12 @@ class CmdCSVWriter(object):
         self.__parser.add_option("--echo", "-e", action="store_true", dest="echo", default=False,
                                  help="echo stdin to stdout")
 
+        self.__parser.add_option("--flush-rows", "-f", type="int", action="store", dest="flush_rows", default=1,
+                                 help="flush echo output every FLUSH_ROWS documents (default 1)")
+
+        self.__parser.add_option("--flush-interval", "-t", type="float", action="store", dest="flush_interval",
+                                 help="flush echo output at least every FLUSH_INTERVAL seconds")
+
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
 
@@ -45,6 +59,18 @@ class CmdCSVWriter(object):
         if self.append and self.exclude_header:
             return False
 
+        if int(self.append) + int(self.union) + int(self.roll) > 1:
+            return False
+
+        if self.roll and self.filename is None:
+            return False
+
+        if self.flush_rows < 1 or (self.flush_interval is not None and self.flush_interval <= 0):
+            return False
+
+        if not self.echo and (self.flush_rows != 1 or self.flush_interval is not None):
+            return False
+
         return True
 
 
@@ -55,6 +81,16 @@ class CmdCSVWriter(object):
         return self.__opts.append
 
 
+    @property
+    def union(self):
+        return self.__opts.union
+
+
+    @property
+    def roll(self):
+        return self.__opts.roll
+
+
     @property
     def exclude_header(self):
         return self.__opts.exclude_header
@@ -65,6 +101,16 @@ class CmdCSVWriter(object):
         return self.__opts.echo
 
 
+    @property
+    def flush_rows(self):
+        return self.__opts.flush_rows
+
+
+    @property
+    def flush_interval(self):
+        return self.__opts.flush_interval
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -82,5 +128,7 @@ class CmdCSVWriter(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdCSVWriter:{append:%s, exclude_header:%s, echo:%s, verbose:%s, filename:%s}" % \
-                    (self.append, self.exclude_header, self.echo, self.verbose, self.filename)
+        return "CmdCSVWriter:{append:%s, union:%s, roll:%s, exclude_header:%s, echo:%s, flush_rows:%s, " \
+               "flush_interval:%s, verbose:%s, filename:%s}" % \
+                    (self.append, self.union, self.roll, self.exclude_header, self.echo, self.flush_rows,
+                     self.flush_interval, self.verbose, self.filename)
@@ -0,0 +1,125 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import optparse
+
+from scs_dev import version
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CmdInferenceReplay(object):
+    """unix command line handler"""
+
+    __DEFAULT_CONNECTIONS = 1
+    __DEFAULT_BATCH_SIZE = 1
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__parser = optparse.OptionParser(usage="%prog [-f CSV_FILE] [-s SAMPLE_PATH -c CLIMATE_PATH] "
+                                                    "[-i INFERENCE_PATH] [-n CONNECTIONS] [-b BATCH] [-v] "
+                                                    "UDS_PATH_1 [.. UDS_PATH_N]", version=version())
+
+        # input...
+        self.__parser.add_option("--file", "-f", type="string", action="store", dest="csv_file",
+                                 help="read documents from CSV_FILE instead of stdin")
+
+        self.__parser.add_option("--sample", "-s", type="string", action="store", dest="sample_path",
+                                 help="build a PMx request from the OPC sample at SAMPLE_PATH")
+
+        self.__parser.add_option("--climate", "-c", type="string", action="store", dest="climate_path",
+                                 help="build a PMx request from the climate sample at CLIMATE_PATH")
+
+        # output...
+        self.__parser.add_option("--inference", "-i", type="string", action="store", dest="inference_path",
+                                 help="report each document, with its inference at INFERENCE_PATH")
+
+        # pool...
+        self.__parser.add_option("--connections", "-n", type="int", action="store", dest="connections",
+                                 default=self.__DEFAULT_CONNECTIONS,
+                                 help="connections per model server (default %d)" % self.__DEFAULT_CONNECTIONS)
+
+        self.__parser.add_option("--batch", "-b", type="int", action="store", dest="batch_size",
+                                 default=self.__DEFAULT_BATCH_SIZE,
+                                 help="requests per message (default %d)" % self.__DEFAULT_BATCH_SIZE)
+
+        # narrative...
+        self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
+                                 help="report narrative to stderr")
+
+        self.__opts, self.__args = self.__parser.parse_args()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_valid(self):
+        if not self.__args:
+            return False
+
+        if bool(self.sample_path) != bool(self.climate_path):
+            return False
+
+        if self.connections < 1 or self.batch_size < 1:
+            return False
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def csv_file(self):
+        return self.__opts.csv_file
+
+
+    @property
+    def sample_path(self):
+        return self.__opts.sample_path
+
+
+    @property
+    def climate_path(self):
+        return self.__opts.climate_path
+
+
+    @property
+    def inference_path(self):
+        return self.__opts.inference_path
+
+
+    @property
+    def connections(self):
+        return self.__opts.connections
+
+
+    @property
+    def batch_size(self):
+        return self.__opts.batch_size
+
+
+    @property
+    def uds_paths(self):
+        return self.__args
+
+
+    @property
+    def verbose(self):
+        return self.__opts.verbose
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def print_help(self, file):
+        self.__parser.print_help(file)
+
+
+    def __str__(self, *args, **kwargs):
+        return "CmdInferenceReplay:{csv_file:%s, sample_path:%s, climate_path:%s, inference_path:%s, " \
+               "connections:%s, batch_size:%s, uds_paths:%s, verbose:%s}" % \
+               (self.csv_file, self.sample_path, self.climate_path, self.inference_path,
+                self.connections, self.batch_size, self.uds_paths, self.verbose)
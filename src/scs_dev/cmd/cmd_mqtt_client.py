@@ -22,24 +22,51 @@ class CmdMQTTClient(object):
         self.__parser = optparse.OptionParser(usage="%prog [-p UDS_PUB] "
                                                     "[-s] { -c { C | G | P | S | X } (UDS_SUB_1) | "
                                                     "[SUB_TOPIC_1 (UDS_SUB_1) .. SUB_TOPIC_N (UDS_SUB_N)] } "
-                                                    "[-e] [-l LED_UDS] [-v]", version=version())
+                                                    "[-w MAX_IN_FLIGHT] [-q QUEUE_DIR] [-b INTERVAL [-z]] "
+                                                    "[-r CAPACITY] [-k [-f]] [-e] [-l LED_UDS] [-m METRICS_UDS] [-v]",
+                                              version=version())
 
         # mode...
         self.__parser.add_option("--pub", "-p", type="string", action="store", dest="uds_pub",
                                  default=None, help="read publications from UDS instead of stdin")
 
+        self.__parser.add_option("--persistent", "-k", action="store_true", dest="persistent", default=False,
+                                 help="use persistent, newline-framed connections on UDS_PUB and UDS_SUBs")
+
+        self.__parser.add_option("--framed", "-f", action="store_true", dest="framed", default=False,
+                                 help="write subscriptions to UDS_SUBs as length-prefixed publication frames")
+
         self.__parser.add_option("--sub", "-s", action="store_true", dest="uds_sub",
                                  help="write subscriptions to UDS instead of stdout")
 
         self.__parser.add_option("--channel", "-c", type="string", action="store", dest="channel",
                                  help="subscribe to channel")
 
+        self.__parser.add_option("--window", "-w", type="int", action="store", dest="max_in_flight", default=1,
+                                 help="pipeline publications, with up to MAX_IN_FLIGHT awaiting PUBACK (default 1)")
+
+        self.__parser.add_option("--queue", "-q", type="string", action="store", dest="queue_dir",
+                                 help="hold publications in a durable queue in QUEUE_DIR")
+
+        self.__parser.add_option("--batch", "-b", type="float", action="store", dest="batch_interval",
+                                 help="publish documents for each topic in batches, every INTERVAL seconds")
+
+        self.__parser.add_option("--compress", "-z", action="store_true", dest="compress", default=False,
+                                 help="compress batches")
+
+        self.__parser.add_option("--priority", "-r", type="int", action="store", dest="lane_capacity",
+                                 help="publish control, status, live then backlog documents, holding up to CAPACITY "
+                                      "of each")
+
         self.__parser.add_option("--echo", "-e", action="store_true", dest="echo", default=False,
                                  help="echo input to stdout (if not writing subscriptions to stdout)")
 
         self.__parser.add_option("--led", "-l", type="string", action="store", dest="led_uds",
                                  help="send LED commands to LED_UDS")
 
+        self.__parser.add_option("--metrics", "-m", type="string", action="store", dest="metrics_uds",
+                                 help="answer queries for publication metrics on METRICS_UDS")
+
         # output...
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
@@ -50,6 +77,24 @@ class CmdMQTTClient(object):
     # ----------------------------------------------------------------------------------------------------------------
 
     def is_valid(self):
+        if self.max_in_flight < 1:
+            return False
+
+        if self.persistent and self.uds_pub is None and not self.__opts.uds_sub:
+            return False
+
+        if self.framed and (not self.persistent or not self.__opts.uds_sub):
+            return False
+
+        if self.batch_interval is not None and self.batch_interval <= 0:
+            return False
+
+        if self.compress and self.batch_interval is None:
+            return False
+
+        if self.lane_capacity is not None and self.lane_capacity < 1:
+            return False
+
         if self.echo and self.subscriptions and not self.__opts.uds_sub:
             return False
 
@@ -104,6 +149,41 @@ class CmdMQTTClient(object):
         return self.__opts.uds_pub
 
 
+    @property
+    def persistent(self):
+        return self.__opts.persistent
+
+
+    @property
+    def framed(self):
+        return self.__opts.framed
+
+
+    @property
+    def max_in_flight(self):
+        return self.__opts.max_in_flight
+
+
+    @property
+    def queue_dir(self):
+        return self.__opts.queue_dir
+
+
+    @property
+    def batch_interval(self):
+        return self.__opts.batch_interval
+
+
+    @property
+    def compress(self):
+        return self.__opts.compress
+
+
+    @property
+    def lane_capacity(self):
+        return self.__opts.lane_capacity
+
+
     @property
     def echo(self):
         return self.__opts.echo
@@ -114,6 +194,11 @@ class CmdMQTTClient(object):
         return self.__opts.led_uds
 
 
+    @property
+    def metrics_uds(self):
+        return self.__opts.metrics_uds
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -126,10 +211,12 @@ class CmdMQTTClient(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdMQTTClient:{subscriptions:%s, channel:%s, channel_uds:%s, uds_pub:%s, echo:%s, " \
-               "led:%s, verbose:%s}" % \
-               (Str.collection(self.subscriptions), self.channel, self.channel_uds, self.uds_pub, self.echo,
-                self.led_uds, self.verbose)
+        return "CmdMQTTClient:{subscriptions:%s, channel:%s, channel_uds:%s, uds_pub:%s, persistent:%s, " \
+               "framed:%s, max_in_flight:%s, queue_dir:%s, batch_interval:%s, compress:%s, lane_capacity:%s, " \
+               "echo:%s, led:%s, metrics_uds:%s, verbose:%s}" % \
+               (Str.collection(self.subscriptions), self.channel, self.channel_uds, self.uds_pub, self.persistent,
+                self.framed, self.max_in_flight, self.queue_dir, self.batch_interval, self.compress,
+                self.lane_capacity, self.echo, self.led_uds, self.metrics_uds, self.verbose)
 
 
 # --------------------------------------------------------------------------------------------------------------------
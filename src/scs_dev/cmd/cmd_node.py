@@ -12,18 +12,24 @@ from scs_dev import version
 
 from scs_core.data.path_dict import PathDict
 
+from scs_dev.transform.node_aggregate import NodeAggregate
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
 class CmdNode(object):
     """unix command line handler"""
 
+    __DEFAULT_FLUSH_ROWS = 10000
+
     def __init__(self):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-x] [-a] [-s] [-f FILE] [-i INDENT] [-v] "
-                                                    "[SUB_PATH_1 .. SUB_PATH_N]", version=version())
+        self.__parser = optparse.OptionParser(usage="%prog [-x] [-a] [-s] [-b [-r FLUSH_ROWS] [-t FLUSH_INTERVAL]] "
+                                                    "[-w WINDOW [-o OPERATIONS]] [-f FILE] [-i INDENT] [-v] "
+                                                    "[SUB_PATH_1 .. SUB_PATH_N]",
+                                              version=version())
 
         # mode...
         self.__parser.add_option("--exclude", "-x", action="store_true", dest="exclude", default=False,
@@ -35,6 +41,26 @@ class CmdNode(object):
         self.__parser.add_option("--sequence", "-s", action="store_true", dest="sequence", default=False,
                                  help="output the contents of the input array node(s) as a sequence")
 
+        # batch...
+        self.__parser.add_option("--batch", "-b", action="store_true", dest="batch", default=False,
+                                 help="compile the sub-paths once, and buffer output")
+
+        self.__parser.add_option("--flush-rows", "-r", type="int", action="store", dest="flush_rows",
+                                 help="in batch mode, flush output every FLUSH_ROWS documents (default %d)" %
+                                      self.__DEFAULT_FLUSH_ROWS)
+
+        self.__parser.add_option("--flush-interval", "-t", type="float", action="store", dest="flush_interval",
+                                 help="in batch mode, flush output at least every FLUSH_INTERVAL seconds")
+
+        # aggregation...
+        self.__parser.add_option("--window", "-w", type="float", action="store", dest="window",
+                                 help="reduce the documents over tumbling windows of WINDOW seconds")
+
+        self.__parser.add_option("--operations", "-o", type="string", action="store", dest="operations",
+                                 help="comma-separated OPERATIONS { %s } (default 'mean')" %
+                                      ' | '.join(NodeAggregate.OPERATIONS))
+
+        # input...
         self.__parser.add_option("--file", "-f", type="string", action="store", dest="filename",
                                  help="read from FILE instead of stdin")
 
@@ -50,8 +76,26 @@ class CmdNode(object):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    @classmethod
-    def is_valid(cls):
+    def is_valid(self):
+        if not self.batch and (self.__opts.flush_rows is not None or self.flush_interval is not None):
+            return False
+
+        if self.__opts.flush_rows is not None and self.__opts.flush_rows < 1:
+            return False
+
+        if self.flush_interval is not None and self.flush_interval <= 0:
+            return False
+
+        if self.window is None and self.__opts.operations is not None:
+            return False
+
+        if self.window is not None and self.window <= 0:
+            return False
+
+        for operation in self.operations:
+            if operation not in NodeAggregate.OPERATIONS:
+                return False
+
         return True
 
 
@@ -84,6 +128,37 @@ class CmdNode(object):
         return self.__opts.sequence
 
 
+    @property
+    def batch(self):
+        return self.__opts.batch
+
+
+    @property
+    def flush_rows(self):
+        if not self.batch:
+            return 1
+
+        return self.__DEFAULT_FLUSH_ROWS if self.__opts.flush_rows is None else self.__opts.flush_rows
+
+
+    @property
+    def flush_interval(self):
+        return self.__opts.flush_interval
+
+
+    @property
+    def window(self):
+        return self.__opts.window
+
+
+    @property
+    def operations(self):
+        if self.__opts.operations is None:
+            return ['mean']
+
+        return [operation.strip() for operation in self.__opts.operations.split(',')]
+
+
     @property
     def filename(self):
         return self.__opts.filename
@@ -111,5 +186,7 @@ class CmdNode(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdNode:{exclude:%s, array:%s, sequence:%s, filename:%s, indent:%s, verbose:%s, sub_paths:%s}" %  \
-               (self.exclude, self.array, self.sequence, self.filename, self.indent, self.verbose, self.__args)
+        return "CmdNode:{exclude:%s, array:%s, sequence:%s, batch:%s, flush_rows:%s, flush_interval:%s, " \
+               "window:%s, operations:%s, filename:%s, indent:%s, verbose:%s, sub_paths:%s}" %  \
+               (self.exclude, self.array, self.sequence, self.batch, self.flush_rows, self.flush_interval,
+                self.window, self.operations, self.filename, self.indent, self.verbose, self.__args)
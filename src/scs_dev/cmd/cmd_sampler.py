@@ -15,12 +15,20 @@ from scs_dev import version
 class CmdSampler(object):
     """unix command line handler"""
 
-    def __init__(self):
+    AGGREGATES = ('trimmed', 'median', 'mean')
+
+    def __init__(self, pre_sample=False, oversample=False, inference=False):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-n NAME] [{ -s SEMAPHORE | -i INTERVAL [-c SAMPLES] }] "
-                                                    "[{ -v | -d }]", version=version())
+        pre_sample_usage = "[-p PRE_SAMPLE_INTERVAL] " if pre_sample else ""
+        oversample_usage = "[-o OVERSAMPLES [-a AGGREGATE]] " if oversample else ""
+        inference_usage = "[-y] " if inference else ""
+
+        self.__parser = optparse.OptionParser(usage="%prog [-n NAME] [{ -s SEMAPHORE | -i INTERVAL [-c SAMPLES] }] " +
+                                                    pre_sample_usage + oversample_usage + inference_usage +
+                                                    "[{ -v | -d }]",
+                                              version=version())
 
         # identity...
         self.__parser.add_option("--name", "-n", type="string", action="store", dest="name",
@@ -36,6 +44,22 @@ class CmdSampler(object):
         self.__parser.add_option("--samples", "-c", type="int", action="store", dest="samples",
                                  help="sample count (1 if interval not specified)")
 
+        if pre_sample:
+            self.__parser.add_option("--pre-sample", "-p", type="float", action="store", dest="pre_sample_interval",
+                                     help="read sensors in the background, every PRE_SAMPLE_INTERVAL seconds")
+
+        if oversample:
+            self.__parser.add_option("--oversample", "-o", type="int", action="store", dest="oversamples",
+                                     help="read sensors OVERSAMPLES times per interval, and report the aggregate")
+
+            self.__parser.add_option("--aggregate", "-a", type="choice", choices=self.AGGREGATES, action="store",
+                                     dest="aggregate", default=self.AGGREGATES[0],
+                                     help="the aggregate: { trimmed | median | mean } (default trimmed)")
+
+        if inference:
+            self.__parser.add_option("--async-inference", "-y", action="store_true", dest="async_inference",
+                                     default=False, help="overlap inference with the next sample, with a timeout")
+
         # output...
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
                                  help="report narrative to stderr")
@@ -55,6 +79,19 @@ class CmdSampler(object):
         if self.__opts.interval is None and self.__opts.samples is not None:
             return False
 
+        if self.pre_sample_interval is not None and self.pre_sample_interval <= 0:
+            return False
+
+        if self.oversamples is not None:
+            if self.oversamples < 1:
+                return False
+
+            if self.__opts.semaphore is None and self.__opts.interval is None:
+                return False
+
+        if self.aggregate != self.AGGREGATES[0] and self.oversamples is None:
+            return False
+
         if self.verbose and self.debug:
             return False
 
@@ -93,6 +130,26 @@ class CmdSampler(object):
         return 1 if self.__opts.interval is None else self.__opts.samples
 
 
+    @property
+    def pre_sample_interval(self):
+        return getattr(self.__opts, 'pre_sample_interval', None)
+
+
+    @property
+    def oversamples(self):
+        return getattr(self.__opts, 'oversamples', None)
+
+
+    @property
+    def aggregate(self):
+        return getattr(self.__opts, 'aggregate', self.AGGREGATES[0])
+
+
+    @property
+    def async_inference(self):
+        return getattr(self.__opts, 'async_inference', False)
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -110,5 +167,7 @@ class CmdSampler(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdSampler:{name:%s, semaphore:%s, interval:%s, samples:%s, verbose:%s, debug:%s}" % \
-                    (self.name, self.semaphore, self.interval, self.samples, self.verbose, self.debug)
+        return "CmdSampler:{name:%s, semaphore:%s, interval:%s, samples:%s, pre_sample_interval:%s, oversamples:%s, " \
+               "aggregate:%s, async_inference:%s, verbose:%s, debug:%s}" % \
+                    (self.name, self.semaphore, self.interval, self.samples, self.pre_sample_interval,
+                     self.oversamples, self.aggregate, self.async_inference, self.verbose, self.debug)
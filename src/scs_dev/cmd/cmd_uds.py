@@ -20,7 +20,11 @@ class CmdUDS(object):
         """
         Constructor
         """
-        self.__parser = optparse.OptionParser(usage="%prog [-v] UDS_SUB", version=version())
+        self.__parser = optparse.OptionParser(usage="%prog [-k] [-v] UDS_SUB", version=version())
+
+        # input...
+        self.__parser.add_option("--persistent", "-k", action="store_true", dest="persistent", default=False,
+                                 help="accept persistent connections, with newline framing or publication frames")
 
         # output...
         self.__parser.add_option("--verbose", "-v", action="store_true", dest="verbose", default=False,
@@ -45,6 +49,11 @@ class CmdUDS(object):
         return self.__args[0] if len(self.__args) > 0 else None
 
 
+    @property
+    def persistent(self):
+        return self.__opts.persistent
+
+
     @property
     def verbose(self):
         return self.__opts.verbose
@@ -57,4 +66,4 @@ class CmdUDS(object):
 
 
     def __str__(self, *args, **kwargs):
-        return "CmdUDS:{verbose:%s}" % self.verbose
+        return "CmdUDS:{path:%s, persistent:%s, verbose:%s}" % (self.path, self.persistent, self.verbose)
@@ -0,0 +1,177 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A local query endpoint on a Unix domain socket. The DomainQueryServer answers each connection with the current value
+of its responder - a newline-terminated string - then closes the connection. The client sends nothing.
+
+The server runs on a daemon thread, so that it does not hold up the process that it reports on.
+
+example:
+socat - UNIX-CONNECT:/home/pi/SCS/pipes/mqtt_metrics.uds
+"""
+
+import os
+import socket
+
+from threading import Event, Thread
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DomainQueryServer(object):
+    """
+    classdocs
+    """
+
+    __BACKLOG =             4                   # connections
+    __ACCEPT_TIMEOUT =      1.0                 # seconds
+    __SEND_TIMEOUT =        5.0                 # seconds
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, path, responder):
+        """
+        Constructor
+        """
+        self.__path = path                                          # string
+        self.__responder = responder                                # callable returning string
+
+        self.__listener = None                                      # socket
+        self.__stopping = Event()
+        self.__thread = None                                        # Thread
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def start(self):
+        if self.__thread is not None:
+            return
+
+        try:
+            os.remove(self.__path)                                  # override any previous use of the UDS
+        except OSError:
+            pass
+
+        self.__listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.__listener.bind(self.__path)
+        self.__listener.listen(self.__BACKLOG)
+        self.__listener.settimeout(self.__ACCEPT_TIMEOUT)
+
+        self.__stopping.clear()
+
+        self.__thread = Thread(target=self.__serve, daemon=True)
+        self.__thread.start()
+
+
+    def stop(self):
+        if self.__thread is None:
+            return
+
+        self.__stopping.set()
+        self.__thread.join()
+        self.__thread = None
+
+        self.__listener.close()
+        self.__listener = None
+
+        try:
+            os.remove(self.__path)
+        except OSError:
+            pass
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __serve(self):
+        while not self.__stopping.is_set():
+            try:
+                connection, _ = self.__listener.accept()
+            except socket.timeout:
+                continue
+
+            except OSError:
+                break
+
+            try:
+                connection.settimeout(self.__SEND_TIMEOUT)
+                connection.sendall((self.__responder() + '\n').encode())
+
+            except OSError:
+                pass                                                # the client has gone
+
+            finally:
+                connection.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def path(self):
+        return self.__path
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "DomainQueryServer:{path:%s, serving:%s}" % (self.path, self.__thread is not None)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DomainQueryClient(object):
+    """
+    classdocs
+    """
+
+    __RECEIVE_SIZE =        65536               # bytes
+
+    DEFAULT_TIMEOUT =       5.0                 # seconds
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, path, timeout=DEFAULT_TIMEOUT):
+        """
+        Constructor
+        """
+        self.__path = path                                          # string
+        self.__timeout = timeout                                    # float seconds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def query(self):
+        response = bytearray()
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(self.__timeout)
+            client.connect(self.__path)
+
+            while True:
+                data = client.recv(self.__RECEIVE_SIZE)
+
+                if not data:
+                    break
+
+                response += data
+
+        return response.decode().strip()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def path(self):
+        return self.__path
+
+
+    @property
+    def timeout(self):
+        return self.__timeout
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "DomainQueryClient:{path:%s, timeout:%s}" % (self.path, self.timeout)
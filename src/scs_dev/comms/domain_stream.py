@@ -0,0 +1,427 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Persistent connections over a Unix domain socket. These classes may be used in place of DomainSocket by UDSReader and
+UDSWriter.
+
+Each message is framed by a newline, so that a connection may be held open, and so that many messages may be sent
+together. A DomainStreamWriter holds its connection open, and reconnects whenever the connection is lost. If a
+buffer_size is given, messages are held until buffer_size bytes are waiting, or until the oldest has waited for
+flush_interval seconds, then are sent together. While it waits for the reader, the writer does not hold its lock, so
+close() may be called from another thread - any write that is waiting then raises ConnectionAbortedError.
+
+A PublicationFrame may be written in place of a message. It is sent length-prefixed, rather than newline-framed, and
+its payload is never parsed by the reader. Frames and newline-framed messages may be mixed on a connection.
+
+A DomainStreamReader accepts any number of concurrent connections. It also accepts connections that carry a single
+unframed message, terminated by the writer closing the connection - as written by DomainSocket. It yields a string
+for each newline-framed message, and a PublicationFrame for each frame.
+
+https://realpython.com/python-sockets/#multi-connection-server
+"""
+
+import os
+import selectors
+import socket
+import time
+
+from threading import Condition, Thread
+
+from scs_dev.comms.publication_frame import PublicationFrame
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DomainStreamReader(object):
+    """
+    classdocs
+    """
+
+    __BACKLOG =             16                  # connections
+    __RECEIVE_SIZE =        65536               # bytes
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, path):
+        """
+        Constructor
+        """
+        self.__path = path                                          # string
+        self.__listener = None                                      # socket
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def connect(self):
+        if self.__listener is not None:
+            return
+
+        try:
+            os.remove(self.__path)                                  # override any previous use of the UDS
+        except OSError:
+            pass
+
+        self.__listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.__listener.bind(self.__path)
+        self.__listener.listen(self.__BACKLOG)
+
+
+    def close(self):
+        if self.__listener is None:
+            return
+
+        self.__listener.close()
+        self.__listener = None
+
+        try:
+            os.remove(self.__path)
+        except OSError:
+            pass
+
+
+    def read(self):
+        self.connect()
+
+        selector = selectors.DefaultSelector()
+        selector.register(self.__listener, selectors.EVENT_READ)
+
+        received = {}                                               # dict of socket: DomainStreamConnection
+
+        try:
+            while True:
+                for key, _ in selector.select():
+                    # connection...
+                    if key.fileobj is self.__listener:
+                        conn, _ = self.__listener.accept()
+                        conn.setblocking(False)
+
+                        selector.register(conn, selectors.EVENT_READ)
+                        received[conn] = DomainStreamConnection()
+                        continue
+
+                    # data...
+                    conn = key.fileobj
+                    connection = received[conn]
+
+                    try:
+                        data = conn.recv(self.__RECEIVE_SIZE)
+
+                    except BlockingIOError:
+                        continue
+
+                    except OSError:
+                        data = b''
+
+                    if data:
+                        for message in connection.messages(data):
+                            yield message
+
+                        continue
+
+                    # closed...
+                    selector.unregister(conn)
+                    conn.close()
+
+                    del received[conn]
+
+                    message = connection.remainder()
+
+                    if message:
+                        yield message
+
+        finally:
+            for conn in received:
+                conn.close()
+
+            selector.close()
+
+
+    def messages(self):                                             # as UDSReader
+        for message in self.read():
+            yield message
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def path(self):
+        return self.__path
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "DomainStreamReader:{path:%s, listening:%s}" % (self.path, self.__listener is not None)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DomainStreamConnection(object):
+    """
+    classdocs
+    """
+
+    __DELIMITER =           b'\n'
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__buffer = bytearray()                                 # bytearray
+        self.__framed = False                                       # bool
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def messages(self, data):
+        self.__buffer += data
+
+        if PublicationFrame.MARKER not in data and not PublicationFrame.is_frame(self.__buffer):
+            return self.__lines()                                   # newline framing only
+
+        messages = []
+
+        while self.__buffer:
+            # length-prefixed...
+            if PublicationFrame.is_frame(self.__buffer):
+                if len(self.__buffer) < PublicationFrame.header_size():
+                    break
+
+                size = PublicationFrame.frame_size(self.__buffer)
+
+                if len(self.__buffer) < size:
+                    break
+
+                messages.append(PublicationFrame.construct_from_bytes(self.__buffer[:size]))
+                del self.__buffer[:size]
+
+                self.__framed = True
+                continue
+
+            # newline-framed...
+            end = self.__buffer.find(self.__DELIMITER)
+
+            if end < 0:
+                break
+
+            message = self.__buffer[:end].decode().strip()
+            del self.__buffer[:end + 1]
+
+            self.__framed = True
+
+            if message:
+                messages.append(message)
+
+        return messages
+
+
+    def __lines(self):
+        end = self.__buffer.rfind(self.__DELIMITER)
+
+        if end < 0:
+            return []
+
+        frames = self.__buffer[:end].split(self.__DELIMITER)
+        del self.__buffer[:end + 1]
+
+        self.__framed = True
+
+        return [message for message in (frame.decode().strip() for frame in frames) if message]
+
+
+    def remainder(self):
+        if self.__framed:
+            return None                                             # a torn frame on a persistent connection
+
+        return self.__buffer.decode().strip()                       # a single, unframed message
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DomainStreamWriter(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_FLUSH_INTERVAL =    0.05            # seconds
+
+    __RETRY_TIME =              1.0             # seconds
+
+    __DELIMITER =               b'\n'
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, path, buffer_size=0, flush_interval=DEFAULT_FLUSH_INTERVAL):
+        """
+        Constructor
+        """
+        self.__path = path                                          # string
+        self.__buffer_size = int(buffer_size)                       # int bytes
+        self.__flush_interval = float(flush_interval)               # float seconds
+
+        self.__socket = None                                        # socket
+        self.__buffer = bytearray()                                 # bytearray
+        self.__buffered_time = None                                 # float time of oldest buffered message
+
+        self.__condition = Condition()
+        self.__flusher = None                                       # Thread
+        self.__closed = False                                       # bool
+
+        self.__reconnect_count = 0                                  # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def connect(self, wait_for_availability=True):
+        with self.__condition:
+            self.__closed = False
+
+            if self.__socket is None:
+                self.__connect(wait_for_availability)
+
+
+    def close(self):
+        with self.__condition:
+            try:
+                if self.__buffer:
+                    self.__send(False)                              # do not wait for an absent reader
+
+            except OSError:
+                self.__buffer.clear()                               # the reader is absent - the messages are lost
+
+            self.__closed = True
+            self.__condition.notify_all()
+
+            self.__disconnect()
+
+        if self.__flusher is not None:
+            self.__flusher.join()
+            self.__flusher = None
+
+
+    def write(self, message, wait_for_availability=True):
+        if isinstance(message, PublicationFrame):
+            frame = message.as_bytes()
+
+        else:
+            frame = message.strip().encode() + self.__DELIMITER
+
+        with self.__condition:
+            if not self.__buffer:
+                self.__buffered_time = time.time()
+
+            self.__buffer += frame
+
+            if len(self.__buffer) >= self.__buffer_size:
+                self.__send(wait_for_availability)
+                return
+
+            if self.__flusher is None:
+                self.__flusher = Thread(target=self.__flush_when_due, daemon=True)
+                self.__flusher.start()
+
+            self.__condition.notify_all()
+
+
+    def flush(self, wait_for_availability=True):
+        with self.__condition:
+            self.__send(wait_for_availability)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __connect(self, wait_for_availability):                    # the condition must be held
+        while True:
+            if self.__closed:
+                raise ConnectionAbortedError("DomainStreamWriter: closed: %s" % self.__path)
+
+            if self.__socket is not None:
+                return                                              # connected by another thread meanwhile
+
+            conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+            try:
+                conn.connect(self.__path)
+                self.__socket = conn
+                return
+
+            except OSError:
+                conn.close()
+
+                if not wait_for_availability:
+                    raise
+
+                self.__condition.wait(self.__RETRY_TIME)            # close() may be called meanwhile
+
+
+    def __disconnect(self):                                         # the condition must be held
+        if self.__socket is None:
+            return
+
+        self.__socket.close()
+        self.__socket = None
+
+
+    def __send(self, wait_for_availability):                       # the condition must be held
+        while self.__buffer:
+            if self.__socket is None:
+                self.__connect(wait_for_availability)
+
+            try:
+                self.__socket.sendall(self.__buffer)
+                self.__buffer.clear()
+
+            except OSError:
+                self.__disconnect()                                 # the reader has restarted - send again
+                self.__reconnect_count += 1
+
+                if not wait_for_availability:
+                    raise
+
+
+    def __flush_when_due(self):
+        with self.__condition:
+            while not self.__closed:
+                if not self.__buffer:
+                    self.__condition.wait()
+                    continue
+
+                wait = self.__buffered_time + self.__flush_interval - time.time()
+
+                if wait > 0:
+                    self.__condition.wait(wait)
+                    continue
+
+                try:
+                    self.__send(True)
+
+                except OSError:
+                    pass                                            # the writer has been closed
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def path(self):
+        return self.__path
+
+
+    @property
+    def buffer_size(self):
+        return self.__buffer_size
+
+
+    @property
+    def reconnect_count(self):
+        return self.__reconnect_count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "DomainStreamWriter:{path:%s, buffer_size:%s, flush_interval:%s, connected:%s, reconnect_count:%s}" % \
+               (self.path, self.buffer_size, self.__flush_interval, self.__socket is not None, self.reconnect_count)
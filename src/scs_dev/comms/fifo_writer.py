@@ -0,0 +1,88 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Writes newline-terminated messages to a named pipe (FIFO), with the same interface as UDSWriter. The FIFO is opened
+on first use. If it has no reader, the writer waits for one, unless wait_for_availability is False, in which case
+ConnectionRefusedError is raised. If the reader goes away, the FIFO is opened again.
+"""
+
+import errno
+import os
+import time
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class FIFOWriter(object):
+    """
+    classdocs
+    """
+
+    __RETRY_TIME =      1.0             # seconds
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, path):
+        """
+        Constructor
+        """
+        self.__path = path                                          # string
+        self.__fd = None                                            # int file descriptor
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def connect(self, wait_for_availability=True):
+        while self.__fd is None:
+            try:
+                fd = os.open(self.__path, os.O_WRONLY | os.O_NONBLOCK)
+
+            except OSError as ex:
+                if ex.errno != errno.ENXIO:                         # ENXIO: the FIFO has no reader
+                    raise
+
+                if not wait_for_availability:
+                    raise ConnectionRefusedError(self.__path)
+
+                time.sleep(self.__RETRY_TIME)
+                continue
+
+            os.set_blocking(fd, True)
+            self.__fd = fd
+
+
+    def close(self):
+        if self.__fd is None:
+            return
+
+        os.close(self.__fd)
+        self.__fd = None
+
+
+    def write(self, message, wait_for_availability=True):
+        data = (message.strip() + '\n').encode()
+
+        while True:
+            self.connect(wait_for_availability=wait_for_availability)
+
+            try:
+                os.write(self.__fd, data)                           # atomic up to PIPE_BUF bytes
+                return
+
+            except BrokenPipeError:
+                self.close()                                        # the reader has gone - open again
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def path(self):
+        return self.__path
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "FIFOWriter:{path:%s, open:%s}" % (self.path, self.__fd is not None)
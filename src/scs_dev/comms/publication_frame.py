@@ -0,0 +1,144 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A publication as it passes between scs_dev utilities: a topic, and a payload that is held as opaque JSON bytes. The
+payload is encoded once, by the producer, and is then forwarded without being parsed again.
+
+On the wire, a frame is a header - the RS (0x1e) marker, the topic length and the payload length, in network byte
+order - then the UTF-8 topic, then the payload. A JSON document can never begin with RS, so frames and newline-framed
+documents may be mixed on the same connection.
+
+frame layout:
+0x1e | topic length (2 bytes) | payload length (4 bytes) | topic | payload
+
+https://tools.ietf.org/html/rfc7464
+"""
+
+import json
+import re
+import struct
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONify
+from scs_core.data.publication import Publication
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class PublicationFrame(object):
+    """
+    classdocs
+    """
+
+    MARKER =                0x1e                                    # ASCII RS
+
+    __HEADER = struct.Struct('>BHI')                                # marker, topic length, payload length
+    __REC = re.compile(rb'"rec"\s*:\s*"([^"]*)"')
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def header_size(cls):
+        return cls.__HEADER.size
+
+
+    @classmethod
+    def frame_size(cls, header):
+        """
+        returns the size of the whole frame, given at least the header bytes
+        """
+        marker, topic_length, payload_length = cls.__HEADER.unpack_from(header)
+
+        if marker != cls.MARKER:
+            raise ValueError("not a frame: %s" % bytes(header[:cls.__HEADER.size]))
+
+        return cls.__HEADER.size + topic_length + payload_length
+
+
+    @classmethod
+    def is_frame(cls, data):
+        return len(data) > 0 and data[0] == cls.MARKER
+
+
+    @classmethod
+    def construct_from_bytes(cls, data):
+        marker, topic_length, payload_length = cls.__HEADER.unpack_from(data)
+
+        if marker != cls.MARKER or len(data) != cls.__HEADER.size + topic_length + payload_length:
+            raise ValueError("malformed frame: %s" % bytes(data[:cls.__HEADER.size]))
+
+        start = cls.__HEADER.size
+
+        topic = bytes(data[start:start + topic_length]).decode()
+        payload = bytes(data[start + topic_length:])
+
+        return cls(topic, payload)
+
+
+    @classmethod
+    def construct_from_publication(cls, publication: Publication):
+        return cls(publication.topic, JSONify.dumps(publication.payload).encode())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, topic, payload):
+        """
+        Constructor
+        """
+        self.__topic = topic                                        # string
+        self.__payload = payload                                    # bytes (JSON)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_bytes(self):
+        topic = self.__topic.encode()
+
+        return self.__HEADER.pack(self.MARKER, len(topic), len(self.__payload)) + topic + self.__payload
+
+
+    def as_message(self):
+        """
+        returns the publication as a newline-framed document would carry it - the payload is not parsed
+        """
+        return '{%s: %s}' % (json.dumps(self.__topic), self.text)
+
+
+    def as_publication(self):
+        return Publication(self.__topic, json.loads(self.__payload, object_hook=OrderedDict))
+
+
+    def rec(self):
+        """
+        returns the rec field of the payload, as an ISO 8601 string, or None - the payload is not parsed
+        """
+        match = self.__REC.search(self.__payload)
+
+        return None if match is None else match.group(1).decode()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def topic(self):
+        return self.__topic
+
+
+    @property
+    def payload(self):
+        return self.__payload
+
+
+    @property
+    def text(self):
+        return self.__payload.decode()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "PublicationFrame:{topic:%s, payload:%s}" % (self.topic, self.payload)
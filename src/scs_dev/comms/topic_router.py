@@ -0,0 +1,246 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Routes subscription messages, of the form {topic: payload} as written by aws_mqtt_client, to any number of sinks.
+
+The topic is scanned from the raw message, without parsing the payload, and is looked up in a table of exact topics
+and topic prefixes - a route whose topic ends in '/#' matches every topic below it. The sinks for each topic are
+cached, so that a message whose topic has no route costs only the scan and one dict lookup.
+
+A sink may be stdout ('-'), a FIFO, or a Unix domain socket. A UDS sink connects for each message, unless persistent
+is set, in which case it holds a newline-framed connection open, as DomainStreamWriter. A sink never waits for an
+absent reader - so that one stalled consumer cannot hold up the others - the document is dropped, and counted.
+"""
+
+import os
+import stat
+
+from json.decoder import scanstring
+
+from scs_core.comms.uds_writer import UDSWriter
+
+from scs_dev.comms.domain_stream import DomainStreamWriter
+from scs_dev.comms.fifo_writer import FIFOWriter
+
+from scs_host.comms.domain_socket import DomainSocket
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TopicRouter(object):
+    """
+    classdocs
+    """
+
+    WILDCARD =              '#'
+
+    __CACHE_SIZE =          4096                # topics
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def split(cls, message):
+        """
+        returns (topic, payload) - the payload is the undecoded JSON text of the message's single field
+        """
+        start = message.find('"')
+
+        if start < 0 or message[:start].strip() != '{':
+            raise ValueError("no topic: %s" % message)
+
+        topic, end = scanstring(message, start + 1)
+
+        colon = message.find(':', end)
+        close = message.rfind('}')
+
+        if colon < 0 or message[end:colon].strip() or close < colon:
+            raise ValueError("no payload: %s" % message)
+
+        payload = message[colon + 1:close].strip()
+
+        if not payload:
+            raise ValueError("no payload: %s" % message)
+
+        return topic, payload
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__exact = {}                                           # dict of topic: list of TopicSink
+        self.__prefixes = []                                        # list of (prefix, TopicSink)
+        self.__cache = {}                                           # dict of topic: tuple of TopicSink
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def add(self, topic, sink):
+        if topic == self.WILDCARD or topic.endswith('/' + self.WILDCARD):
+            self.__prefixes.append((topic[:-len(self.WILDCARD)], sink))
+
+        else:
+            self.__exact.setdefault(topic, []).append(sink)
+
+        self.__cache.clear()
+
+
+    def sinks(self, topic):
+        try:
+            return self.__cache[topic]
+
+        except KeyError:
+            pass
+
+        sinks = list(self.__exact.get(topic, []))
+        sinks.extend(sink for prefix, sink in self.__prefixes if topic.startswith(prefix))
+
+        if len(self.__cache) >= self.__CACHE_SIZE:
+            self.__cache.clear()                                    # the topic space is unbounded
+
+        self.__cache[topic] = tuple(sinks)
+
+        return self.__cache[topic]
+
+
+    def close(self):
+        for sink in self.all_sinks():
+            sink.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def all_sinks(self):
+        sinks = []
+
+        for topic_sinks in self.__exact.values():
+            sinks.extend(topic_sinks)
+
+        sinks.extend(sink for _, sink in self.__prefixes)
+
+        return list({id(sink): sink for sink in sinks}.values())
+
+
+    @property
+    def topics(self):
+        return list(self.__exact.keys()) + [prefix + self.WILDCARD for prefix, _ in self.__prefixes]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "TopicRouter:{topics:%s, sinks:%s, cached:%s}" % \
+               (self.topics, [str(sink) for sink in self.all_sinks()], len(self.__cache))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TopicSink(object):
+    """
+    classdocs
+    """
+
+    STDOUT =                '-'
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, name, persistent=False):
+        if name == cls.STDOUT:
+            return cls(UDSWriter(DomainSocket, None), True)
+
+        try:
+            is_fifo = stat.S_ISFIFO(os.stat(name).st_mode)
+
+        except OSError:
+            is_fifo = False                                         # a UDS whose reader has not yet started
+
+        if is_fifo:
+            return cls(UDSWriter(FIFOWriter, name), True)
+
+        if persistent:
+            return cls(UDSWriter(DomainStreamWriter, name), True)
+
+        return cls(UDSWriter(DomainSocket, name), False)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, writer, persistent):
+        """
+        Constructor
+        """
+        self.__writer = writer                                      # UDSWriter
+        self.__persistent = persistent                              # bool
+
+        self.__available = True                                     # bool
+        self.__count = 0                                            # int
+        self.__drop_count = 0                                       # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write(self, document):
+        try:
+            if not self.__persistent:
+                self.__writer.connect(wait_for_availability=False)
+
+            self.__writer.write(document, False)
+
+            self.__available = True
+            self.__count += 1
+
+        except OSError:
+            self.__available = False
+            self.__drop_count += 1
+
+            if self.__persistent:
+                self.__writer.close()                               # discard the undelivered document
+
+        finally:
+            if not self.__persistent:
+                self.__writer.close()
+
+        return self.__available
+
+
+    def close(self):
+        self.__writer.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def path(self):
+        return self.__writer.path
+
+
+    @property
+    def persistent(self):
+        return self.__persistent
+
+
+    @property
+    def available(self):
+        return self.__available
+
+
+    @property
+    def count(self):
+        return self.__count
+
+
+    @property
+    def drop_count(self):
+        return self.__drop_count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "TopicSink:{writer:%s, persistent:%s, available:%s, count:%s, drop_count:%s}" % \
+               (self.__writer, self.persistent, self.available, self.count, self.drop_count)
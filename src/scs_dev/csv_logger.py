@@ -36,11 +36,38 @@ credentials and configuration are required.
 
 Note: echoing cannot begin until a network connection has been established.
 
+With the --catch-up flag, the backlog is replayed in batches of at most BATCH documents, at a rate of at most RATE
+documents per second, and live documents are output ahead of the backlog. After each batch, the rec of the last
+document replayed is saved in a checkpoint file in the csv_logger root directory. If the utility is restarted, the
+backlog is resumed from the checkpoint, without a query to the historic data API. Once the backlog has been cleared,
+the checkpoint follows the live documents. Progress and the estimated time to completion are logged.
+
+Documents are written to storage through a write-behind buffer. The buffer is written, flushed and synced when it
+holds FLUSH_ROWS documents, or when its oldest document is FLUSH_INTERVAL seconds old. If --flush-interval is not
+set, the write-interval of the csv_logger_conf is used. If neither threshold is set, each document is written
+immediately. For high-rate streams on SD card hosts, batching greatly reduces the number of writes. The buffer is
+always written on SIGTERM, so data may only be lost on power failure, and then only the documents received within the
+flush interval. If the volume becomes full, documents held in the buffer that could not be written are echoed.
+
+If the csv_logger_conf specifies a compression codec - gzip, bz2, xz or zstd - each log file is compressed when it is
+closed, at the end of the day or when the utility terminates. The log reader, and the csv_reader utility, read
+compressed files transparently. The delete-oldest policy applies to compressed files as it does to plain files.
+
+The --sink flag selects the storage format. With "columnar", documents are written to a binary columnar archive
+instead of CSV - with "both", to an archive as well as to CSV. Archive files are named as log files are, with the
+suffix .sca, and are written in blocks on the same flush thresholds. Archives are compact, are not limited to the
+fields of the first document, and can be read in a fraction of the time taken to parse CSV. They are exported to
+JSON using the archive_reader utility. Echoing requires the CSV sink.
+
 SYNOPSIS
-csv_logger.py [-a] [-e] [-v] TOPIC
+csv_logger.py [-a] [-f FLUSH_ROWS] [-t FLUSH_INTERVAL] [-s { csv | columnar | both }] [-e [-c [-r RATE] [-b BATCH]]]
+[-v] TOPIC
 
 EXAMPLES
 ./socket_receiver.py | ./csv_logger.py -e climate
+./gases_sampler.py -i10 | ./csv_logger.py -e -c -r 20 -b 200 gases
+./particulates_sampler.py -i1 | ./csv_logger.py -f 60 -t 120 particulates
+./particulates_sampler.py -i1 | ./csv_logger.py -f 600 -s both particulates
 
 DOCUMENT EXAMPLE - INPUT
 {"tag": "scs-ap1-6", "rec": "2018-04-04T14:50:27.641+00:00", "val": {"hmd": 59.6, "tmp": 23.8}}
@@ -50,6 +77,7 @@ tag,rec,val.hmd,val.tmp
 scs-ap1-6,2018-04-04T14:50:38.394+00:00,59.7,23.8
 
 SEE ALSO
+scs_dev/archive_reader
 scs_dev/csv_log_sync
 scs_dev/csv_reader
 scs_dev/csv_writer
@@ -72,16 +100,19 @@ from scs_core.aws.config.project import Project
 from scs_core.aws.security.cognito_device import CognitoDeviceCredentials
 from scs_core.aws.security.cognito_login_manager import CognitoLoginManager
 
-from scs_core.csv.csv_log_reader import CSVLogReader, CSVLogQueueBuilder
-from scs_core.csv.csv_logger import CSVLogger
-from scs_core.csv.csv_logger_conf import CSVLoggerConf
-
 from scs_core.sys.logging import Logging
 from scs_core.sys.signalled_exit import SignalledExit
 from scs_core.sys.system_id import SystemID
 
 from scs_dev.cmd.cmd_csv_logger import CmdCSVLogger
 
+from scs_dev.reader.csv_catch_up_reader import CSVCatchUpReader, CSVCatchUpCheckpoint
+from scs_dev.reader.csv_log_reader import CSVLogReader, CSVLogQueueBuilder
+from scs_dev.writer.column_archive_logger import ColumnArchiveLogger
+from scs_dev.writer.csv_batch_logger import CSVBatchLogger
+from scs_dev.writer.csv_logger_conf import CSVLoggerConf
+from scs_dev.writer.output_buffer import OutputBuffer
+
 from scs_host.sys.host import Host
 
 
@@ -93,7 +124,9 @@ if __name__ == '__main__':
     auth = None
     logger = None
     writer = None
+    archive = None
     reader = None
+    echo_buffer = None
     file_path = None
 
     try:
@@ -140,10 +173,33 @@ if __name__ == '__main__':
 
         # writer...
         write_log = conf.csv_log(cmd.topic, tag=system_id.message_tag())
-        writer = CSVLogger.construct(Host, write_log, conf.delete_oldest, conf.write_interval)
+        flush_interval = conf.write_interval if cmd.flush_interval is None else cmd.flush_interval
+        try:
+            compression = conf.csv_compression()
+        except ValueError as ex:
+            logger.error("CSVLoggerConf: %s" % ex)
+            exit(1)
+
+        if cmd.writes_csv():
+            writer = CSVBatchLogger.construct(Host, write_log, conf.delete_oldest, max_age=flush_interval,
+                                              max_count=cmd.flush_rows, compression=compression)
+        else:
+            writer = ColumnArchiveLogger.construct(Host, write_log, conf.delete_oldest, max_age=flush_interval,
+                                                   max_count=cmd.flush_rows)
 
         logger.info(writer)
 
+        # archive...
+        if cmd.sink == 'both':
+            archive_log = conf.csv_log(cmd.topic, tag=system_id.message_tag())
+            archive = ColumnArchiveLogger.construct(Host, archive_log, conf.delete_oldest, max_age=flush_interval,
+                                                    max_count=cmd.flush_rows)
+
+            logger.info(archive)
+
+        # direct echo...
+        echo_buffer = OutputBuffer(max_count=cmd.flush_rows or 1, max_interval=cmd.flush_interval)
+
         # reader...
         if cmd.echo:
             # literal topic...
@@ -167,8 +223,13 @@ if __name__ == '__main__':
             # CSVLogQueueBuilder...
             queue_builder = CSVLogQueueBuilder(conf, credentials, system_id.message_tag(), cmd.topic, topic_path)
 
-            # CSVLogReader...
-            reader = CSVLogReader(queue_builder, nullify=True)
+            # reader...
+            if cmd.catch_up:
+                checkpoint_filename = CSVCatchUpCheckpoint.filename_for(conf.root_path, cmd.topic)
+                reader = CSVCatchUpReader(queue_builder, checkpoint_filename, nullify=True,
+                                          max_rate=cmd.catch_up_rate, max_count=cmd.catch_up_batch)
+            else:
+                reader = CSVLogReader(queue_builder, nullify=True)
 
             logger.info(reader)
 
@@ -211,6 +272,14 @@ if __name__ == '__main__':
                 if reader:
                     reader.stop()
 
+            if archive and not archive.writing_inhibited:
+                try:
+                    archive.write(jstr)
+
+                except Exception as ex:
+                    logger.error("archive: %s" % repr(ex))
+                    archive.writing_inhibited = True
+
             if not cmd.echo and not writer.writing_inhibited:
                 continue
 
@@ -218,8 +287,13 @@ if __name__ == '__main__':
             if writer.writing_inhibited:
                 logger.error("no CSV access")
 
-                print(jstr)
-                sys.stdout.flush()
+                unwritten = writer.take_unwritten()
+
+                if not unwritten or unwritten[-1] is not jstr:
+                    unwritten.append(jstr)
+
+                for document in unwritten:
+                    echo_buffer.print(document)
 
                 continue
 
@@ -241,7 +315,19 @@ if __name__ == '__main__':
             logger.info("finishing")
 
         if writer:
-            writer.close()
+            try:
+                writer.close()
+            except Exception as ex:
+                logger.error(repr(ex))
+
+        if archive:
+            try:
+                archive.close()
+            except Exception as ex:
+                logger.error(repr(ex))
+
+        if echo_buffer is not None:
+            echo_buffer.flush()
 
         if reader:
             reader.stop()
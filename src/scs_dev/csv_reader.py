@@ -19,12 +19,39 @@ By default, output is in the form of a sequence of JSON documents, separated by
 selected, output is in the form of a JSON array - the output opens with a '[' character, documents are separated by
 the ',' character, and the output is terminated by a ']' character.
 
+By default, each document is flushed to stdout as soon as it is read. The batch (-b) mode is intended for the bulk
+conversion of large files: the header row is compiled once into a plan of document paths, and output is written in
+large chunks. In batch mode, output is flushed every FLUSH_ROWS documents, or every FLUSH_INTERVAL seconds if
+specified.
+
+If the jobs (-j) option is used, files are converted in parallel by a pool of JOBS processes, each using the batch
+conversion method. Documents are output in file order, or - if the merge (-m) flag is set - as a merge of all the files
+ordered by the rec field. The merge requires that each file is ordered by rec, as csv_logger files are. Limit, nullify,
+string and array options apply as for sequential conversion, with the limit applied to each file.
+
+The --start and --end options restrict output to rows whose rec field lies in the interval START <= rec < END. Each file
+is memory-mapped, and reading begins at the position given by a sparse index of rec values, rather than at the top of
+the file. The index is built as required, and - if the index (-i) flag is set - cached beside the file, with the suffix
+.rec-index.json. A cached index is rebuilt if the file has changed. Files must be ordered by rec.
+
+Files compressed by the csv_logger - with the suffix .gz, .bz2, .xz or .zst - are decompressed transparently, as a
+stream. Compressed files cannot be indexed, so the --start and --end options filter every row of a compressed file.
+
 SYNOPSIS
-csv_reader.py [-s] [-n] [-l LIMIT] [-a] [-v] [FILENAME_1 .. FILENAME_N]
+csv_reader.py [-s] [-n] [-l LIMIT] [-b [-r FLUSH_ROWS] [-t FLUSH_INTERVAL]]
+{ [-j JOBS [-m]] | [--start START] [--end END] [-i] } [-a] [-v] [FILENAME_1 .. FILENAME_N]
 
 EXAMPLES
 csv_reader.py -v scs-ph1-10-status-2019-07-*.csv
 
+csv_reader.py -b -r 50000 scs-bgx-431-gases-2023-*.csv > gases-2023.jstr
+
+csv_reader.py -b -j 4 -m scs-bgx-431-gases-2023-*.csv > gases-2023.jstr
+
+csv_reader.py -i --start 2023-07-14T13:00:00Z --end 2023-07-14T18:00:00Z scs-bgx-431-gases-2023-07-14.csv
+
+csv_reader.py -b scs-bgx-431-status-2023-07-*.csv.gz
+
 DOCUMENT EXAMPLE - INPUT
 tag,rec,val.hmd,val.tmp
 scs-ap1-6,2018-04-04T14:50:38.394+00:00,59.7,23.8
@@ -50,6 +77,12 @@ from scs_core.csv.csv_dict import CSVHeaderError
 
 from scs_dev.cmd.cmd_csv_reader import CmdCSVReader
 
+from scs_dev.reader.csv_batch_reader import CSVBatchReader
+from scs_dev.reader.csv_file_pool import CSVFilePool
+from scs_dev.reader.csv_window_reader import CSVWindowReader
+from scs_dev.writer.csv_compression import CSVCompression
+from scs_dev.writer.output_buffer import OutputBuffer
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -57,88 +90,166 @@ if __name__ == '__main__':
 
     file_count = 0
     total_rows = 0
+    output_count = 0
 
     reader = None
+    pool = None
 
     # ----------------------------------------------------------------------------------------------------------------
     # cmd...
 
     cmd = CmdCSVReader()
 
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
     if cmd.verbose:
         print("csv_reader: %s" % cmd, file=sys.stderr)
 
+    # output...
+    output = OutputBuffer(sys.stdout, max_count=cmd.flush_rows, max_interval=cmd.flush_interval)
+
     if cmd.array:
-        print('[', end='')
+        output.write('[')
 
     try:
-        for filename in cmd.filenames:
-
-            file_count += 1
-            rows = 0
-
+        if cmd.jobs:
             # --------------------------------------------------------------------------------------------------------
             # resources...
 
-            try:
-                reader = CSVReader.construct_for_file(filename, cast=cmd.cast, nullify=cmd.nullify)
-
-            except FileNotFoundError:
-                print("csv_reader: file not found: %s" % filename, file=sys.stderr)
-                exit(1)
-
-            except KeyError as ex:
-                print("csv_reader: empty header cell in: %s." % ex, file=sys.stderr)
-                exit(1)
-
-            except ValueError as ex:
-                print("csv_reader: duplicate column names in: %s." % ex, file=sys.stderr)
-                exit(1)
+            pool = CSVFilePool(cmd.jobs, cast=cmd.cast, nullify=cmd.nullify, limit=cmd.limit, keyed=cmd.merge)
 
             if cmd.verbose:
-                print("csv_reader: %s" % reader, file=sys.stderr)
+                print("csv_reader: %s" % pool, file=sys.stderr)
                 sys.stderr.flush()
 
+            pool.open()
+
 
             # --------------------------------------------------------------------------------------------------------
             # run...
 
-            try:
-                for datum in reader.rows():
-                    if cmd.limit is not None and rows >= cmd.limit:
-                        break
+            merging = []
+
+            for conversion in pool.conversions(cmd.filenames):
+                file_count += 1
+
+                if conversion.error:
+                    print("csv_reader: %s" % conversion.error, file=sys.stderr)
+                    exit(1)
+
+                if cmd.verbose:
+                    print("csv_reader: %s" % conversion.reader, file=sys.stderr)
+
+                    if conversion.warning:
+                        print("csv_reader: %s" % conversion.warning, file=sys.stderr)
+
+                    print("csv_reader: rows: %d" % conversion.rows, file=sys.stderr)
+                    sys.stderr.flush()
+
+                total_rows += conversion.rows
 
+                if cmd.merge:
+                    merging.append(conversion)
+                    continue
+
+                for datum in conversion.lines():
                     if cmd.array:
-                        if rows == 0:
-                            print(datum, end='')
+                        output.write(datum if output_count == 0 else ", %s" % datum)
+                    else:
+                        output.print(datum)
 
-                        else:
-                            print(", %s" % datum, end='')
+                    output_count += 1
+
+            for datum in CSVFilePool.merge(merging):
+                if cmd.array:
+                    output.write(datum if output_count == 0 else ", %s" % datum)
+                else:
+                    output.print(datum)
+
+                output_count += 1
 
+        else:
+            for filename in cmd.filenames:
+
+                file_count += 1
+                rows = 0
+
+                # ----------------------------------------------------------------------------------------------------
+                # resources...
+
+                try:
+                    if cmd.has_window():
+                        reader = CSVWindowReader.construct_for_file(filename, start=cmd.start, end=cmd.end,
+                                                                    cast=cmd.cast, nullify=cmd.nullify,
+                                                                    cache_index=cmd.index)
+                    elif cmd.batch:
+                        reader = CSVBatchReader.construct_for_file(filename, cast=cmd.cast, nullify=cmd.nullify)
+                    elif filename is not None and CSVCompression.is_compressed(filename):
+                        reader = CSVReader(CSVCompression.open_for_reading(filename), filename=filename,
+                                           cast=cmd.cast, nullify=cmd.nullify)
                     else:
-                        print(datum)
+                        reader = CSVReader.construct_for_file(filename, cast=cmd.cast, nullify=cmd.nullify)
 
-                    sys.stdout.flush()
+                except FileNotFoundError:
+                    print("csv_reader: file not found: %s" % filename, file=sys.stderr)
+                    exit(1)
 
-                    rows += 1
+                except KeyError as ex:
+                    print("csv_reader: empty header cell in: %s." % ex, file=sys.stderr)
+                    exit(1)
 
-            except CSVHeaderError as ex:
-                print("csv_reader: clashing column names: '%s' and '%s'" % (ex.left, ex.right), file=sys.stderr)
-                exit(1)
+                except ValueError as ex:
+                    print("csv_reader: duplicate column names in: %s." % ex, file=sys.stderr)
+                    exit(1)
+
+                except CSVHeaderError as ex:
+                    print("csv_reader: clashing column names: '%s' and '%s'" % (ex.left, ex.right), file=sys.stderr)
+                    exit(1)
+
+                except CSVReaderException as ex:
+                    print("csv_reader: %s" % ex, file=sys.stderr)
+                    exit(1)
 
-            except CSVReaderException as ex:
                 if cmd.verbose:
-                    print("csv_reader: ending file on row %d: %s" % (rows, ex), file=sys.stderr)
-                    continue
+                    print("csv_reader: %s" % reader, file=sys.stderr)
+                    sys.stderr.flush()
 
-            finally:
-                if reader is not None:
-                    reader.close()
 
-            if cmd.verbose:
-                print("csv_reader: rows: %d" % rows, file=sys.stderr)
+                # ----------------------------------------------------------------------------------------------------
+                # run...
+
+                try:
+                    for datum in reader.rows():
+                        if cmd.limit is not None and rows >= cmd.limit:
+                            break
+
+                        if cmd.array:
+                            output.write(datum if output_count == 0 else ", %s" % datum)
+                        else:
+                            output.print(datum)
+
+                        rows += 1
+                        output_count += 1
+
+                except CSVHeaderError as ex:
+                    print("csv_reader: clashing column names: '%s' and '%s'" % (ex.left, ex.right), file=sys.stderr)
+                    exit(1)
 
-            total_rows += rows
+                except CSVReaderException as ex:
+                    if cmd.verbose:
+                        print("csv_reader: ending file on row %d: %s" % (rows, ex), file=sys.stderr)
+                        continue
+
+                finally:
+                    if reader is not None:
+                        reader.close()
+
+                if cmd.verbose:
+                    print("csv_reader: rows: %d" % rows, file=sys.stderr)
+
+                total_rows += rows
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -148,8 +259,13 @@ if __name__ == '__main__':
         print(file=sys.stderr)
 
     finally:
+        if pool is not None:
+            pool.close()
+
         if cmd.array:
-            print(']')
+            output.print(']')
+
+        output.flush()
 
         if cmd and cmd.verbose and file_count > 1:
             print("csv_reader: files: %d total rows: %d" % (file_count, total_rows), file=sys.stderr)
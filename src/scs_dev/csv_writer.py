@@ -15,11 +15,27 @@ All the leaf nodes of the first JSON document are included in the CSV. If subseq
 contain fields that were not in this first document, these extra fields are ignored. If subsequent JSON documents
 do not contain a field that is in the header, then this field is given the null value.
 
+If the --union flag is set, fields that appear in later documents are not ignored. Rows are spooled to a temporary
+file, and the header - the union of the fields of all documents - is written at close, followed by the rows. Memory
+use is bounded by the number of distinct fields, rather than the number of documents. Note that no output is written
+until the input stream closes.
+
+If the --roll flag is set, rows are written as they arrive, but when a document contains new fields, the current file
+is closed and a new file segment is started, with the widened header. Segments are named FILENAME.1.csv,
+FILENAME.2.csv, and so on. A FILENAME must be given.
+
+In both modes, a field that extends a field that was previously a leaf node replaces that leaf node.
+
+By default, echoed documents are flushed to stdout one at a time. For high-rate streams, the --flush-rows and
+--flush-interval options can be used to batch echo output. Pending output is flushed when the input stream closes,
+or on SIGTERM.
+
 SYNOPSIS
-csv_writer.py [{ -a | -x }] [-e] [-v] [FILENAME]
+csv_writer.py [{ -a | -u | -r }] [-x] [-e [-f FLUSH_ROWS] [-t FLUSH_INTERVAL]] [-v] [FILENAME]
 
 EXAMPLES
 socket_receiver.py | csv_writer.py temp.csv -e
+./gases_sampler.py -i10 | ./csv_writer.py -u gases.csv
 
 DOCUMENT EXAMPLE - INPUT
 {"tag": "scs-ap1-6", "rec": "2018-04-04T14:50:27.641+00:00", "val": {"hmd": 59.6, "tmp": 23.8}}
@@ -36,14 +52,20 @@ import sys
 
 from scs_core.csv.csv_writer import CSVWriter
 
+from scs_core.sys.signalled_exit import SignalledExit
+
 from scs_dev.cmd.cmd_csv_writer import CmdCSVWriter
 
+from scs_dev.writer.csv_schema_writer import CSVSchemaWriter
+from scs_dev.writer.output_buffer import OutputBuffer
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
 if __name__ == '__main__':
 
     writer = None
+    echo_buffer = None
 
     document_count = 0
     processed_count = 0
@@ -65,15 +87,25 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # resources...
 
-        writer = CSVWriter(filename=cmd.filename, append=cmd.append, exclude_header=cmd.exclude_header)
+        if cmd.union or cmd.roll:
+            writer = CSVSchemaWriter(filename=cmd.filename, exclude_header=cmd.exclude_header, roll=cmd.roll)
+        else:
+            writer = CSVWriter(filename=cmd.filename, append=cmd.append, exclude_header=cmd.exclude_header)
 
         if cmd.verbose:
             print("csv_writer: %s" % writer, file=sys.stderr)
 
+        # echo...
+        if cmd.echo:
+            echo_buffer = OutputBuffer(max_count=cmd.flush_rows, max_interval=cmd.flush_interval)
+
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
+        # signal handler...
+        SignalledExit.construct()
+
         for line in sys.stdin:
             jstr = line.strip()
 
@@ -84,8 +116,7 @@ if __name__ == '__main__':
 
             # echo...
             if cmd.echo:
-                print(jstr)
-                sys.stdout.flush()
+                echo_buffer.print(jstr)
 
             processed_count += 1
 
@@ -97,6 +128,9 @@ if __name__ == '__main__':
         print(file=sys.stderr)
 
     finally:
+        if echo_buffer is not None:
+            echo_buffer.flush()
+
         if writer is not None:
             writer.close()
 
@@ -43,13 +43,35 @@ fields for:
 Command-line options allow for single-shot reading, multiple readings with specified time intervals, or readings
 controlled by an independent scheduling process via a Unix semaphore.
 
+The SHT and the electrochemical sensors are read for each sample. The barometer is read once a minute, and the NDIR
+CO2 sensor at its own measurement interval, in the background - each sample takes their latest values. The sampling
+interval may therefore be shorter than the NDIR measurement interval. In debug mode, the age of each sensor's reading
+is reported for each sample.
+
+If the --oversample (-o) option is set, the SHT and electrochemical sensors are read OVERSAMPLES times per sampling
+interval, in the background. Each sample reports, for each electrochemical sensor field, the aggregate of the readings
+since the previous sample - by default, the mean excluding the largest and smallest readings. Each sensor's "ovs"
+field gives the number of readings, and the mean, median, trimmed mean and standard deviation of its concentration.
+The readings are summarised in running accumulators, and are not retained.
+
+If a gas model is configured, each sample is presented to the model server for inference. If the --async-inference
+(-y) flag is set, the inference of each sample overlaps the acquisition of the next, and each sample is reported
+after the next sample has been taken. An inference that is not available within the sampling interval is logged,
+and its sample is not reported - a stalled model server does not hold up sampling. If the model server remains
+stalled, its session is restarted.
+
 Support for the Alphasense NDIR was withdrawn on 9 Sep 2020.
 
 SYNOPSIS
-gases_sampler.py [{ -s SEMAPHORE | -i INTERVAL [-n SAMPLES] }] [{ -v | -d }]
+gases_sampler.py [{ -s SEMAPHORE | -i INTERVAL [-n SAMPLES] }] [-o OVERSAMPLES [-a { trimmed | median | mean }]]
+[-y] [{ -v | -d }]
 
 EXAMPLES
-./gases_sampler.py -i10
+./gases_sampler.py -i2
+
+./gases_sampler.py -s scs-gases -o10
+
+./gases_sampler.py -s scs-gases -y
 
 FILES
 ~/SCS/conf/afe_baseline.json
@@ -119,6 +141,7 @@ from scs_core.sys.system_id import SystemID
 from scs_core.model.gas.gas_model_conf import GasModelConf
 
 from scs_dev.cmd.cmd_sampler import CmdSampler
+from scs_dev.inference.async_inference_client import AsyncInferenceClient
 from scs_dev.sampler.gases_sampler import GasesSampler
 
 from scs_dfe.climate.pressure_conf import PressureConf
@@ -133,6 +156,16 @@ from scs_host.sync.schedule_runner import ScheduleRunner
 from scs_host.sys.host import Host
 
 
+# --------------------------------------------------------------------------------------------------------------------
+
+def inference_requests(gases_sampler, gases_interface):
+    for gases_sample in gases_sampler.samples():
+        with gases_sampler.bus_lock:
+            status = gases_interface.status()
+
+        yield gases_sample, status.temp
+
+
 # --------------------------------------------------------------------------------------------------------------------
 
 if __name__ == '__main__':
@@ -140,6 +173,7 @@ if __name__ == '__main__':
     ox_calibrator = None
     interface = None
     client = None
+    async_client = None
     sampler = None
     scd30 = None
 
@@ -150,7 +184,7 @@ if __name__ == '__main__':
     # ----------------------------------------------------------------------------------------------------------------
     # cmd...
 
-    cmd = CmdSampler()
+    cmd = CmdSampler(oversample=True, inference=True)
 
     if not cmd.is_valid():
         cmd.print_help(sys.stderr)
@@ -218,11 +252,6 @@ if __name__ == '__main__':
         scd30_conf = SCD30Conf.load(Host)
         scd30 = None if scd30_conf is None else scd30_conf.scd30()
 
-        if scd30_conf and (0 < cmd.interval <= scd30_conf.sample_interval):
-            logger.error("interval (%d) must be grater than SCD30Conf sample interval (%d)." %
-                         (cmd.interval, scd30_conf.sample_interval))
-            exit(2)
-
         if scd30_conf:
             logger.info(scd30_conf)
 
@@ -277,11 +306,25 @@ if __name__ == '__main__':
 
             client.wait_for_server()
 
+            if cmd.async_inference:
+                async_client = AsyncInferenceClient(client, schedule_item.interval)
+                logger.info(async_client)
+
+        # oversampling...
+        oversample_interval = None
+
+        if cmd.oversamples:
+            interval = cmd.interval if cmd.interval else schedule.item(semaphore).interval
+            oversample_interval = interval / cmd.oversamples
+
+            logger.info("oversample interval: %0.3f" % oversample_interval)
+
         # sampler...
         runner = TimedRunner(cmd.interval, cmd.samples) if cmd.semaphore is None \
             else ScheduleRunner(cmd.semaphore)
 
-        sampler = GasesSampler(runner, tag, barometer, scd30, sht, gas_sensor_interface)
+        sampler = GasesSampler(runner, tag, barometer, scd30, sht, gas_sensor_interface,
+                               oversample_interval=oversample_interval, aggregate=cmd.aggregate)
 
         logger.info(sampler)
 
@@ -298,11 +341,21 @@ if __name__ == '__main__':
         if inference_conf:
             logger.info("greengrass model: %s" % client.model_name())
 
-        for sample in sampler.samples():
+        if not inference_conf:
+            inferences = (((sample,), None) for sample in sampler.samples())
+
+        elif async_client:
+            async_client.start()
+            inferences = async_client.inferences(inference_requests(sampler, interface))
+
+        else:
+            inferences = ((request, client.infer(*request)) for request in inference_requests(sampler, interface))
+
+        for request, inference in inferences:
+            sample = request[0]
+
             # inference...
             if inference_conf:
-                inference = client.infer(sample, interface.status().temp)
-
                 if inference is None:
                     logger.error("inference rejected: %s" % JSONify.dumps(sample))
                     continue
@@ -313,6 +366,8 @@ if __name__ == '__main__':
 
             # report...
             logger.info("       rec: %s" % sample.rec.as_time())
+            logger.debug("  acquired: %s" % ', '.join("%s: -%0.3f" % (name, acquisition.age())
+                                                      for name, acquisition in sampler.acquisitions.items()))
             print(JSONify.dumps(sample))
             sys.stdout.flush()
 
@@ -330,9 +385,15 @@ if __name__ == '__main__':
         if cmd:
             logger.info("finishing")
 
+        if async_client:
+            async_client.stop()
+
         if client:
             client.close()
 
+        if sampler:
+            sampler.stop()
+
         if scd30:
             try:
                 scd30.stop_periodic_measurement()
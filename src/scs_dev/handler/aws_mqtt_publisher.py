@@ -4,12 +4,33 @@ Created on 27 Sep 2018
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
 import AWSIoTPythonSDK.exception.AWSIoTExceptions as AWSIoTExceptions
 
+If max_in_flight is greater than one, publications are pipelined: up to max_in_flight QoS 1 publications may await
+their PUBACK at any one time, and PUBACKs are handled asynchronously. A publication whose PUBACK has not arrived within
+ack_timeout is published again - other publications are not held up. publish(..) blocks only while the window is full.
+The client must then be an scs_dev MQTTClient.
+
+Each publication is given a sequence number as it is presented. acknowledged_count gives the number of publications
+presented before the oldest that still awaits its PUBACK, so that a durable queue may be committed up to that point
+without waiting for the window to empty.
+
+A publication is counted as acknowledged only once its PUBACK has been received. While the client is offline, the SDK
+holds publications in its volatile offline queue - such a publication is treated as unacknowledged, and is published
+again after ack_timeout, until a PUBACK is received. When pipelined, it holds its place in the window, so that no more
+than max_in_flight publications are held by the SDK. Otherwise, publish(..) blocks until it has been acknowledged. A
+publication may therefore be received more than once, but a durable queue is never committed past one that is held
+only by the SDK.
+
+If metrics are given, the latency of each acknowledged publication is recorded, as is each publication that fails,
+times out, or is queued by the SDK while the client is offline.
 """
 
 import time
 
+from collections import OrderedDict, deque
 from socket import gaierror
+from threading import Condition
 
+from AWSIoTPythonSDK.exception.AWSIoTExceptions import publishError
 from AWSIoTPythonSDK.exception.operationTimeoutException import operationTimeoutException
 
 from scs_core.aws.client.client_auth import ClientAuth
@@ -19,6 +40,7 @@ from scs_core.comms.mqtt_conf import MQTTConf
 
 from scs_core.data.queue_report import QueueReport, ClientStatus
 
+from scs_dev.handler.mqtt_metrics import MQTTMetrics
 from scs_dev.handler.mqtt_reporter import MQTTReporter
 
 
@@ -32,10 +54,20 @@ class AWSMQTTPublisher(object):
     __CONNECT_TIME =                3.0         # seconds
     __CONNECT_RETRY_TIME =         10.0         # seconds
 
+    __ACK_TIMEOUT =                60.0         # seconds - as the MQTTClient operation timeout
+    __SEND_RETRY_TIME =             1.0         # seconds
+    __FLUSH_TIMEOUT =              10.0         # seconds
+    __POLL_TIME =                   1.0         # seconds
+
+    __LATENCY_HISTORY =         10000           # latest PUBACK latencies retained
+
+    __QUEUED_KEY =              'queued'        # in-flight key prefix for publications queued by the SDK
+
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, conf: MQTTConf, auth: ClientAuth, client: MQTTClient, reporter: MQTTReporter):
+    def __init__(self, conf: MQTTConf, auth: ClientAuth, client: MQTTClient, reporter: MQTTReporter,
+                 max_in_flight=1, ack_timeout=__ACK_TIMEOUT, metrics: MQTTMetrics = None):
         """
         Constructor
         """
@@ -43,6 +75,20 @@ class AWSMQTTPublisher(object):
         self.__auth = auth
         self.__client = client
         self.__reporter = reporter
+        self.__metrics = metrics                                    # MQTTMetrics
+
+        # pipeline...
+        self.__max_in_flight = int(max_in_flight)                   # int
+        self.__ack_timeout = float(ack_timeout)                     # float seconds
+
+        self.__in_flight = OrderedDict()                            # dict of mid or queued key: AWSMQTTInFlight
+        self.__condition = Condition()
+
+        self.__presented_count = 0                                  # int
+        self.__queued_count = 0                                     # int
+        self.__ack_count = 0                                        # int
+        self.__retry_count = 0                                      # int
+        self.__latencies = deque(maxlen=self.__LATENCY_HISTORY)     # deque of float seconds
 
         # report...
         client_state = ClientStatus.INHIBITED if conf.inhibit_publishing else ClientStatus.WAITING
@@ -87,6 +133,10 @@ class AWSMQTTPublisher(object):
         if self.__conf.inhibit_publishing:
             return
 
+        # in-flight...
+        if self.is_pipelined() and not self.flush(self.__FLUSH_TIMEOUT):
+            self.__reporter.print("disconnect: unacknowledged: %d" % len(self.__in_flight))
+
         # disconnect...
         self.__client.disconnect()
 
@@ -101,7 +151,14 @@ class AWSMQTTPublisher(object):
             return
 
         # report...
-        self.__status.length = 1                # indicate that document(s) have been presented for publication
+        if not self.__status.length:
+            self.__status.length = 1            # indicate that document(s) have been presented for publication
+
+        self.__presented_count += 1
+
+        if self.is_pipelined():
+            self.__publish_pipelined(publication, self.__presented_count)
+            return
 
         # publish...
         while True:
@@ -111,9 +168,25 @@ class AWSMQTTPublisher(object):
                 elapsed = time.time() - start
 
                 self.__reporter.print("paho: %s: %0.3f" % ("1" if reached_paho else "0", elapsed))
-                break
+
+                if reached_paho:
+                    if self.__metrics is not None:
+                        self.__metrics.record_publish(elapsed)
+
+                    break
+
+                # queued by the SDK - not acknowledged...
+                self.__record_failure()
+
+                self.__status.publish_success = False
+                self.__report()
+
+                time.sleep(self.__ack_timeout)
 
             except operationTimeoutException:
+                if self.__metrics is not None:
+                    self.__metrics.record_failure()
+
                 # report...
                 self.__status.publish_success = False
                 self.__report()
@@ -123,6 +196,135 @@ class AWSMQTTPublisher(object):
         self.__report()
 
 
+    def flush(self, timeout=None):
+        end_time = None if timeout is None else time.time() + timeout
+
+        with self.__condition:
+            while self.__in_flight:
+                self.__retry_expired()
+
+                wait = self.__POLL_TIME if end_time is None else min(self.__POLL_TIME, end_time - time.time())
+
+                if wait <= 0:
+                    return False
+
+                self.__condition.wait(wait)
+
+        return True
+
+
+    def retry_expired(self):
+        with self.__condition:
+            self.__retry_expired()
+
+
+    def report_length(self, length):
+        if length == self.__status.length:
+            return
+
+        self.__status.length = length
+        self.__report()
+
+
+    def is_pipelined(self):
+        return self.__max_in_flight > 1
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __publish_pipelined(self, publication, sequence):
+        with self.__condition:
+            # window...
+            while True:
+                self.__retry_expired()
+
+                if len(self.__in_flight) < self.__max_in_flight:
+                    break
+
+                self.__condition.wait(self.__POLL_TIME)
+
+            # publish...
+            self.__send(AWSMQTTInFlight(publication, sequence, time.time()))
+
+
+    def __send(self, in_flight):                                    # the condition must be held
+        while True:
+            try:
+                mid = self.__client.publish_async(in_flight.publication, self.__on_ack)
+                break
+
+            except (publishError, OSError) as ex:
+                self.__reporter.print("publish: %s" % ex)
+                self.__set_publish_success(False)
+                self.__record_failure()
+
+                self.__condition.wait(self.__SEND_RETRY_TIME)       # PUBACKs may be received meanwhile
+
+        if mid is None:
+            self.__reporter.print("paho: queued")                   # the client is offline - no PUBACK will follow
+            self.__record_failure()
+
+            # retried when ack_timeout expires...
+            self.__queued_count += 1
+            mid = '%s-%d' % (self.__QUEUED_KEY, self.__queued_count)
+
+        in_flight.sent = time.time()
+        self.__in_flight[mid] = in_flight
+
+
+    def __retry_expired(self):                                      # the condition must be held
+        expiry = time.time() - self.__ack_timeout
+
+        while self.__in_flight:
+            mid, in_flight = next(iter(self.__in_flight.items()))
+
+            if in_flight.sent > expiry:
+                break                                               # later publications were sent later
+
+            del self.__in_flight[mid]
+
+            self.__reporter.print("puback: %s: timeout" % mid)
+            self.__set_publish_success(False)
+            self.__record_failure()
+
+            self.__retry_count += 1
+            self.__send(in_flight)
+
+
+    def __on_ack(self, mid, data=None):                             # called on an SDK thread
+        with self.__condition:
+            in_flight = self.__in_flight.pop(mid, None)
+
+            if in_flight is None:
+                return                                              # the publication timed out, and was sent again
+
+            latency = time.time() - in_flight.presented
+
+            self.__ack_count += 1
+            self.__latencies.append(latency)
+
+            if self.__metrics is not None:
+                self.__metrics.record_publish(latency)
+
+            self.__set_publish_success(True)
+            self.__condition.notify_all()
+
+        self.__reporter.print("puback: %s: %0.3f" % (mid, latency))
+
+
+    def __record_failure(self):
+        if self.__metrics is not None:
+            self.__metrics.record_failure()
+
+
+    def __set_publish_success(self, publish_success):
+        if self.__status.publish_success == publish_success:
+            return
+
+        self.__status.publish_success = publish_success
+        self.__report()
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __report(self):
@@ -130,8 +332,110 @@ class AWSMQTTPublisher(object):
         self.__reporter.set_led(self.__status)
 
 
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def max_in_flight(self):
+        return self.__max_in_flight
+
+
+    @property
+    def in_flight_count(self):
+        return len(self.__in_flight)
+
+
+    @property
+    def presented_count(self):
+        return self.__presented_count
+
+
+    @property
+    def acknowledged_count(self):                                   # publications presented before the oldest unacked
+        with self.__condition:
+            if not self.__in_flight:
+                return self.__presented_count
+
+            return min(in_flight.sequence for in_flight in self.__in_flight.values()) - 1
+
+
+    @property
+    def ack_count(self):
+        return self.__ack_count
+
+
+    @property
+    def retry_count(self):
+        return self.__retry_count
+
+
+    @property
+    def metrics(self):
+        return self.__metrics
+
+
+    @property
+    def latencies(self):
+        with self.__condition:
+            return list(self.__latencies)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "AWSMQTTPublisher:{conf:%s, auth:%s, client:%s, reporter:%s, max_in_flight:%s, ack_timeout:%s, " \
+               "report:%s}" % \
+               (self.__conf, self.__auth, self.__client, self.__reporter, self.max_in_flight, self.__ack_timeout,
+                self.__status)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class AWSMQTTInFlight(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, publication, sequence, presented):
+        """
+        Constructor
+        """
+        self.__publication = publication                            # Publication
+        self.__sequence = sequence                                  # int
+        self.__presented = presented                                # float time
+        self.__sent = None                                          # float time
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def publication(self):
+        return self.__publication
+
+
+    @property
+    def sequence(self):
+        return self.__sequence
+
+
+    @property
+    def presented(self):
+        return self.__presented
+
+
+    @property
+    def sent(self):
+        return self.__sent
+
+
+    @sent.setter
+    def sent(self, sent):
+        self.__sent = sent
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
-        return "AWSMQTTPublisher:{conf:%s, auth:%s, client:%s, reporter:%s, report:%s}" % \
-               (self.__conf, self.__auth, self.__client, self.__reporter, self.__status)
+        return "AWSMQTTInFlight:{publication:%s, sequence:%s, presented:%s, sent:%s}" % \
+               (self.publication, self.sequence, self.presented, self.sent)
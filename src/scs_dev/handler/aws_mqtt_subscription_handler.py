@@ -2,14 +2,32 @@
 Created on 27 Sep 2018
 
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+handle(..) is called on the MQTT client's network thread, so it must never block: it places the message in a bounded
+queue, and returns. A worker thread, started by start(), delivers queued messages to comms in order.
+
+If the queue is full - because the consumer is absent or slow - the oldest message is dropped, and counted. If
+persistent is set, the worker holds its comms connection open - comms must then use newline framing, for example
+DomainStreamWriter. Otherwise, a connection is made for each message.
+
+If framed is set, each message is delivered as a PublicationFrame - its payload is forwarded as received, without
+being parsed. comms must then be a DomainStreamWriter.
+
+stop() does not block: the worker is given __STOP_TIMEOUT to complete its delivery. A persistent connection is then
+closed, which releases a worker that is still waiting for an absent consumer - its message is lost.
 """
 
 import json
 import sys
 
+from collections import deque
+from threading import Condition, Thread
+
 from scs_core.data.json import JSONify
 from scs_core.data.publication import Publication
 
+from scs_dev.comms.publication_frame import PublicationFrame
+
 
 # --------------------------------------------------------------------------------------------------------------------
 # subscription handler...
@@ -19,15 +37,61 @@ class AWSMQTTSubscriptionHandler(object):
     classdocs
     """
 
+    DEFAULT_QUEUE_SIZE =        1000            # messages
+
+    __STOP_TIMEOUT =            2.0             # seconds
+
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, reporter, comms=None, echo=False):
+    def __init__(self, reporter, comms=None, echo=False, persistent=False, framed=False,
+                 queue_size=DEFAULT_QUEUE_SIZE):
         """
         Constructor
         """
         self.__reporter = reporter
         self.__comms = comms
         self.__echo = echo
+        self.__persistent = persistent
+        self.__framed = framed
+
+        self.__queue = deque(maxlen=queue_size)                     # deque of (string, bytes)
+        self.__condition = Condition()
+        self.__worker = None                                        # Thread
+        self.__running = False                                      # bool
+
+        self.__delivered_count = 0                                  # int
+        self.__drop_count = 0                                       # int
+        self.__reported_drop_count = 0                              # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def start(self):
+        with self.__condition:
+            if self.__running:
+                return
+
+            self.__running = True
+
+        self.__worker = Thread(target=self.__run, daemon=True)
+        self.__worker.start()
+
+
+    def stop(self):
+        with self.__condition:
+            self.__running = False
+            self.__condition.notify_all()
+
+        if self.__worker is not None:
+            self.__worker.join(self.__STOP_TIMEOUT)                 # the worker may be waiting for the consumer
+
+            if self.__worker.is_alive():
+                self.__reporter.print("stop: %s: consumer unavailable" % self.__comms.path)
+
+            self.__worker = None
+
+        if self.__persistent:
+            self.__comms.close()                                    # releases a worker waiting for the consumer
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -35,32 +99,92 @@ class AWSMQTTSubscriptionHandler(object):
     # noinspection PyUnusedLocal
 
     def handle(self, client, userdata, message):
-        payload = message.payload.decode()
-        payload_jdict = json.loads(payload)
+        with self.__condition:
+            if len(self.__queue) == self.__queue.maxlen:
+                self.__drop_count += 1                              # the oldest message is displaced
+
+            self.__queue.append((message.topic, message.payload))
+            self.__condition.notify_all()
 
-        publication = Publication(message.topic, payload_jdict)
 
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __run(self):
+        while True:
+            with self.__condition:
+                while self.__running and not self.__queue:
+                    self.__condition.wait()
+
+                if not self.__running:
+                    return
+
+                topic, payload = self.__queue.popleft()
+
+            if self.__framed:
+                message = PublicationFrame(topic, payload)          # the payload is forwarded as it stands
+
+            else:
+                try:
+                    message = JSONify.dumps(Publication(topic, json.loads(payload.decode())))
+
+                except ValueError as ex:
+                    self.__reporter.print("handle: %s: %s" % (ex, payload))
+                    continue
+
+            self.__deliver(message)
+
+            if self.__echo:
+                document = message.as_message() if self.__framed else message
+
+                print(document)
+                sys.stdout.flush()
+
+                self.__reporter.print("received: %s" % document)
+
+
+    def __deliver(self, message):
         try:
-            self.__comms.connect(wait_for_availability=True)
-            self.__comms.write(JSONify.dumps(publication), False)
+            if not self.__persistent:
+                self.__comms.connect(wait_for_availability=True)
+
+            self.__comms.write(message, True)
+            self.__delivered_count += 1
 
         except ConnectionError:
-            self.__reporter.print("handle: ConnectionError: %s" % self.__comms.address)
+            self.__reporter.print("handle: ConnectionError: %s" % self.__comms.path)
 
         finally:
-            self.__comms.close()
+            if not self.__persistent:
+                self.__comms.close()
 
-        if self.__echo:
-            print(JSONify.dumps(publication))
-            sys.stdout.flush()
+        # report...
+        drop_count = self.__drop_count
 
-            self.__reporter.print("received: %s" % JSONify.dumps(publication))
+        if drop_count > self.__reported_drop_count:
+            self.__reporter.print("handle: %s: dropped: %d" % (self.__comms.path, drop_count))
+            self.__reported_drop_count = drop_count
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __str__(self, *args, **kwargs):
-        return "AWSMQTTSubscriptionHandler:{reporter:%s, comms:%s, echo:%s}" % \
-               (self.__reporter, self.__comms, self.__echo)
+    @property
+    def queue_length(self):
+        return len(self.__queue)
+
+
+    @property
+    def delivered_count(self):
+        return self.__delivered_count
 
 
+    @property
+    def drop_count(self):
+        return self.__drop_count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "AWSMQTTSubscriptionHandler:{reporter:%s, comms:%s, echo:%s, persistent:%s, framed:%s, " \
+               "queue_size:%s}" % \
+               (self.__reporter, self.__comms, self.__echo, self.__persistent, self.__framed, self.__queue.maxlen)
@@ -0,0 +1,182 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+An MQTTClient that can also publish asynchronously - the PUBACK is signalled to a callback, rather than awaited. Its
+interface, configuration and connection behaviour match those of scs_core.aws.client.mqtt_client.MQTTClient, so that it
+may be managed by the MQTTClientManager.
+
+The SDK client is constructed by sdk_client(..), which may be overridden - for example, to connect to a local broker.
+
+A PublicationFrame may be published in place of a Publication - its payload is sent as it stands, without being
+parsed or encoded again.
+
+If metrics are given, the size of each payload handed to the SDK is recorded.
+
+https://s3.amazonaws.com/aws-iot-device-sdk-python-docs/sphinx/html/index.html
+"""
+
+import logging
+
+from AWSIoTPythonSDK.core.protocol.internal.events import FixedEventMids
+from AWSIoTPythonSDK.exception.AWSIoTExceptions import connectError, connectTimeoutException
+from AWSIoTPythonSDK.exception.AWSIoTExceptions import disconnectError, disconnectTimeoutException
+
+import AWSIoTPythonSDK.MQTTLib as MQTTLib
+
+from scs_core.data.json import JSONify
+from scs_core.data.str import Str
+
+from scs_dev.comms.publication_frame import PublicationFrame
+from scs_dev.handler.mqtt_metrics import MQTTMetrics
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class MQTTClient(object):
+    """
+    classdocs
+    """
+    __KEEP_ALIVE_INTERVAL =         1200                   # recommended: 30 default: 600 (seconds)
+
+    __PORT =                        8883
+
+    __QUEUE_SIZE =                  -1                      # recommended: infinite
+    __QUEUE_DRAINING_FREQUENCY =    2                       # recommended: 2 (Hz)
+
+    __RECONN_BASE =                 1                       # recommended: 1 (sec)
+    __RECONN_MAX =                  10                      # recommended: 32 or 128 (sec)
+    __RECONN_STABLE =               5                       # recommended: 20 (sec)
+
+    __DISCONNECT_TIMEOUT =          60                      # recommended: 10 (sec)
+    __OPERATION_TIMEOUT =           60                      # recommended: 5 (sec)
+
+    __PUB_QOS =                     1
+    __SUB_QOS =                     1
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __assert_logger(level):
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+
+        logger = logging.getLogger("AWSIoTPythonSDK.core")
+        logger.setLevel(level)
+        logger.addHandler(stream_handler)
+
+
+    @classmethod
+    def payload(cls, publication):
+        if isinstance(publication, PublicationFrame):
+            return publication.payload
+
+        return JSONify.dumps(publication.payload)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, *subscribers, metrics: MQTTMetrics = None):
+        """
+        Constructor
+        """
+        self.__client = None                                        # AWSIoTMQTTClient
+        self.__subscribers = subscribers                            # tuple of MQTTSubscriber
+        self.__metrics = metrics                                    # MQTTMetrics
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def connect(self, auth, debug=False):
+        # logging...
+        if debug:
+            self.__assert_logger(logging.DEBUG)
+
+        # client...
+        self.__client = self.sdk_client(auth)
+
+        # subscriptions...
+        for subscriber in self.__subscribers:
+            self.__client.subscribe(subscriber.topic, self.__SUB_QOS, subscriber.handler)
+
+        # connect...
+        try:
+            return self.__client.connect(keepAliveIntervalSecond=self.__KEEP_ALIVE_INTERVAL)
+
+        except (connectError, connectTimeoutException) as ex:
+            raise OSError(repr(ex))
+
+
+    def disconnect(self):
+        if self.__client is None:
+            return
+
+        try:
+            self.__client.disconnect()
+
+        except (disconnectError, disconnectTimeoutException):
+            pass
+
+        self.__client = None
+
+
+    def sdk_client(self, auth):
+        client = MQTTLib.AWSIoTMQTTClient(auth.client_id)
+
+        client.configureEndpoint(auth.endpoint, self.__PORT)
+        client.configureCredentials(auth.root_ca_file_path, auth.private_key_path, auth.certificate_path)
+
+        client.configureAutoReconnectBackoffTime(self.__RECONN_BASE, self.__RECONN_MAX, self.__RECONN_STABLE)
+
+        client.configureOfflinePublishQueueing(self.__QUEUE_SIZE)
+        client.configureDrainingFrequency(self.__QUEUE_DRAINING_FREQUENCY)
+
+        client.configureConnectDisconnectTimeout(self.__DISCONNECT_TIMEOUT)
+        client.configureMQTTOperationTimeout(self.__OPERATION_TIMEOUT)
+
+        return client
+
+
+    def publish(self, publication):
+        if not self.__client:
+            raise IOError("publish: no client")
+
+        payload = self.payload(publication)
+        self.__record_sent(payload)
+
+        return self.__client.publish(publication.topic, payload, self.__PUB_QOS)
+
+
+    def publish_async(self, publication, ack_callback):
+        """
+        Returns the packet ID, or None if the publication was queued by the SDK because the client is offline - in
+        that case, ack_callback will not be called. ack_callback is called with keyword argument mid, on an SDK thread.
+        """
+        if not self.__client:
+            raise IOError("publish_async: no client")
+
+        payload = self.payload(publication)
+        self.__record_sent(payload)
+
+        mid = self.__client.publishAsync(publication.topic, payload, self.__PUB_QOS, ackCallback=ack_callback)
+
+        return None if mid == FixedEventMids.QUEUED_MID else mid
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __record_sent(self, payload):
+        if self.__metrics is None:
+            return
+
+        self.__metrics.record_sent(len(payload) if isinstance(payload, bytes) else len(payload.encode()))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "MQTTClient:{subscribers:%s, metrics:%s}" % (Str.collection(self.__subscribers), self.__metrics)
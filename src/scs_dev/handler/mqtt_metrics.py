@@ -0,0 +1,471 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Publication metrics for aws_mqtt_client, over a rolling window:
+
+* publish-latency - from the presentation of a document to the publisher, to its PUBACK
+* queue-wait - the time that a document spends queued in aws_mqtt_client, before its presentation
+* sent - messages and bytes per second handed to the MQTT client, including retries
+* connection - reconnects and downtime
+
+The SDK reconnects by itself, so the connection is judged by the outcome of publications: an outage starts with the
+first publication that fails, times out, or is queued by the SDK because the client is offline, and ends with the
+next publication that is acknowledged. Each outage that ends is counted as a reconnect.
+
+Histograms and rates are held in SLOT_COUNT slots, each covering window / SLOT_COUNT seconds - the oldest slot is
+discarded as time passes. Histogram buckets are logarithmic, doubling from 1 millisecond. Percentiles are given as
+the upper bound of their bucket.
+
+An MQTTMetricsMonitor saves a snapshot of the metrics every interval seconds, and - if a path is given - answers each
+connection to a Unix domain socket with a snapshot.
+
+example JSON:
+{"rec": "2026-10-18T10:15:00Z", "up": 3600.0, "window": 300.0,
+"publish-latency": {"count": 298, "min": 0.081, "mean": 0.113, "p50": 0.128, "p90": 0.128, "p99": 0.256,
+"max": 0.402, "buckets": {"0.128": 270, "0.256": 25, "0.512": 3}},
+"queue-wait": {"count": 298, "min": 0.0, "mean": 0.001, "p50": 0.001, "p90": 0.001, "p99": 0.002, "max": 0.002,
+"buckets": {"0.001": 290, "0.002": 8}},
+"sent": {"msgs-per-sec": 1.0, "bytes-per-sec": 412.3, "msgs": 3583, "bytes": 1476199},
+"connection": {"connected": true, "reconnects": 1, "downtime": 42.3, "outage": null}}
+"""
+
+import os
+import time
+
+from abc import abstractmethod
+from bisect import bisect_left
+from collections import OrderedDict
+from threading import Event, Lock, Thread
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.json import JSONable, JSONify
+
+from scs_dev.comms.domain_query import DomainQueryServer
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class MQTTMetrics(JSONable):
+    """
+    classdocs
+    """
+
+    DEFAULT_WINDOW =        300.0               # seconds
+
+    __FILENAME =            "mqtt_metrics.json"
+
+    @classmethod
+    def filename(cls, report_file):
+        return os.path.join(os.path.dirname(report_file), cls.__FILENAME)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, window=DEFAULT_WINDOW, now=None):
+        """
+        Constructor
+        """
+        now = time.time() if now is None else now
+
+        self.__window = float(window)                               # float seconds
+        self.__start = now                                          # float time
+
+        self.__latency = RollingHistogram(window, now)              # RollingHistogram
+        self.__wait = RollingHistogram(window, now)                 # RollingHistogram
+        self.__sent = RollingCounter(window, now)                   # RollingCounter
+
+        self.__sent_count = 0                                       # int
+        self.__sent_bytes = 0                                       # int
+
+        self.__reconnect_count = 0                                  # int
+        self.__downtime = 0.0                                       # float seconds
+        self.__outage_start = None                                  # float time
+
+        self.__lock = Lock()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def record_publish(self, latency, now=None):
+        now = time.time() if now is None else now
+
+        with self.__lock:
+            self.__latency.record(latency, now)
+
+            if self.__outage_start is not None:
+                self.__downtime += now - self.__outage_start
+                self.__reconnect_count += 1
+                self.__outage_start = None
+
+
+    def record_failure(self, now=None):
+        now = time.time() if now is None else now
+
+        with self.__lock:
+            if self.__outage_start is None:
+                self.__outage_start = now
+
+
+    def record_wait(self, wait, now=None):
+        if wait is None:
+            return                                                  # the wait is not known
+
+        now = time.time() if now is None else now
+
+        with self.__lock:
+            self.__wait.record(wait, now)
+
+
+    def record_sent(self, size, now=None):
+        now = time.time() if now is None else now
+
+        with self.__lock:
+            self.__sent.record(size, now)
+
+            self.__sent_count += 1
+            self.__sent_bytes += size
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def save(self, filename, now=None):
+        jstr = JSONify.dumps(self.as_json(now=now))
+
+        # file...
+        tmp_filename = '.'.join((filename, str(os.getpid())))
+
+        try:
+            with open(tmp_filename, 'w') as f:
+                f.write(jstr + '\n')
+
+        except FileNotFoundError:                                   # the containing directory does not exist (yet)
+            return False
+
+        # atomic operation...
+        os.rename(tmp_filename, filename)
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, now=None, **kwargs):
+        now = time.time() if now is None else now
+
+        with self.__lock:
+            outage = None if self.__outage_start is None else now - self.__outage_start
+            msgs_per_sec, bytes_per_sec = self.__sent.rates(now)
+
+            sent = OrderedDict()
+            sent['msgs-per-sec'] = round(msgs_per_sec, 1)
+            sent['bytes-per-sec'] = round(bytes_per_sec, 1)
+            sent['msgs'] = self.__sent_count
+            sent['bytes'] = self.__sent_bytes
+
+            connection = OrderedDict()
+            connection['connected'] = outage is None
+            connection['reconnects'] = self.__reconnect_count
+            connection['downtime'] = round(self.__downtime + (0.0 if outage is None else outage), 1)
+            connection['outage'] = None if outage is None else round(outage, 1)
+
+            jdict = OrderedDict()
+
+            jdict['rec'] = LocalizedDatetime.construct_from_timestamp(now).utc()
+            jdict['up'] = round(now - self.__start, 1)
+            jdict['window'] = self.__window
+
+            jdict['publish-latency'] = self.__latency.summary(now)
+            jdict['queue-wait'] = self.__wait.summary(now)
+            jdict['sent'] = sent
+            jdict['connection'] = connection
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def window(self):
+        return self.__window
+
+
+    @property
+    def reconnect_count(self):
+        return self.__reconnect_count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "MQTTMetrics:{window:%s, sent_count:%s, reconnect_count:%s, outage_start:%s}" % \
+               (self.window, self.__sent_count, self.reconnect_count, self.__outage_start)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class MQTTMetricsMonitor(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_INTERVAL =      60.0                # seconds
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, metrics: MQTTMetrics, filename, uds_path=None, interval=DEFAULT_INTERVAL):
+        """
+        Constructor
+        """
+        self.__metrics = metrics                                    # MQTTMetrics
+        self.__filename = filename                                  # string
+        self.__interval = float(interval)                           # float seconds
+
+        self.__server = None if uds_path is None else DomainQueryServer(uds_path, self.__snapshot)
+
+        self.__stopping = Event()
+        self.__saver = None                                         # Thread
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def start(self):
+        self.__stopping.clear()
+
+        self.__saver = Thread(target=self.__save_when_due, daemon=True)
+        self.__saver.start()
+
+        if self.__server is not None:
+            self.__server.start()
+
+
+    def stop(self):
+        self.__stopping.set()
+
+        if self.__saver is not None:
+            self.__saver.join()
+            self.__saver = None
+
+        if self.__server is not None:
+            self.__server.stop()
+
+        try:
+            os.remove(self.__filename)                              # as the queue report
+        except OSError:
+            pass
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __save_when_due(self):
+        self.__metrics.save(self.__filename)
+
+        while not self.__stopping.wait(self.__interval):
+            self.__metrics.save(self.__filename)
+
+
+    def __snapshot(self):
+        return JSONify.dumps(self.__metrics)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def filename(self):
+        return self.__filename
+
+
+    @property
+    def uds_path(self):
+        return None if self.__server is None else self.__server.path
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "MQTTMetricsMonitor:{metrics:%s, filename:%s, server:%s, interval:%s}" % \
+               (self.__metrics, self.filename, self.__server, self.__interval)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class RollingWindow(object):
+    """
+    classdocs
+    """
+
+    SLOT_COUNT =            10
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, window, now):
+        """
+        Constructor
+        """
+        self.__slot_interval = float(window) / self.SLOT_COUNT      # float seconds
+        self.__start = now                                          # float time
+
+        self.__slots = [None] * self.SLOT_COUNT                     # list of slot
+        self.__epochs = [None] * self.SLOT_COUNT                    # list of int slot number
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @abstractmethod
+    def _empty_slot(self):
+        pass
+
+
+    def _slot(self, now):
+        epoch = int(now // self.__slot_interval)
+        index = epoch % self.SLOT_COUNT
+
+        if self.__epochs[index] != epoch:
+            self.__slots[index] = self._empty_slot()                # the slot is reused
+            self.__epochs[index] = epoch
+
+        return self.__slots[index]
+
+
+    def _live_slots(self, now):
+        epoch = int(now // self.__slot_interval)
+
+        return [slot for slot, slot_epoch in zip(self.__slots, self.__epochs)
+                if slot_epoch is not None and 0 <= epoch - slot_epoch < self.SLOT_COUNT]
+
+
+    def _span(self, now):
+        """
+        the time covered by the live slots
+        """
+        covered = (self.SLOT_COUNT - 1) * self.__slot_interval + now % self.__slot_interval
+
+        return min(covered, now - self.__start)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class RollingHistogram(RollingWindow):
+    """
+    classdocs
+    """
+
+    BOUNDS = tuple(0.001 * 2 ** i for i in range(21))               # bucket upper bounds, seconds - then overflow
+
+    __PERCENTILES = (('p50', 0.5), ('p90', 0.9), ('p99', 0.99))
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, window, now):
+        """
+        Constructor
+        """
+        super().__init__(window, now)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def _empty_slot(self):
+        return [[0] * (len(self.BOUNDS) + 1), 0.0, None, None]      # counts, total, min, max
+
+
+    def record(self, value, now):
+        slot = self._slot(now)
+
+        slot[0][bisect_left(self.BOUNDS, value)] += 1
+        slot[1] += value
+        slot[2] = value if slot[2] is None else min(slot[2], value)
+        slot[3] = value if slot[3] is None else max(slot[3], value)
+
+
+    def summary(self, now):
+        slots = self._live_slots(now)
+
+        counts = [sum(bucket) for bucket in zip(*(slot[0] for slot in slots))] if slots else []
+        count = sum(counts)
+
+        jdict = OrderedDict()
+        jdict['count'] = count
+
+        if not count:
+            return jdict
+
+        minimum = min(slot[2] for slot in slots if slot[2] is not None)
+        maximum = max(slot[3] for slot in slots if slot[3] is not None)
+
+        jdict['min'] = round(minimum, 3)
+        jdict['mean'] = round(sum(slot[1] for slot in slots) / count, 3)
+
+        for name, fraction in self.__PERCENTILES:
+            jdict[name] = round(self.__percentile(counts, count, fraction, maximum), 3)
+
+        jdict['max'] = round(maximum, 3)
+
+        buckets = OrderedDict()
+
+        for i, bucket_count in enumerate(counts):
+            if bucket_count:
+                buckets['%g' % self.BOUNDS[i] if i < len(self.BOUNDS) else 'more'] = bucket_count
+
+        jdict['buckets'] = buckets
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __percentile(self, counts, count, fraction, maximum):
+        rank = fraction * count
+        cumulative = 0
+
+        for i, bucket_count in enumerate(counts):
+            cumulative += bucket_count
+
+            if cumulative >= rank:
+                return min(self.BOUNDS[i], maximum) if i < len(self.BOUNDS) else maximum
+
+        return maximum
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class RollingCounter(RollingWindow):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, window, now):
+        """
+        Constructor
+        """
+        super().__init__(window, now)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def _empty_slot(self):
+        return [0, 0]                                               # count, total
+
+
+    def record(self, amount, now):
+        slot = self._slot(now)
+
+        slot[0] += 1
+        slot[1] += amount
+
+
+    def rates(self, now):
+        """
+        returns (count per second, total per second)
+        """
+        span = self._span(now)
+
+        if span <= 0:
+            return 0.0, 0.0
+
+        slots = self._live_slots(now)
+
+        return sum(slot[0] for slot in slots) / span, sum(slot[1] for slot in slots) / span
@@ -0,0 +1,242 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A PublicationBatcher coalesces the documents presented for each topic into batches. A batch window opens when a
+document is appended to an empty batcher, and closes interval seconds later - every batch is then flushed. A batch is
+also flushed early if adding a document would take its uncompressed size above max_size.
+
+Each batch is published as a single document on the original topic - a PublicationBatch envelope:
+
+{"batch": {"ver": 1, "enc": "json", "count": 3, "docs": [{...}, {...}, {...}]}}
+
+If compression is selected, docs is the zlib-compressed, base64-encoded, compact JSON form of the list of documents,
+and enc is "zlib+base64". PublicationBatch.construct_from_jdict(..) recovers the documents.
+"""
+
+import base64
+import json
+import time
+import zlib
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable, JSONify
+from scs_core.data.publication import Publication
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class PublicationBatcher(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_MAX_SIZE =          65536           # bytes - uncompressed - AWS IoT messages may be up to 128 KB
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, interval, max_size=DEFAULT_MAX_SIZE, compress=False):
+        """
+        Constructor
+        """
+        self.__interval = float(interval)                           # float seconds
+        self.__max_size = int(max_size)                             # int bytes
+        self.__compress = bool(compress)                            # bool
+
+        self.__batches = OrderedDict()                              # dict of topic: PublicationBatch
+        self.__window_end = None                                    # float time
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, publication: Publication):
+        """
+        Returns a list of Publications - the batch for the topic, if it had to be flushed to accept the document.
+        """
+        size = len(JSONify.dumps(publication.payload, separators=(',', ':')))
+        flushed = []
+
+        batch = self.__batches.get(publication.topic)
+
+        if batch is not None and batch.size + size > self.__max_size:
+            flushed.append(Publication(publication.topic, batch.as_json()))
+            batch = None
+
+        if batch is None:
+            batch = PublicationBatch(compress=self.__compress)
+            self.__batches[publication.topic] = batch
+
+        batch.append(publication.payload, size)
+
+        if self.__window_end is None:
+            self.__window_end = time.time() + self.__interval
+
+        return flushed
+
+
+    def flush(self):
+        """
+        Returns a list of Publications - every batch, in order of topic first presented.
+        """
+        flushed = [Publication(topic, batch.as_json()) for topic, batch in self.__batches.items()]
+
+        self.__batches = OrderedDict()
+        self.__window_end = None
+
+        return flushed
+
+
+    def is_due(self):
+        return self.__window_end is not None and time.time() >= self.__window_end
+
+
+    def is_empty(self):
+        return not self.__batches
+
+
+    def wait_time(self):
+        """
+        Returns the time in seconds until the batch window closes, or None if no window is open.
+        """
+        if self.__window_end is None:
+            return None
+
+        return max(self.__window_end - time.time(), 0.0)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def interval(self):
+        return self.__interval
+
+
+    @property
+    def max_size(self):
+        return self.__max_size
+
+
+    @property
+    def compress(self):
+        return self.__compress
+
+
+    @property
+    def count(self):
+        return sum(len(batch) for batch in self.__batches.values())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "PublicationBatcher:{interval:%s, max_size:%s, compress:%s, topics:%s, count:%s}" % \
+               (self.interval, self.max_size, self.compress, len(self.__batches), self.count)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class PublicationBatch(JSONable):
+    """
+    classdocs
+    """
+
+    VERSION =           1
+
+    ENCODING_JSON =     'json'
+    ENCODING_ZLIB =     'zlib+base64'
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def is_batch(cls, payload):
+        return isinstance(payload, dict) and isinstance(payload.get('batch'), dict)
+
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not cls.is_batch(jdict):
+            return None
+
+        batch = jdict['batch']
+
+        version = batch.get('ver')
+        encoding = batch.get('enc')
+        docs = batch.get('docs')
+
+        if version != cls.VERSION:
+            raise ValueError("unsupported batch version: %s" % version)
+
+        if encoding == cls.ENCODING_ZLIB:
+            docs = json.loads(zlib.decompress(base64.b64decode(docs)).decode())
+
+        elif encoding != cls.ENCODING_JSON:
+            raise ValueError("unsupported batch encoding: %s" % encoding)
+
+        return cls(docs=docs, compress=encoding == cls.ENCODING_ZLIB)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, docs=None, compress=False):
+        """
+        Constructor
+        """
+        self.__docs = [] if docs is None else list(docs)            # list of dict
+        self.__compress = bool(compress)                            # bool
+
+        self.__size = 0                                             # int bytes - compact JSON
+
+
+    def __len__(self):
+        return len(self.__docs)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, doc, size):
+        self.__docs.append(doc)
+        self.__size += size + 1                                     # with its separator
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['ver'] = self.VERSION
+        jdict['enc'] = self.ENCODING_ZLIB if self.compress else self.ENCODING_JSON
+        jdict['count'] = len(self)
+
+        if self.compress:
+            jstr = JSONify.dumps(self.docs, separators=(',', ':'))
+            jdict['docs'] = base64.b64encode(zlib.compress(jstr.encode(), 9)).decode()
+
+        else:
+            jdict['docs'] = self.docs
+
+        return {'batch': jdict}
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def docs(self):
+        return self.__docs
+
+
+    @property
+    def compress(self):
+        return self.__compress
+
+
+    @property
+    def size(self):
+        return self.__size
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "PublicationBatch:{compress:%s, count:%s, size:%s}" % (self.compress, len(self), self.size)
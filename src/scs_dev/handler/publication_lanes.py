@@ -0,0 +1,240 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+PublicationLanes hold the messages presented for publication in bounded priority lanes: control, status, live and
+backlog. A message is routed by the last node of its topic path - control or status - otherwise it is a sample. A
+sample whose rec is more than BACKLOG_AGE seconds old is backlog. The payload of a PublicationFrame is not parsed -
+its rec is found by a scan.
+
+get(..) always returns a message from the highest-priority lane that is not empty. last_wait then gives the time that
+the message spent in its lane.
+
+put(..) blocks while the message's lane is full. Where messages are read from a Unix domain socket, the reader then
+stops reading, so upstream writers are blocked in turn - this is the backpressure. Since only one lane is ever waited
+on, a control message behind a blocked sample waits no longer than it takes to publish a single sample.
+"""
+
+import json
+import time
+
+from collections import deque
+from queue import Empty
+from threading import Condition
+
+from scs_core.data.datetime import LocalizedDatetime
+
+from scs_dev.comms.publication_frame import PublicationFrame
+from scs_dev.handler.mqtt_reporter import MQTTReporter
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class PublicationLanes(object):
+    """
+    classdocs
+    """
+
+    CONTROL =       0
+    STATUS =        1
+    LIVE =          2
+    BACKLOG =       3
+
+    NAMES = ('control', 'status', 'live', 'backlog')
+
+    DEFAULT_CAPACITY =          1000                    # messages per lane
+    BACKLOG_AGE =               60.0                    # seconds
+
+    __SUBJECTS = {'control': CONTROL, 'status': STATUS}
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def lane(cls, message, now=None):
+        if isinstance(message, PublicationFrame):
+            subject_lane = cls.subject_lane(message.topic)
+
+            if subject_lane is not None:
+                return subject_lane
+
+            return cls.__sample_lane(LocalizedDatetime.construct_from_iso8601(message.rec()), now)
+
+        try:
+            jdict = json.loads(message)
+
+            for topic, payload in jdict.items():
+                subject_lane = cls.subject_lane(topic)
+
+                if subject_lane is not None:
+                    return subject_lane
+
+                rec = LocalizedDatetime.construct_from_iso8601(payload.get('rec'))
+                break
+
+            else:
+                return cls.LIVE
+
+        except (AttributeError, TypeError, ValueError):
+            return cls.LIVE                             # invalid messages are reported on publication
+
+        return cls.__sample_lane(rec, now)
+
+
+    @classmethod
+    def __sample_lane(cls, rec, now):
+        if rec is None:
+            return cls.LIVE
+
+        now = time.time() if now is None else now
+
+        return cls.BACKLOG if now - rec.timestamp() > cls.BACKLOG_AGE else cls.LIVE
+
+
+    @classmethod
+    def subject_lane(cls, topic):
+        return cls.__SUBJECTS.get(topic.split('/')[-1])
+
+
+    @classmethod
+    def is_urgent(cls, lane):
+        return lane < cls.LIVE
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, reporter: MQTTReporter = None):
+        """
+        Constructor
+        """
+        self.__capacity = int(capacity)                             # int messages per lane
+        self.__reporter = reporter                                  # MQTTReporter
+
+        self.__lanes = tuple(deque() for _ in self.NAMES)           # tuple of deque of (float time, message)
+        self.__condition = Condition()
+        self.__closed = False                                       # bool
+
+        self.__last_wait = None                                     # float seconds
+
+        self.__blocked_count = 0                                    # int
+        self.__blocked_time = 0.0                                   # float seconds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def put(self, message, lane=None):
+        """
+        Blocks while the lane is full. A message of None marks the end of input.
+        """
+        if message is None:
+            self.close()
+            return
+
+        lane = self.lane(message) if lane is None else lane
+
+        with self.__condition:
+            if len(self.__lanes[lane]) >= self.__capacity:
+                self.__backpressure(lane)
+
+            self.__lanes[lane].append((time.time(), message))
+            self.__condition.notify_all()
+
+
+    def get(self, timeout=None):
+        """
+        Returns the message with the highest priority, or None if the input has ended. Raises queue.Empty on timeout.
+        """
+        end_time = None if timeout is None else time.time() + timeout
+
+        with self.__condition:
+            while True:
+                for lane in self.__lanes:
+                    if lane:
+                        return self.__pop(lane)
+
+                if self.__closed:
+                    return None
+
+                wait = None if end_time is None else end_time - time.time()
+
+                if wait is not None and wait <= 0:
+                    raise Empty()
+
+                self.__condition.wait(wait)
+
+
+    def get_urgent(self):
+        """
+        Returns a control or status message if one is waiting, otherwise None. Does not block.
+        """
+        with self.__condition:
+            for lane in self.__lanes[:self.LIVE]:
+                if lane:
+                    return self.__pop(lane)
+
+        return None
+
+
+    def close(self):
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify_all()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __pop(self, lane):                                          # the condition must be held
+        queued, message = lane.popleft()
+
+        self.__last_wait = time.time() - queued
+        self.__condition.notify_all()
+
+        return message
+
+
+    def __backpressure(self, lane):                                 # the condition must be held
+        self.__blocked_count += 1
+        start = time.time()
+
+        if self.__reporter:
+            self.__reporter.print("lanes: %s: full" % self.NAMES[lane])
+
+        while len(self.__lanes[lane]) >= self.__capacity:
+            self.__condition.wait()
+
+        self.__blocked_time += time.time() - start
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def capacity(self):
+        return self.__capacity
+
+
+    @property
+    def lengths(self):
+        with self.__condition:
+            return [len(lane) for lane in self.__lanes]
+
+
+    @property
+    def last_wait(self):
+        return self.__last_wait
+
+
+    @property
+    def blocked_count(self):
+        return self.__blocked_count
+
+
+    @property
+    def blocked_time(self):
+        return self.__blocked_time
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "PublicationLanes:{capacity:%s, lengths:%s, closed:%s, blocked_count:%s, blocked_time:%0.1f}" % \
+               (self.capacity, self.lengths, self.__closed, self.blocked_count, self.blocked_time)
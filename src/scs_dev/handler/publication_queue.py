@@ -0,0 +1,514 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A PublicationQueue is a durable, append-only queue of messages, held in a directory of memory-mapped segment files.
+Messages are appended by a producer, and read in order by a single consumer.
+
+Each record is a little-endian header - payload length and CRC-32 of the payload - followed by the UTF-8 payload.
+A message may be a string, or a PublicationFrame - a frame is stored in its wire form, and is returned as a frame.
+Segments are pre-allocated and zero-filled, so a zero length marks the end of the records in a segment. When a record
+does not fit, a new segment is started.
+
+Appends are written to the mapped segment immediately, but are synced to storage as a group - every commit_count
+records or commit_interval seconds, whichever comes first - so that an SD card is not synced for every message.
+
+The consumer's position is persisted in an offset file by commit(..). This should be called once the messages read
+so far have been delivered - or, given a position taken earlier from the position property, once the messages read
+before that position have been delivered. Segments that precede the committed position are deleted. After a restart,
+reading resumes from the committed position - delivery is at least once.
+
+On opening, the last segment is scanned, and any torn or corrupt record at its end is discarded.
+
+After next(..), last_wait gives the time that the message spent in the queue, or None if the message was appended
+before the queue was opened.
+"""
+
+import json
+import mmap
+import os
+import struct
+import time
+import zlib
+
+from collections import deque
+from threading import Condition
+
+from scs_dev.comms.publication_frame import PublicationFrame
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class PublicationQueue(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_SEGMENT_SIZE =      16 * 1024 * 1024        # bytes
+    DEFAULT_COMMIT_COUNT =      1000                    # records
+    DEFAULT_COMMIT_INTERVAL =   0.1                     # seconds
+
+    OFFSET_INTERVAL =           1.0                     # seconds - recommended interval for consumer commits
+
+    __OFFSET_FILENAME = "consumer-offset.json"
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def open(cls, directory, segment_size=DEFAULT_SEGMENT_SIZE, commit_count=DEFAULT_COMMIT_COUNT,
+             commit_interval=DEFAULT_COMMIT_INTERVAL):
+        os.makedirs(directory, exist_ok=True)
+
+        queue = cls(directory, segment_size, commit_count, commit_interval)
+        queue.__recover()
+
+        return queue
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, directory, segment_size, commit_count, commit_interval):
+        """
+        Constructor
+        """
+        self.__directory = directory                    # string
+        self.__segment_size = int(segment_size)         # int bytes
+        self.__commit_count = int(commit_count)         # int
+        self.__commit_interval = float(commit_interval) # float seconds
+
+        self.__writer = None                            # PublicationQueueSegment
+        self.__reader = None                            # PublicationQueueSegment
+        self.__read_position = 0                        # int
+
+        self.__committed_segment = None                 # int
+        self.__committed_position = None                # int
+
+        self.__length = 0                               # int unread records
+        self.__unsynced_count = 0                       # int
+        self.__sync_time = time.time()                  # float
+
+        self.__append_times = deque()                   # deque of float time, for records appended since opening
+        self.__last_wait = None                         # float seconds
+
+        self.__condition = Condition()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, message):
+        payload = message.as_bytes() if isinstance(message, PublicationFrame) else message.encode()
+
+        with self.__condition:
+            if not self.__writer.append(payload):
+                self.__writer.sync()
+
+                size = max(self.__segment_size, PublicationQueueSegment.size(payload))
+                previous = self.__writer
+
+                self.__writer = PublicationQueueSegment.create(self.__directory, previous.number + 1, size)
+                self.__writer.append(payload)
+
+                if previous is not self.__reader:
+                    previous.close()
+
+            self.__length += 1
+            self.__unsynced_count += 1
+
+            self.__append_times.append(time.time())
+
+            if self.__unsynced_count >= self.__commit_count or \
+                    time.time() - self.__sync_time >= self.__commit_interval:
+                self.__sync()
+
+            self.__condition.notify_all()
+
+
+    def next(self, timeout=None):
+        end_time = None if timeout is None else time.time() + timeout
+
+        with self.__condition:
+            while True:
+                record = self.__reader.read(self.__read_position)
+
+                if record is not None:
+                    message, self.__read_position = record
+
+                    if len(self.__append_times) >= self.__length:
+                        self.__last_wait = time.time() - self.__append_times.popleft()
+
+                    else:
+                        self.__last_wait = None         # appended before the queue was opened
+
+                    self.__length -= 1
+
+                    if PublicationFrame.is_frame(message):
+                        return PublicationFrame.construct_from_bytes(message)
+
+                    return message.decode()
+
+                # next segment...
+                if self.__reader.number < self.__writer.number:
+                    number = self.__reader.number + 1
+                    previous = self.__reader
+
+                    self.__reader = self.__writer if number == self.__writer.number else \
+                        PublicationQueueSegment.open(self.__directory, number)
+                    self.__read_position = 0
+
+                    if previous is not self.__writer:
+                        previous.close()
+
+                    continue
+
+                # wait...
+                wait = None if end_time is None else end_time - time.time()
+
+                if wait is not None and wait <= 0:
+                    return None
+
+                self.__condition.wait(wait)
+
+
+    def sync(self):
+        with self.__condition:
+            self.__sync()
+
+
+    def sync_if_due(self):
+        with self.__condition:
+            if self.__unsynced_count and time.time() - self.__sync_time >= self.__commit_interval:
+                self.__sync()
+
+
+    def commit(self, position=None):
+        if position is None:
+            position = self.position
+
+        segment, position = position
+
+        if (segment, position) == (self.__committed_segment, self.__committed_position):
+            return
+
+        # offset...
+        jstr = json.dumps({'segment': segment, 'position': position})
+        tmp_filename = self.__offset_filename() + '.tmp'
+
+        with open(tmp_filename, 'w') as file:
+            file.write(jstr + '\n')
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(tmp_filename, self.__offset_filename())
+
+        self.__committed_segment = segment
+        self.__committed_position = position
+
+        # consumed segments...
+        for number in PublicationQueueSegment.numbers(self.__directory):
+            if number >= segment:
+                break
+
+            PublicationQueueSegment.delete(self.__directory, number)
+
+
+    def close(self):
+        with self.__condition:
+            if self.__writer is None:
+                return
+
+            self.__sync()
+
+            if self.__reader is not self.__writer:
+                self.__reader.close()
+
+            self.__writer.close()
+
+            self.__reader = None
+            self.__writer = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __recover(self):
+        numbers = PublicationQueueSegment.numbers(self.__directory)
+
+        # consumer...
+        try:
+            with open(self.__offset_filename()) as file:
+                jdict = json.load(file)
+
+            segment = jdict['segment']
+            position = jdict['position']
+
+        except (OSError, ValueError, KeyError):
+            segment = numbers[0] if numbers else 0
+            position = 0
+
+        if not numbers or segment > numbers[-1]:
+            numbers.append(segment)
+            PublicationQueueSegment.create(self.__directory, segment, self.__segment_size).close()
+
+        elif segment < numbers[0]:
+            segment = numbers[0]                        # the committed segment has been deleted
+            position = 0
+
+        self.__committed_segment = segment
+        self.__committed_position = position
+
+        # writer...
+        self.__writer = PublicationQueueSegment.open(self.__directory, numbers[-1])
+        self.__writer.recover()
+
+        # reader...
+        self.__reader = self.__writer if segment == numbers[-1] else \
+            PublicationQueueSegment.open(self.__directory, segment)
+        self.__read_position = position
+
+        # length...
+        for number in numbers:
+            if number < segment:
+                continue
+
+            if number == self.__writer.number:
+                counted = self.__writer
+
+            elif number == segment:
+                counted = self.__reader
+
+            else:
+                counted = PublicationQueueSegment.open(self.__directory, number)
+
+            self.__length += counted.count(self.__read_position if number == segment else 0)
+
+            if counted is not self.__writer and counted is not self.__reader:
+                counted.close()
+
+
+    def __sync(self):
+        self.__writer.sync()
+
+        self.__unsynced_count = 0
+        self.__sync_time = time.time()
+
+
+    def __offset_filename(self):
+        return os.path.join(self.__directory, self.__OFFSET_FILENAME)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def position(self):                                 # the (segment, position) following the last message read
+        with self.__condition:
+            return self.__reader.number, self.__read_position
+
+
+    @property
+    def directory(self):
+        return self.__directory
+
+
+    @property
+    def length(self):
+        return self.__length
+
+
+    @property
+    def last_wait(self):
+        return self.__last_wait
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "PublicationQueue:{directory:%s, segment_size:%s, commit_count:%s, commit_interval:%s, " \
+               "committed_segment:%s, committed_position:%s, length:%s}" % \
+               (self.directory, self.__segment_size, self.__commit_count, self.__commit_interval,
+                self.__committed_segment, self.__committed_position, self.length)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class PublicationQueueSegment(object):
+    """
+    classdocs
+    """
+
+    __HEADER = struct.Struct('<II')                     # length, CRC-32
+
+    __SUFFIX = ".seg"
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def size(cls, payload):                             # the segment size required for the payload alone
+        return cls.__HEADER.size + len(payload) + cls.__HEADER.size
+
+
+    @classmethod
+    def numbers(cls, directory):
+        return sorted(int(filename[:-len(cls.__SUFFIX)]) for filename in os.listdir(directory)
+                      if filename.endswith(cls.__SUFFIX))
+
+
+    @classmethod
+    def create(cls, directory, number, size):
+        filename = cls.__filename(directory, number)
+
+        with open(filename, 'wb') as file:
+            file.truncate(size)                         # zero-filled
+            file.flush()
+            os.fsync(file.fileno())
+
+        return cls.open(directory, number)
+
+
+    @classmethod
+    def open(cls, directory, number):
+        filename = cls.__filename(directory, number)
+
+        with open(filename, 'r+b') as file:
+            buffer = mmap.mmap(file.fileno(), 0)
+
+        return cls(number, filename, buffer)
+
+
+    @classmethod
+    def delete(cls, directory, number):
+        try:
+            os.remove(cls.__filename(directory, number))
+        except FileNotFoundError:
+            pass
+
+
+    @classmethod
+    def __filename(cls, directory, number):
+        return os.path.join(directory, "%020d%s" % (number, cls.__SUFFIX))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, number, filename, buffer):
+        """
+        Constructor
+        """
+        self.__number = number                          # int
+        self.__filename = filename                      # string
+        self.__buffer = buffer                          # mmap
+
+        self.__end = 0                                  # int position after the last record written
+        self.__synced = 0                               # int position up to which records have been synced
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def recover(self):
+        position = 0
+
+        while True:
+            record = self.read(position)
+
+            if record is None:
+                break
+
+            _, position = record
+
+        # discard any torn record...
+        remainder = bytes(len(self.__buffer) - position)
+
+        if self.__buffer[position:] != remainder:
+            self.__buffer[position:] = remainder
+            self.__buffer.flush()
+
+        self.__end = position
+        self.__synced = position
+
+
+    def count(self, position):
+        count = 0
+
+        while True:
+            record = self.read(position)
+
+            if record is None:
+                return count
+
+            _, position = record
+            count += 1
+
+
+    def append(self, payload):
+        end = self.__end + self.__HEADER.size + len(payload)
+
+        if end + self.__HEADER.size > len(self.__buffer):
+            return False                                # the end marker must also fit
+
+        self.__buffer[self.__end + self.__HEADER.size:end] = payload
+        self.__buffer[self.__end:self.__end + self.__HEADER.size] = \
+            self.__HEADER.pack(len(payload), zlib.crc32(payload))
+
+        self.__end = end
+
+        return True
+
+
+    def read(self, position):
+        if position + self.__HEADER.size > len(self.__buffer):
+            return None
+
+        length, crc = self.__HEADER.unpack_from(self.__buffer, position)
+
+        if length == 0:
+            return None
+
+        start = position + self.__HEADER.size
+        end = start + length
+
+        if end > len(self.__buffer):
+            return None
+
+        payload = self.__buffer[start:end]
+
+        if zlib.crc32(payload) != crc:
+            return None
+
+        return payload, end
+
+
+    def sync(self):
+        if self.__end == self.__synced:
+            return
+
+        start = self.__synced - self.__synced % mmap.ALLOCATIONGRANULARITY
+        self.__buffer.flush(start, self.__end - start)
+
+        self.__synced = self.__end
+
+
+    def close(self):
+        self.sync()
+        self.__buffer.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def number(self):
+        return self.__number
+
+
+    @property
+    def filename(self):
+        return self.__filename
+
+
+    @property
+    def end(self):
+        return self.__end
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "PublicationQueueSegment:{number:%s, filename:%s, end:%s}" % (self.number, self.filename, self.end)
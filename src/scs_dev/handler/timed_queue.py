@@ -0,0 +1,57 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A FIFO Queue that times its items: after get(..), last_wait gives the time that the item spent in the queue.
+
+https://docs.python.org/3/library/queue.html
+"""
+
+import time
+
+from queue import Queue
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TimedQueue(Queue):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, maxsize=0):
+        """
+        Constructor
+        """
+        super().__init__(maxsize=maxsize)
+
+        self.__last_wait = None                                     # float seconds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def _put(self, item):                                           # the queue's mutex is held
+        self.queue.append((time.time(), item))
+
+
+    def _get(self):                                                 # the queue's mutex is held
+        queued, item = self.queue.popleft()
+        self.__last_wait = time.time() - queued
+
+        return item
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def last_wait(self):
+        return self.__last_wait
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "TimedQueue:{maxsize:%s, length:%s, last_wait:%s}" % (self.maxsize, self.qsize(), self.last_wait)
@@ -0,0 +1,226 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+An asynchronous mode for an scs_core gas or PMx inference client, for live sampling.
+
+Each request is inferred on a worker thread, so that the inference of one sample overlaps the acquisition of the
+next: inferences(..) yields each request and its inference after the following request has been acquired - or, for
+the final request, when the requests are exhausted.
+
+An inference that is not available within timeout seconds of its submission is reported as None. While the model
+server is stalled, requests are not submitted, and are reported as None without waiting - the sampling process is
+never held up by more than the timeout. Once the server responds, the late inference is discarded, and submission
+resumes. The client's UDSClient is only used by the worker thread, so responses are never mismatched to requests.
+
+If the server does not respond within restart_wait of the deadline of the stalled request, the stalled worker is
+abandoned, and the client's session is restarted on a new worker - the client is closed, and its server awaited
+again. The restart wait is doubled after each restart that does not lead to an inference, up to MAX_RESTART_WAIT.
+"""
+
+import time
+
+from queue import Queue
+from threading import Event, Thread
+
+from scs_core.sys.logging import Logging
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class AsyncInferenceClient(object):
+    """
+    classdocs
+    """
+
+    RESTART_TIMEOUTS =  3                                           # the initial restart wait, in timeouts
+    MAX_RESTART_WAIT =  600.0                                       # seconds
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, client, timeout):
+        """
+        Constructor
+        """
+        self.__client = client                                      # GasInferenceClient or PMxInferenceClient
+        self.__timeout = float(timeout)                             # float seconds
+
+        self.__jobs = None                                          # Queue of InferenceJob, for the current worker
+        self.__job = None                                           # InferenceJob - the latest submitted
+        self.__worker = None                                        # Thread
+
+        self.__restart_wait = self.__initial_restart_wait()         # float seconds
+        self.__restart_count = 0                                    # int
+
+        self.__logger = Logging.getLogger()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def start(self):
+        if self.__worker is not None:
+            return
+
+        self.__start_worker(False)
+
+
+    def stop(self):
+        if self.__worker is None:
+            return
+
+        self.__jobs.put(None)
+        self.__worker = None                                        # a stalled worker is not joined
+
+
+    def restart(self):
+        self.__logger.error("inference server stalled - restarting session")
+
+        self.stop()
+
+        try:
+            self.__client.close()                                   # the stalled worker may be released
+
+        except Exception as ex:
+            self.__logger.error("inference client close failed: %s" % repr(ex))
+
+        self.__job = None
+        self.__restart_count += 1
+        self.__restart_wait = min(self.__restart_wait * 2, self.MAX_RESTART_WAIT)
+
+        self.__start_worker(True)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def submit(self, *args):
+        if self.stalled:
+            if time.time() < self.__job.deadline + self.__restart_wait:
+                return None
+
+            self.restart()
+
+        self.__job = InferenceJob(args, time.time() + self.__timeout)
+        self.__jobs.put(self.__job)
+
+        return self.__job
+
+
+    def result(self, job):
+        if job is None:
+            self.__logger.error("inference server stalled - request not submitted")
+            return None
+
+        if not job.done.wait(max(job.deadline - time.time(), 0.0)):
+            self.__logger.error("inference timed out after %0.1f seconds" % self.__timeout)
+            return None
+
+        if job.error is not None:
+            raise job.error
+
+        self.__restart_wait = self.__initial_restart_wait()
+
+        return job.inference
+
+
+    def inferences(self, requests):
+        pending = None                                              # (args, InferenceJob)
+
+        for args in requests:                                       # acquisition overlaps the pending inference
+            if pending is not None:
+                yield pending[0], self.result(pending[1])
+
+            pending = (args, self.submit(*args))
+
+        if pending is not None:
+            yield pending[0], self.result(pending[1])
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __initial_restart_wait(self):
+        return min(self.__timeout * self.RESTART_TIMEOUTS, self.MAX_RESTART_WAIT)
+
+
+    def __start_worker(self, reconnect):
+        self.__jobs = Queue()
+
+        self.__worker = Thread(target=self.__run, args=(self.__jobs, reconnect), daemon=True)
+        self.__worker.start()
+
+
+    def __run(self, jobs, reconnect):
+        if reconnect:
+            try:
+                self.__client.wait_for_server()
+
+            except Exception as ex:
+                self.__logger.error("inference client reconnect failed: %s" % repr(ex))
+
+        while True:
+            job = jobs.get()
+
+            if job is None:
+                return
+
+            try:
+                job.inference = self.__client.infer(*job.args)
+
+            except Exception as ex:
+                job.error = ex
+
+            finally:
+                job.done.set()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def stalled(self):
+        return self.__job is not None and not self.__job.done.is_set()
+
+
+    @property
+    def timeout(self):
+        return self.__timeout
+
+
+    @property
+    def restart_count(self):
+        return self.__restart_count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "AsyncInferenceClient:{client:%s, timeout:%s, stalled:%s, restart_count:%s}" % \
+               (self.__client.__class__.__name__, self.__timeout, self.stalled, self.restart_count)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class InferenceJob(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, args, deadline):
+        """
+        Constructor
+        """
+        self.args = args                                            # tuple of infer(..) arguments
+        self.deadline = deadline                                    # float time
+
+        self.inference = None                                       # dict
+        self.error = None                                           # Exception
+
+        self.done = Event()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "InferenceJob:{args:%s, deadline:%s, inference:%s, error:%s}" % \
+               (self.args, self.deadline, self.inference, self.error)
@@ -0,0 +1,188 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A batched API for an scs_core gas or PMx inference client, for the replay or back-fill of recorded samples.
+
+Each sample of a batch is passed to the client's infer(..) method in turn, on its own thread, so that the client
+maintains its state - such as its T / rH slope regressions - and performs any pre- or postprocessing, as it would
+for live samples. The threads' requests are collected by an InferenceSocket, and sent to the model server in a single
+message.
+
+If the model server does not accept a batch, the requests of the batch - and of all following batches - are sent
+one at a time.
+"""
+
+from threading import Thread
+
+from scs_core.sys.logging import Logging
+
+from scs_dev.inference.inference_socket import InferenceSocket, InferenceSlot
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BatchInferenceClient(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_BATCH_SIZE =    20                                      # samples
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, inference_conf, host, socket, schedule_item, batch_size=DEFAULT_BATCH_SIZE):
+        sockets = []
+
+        def inference_socket(path):
+            sockets.append(InferenceSocket(socket(path)))
+            return sockets[-1]
+
+        client = inference_conf.client(host, inference_socket, schedule_item)
+
+        return cls(client, sockets[0], batch_size=batch_size)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, client, socket: InferenceSocket, batch_size=DEFAULT_BATCH_SIZE):
+        """
+        Constructor
+        """
+        self.__client = client                                      # GasInferenceClient or PMxInferenceClient
+        self.__socket = socket                                      # InferenceSocket
+        self.__batch_size = int(batch_size)                         # int
+
+        self.__batch_supported = True                               # bool
+        self.__logger = Logging.getLogger()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def wait_for_server(self):
+        self.__client.wait_for_server()
+
+
+    def open(self):
+        self.__client.open()
+
+
+    def close(self):
+        self.__client.close()
+
+
+    def model_name(self):
+        return self.__client.model_name()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def infer(self, *args):
+        return self.__client.infer(*args)
+
+
+    def infer_batch(self, requests):
+        slots = []
+
+        # requests...
+        for args in requests:
+            slot = InferenceSlot(tuple(args))
+            slots.append(slot)
+
+            Thread(target=self.__infer, args=(slot,), daemon=True).start()
+            slot.sent.wait()                                        # the client's state is updated in order
+
+        # responses...
+        sent = [slot for slot in slots if slot.request is not None]
+
+        try:
+            for slot, response in zip(sent, self.__responses([slot.request for slot in sent])):
+                slot.response = response
+                slot.received.set()
+
+        finally:
+            for slot in sent:
+                slot.received.set()                                 # no thread is left waiting
+
+        # inferences...
+        inferences = []
+
+        for slot in slots:
+            slot.done.wait()
+
+            if slot.error is not None:
+                raise slot.error
+
+            inferences.append(slot.inference)
+
+        return inferences
+
+
+    def inferences(self, requests):
+        batch = []
+
+        for args in requests:
+            batch.append(args)
+
+            if len(batch) < self.__batch_size:
+                continue
+
+            yield from zip(batch, self.infer_batch(batch))
+            batch = []
+
+        if batch:
+            yield from zip(batch, self.infer_batch(batch))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __infer(self, slot):
+        self.__socket.bind(slot)
+
+        try:
+            slot.inference = self.__client.infer(*slot.args)
+
+        except Exception as ex:
+            slot.error = ex
+
+        finally:
+            self.__socket.release()
+
+            slot.sent.set()                                         # in case no request was made
+            slot.done.set()
+
+
+    def __responses(self, messages):
+        if not messages:
+            return []
+
+        if self.__batch_supported and len(messages) > 1:
+            try:
+                return self.__socket.request_batch(messages)
+
+            except ValueError as ex:
+                self.__logger.warning("%s - sending requests singly" % ex)
+                self.__batch_supported = False
+
+        return [self.__socket.request(message) for message in messages]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def batch_size(self):
+        return self.__batch_size
+
+
+    @property
+    def batch_supported(self):
+        return self.__batch_supported
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BatchInferenceClient:{client:%s, socket:%s, batch_size:%s, batch_supported:%s}" % \
+               (self.__client.__class__.__name__, self.__socket, self.__batch_size, self.__batch_supported)
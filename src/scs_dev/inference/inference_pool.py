@@ -0,0 +1,253 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A pool of persistent UDSClient connections to one or more model servers, for the offline replay of inference requests.
+
+Each connection is held by a worker thread. Requests - or batches of requests - are taken by whichever worker is
+free, and inferences(..) yields the document and the response of each request, in request order. The number of
+requests in progress is limited, so that memory use does not depend on the length of the replay.
+
+The greengrass model servers accept one session at a time, so each server should be given one connection. If a
+batch size is given, the requests of each batch are sent as a JSON array, in a single message. If a model server does
+not accept a batch, the requests of the batch - and of all following batches - are sent one at a time.
+
+The latency of each request - the time from the sending of its message to the receipt of the response - is recorded.
+"""
+
+import time
+
+from array import array
+from collections import deque
+from queue import Queue
+from threading import Event, Thread
+
+from scs_core.comms.uds_client import UDSClient
+from scs_core.sys.logging import Logging
+
+from scs_dev.inference.inference_socket import InferenceSocket
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class InferencePool(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_BATCH_SIZE =    1                                       # requests per message
+
+    __TASKS_PER_WORKER =    4                                       # the limit of tasks in progress
+    __STOP_TIMEOUT =        10.0                                    # seconds - a stalled worker is abandoned
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, socket, paths, connections=1, batch_size=DEFAULT_BATCH_SIZE):
+        """
+        Constructor
+        """
+        self.__socket = socket                                      # DomainSocket class
+        self.__paths = tuple(paths)                                 # tuple of string
+        self.__connections = int(connections)                       # int - per server
+        self.__batch_size = int(batch_size)                         # int
+
+        self.__tasks = Queue()
+        self.__workers = []                                         # list of Thread
+        self.__batch_supported = True                               # bool
+
+        self.__latencies = array('d')                               # float seconds, in request order
+        self.__sorted = None                                        # list of float seconds
+
+        self.__logger = Logging.getLogger()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def start(self):
+        if self.__workers:
+            return
+
+        for path in self.__paths:
+            for _ in range(self.__connections):
+                client = UDSClient(self.__socket, path)
+                client.open()
+
+                worker = Thread(target=self.__run, args=(client,), daemon=True)
+                worker.start()
+
+                self.__workers.append(worker)
+
+
+    def stop(self):
+        for _ in self.__workers:
+            self.__tasks.put(None)
+
+        for worker in self.__workers:
+            worker.join(timeout=self.__STOP_TIMEOUT)
+
+        self.__workers = []
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def inferences(self, requests):                                 # iterable of (document, message)
+        pending = deque()                                           # of InferenceTask, in request order
+        batch = []
+
+        for request in requests:
+            batch.append(request)
+
+            if len(batch) < self.__batch_size:
+                continue
+
+            pending.append(self.__submit(batch))
+            batch = []
+
+            while len(pending) >= self.__max_pending():
+                yield from self.__collect(pending.popleft())
+
+        if batch:
+            pending.append(self.__submit(batch))
+
+        while pending:
+            yield from self.__collect(pending.popleft())
+
+
+    def latency(self, percentile):
+        if not self.__latencies:
+            return None
+
+        if self.__sorted is None or len(self.__sorted) != len(self.__latencies):
+            self.__sorted = sorted(self.__latencies)
+
+        index = int(round((len(self.__sorted) - 1) * percentile / 100.0))
+
+        return self.__sorted[index]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __max_pending(self):
+        return len(self.__workers) * self.__TASKS_PER_WORKER
+
+
+    def __submit(self, requests):
+        task = InferenceTask(requests)
+        self.__tasks.put(task)
+
+        return task
+
+
+    def __collect(self, task):
+        task.done.wait()
+
+        if task.error is not None:
+            raise task.error
+
+        for document, response in zip(task.documents, task.responses):
+            self.__latencies.append(task.latency)
+
+            yield document, response
+
+
+    def __run(self, client):
+        try:
+            while True:
+                task = self.__tasks.get()
+
+                if task is None:
+                    return
+
+                try:
+                    start_time = time.time()
+                    task.responses = self.__request(client, task.messages)
+                    task.latency = time.time() - start_time
+
+                except Exception as ex:
+                    task.error = ex
+
+                finally:
+                    task.done.set()
+
+        finally:
+            client.close()
+
+
+    def __request(self, client, messages):
+        if self.__batch_supported and len(messages) > 1:
+            client.request(InferenceSocket.batch(messages))
+
+            try:
+                return InferenceSocket.unbatch(client.wait_for_response(), len(messages))
+
+            except ValueError as ex:
+                self.__logger.warning("%s - sending requests singly" % ex)
+                self.__batch_supported = False
+
+        responses = []
+
+        for message in messages:
+            client.request(message)
+            responses.append(client.wait_for_response())
+
+        return responses
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def paths(self):
+        return self.__paths
+
+
+    @property
+    def batch_size(self):
+        return self.__batch_size
+
+
+    @property
+    def batch_supported(self):
+        return self.__batch_supported
+
+
+    @property
+    def request_count(self):
+        return len(self.__latencies)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "InferencePool:{paths:%s, connections:%s, batch_size:%s, batch_supported:%s, workers:%s}" % \
+               (list(self.__paths), self.__connections, self.__batch_size, self.__batch_supported,
+                len(self.__workers))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class InferenceTask(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, requests):
+        """
+        Constructor
+        """
+        self.documents = [document for document, _ in requests]     # list of request documents
+        self.messages = [message for _, message in requests]        # list of string
+
+        self.responses = None                                       # list of string
+        self.latency = None                                         # float seconds
+        self.error = None                                           # Exception
+
+        self.done = Event()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "InferenceTask:{messages:%s, latency:%s, error:%s}" % (len(self.messages), self.latency, self.error)
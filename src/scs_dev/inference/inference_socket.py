@@ -0,0 +1,157 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A wrapper for the DomainSocket of an inference client's UDSClient, allowing the requests made by the client's
+infer(..) method to be collected and sent to the model server as a batch.
+
+A thread that is bound to an InferenceSlot does not use the socket: its request is placed in the slot, and its
+response is awaited from the slot. All other threads - including those that open and close the session, or request
+the model name - use the socket in the usual way.
+
+A batch is sent as a JSON array of requests, in a single message. The model server responds with a JSON array of
+responses, in the same order.
+"""
+
+import json
+
+from threading import Event, local
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class InferenceSocket(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, uds):
+        """
+        Constructor
+        """
+        self.__uds = uds                                            # DomainSocket
+        self.__local = local()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # DomainSocket client interface...
+
+    def connect(self, *args, **kwargs):
+        self.__uds.connect(*args, **kwargs)
+
+
+    def close(self):
+        self.__uds.close()
+
+
+    def client_send(self, message):
+        slot = self.__slot()
+
+        if slot is None:
+            self.__uds.client_send(message)
+            return
+
+        slot.request = message
+        slot.sent.set()
+
+
+    def client_receive(self):
+        slot = self.__slot()
+
+        if slot is None:
+            return self.__uds.client_receive()
+
+        slot.received.wait()
+
+        return slot.response
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # slots...
+
+    def bind(self, slot):
+        self.__local.slot = slot
+
+
+    def release(self):
+        self.__local.slot = None
+
+
+    def __slot(self):
+        return getattr(self.__local, 'slot', None)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # requests...
+
+    def request(self, message):
+        self.__uds.client_send(message.strip())
+
+        return self.__uds.client_receive()
+
+
+    def request_batch(self, messages):
+        response = self.request(self.batch(messages))
+
+        return self.unbatch(response, len(messages))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # batches...
+
+    @staticmethod
+    def batch(messages):
+        return '[' + ', '.join(message.strip() for message in messages) + ']'
+
+
+    @staticmethod
+    def unbatch(response, count):
+        try:
+            responses = json.loads(response)
+        except (TypeError, ValueError):
+            responses = None
+
+        if not isinstance(responses, list) or len(responses) != count:
+            raise ValueError("batch not supported: %s" % response)
+
+        return [json.dumps(item) for item in responses]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "InferenceSocket:{uds:%s}" % self.__uds
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class InferenceSlot(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, args):
+        """
+        Constructor
+        """
+        self.args = args                                            # tuple of infer(..) arguments
+
+        self.request = None                                         # string
+        self.response = None                                        # string
+        self.inference = None                                       # dict
+        self.error = None                                           # Exception
+
+        self.sent = Event()                                         # set when the request - if any - is made
+        self.received = Event()                                     # set when the response is available
+        self.done = Event()                                         # set when infer(..) has returned
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "InferenceSlot:{request:%s, response:%s, error:%s}" % (self.request, self.response, self.error)
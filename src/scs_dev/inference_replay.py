@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+DESCRIPTION
+The inference_replay utility is used to re-run greengrass gas or PMx models over historical data - for example, to
+re-validate a model. Documents are read from stdin or, if the --file (-f) option is used, from a CSV file. Each
+document is presented to a model server, and the inferences are written to stdout, in document order.
+
+By default, each document is sent to the model server as it stands - it must therefore be a complete request. If the
+--sample (-s) and --climate (-c) options are used, a PMx request is built from the OPC sample and the climate sample
+found at the given paths within each document.
+
+Requests are fanned out over a pool of persistent connections, to one or more model servers - each UDS_PATH is the
+Unix domain socket of a model server, relative to the SCS directory if not absolute. The greengrass model servers
+accept one session at a time, so the default is one connection per server. If the --batch (-b) option is used, BATCH
+requests are sent in each message, as a JSON array. If the model servers do not accept batches, requests are sent one
+at a time.
+
+By default, only the inference is reported. If the --inference (-i) option is used, each document is reported, with
+its inference at INFERENCE_PATH. Requests that are rejected by the model server are logged, and are not reported.
+
+In verbose mode, the elapsed time, the rate and the latency percentiles of the requests are reported on completion.
+
+SYNOPSIS
+inference_replay.py [-f CSV_FILE] [-s SAMPLE_PATH -c CLIMATE_PATH] [-i INFERENCE_PATH] [-n CONNECTIONS] [-b BATCH]
+[-v] UDS_PATH_1 [.. UDS_PATH_N]
+
+EXAMPLES
+csv_reader.py pm2p5-h1-validation.csv | \
+inference_replay.py -v -s praxis.pmx -c praxis.meteo -i praxis.pmx.exg \
+pipes/lambda-model-pmx-s1-1.uds pipes/lambda-model-pmx-s1-2.uds
+
+inference_replay.py -v -b 20 -f gas-requests-2025.csv pipes/lambda-model-gas-s1.uds
+
+SEE ALSO
+scs_dev/csv_reader
+scs_dev/gases_sampler
+scs_dev/particulates_sampler
+scs_mfr/gas_model_conf
+scs_mfr/pmx_model_conf
+"""
+
+import json
+import os
+import sys
+import time
+
+from collections import OrderedDict
+
+from scs_core.csv.csv_reader import CSVReader, CSVReaderException
+
+from scs_core.data.json import JSONify
+from scs_core.data.path_dict import PathDict
+
+from scs_core.model.pmx.s1.pmx_request import PMxRequest
+
+from scs_core.sample.sample import Sample
+
+from scs_core.sys.logging import Logging
+from scs_core.sys.signalled_exit import SignalledExit
+
+from scs_dev.cmd.cmd_inference_replay import CmdInferenceReplay
+from scs_dev.inference.inference_pool import InferencePool
+
+from scs_host.comms.domain_socket import DomainSocket
+from scs_host.sys.host import Host
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def inference_requests(lines, sample_path, climate_path):
+    for line in lines:
+        datum = PathDict.construct_from_jstr(line)
+
+        if datum is None:
+            continue
+
+        if sample_path:
+            sample = Sample.construct_from_jdict(datum.node(sample_path))
+            climate = Sample.construct_from_jdict(datum.node(climate_path))
+
+            request = PMxRequest(sample, climate).as_json()
+
+        else:
+            request = datum.node()
+
+        yield datum, JSONify.dumps(request)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    reader = None
+    pool = None
+
+    document_count = 0
+    rejected_count = 0
+    start_time = None
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cmd...
+
+    cmd = CmdInferenceReplay()
+
+    if not cmd.is_valid():
+        cmd.print_help(sys.stderr)
+        exit(2)
+
+    # logging...
+    Logging.config('inference_replay', verbose=cmd.verbose)
+    logger = Logging.getLogger()
+
+    logger.info(cmd)
+
+    try:
+        # ------------------------------------------------------------------------------------------------------------
+        # resources...
+
+        # input...
+        if cmd.csv_file:
+            try:
+                reader = CSVReader.construct_for_file(cmd.csv_file)
+
+            except FileNotFoundError:
+                logger.error("file not found: %s" % cmd.csv_file)
+                exit(1)
+
+            logger.info(reader)
+
+        # pool...
+        uds_paths = [os.path.join(Host.scs_path(), uds_path) for uds_path in cmd.uds_paths]
+
+        pool = InferencePool(DomainSocket, uds_paths, connections=cmd.connections, batch_size=cmd.batch_size)
+
+
+        # ------------------------------------------------------------------------------------------------------------
+        # run...
+
+        # signal handler...
+        SignalledExit.construct()
+
+        pool.start()
+        logger.info(pool)
+
+        start_time = time.time()
+
+        lines = sys.stdin if reader is None else reader.rows()
+        requests = inference_requests(lines, cmd.sample_path, cmd.climate_path)
+
+        for datum, response in pool.inferences(requests):
+            document_count += 1
+
+            inference = json.loads(response, object_hook=OrderedDict)
+
+            if inference is None:
+                logger.error("inference rejected: %s" % JSONify.dumps(datum))
+                rejected_count += 1
+                continue
+
+            if cmd.inference_path:
+                datum.append(cmd.inference_path, inference)
+                print(JSONify.dumps(datum))
+
+            else:
+                print(JSONify.dumps(inference))
+
+        sys.stdout.flush()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # end...
+
+    except CSVReaderException as ex:
+        logger.error(repr(ex))
+
+    except ConnectionError as ex:
+        logger.error(repr(ex))
+
+    except (KeyboardInterrupt, SystemExit):
+        pass
+
+    finally:
+        logger.info("finishing")
+
+        if pool:
+            pool.stop()
+
+        if reader:
+            reader.close()
+
+        logger.info("documents: %d rejected: %d" % (document_count, rejected_count))
+
+        if start_time and document_count > 0:
+            elapsed_time = time.time() - start_time
+
+            logger.info("elapsed time: %0.1f s rate: %0.1f documents/s" %
+                        (elapsed_time, document_count / elapsed_time))
+
+            logger.info("latency: p50: %0.4f s p90: %0.4f s p99: %0.4f s max: %0.4f s" %
+                        (pool.latency(50), pool.latency(90), pool.latency(99), pool.latency(100)))
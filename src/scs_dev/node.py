@@ -20,8 +20,9 @@ By default, output is in the form of a sequence of JSON documents, separated by
 selected, output is in the form of a JSON array - the output opens with a '[' character, documents are separated by
 the ',' character, and the output is terminated by a ']' character.
 
-Alternatively, if the node is an array or other iterable type, then it may be output as a sequence (a list of items
-separated by newline characters) according to the -s flag.
+Alternatively, if the input is a JSON array, then its members may be processed as a sequence according to the -s
+flag. In this mode the array is parsed incrementally, so each member is output as soon as it has been read, and memory
+use does not grow with the size of the array. The array may span any number of lines.
 
 The ordering of output nodes is as follows:
 * Exclude mode - by input nodes
@@ -30,12 +31,29 @@ The ordering of output nodes is as follows:
 WARNING: node ordering is overridden by the internal node structure. Thus the specified ordering: a.b.c, x.b.c, a.b.d
 would be rendered as: a.b.c, a.b.d, x.b.c
 
+The batch (-b) mode is intended for high-volume streams. The sub-paths are compiled once into a trie, and the
+included or excluded nodes of each document are found in a single pass over the document, giving the same output as
+the default method. Output is flushed every FLUSH_ROWS documents, or every FLUSH_INTERVAL seconds if specified.
+
+If a WINDOW (-w) is specified, the extracted nodes are reduced over tumbling windows of WINDOW seconds, keyed on
+the rec field of each input document. One document is output for each window, labelled with the end of the
+window, giving the requested OPERATIONS for each leaf node, as "path.operation". Running values are held, rather than
+the documents themselves. Input documents should be in rec order, and documents without a valid rec are ignored. The
+final window is reported at the end of input.
+
 SYNOPSIS
-node.py [{ [-x] [-a] | -s }] [-f FILE] [-i INDENT] [-v] [SUB_PATH_1 .. SUB_PATH_N]
+node.py [{ [-x] [-a] | -s }] [-b [-r FLUSH_ROWS] [-t FLUSH_INTERVAL]] [-w WINDOW [-o OPERATIONS]]
+[-f FILE] [-i INDENT] [-v] [SUB_PATH_1 .. SUB_PATH_N]
 
 EXAMPLES
 csv_reader.py climate.csv | node.py -x val.bar
 
+csv_reader.py -b status.csv | node.py -b rec val.tmp val.sch val.gps
+
+csv_reader.py -a climate.csv | node.py -s val.tmp
+
+csv_reader.py gases.csv | node.py -b -w 60 -o mean,min,max,count val.NO2.cnc val.Ox.cnc
+
 DOCUMENT EXAMPLE - INPUT
 {"val": {"hmd": 73.5, "tmp": 10.8, "bar": ""}, "rec": "2019-02-17T08:56:53Z"}
 {"val": {"hmd": 73.6, "tmp": 10.8, "bar": ""}, "rec": "2019-02-17T08:57:53Z"}
@@ -48,11 +66,15 @@ default mode:
 array mode:
 [{"val": {"hmd": 73.5, "tmp": 10.8}, "rec": "2019-02-17T08:56:53Z"},
 {"val": {"hmd": 73.6, "tmp": 10.8}, "rec": "2019-02-17T08:57:53Z"}]
+
+window mode (-w 3600 -o mean,count val.hmd):
+{"rec": "2019-02-17T09:00:00Z", "val": {"hmd": {"mean": 73.6, "count": 2}}}
 """
 
 import json
 import sys
 
+from scs_core.data.datetime import LocalizedDatetime
 from scs_core.data.json import JSONify
 from scs_core.data.path_dict import PathDict
 
@@ -60,6 +82,12 @@ from scs_core.sys.logging import Logging
 
 from scs_dev.cmd.cmd_node import CmdNode
 
+from scs_dev.reader.json_array_reader import JSONArrayReader
+
+from scs_dev.transform.node_aggregate import NodeAggregate
+from scs_dev.transform.node_projection import NodeProjection
+from scs_dev.writer.output_buffer import OutputBuffer
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -68,6 +96,9 @@ if __name__ == '__main__':
     document_count = 0
     output_count = 0
 
+    reader = None
+    output = None
+
     # ----------------------------------------------------------------------------------------------------------------
     # cmd...
 
@@ -86,53 +117,83 @@ if __name__ == '__main__':
         # ------------------------------------------------------------------------------------------------------------
         # resources...
 
-        if cmd.filename:
-            try:
+        try:
+            if cmd.sequence:
+                reader = JSONArrayReader.construct_for_file(cmd.filename)
+                source = reader.items()                 # array members, as they are read
+                logger.info(reader)
+
+            elif cmd.filename:
                 with open(cmd.filename) as file:
                     source = [file.read()]
 
-            except FileNotFoundError:
-                logger.error("file not found: %s" % cmd.filename)
-                exit(1)
+            else:
+                source = sys.stdin
 
-        else:
-            source = sys.stdin
+        except FileNotFoundError:
+            logger.error("file not found: %s" % cmd.filename)
+            exit(1)
 
-        if cmd.sequence:
-            for document in source:
-                try:
-                    source = [json.dumps(item) for item in json.loads(document)]
-                except json.JSONDecodeError:
-                    logger.error("invalid document: '%s'" % document.strip())
-                    exit(1)
-                break
+
+        # projection...
+        projection = NodeProjection.construct(cmd.sub_paths, exclude=cmd.exclude) if cmd.batch else None
+        logger.info(projection)
+
+        # aggregate...
+        aggregate = NodeAggregate(cmd.window, cmd.operations) if cmd.window else None
+        logger.info(aggregate)
+
+        # output...
+        encoder = JSONify(ensure_ascii=False, indent=None if cmd.array else cmd.indent)
+        output = OutputBuffer(sys.stdout, max_count=cmd.flush_rows, max_interval=cmd.flush_interval)
 
 
         # ------------------------------------------------------------------------------------------------------------
         # run...
 
         if cmd.array:
-            print('[', end='')
+            output.write('[')
 
         node = None
         first = True
+        rec = None
 
         for document in source:
-            datum = PathDict.construct_from_jstr(document)
+            if cmd.sequence:
+                jdict = document
 
-            if datum is None:
-                continue
+            else:
+                try:
+                    jdict = json.loads(document)
+                except ValueError:
+                    continue
 
             document_count += 1
 
+            if aggregate is not None:
+                try:
+                    rec = LocalizedDatetime.construct_from_iso8601(jdict['rec'])
+                except (KeyError, TypeError):
+                    rec = None
+
+                if rec is None:
+                    continue                            # the document cannot be placed in a window
+
             if cmd.exclude and not cmd.has_sub_paths():
                 continue                                # everything is excluded
 
             # build...
-            if not cmd.has_sub_paths():
-                target = datum                          # everything is included
+            if projection is not None and isinstance(jdict, dict):
+                target = projection.project(jdict)
+
+                if target is NodeProjection.EMPTY:
+                    continue
+
+            elif not cmd.has_sub_paths():
+                target = PathDict(dictionary=jdict)     # everything is included
 
             else:
+                datum = PathDict(dictionary=jdict)
                 target = PathDict()
 
                 if cmd.exclude:
@@ -147,21 +208,38 @@ if __name__ == '__main__':
                         if datum.has_sub_path(sub_path):
                             target.append(sub_path, datum.node(sub_path))
 
+            # aggregate...
+            if aggregate is not None:
+                target = aggregate.append(rec, target)  # the report of a closed window, if any
+
+                if target is None:
+                    continue
+
             # report...
             if not target:
                 continue                                # skip empty outputs
 
             if cmd.array:
                 if first:
-                    print(JSONify.dumps(target), end='')
+                    output.write(encoder.encode(target))
                     first = False
 
                 else:
-                    print(", %s" % JSONify.dumps(target), end='')
+                    output.write(", %s" % encoder.encode(target))
+
+            else:
+                output.print(encoder.encode(target))
+                output_count += 1
+
+        # final window...
+        if aggregate is not None and aggregate.has_report():
+            target = aggregate.report()
+
+            if cmd.array:
+                output.write(encoder.encode(target) if first else ", %s" % encoder.encode(target))
 
             else:
-                print(JSONify.dumps(target, indent=cmd.indent))
-                sys.stdout.flush()
+                output.print(encoder.encode(target))
                 output_count += 1
 
 
@@ -175,9 +253,19 @@ if __name__ == '__main__':
         logger.error(repr(ex))
         exit(1)
 
+    except ValueError as ex:
+        logger.error("invalid document: %s" % ex)
+        exit(1)
+
     finally:
-        if cmd.array:
-            print(']')
-            output_count = 1
+        if reader is not None:
+            reader.close()
+
+        if output is not None:
+            if cmd.array:
+                output.print(']')
+                output_count = 1
+
+            output.flush()
 
         logger.info("documents: %d output: %d" % (document_count, output_count))
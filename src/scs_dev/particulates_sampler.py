@@ -40,12 +40,20 @@ controlled by an independent scheduling process via a Unix semaphore.
 If any errors are detected while the OPC is running, these are logged. the log can be interrogated using the
 mfr/opc_error_log utility.
 
+If a PMx model is configured, each sample is presented to the model server for inference. If the --async-inference
+(-y) flag is set, the inference of each sample overlaps the acquisition of the next, and each sample is reported
+after the next sample has been taken. An inference that is not available within the sampling interval is logged,
+and its sample is not reported - a stalled model server does not hold up sampling. If the model server remains
+stalled, its session is restarted.
+
 SYNOPSIS
-particulates_sampler.py [-n NAME] [{ -s SEMAPHORE | -i INTERVAL [-c SAMPLES] }] [{ -v | -d }]
+particulates_sampler.py [-n NAME] [{ -s SEMAPHORE | -i INTERVAL [-c SAMPLES] }] [-y] [{ -v | -d }]
 
 EXAMPLES
 ./particulates_sampler.py -v -f /home/pi/SCS/conf/opc_conf_cs1.json
 
+./particulates_sampler.py -s scs-particulates -y
+
 FILES
 ~/SCS/conf/opc_conf.json
 ~/SCS/conf/schedule.json
@@ -108,6 +116,7 @@ from scs_core.sys.signalled_exit import SignalledExit
 from scs_core.sys.system_id import SystemID
 
 from scs_dev.cmd.cmd_sampler import CmdSampler
+from scs_dev.inference.async_inference_client import AsyncInferenceClient
 from scs_dev.sampler.particulates_sampler import ParticulatesSampler
 
 from scs_dfe.climate.sht_conf import SHTConf
@@ -120,6 +129,23 @@ from scs_host.sync.schedule_runner import ScheduleRunner
 from scs_host.sys.host import Host
 
 
+# --------------------------------------------------------------------------------------------------------------------
+
+def inference_requests(opc_samples, ext_sht):
+    for opc_sample in opc_samples:
+        if opc_sample is None:
+            continue
+
+        try:
+            ext_sht_sample = None if ext_sht is None else ext_sht.sample()
+
+        except OSError as ex:
+            Logging.getLogger().error("SHT: %s" % ex)
+            exit(1)
+
+        yield opc_sample, ext_sht_sample
+
+
 # TODO: support "empty" OPCConf when no OPC is present?
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -130,12 +156,13 @@ if __name__ == '__main__':
     opc = None
     sht = None
     client = None
+    async_client = None
     sampler = None
 
     # ----------------------------------------------------------------------------------------------------------------
     # cmd...
 
-    cmd = CmdSampler()
+    cmd = CmdSampler(inference=True)
 
     if not cmd.is_valid():
         cmd.print_help(sys.stderr)
@@ -226,6 +253,10 @@ if __name__ == '__main__':
             client = inference_conf.client(Host, DomainSocket, schedule_item)
             client.wait_for_server()
 
+            if cmd.async_inference:
+                async_client = AsyncInferenceClient(client, schedule_item.interval)
+                logger.info(async_client)
+
             # SHT...
             sht_conf = SHTConf.load(Host)
 
@@ -276,23 +307,21 @@ if __name__ == '__main__':
         if inference_conf:
             logger.info("greengrass model: %s" % client.model_name())
 
-        for opc_sample in sampler.samples():
-            if opc_sample is None:
-                continue
+        if not inference_conf:
+            inferences = (((opc_sample,), None) for opc_sample in sampler.samples() if opc_sample is not None)
 
-            if inference_conf:
-                # climate...
-                try:
-                    ext_sht_sample = None if sht is None else sht.sample()
+        elif async_client:
+            async_client.start()
+            inferences = async_client.inferences(inference_requests(sampler.samples(), sht))
 
-                except OSError as ex:
-                    ext_sht_sample = None
-                    logger.error("SHT: %s" % ex)
-                    exit(1)
+        else:
+            inferences = ((request, client.infer(*request)) for request in inference_requests(sampler.samples(), sht))
 
-                # inference...
-                inference = client.infer(opc_sample, ext_sht_sample)
+        for request, inference in inferences:
+            opc_sample = request[0]
 
+            # inference...
+            if inference_conf:
                 if inference is None:
                     logger.error("inference rejected: %s" % JSONify.dumps(opc_sample))
                     continue
@@ -321,6 +350,9 @@ if __name__ == '__main__':
         if sampler:
             sampler.stop()
 
+        if async_client:
+            async_client.stop()
+
         if client:
             client.close()
 
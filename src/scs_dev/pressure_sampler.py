@@ -21,12 +21,19 @@ with fields for:
 Command-line options allow for single-shot reading, multiple readings with specified time intervals, or readings
 controlled by an independent scheduling process via a Unix semaphore.
 
+If the --pre-sample (-p) option is set, the barometer is read in the background, every PRE_SAMPLE_INTERVAL seconds,
+and each sample takes its latest value. Each sample is then produced as soon as it is scheduled, and its recording
+time does not vary with I2C contention. A value more than two pre-sample intervals old is not used - the barometer is
+then read directly. In debug mode, the age of the reading is reported for each sample.
+
 SYNOPSIS
-pressure_sampler.py [{ -s SEMAPHORE | -i INTERVAL [-n SAMPLES] }] [{ -v | -d }]
+pressure_sampler.py [{ -s SEMAPHORE | -i INTERVAL [-n SAMPLES] }] [-p PRE_SAMPLE_INTERVAL] [{ -v | -d }]
 
 EXAMPLES
 ./pressure_sampler.py -i10
 
+./pressure_sampler.py -s scs-climate -p10
+
 FILES
 ~/SCS/conf/mpl115a2_calib.json
 ~/SCS/conf/pressure_conf.json
@@ -79,10 +86,12 @@ from scs_host.sys.host import Host
 
 if __name__ == '__main__':
 
+    sampler = None
+
     # ----------------------------------------------------------------------------------------------------------------
     # cmd...
 
-    cmd = CmdSampler()
+    cmd = CmdSampler(pre_sample=True)
 
     if not cmd.is_valid():
         cmd.print_help(sys.stderr)
@@ -130,7 +139,7 @@ if __name__ == '__main__':
         runner = TimedRunner(cmd.interval, cmd.samples) if cmd.semaphore is None \
             else ScheduleRunner(cmd.semaphore)
 
-        sampler = PressureSampler(runner, tag, barometer, conf.altitude)
+        sampler = PressureSampler(runner, tag, barometer, conf.altitude, pre_sample_interval=cmd.pre_sample_interval)
 
         logger.info(sampler)
 
@@ -142,10 +151,12 @@ if __name__ == '__main__':
         SignalledExit.construct()
 
         sampler.init()
+        sampler.start()
 
         for sample in sampler.samples():
             # report...
             logger.info("rec: %s" % sample.rec.as_time())
+            logger.debug("acquired: -%0.3f" % sampler.acquisition.age())
 
             print(JSONify.dumps(sample))
             sys.stdout.flush()
@@ -164,4 +175,7 @@ if __name__ == '__main__':
         if cmd:
             logger.info("finishing")
 
+        if sampler:
+            sampler.stop()
+
         I2C.Sensors.close()
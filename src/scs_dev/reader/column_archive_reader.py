@@ -0,0 +1,319 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A ColumnArchiveReader presents the blocks of a binary columnar archive, as written by a ColumnArchiveWriter. The file
+is memory-mapped: columns of native byte order are presented as memoryviews of the map, without copying, and blocks
+whose rec range lies outside the requested window are skipped without decoding.
+
+A block that is truncated - for example, by a power failure while it was written - ends the archive.
+"""
+
+import json
+import mmap
+import os
+import sys
+
+from array import array
+from collections import OrderedDict
+
+from scs_core.data.json import JSONify
+
+from scs_dev.reader.csv_path_plan import CSVPathPlan
+from scs_dev.writer.column_archive_writer import ColumnArchiveWriter
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ColumnArchiveException(RuntimeError):
+    """
+    classdocs
+    """
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ColumnArchiveReader(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_for_file(cls, filename, start=None, end=None, rec_field='rec'):
+        if not os.path.isfile(filename):
+            raise FileNotFoundError(filename)
+
+        file = open(filename, 'rb')
+
+        if os.path.getsize(filename) < len(ColumnArchiveWriter.MAGIC):
+            file.close()
+            raise ColumnArchiveException("not an archive: %s" % filename)
+
+        mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if mm[:len(ColumnArchiveWriter.MAGIC)] != ColumnArchiveWriter.MAGIC:
+            mm.close()
+            file.close()
+            raise ColumnArchiveException("not an archive: %s" % filename)
+
+        return cls(filename, file, mm, start, end, rec_field)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, filename, file, mm, start, end, rec_field):
+        """
+        Constructor
+        """
+        self.__filename = filename                                  # string
+        self.__file = file                                          # binary file
+        self.__mm = mm                                              # mmap
+
+        self.__start = None if start is None else round(start.timestamp() * 1000)     # int epoch millis or None
+        self.__end = None if end is None else round(end.timestamp() * 1000)           # int epoch millis or None
+        self.__rec_field = rec_field                                # string
+
+        self.__encoder = JSONify(ensure_ascii=False)
+        self.__plans = {}                                           # dict of tuple of paths: CSVPathPlan
+
+        self.__block_count = 0                                      # int
+        self.__read_count = 0                                       # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def close(self):
+        try:
+            self.__mm.close()
+        except BufferError:
+            pass                                                    # a column view is still held by the caller
+
+        self.__file.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def blocks(self):
+        mm = self.__mm
+        size = len(mm)
+        offset = len(ColumnArchiveWriter.MAGIC)
+
+        while offset + ColumnArchiveWriter.HEADER_LENGTH.size <= size:
+            header_length = ColumnArchiveWriter.HEADER_LENGTH.unpack_from(mm, offset)[0]
+            header_start = offset + ColumnArchiveWriter.HEADER_LENGTH.size
+            data_start = header_start + header_length
+
+            if data_start > size:
+                return                                              # truncated header
+
+            try:
+                header = json.loads(mm[header_start:data_start].decode())
+            except ValueError:
+                return
+
+            data_length = sum(column['length'] for column in header['columns'])
+
+            if data_start + data_length > size:
+                return                                              # truncated data
+
+            offset = data_start + data_length
+
+            if not self.__in_window(header):
+                continue
+
+            self.__block_count += 1
+
+            yield ColumnArchiveBlock(header, memoryview(mm)[data_start:offset])
+
+
+    def documents(self):
+        for block in self.blocks():
+            paths = tuple(block.paths())
+            plan = self.__plans.get(paths)
+
+            if plan is None:
+                plan = self.__plans[paths] = CSVPathPlan.construct_from_paths(paths)
+
+            columns = [block.values(path) for path in paths]
+            recs = block.recs(self.__rec_field)
+            recs = None if recs is None else recs.tolist()
+
+            for i, row in enumerate(zip(*columns)):
+                if recs is not None:
+                    if self.__start is not None and recs[i] < self.__start:
+                        continue
+
+                    if self.__end is not None and recs[i] >= self.__end:
+                        continue
+
+                self.__read_count += 1
+
+                yield plan.as_dict(row)
+
+
+    def rows(self):
+        encode = self.__encoder.encode
+
+        for document in self.documents():
+            yield encode(document)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __in_window(self, header):
+        if self.__start is not None and header['rec-max'] is not None and header['rec-max'] < self.__start:
+            return False
+
+        if self.__end is not None and header['rec-min'] is not None and header['rec-min'] >= self.__end:
+            return False
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def filename(self):
+        return self.__filename
+
+
+    @property
+    def block_count(self):
+        return self.__block_count
+
+
+    @property
+    def read_count(self):
+        return self.__read_count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ColumnArchiveReader:{filename:%s, start:%s, end:%s, rec_field:%s, block_count:%s, read_count:%s}" % \
+               (self.filename, self.__start, self.__end, self.__rec_field, self.block_count, self.read_count)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ColumnArchiveBlock(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, header, data):
+        """
+        Constructor
+        """
+        self.__header = header                                      # dict
+        self.__data = data                                          # memoryview
+
+        self.__columns = OrderedDict((column['path'], column) for column in header['columns'])
+
+
+    def __len__(self):
+        return self.__header['rows']
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def paths(self):
+        return self.__columns.keys()
+
+
+    def column(self, path):
+        column = self.__columns[path]
+        typecode = column['type']
+
+        data = self.__data[column['offset']:column['offset'] + column['length'] - column.get('ints', 0)]
+
+        if typecode == 'J':
+            return json.loads(bytes(data).decode())
+
+        typecode = 'q' if typecode == 'T' else typecode
+
+        if self.__header['byteorder'] == sys.byteorder:
+            return data.cast(typecode)                              # mapped, not copied
+
+        values = array(typecode, bytes(data))
+        values.byteswap()
+
+        return values
+
+
+    def recs(self, rec_field='rec'):
+        column = self.__columns.get(rec_field)
+
+        return None if column is None or column['type'] != 'T' else self.column(rec_field)
+
+
+    def values(self, path):
+        column = self.__columns[path]
+        typecode = column['type']
+        array_values = self.column(path)
+
+        if typecode == 'J':
+            return array_values
+
+        null = ColumnArchiveWriter.NULLS[typecode]
+
+        if typecode == 'f':
+            return self.__restore_ints(column, [None if value != value else float('%.7g' % value)
+                                                for value in array_values])
+
+        if typecode == 'd':
+            return self.__restore_ints(column, [None if value != value else value for value in array_values])
+
+        if typecode == 'B':
+            return [None if value == null else bool(value) for value in array_values]
+
+        if typecode == 'H':
+            strings = column['strings']
+            return [None if value == null else strings[value] for value in array_values]
+
+        if typecode == 'T':
+            tz = column['tz']
+            include_millis = column['millis']
+
+            return [None if value == null else ColumnArchiveWriter.format_rec(value, tz, include_millis)
+                    for value in array_values]
+
+        return [None if value == null else value for value in array_values]
+
+
+    def __restore_ints(self, column, values):
+        if 'ints' not in column:
+            return values
+
+        end = column['offset'] + column['length']
+        mask = self.__data[end - column['ints']:end]
+
+        for i in range(len(values)):
+            if mask[i // 8] & (1 << (i % 8)):
+                values[i] = int(values[i])
+
+        return values
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def rec_min(self):
+        return self.__header['rec-min']
+
+
+    @property
+    def rec_max(self):
+        return self.__header['rec-max']
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ColumnArchiveBlock:{rows:%s, rec_min:%s, rec_max:%s, columns:%s}" % \
+               (len(self), self.rec_min, self.rec_max, len(self.__columns))
@@ -0,0 +1,178 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A drop-in alternative to scs_core.csv.csv_reader.CSVReader for bulk conversion. The header is compiled once into a
+CSVPathPlan, and a single JSON encoder is shared by all rows.
+"""
+
+import csv
+import sys
+
+from scs_core.csv.csv_reader import CSVReaderException
+
+from scs_core.data.json import JSONify
+from scs_core.data.str import Str
+
+from scs_dev.reader.csv_path_plan import CSVPathPlan
+from scs_dev.writer.csv_compression import CSVCompression
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVBatchReader(object):
+    """
+    classdocs
+    """
+
+    __REPRESENTATIONS_OF_NULL = ('', 'NULL')
+
+    __READ_BUFFER_SIZE = 1048576                                    # bytes
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def recast(value):
+        if value is None:
+            return None
+
+        # skip conversions that cannot succeed, such as for tags and ISO 8601 datetimes...
+        head = value[:1]
+
+        if ':' not in value and not (head.isalpha() and head not in 'iInN'):        # inf, infinity, nan
+            if '.' not in value:
+                try:
+                    return int(value)
+                except ValueError:
+                    pass
+
+            try:
+                return float(value)
+            except ValueError:
+                pass
+
+        upper = value.upper()
+
+        if upper == 'TRUE':
+            return True
+
+        if upper == 'FALSE':
+            return False
+
+        return value
+
+
+    @classmethod
+    def renullify(cls, value):
+        try:
+            return None if value.upper() in cls.__REPRESENTATIONS_OF_NULL else value
+        except AttributeError:
+            return value
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_for_file(cls, filename, cast=True, nullify=False):
+        iterable = sys.stdin if filename is None else \
+            CSVCompression.open_for_reading(filename, buffering=cls.__READ_BUFFER_SIZE)
+
+        return cls(iterable, filename=filename, cast=cast, nullify=nullify)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, iterable, filename=None, cast=True, nullify=False):
+        """
+        Constructor
+        """
+        self.__iterable = iterable                                  # iterable
+        self.__filename = filename                                  # string
+        self.__cast = bool(cast)                                    # bool
+        self.__nullify = bool(nullify)                              # bool
+
+        self.__encoder = JSONify(ensure_ascii=False)                # shared by all rows
+        self.__read_count = 0                                       # int
+
+        try:
+            self.__reader = csv.reader(iterable, quoting=csv.QUOTE_ALL, skipinitialspace=True)
+
+            try:
+                paths = next(self.__reader)
+            except StopIteration:                                   # no input
+                paths = []
+
+        except csv.Error as ex:
+            raise CSVReaderException(ex)
+
+        self.__plan = CSVPathPlan.construct_from_paths(paths)       # CSVPathPlan
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def close(self):
+        if self.__filename is None:
+            return
+
+        self.__iterable.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def documents(self):
+        plan = self.__plan
+        recast = self.recast
+        renullify = self.renullify
+
+        try:
+            for row in self.__reader:
+                if not row:
+                    continue
+
+                if self.__nullify:
+                    row = [renullify(cell) for cell in row]
+
+                if self.__cast:
+                    row = [recast(cell) for cell in row]
+
+                yield plan.as_dict(row)
+
+                self.__read_count += 1
+
+        except csv.Error as ex:
+            raise CSVReaderException(ex)            # typically on the last line of a badly-closed CSV file
+
+
+    def rows(self):
+        encode = self.__encoder.encode
+
+        for document in self.documents():
+            yield encode(document)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def filename(self):
+        return self.__filename
+
+
+    @property
+    def read_count(self):
+        return self.__read_count
+
+
+    @property
+    def plan(self):
+        return self.__plan
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        iterable = self.__iterable.__class__.__name__
+
+        return "CSVBatchReader:{iterable:%s, filename:%s, cast:%s, nullify:%s, read_count:%s, plan:%s}" % \
+               (iterable, self.filename, self.__cast, self.__nullify, self.read_count,
+                Str.collection(list(self.plan.paths())))
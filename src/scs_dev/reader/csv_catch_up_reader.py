@@ -0,0 +1,680 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A CSVCatchUpReader is an alternative to the CSVLogReader, for the csv_logger --echo mode. The backlog - documents
+that are missing from the data store - is replayed in batches of at most max_count documents and max_bytes bytes, at
+a rate of at most max_rate documents per second. Live documents - those in the files included by the csv_logger - are
+always output first, as soon as they have been written.
+
+The rec of the last backlog document output is saved to a CSVCatchUpCheckpoint after each batch. If a checkpoint
+exists for the topic when the reader is started, the backlog is resumed from the checkpoint, without a byline query.
+Once the backlog has been cleared, the checkpoint follows the live documents.
+
+Delivery is at-least-once: if the reader is stopped before the backlog has been cleared, live documents output since
+it was started are replayed with the remaining backlog when it is restarted.
+
+Progress - the fraction of the backlog interval replayed, the replay rate, and an ETA - is logged at intervals.
+
+example checkpoint:
+{"topic": "particulates", "tag": "scs-be2-3", "rec": "2023-07-14T13:04:10Z", "caught-up": false}
+"""
+
+import os
+import sys
+import time
+
+from collections import OrderedDict
+from itertools import islice
+from multiprocessing import Manager
+
+from requests.exceptions import ConnectionError
+
+from scs_core.csv.csv_reader import CSVReaderException
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.json import JSONify, JSONReport
+
+from scs_core.sync.synchronised_process import SynchronisedProcess
+
+from scs_core.sys.logging import Logging
+
+from scs_dev.reader.csv_batch_reader import CSVBatchReader
+from scs_dev.writer.csv_compression import CSVCompression
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVCatchUpReader(SynchronisedProcess):
+    """
+    classdocs
+    """
+
+    DEFAULT_MAX_COUNT = 100                             # documents
+    DEFAULT_MAX_BYTES = 65536                           # bytes
+
+    __POLL_INTERVAL = 0.1                               # seconds
+    __CHECKPOINT_INTERVAL = 10.0                        # seconds
+    __PROGRESS_INTERVAL = 30.0                          # seconds
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, queue_builder, checkpoint_filename, nullify=False, max_rate=None, max_count=None,
+                 max_bytes=None, output=None):
+        """
+        Constructor
+        """
+        self.__logger = Logging.getLogger()
+        self.__logging_specification = Logging.specification()
+
+        manager = Manager()
+
+        SynchronisedProcess.__init__(self, value=manager.list())
+
+        self.__queue_builder = queue_builder                                    # CSVLogQueueBuilder
+        self.__checkpoint_filename = checkpoint_filename                        # string
+        self.__nullify = bool(nullify)                                          # bool
+
+        self.__max_rate = max_rate if max_rate else None                        # float documents / second or None
+        self.__max_count = self.DEFAULT_MAX_COUNT if max_count is None else int(max_count)
+        self.__max_bytes = self.DEFAULT_MAX_BYTES if max_bytes is None else int(max_bytes)
+
+        self.__output = output                                                  # file-like or None for stdout
+        self.__encoder = JSONify(ensure_ascii=False)
+
+        self.__included = None                                                  # string - client process only
+
+        self.__backlog = None                                                   # CSVCatchUpBacklog
+        self.__live = None                                                      # CSVLiveFile
+        self.__live_reader = None                                               # CSVBatchReader
+        self.__live_index = 0                                                   # int
+        self.__live_rec = None                                                  # string
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def run(self, halt_on_caught_up=False):
+        Logging.replicate(self.__logging_specification)
+        self.__logger = Logging.getLogger()
+
+        checkpoint = None
+
+        try:
+            # build backlog...
+            checkpoint = CSVCatchUpCheckpoint.load(self.__checkpoint_filename)
+
+            if checkpoint.matches(self.__queue_builder.topic_name, self.__queue_builder.message_tag):
+                self.__logger.info("resuming from: %s" % checkpoint)
+
+                timeline_start = checkpoint.rec.utc_datetime
+                cursors = self.__queue_builder.find_cursors_from(timeline_start)
+
+            else:
+                timeline_start, cursors = self.__queue_builder.find_cursors()   # waits indefinitely for network
+
+                rec = None if timeline_start is None else LocalizedDatetime(timeline_start)
+                checkpoint = CSVCatchUpCheckpoint(self.__queue_builder.topic_name,
+                                                  self.__queue_builder.message_tag, rec, False)
+
+            self.__logger.info("timeline_start: %s" % timeline_start)
+
+            backlog = CSVCatchUpBacklog(cursors, nullify=self.__nullify)
+            progress = CSVCatchUpProgress(None if timeline_start is None else timeline_start.timestamp(), time.time())
+
+            self.__backlog = backlog
+            self.__logger.info("backlog: %s" % backlog)
+
+            checkpoint.caught_up = not backlog.is_pending()
+            checkpoint.save(self.__checkpoint_filename)
+
+            # drain backlog and live...
+            tokens = float(self.__max_count)
+            latest_refill = time.time()
+            latest_checkpoint = time.time()
+            latest_progress = time.time()
+
+            while True:
+                # live...
+                live_count = self.__echo_live()
+
+                # backlog...
+                backlog_count = 0
+
+                if backlog.is_pending():
+                    now = time.time()
+
+                    if self.__max_rate is not None:
+                        tokens = min(self.__max_count, tokens + (now - latest_refill) * self.__max_rate)
+                    latest_refill = now
+
+                    if self.__max_rate is None or tokens >= self.__max_count:
+                        lines, rec = backlog.next_batch(self.__encoder.encode, self.__max_count, self.__max_bytes)
+
+                        if lines:
+                            self.__write(lines)
+
+                            backlog_count = len(lines)
+                            tokens -= backlog_count
+
+                            checkpoint.rec = LocalizedDatetime.construct_from_iso8601(rec) or checkpoint.rec
+                            checkpoint.save(self.__checkpoint_filename)
+
+                            progress.update(checkpoint.rec, backlog_count)
+
+                    if not backlog.is_pending():
+                        self.__logger.info("caught up: %s" % progress)
+
+                        checkpoint.caught_up = True
+                        self.__save_live_checkpoint(checkpoint)
+
+                        latest_checkpoint = time.time()
+
+                    elif time.time() - latest_progress >= self.__PROGRESS_INTERVAL:
+                        self.__logger.info("catching up: %s" % progress)
+                        latest_progress = time.time()
+
+                elif halt_on_caught_up and live_count == 0:
+                    return
+
+                # live checkpoint...
+                if checkpoint.caught_up and time.time() - latest_checkpoint >= self.__CHECKPOINT_INTERVAL:
+                    self.__save_live_checkpoint(checkpoint)
+                    latest_checkpoint = time.time()
+
+                if live_count == 0 and backlog_count == 0:
+                    time.sleep(self.__POLL_INTERVAL)
+
+        except FileNotFoundError as ex:
+            self.__logger.error(repr(ex))
+
+        except (BrokenPipeError, ConnectionError, EOFError, KeyboardInterrupt, SystemExit):
+            pass
+
+        finally:
+            if checkpoint is not None and checkpoint.caught_up:
+                self.__save_live_checkpoint(checkpoint)
+
+            if self.__backlog is not None:
+                self.__backlog.close()
+
+            if self.__live is not None:
+                self.__live.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # run methods...
+
+    def __echo_live(self):
+        count = self.__read_live()
+
+        if count > 0:
+            return count
+
+        # next file...
+        with self._lock:
+            file_paths = list(self._value[self.__live_index:])
+
+        for file_path in file_paths:
+            if self.__live is not None:
+                count += self.__read_live()                     # the file is complete
+                self.__live.close()
+
+            self.__logger.info("live: %s" % file_path)
+
+            if self.__backlog is not None:
+                self.__backlog.exclude(file_path)               # the file was created before the backlog was found
+
+            self.__live = CSVLiveFile(file_path)
+            self.__live_reader = None
+            self.__live_index += 1
+
+            count += self.__read_live()
+
+        return count
+
+
+    def __read_live(self):
+        if self.__live is None:
+            return 0
+
+        if self.__live_reader is None:
+            if not self.__live.is_ready():
+                return 0
+
+            self.__live_reader = CSVBatchReader(self.__live, nullify=self.__nullify)
+
+        try:
+            documents = list(self.__live_reader.documents())
+
+        except CSVReaderException as ex:
+            self.__logger.error("live: %s: %s" % (self.__live.file_path, ex))
+            return 0
+
+        if not documents:
+            return 0
+
+        self.__write([self.__encoder.encode(document) for document in documents])
+        self.__live_rec = documents[-1].get('rec', self.__live_rec)
+
+        return len(documents)
+
+
+    def __write(self, lines):
+        output = sys.stdout if self.__output is None else self.__output
+
+        output.write('\n'.join(lines) + '\n')
+        output.flush()
+
+
+    def __save_live_checkpoint(self, checkpoint):
+        if self.__live_rec is not None:
+            checkpoint.rec = LocalizedDatetime.construct_from_iso8601(self.__live_rec) or checkpoint.rec
+
+        checkpoint.save(self.__checkpoint_filename)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # setters for client process...
+
+    def include(self, file_path):
+        if file_path is None or file_path == self.__included:
+            return
+
+        with self._lock:
+            self._value.append(file_path)
+
+        self.__included = file_path
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def max_rate(self):
+        return self.__max_rate
+
+
+    @property
+    def max_count(self):
+        return self.__max_count
+
+
+    @property
+    def max_bytes(self):
+        return self.__max_bytes
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        with self._lock:
+            live = list(self._value)
+
+        return "CSVCatchUpReader:{queue_builder:%s, checkpoint_filename:%s, nullify:%s, max_rate:%s, " \
+               "max_count:%s, max_bytes:%s, live:%s}" % \
+               (self.__queue_builder, self.__checkpoint_filename, self.__nullify, self.max_rate,
+                self.max_count, self.max_bytes, live)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVCatchUpBacklog(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, cursors, nullify=False):
+        """
+        Constructor
+        """
+        self.__cursors = sorted(cursors, key=lambda cursor: os.path.basename(cursor.file_path))
+        self.__nullify = nullify                                                # bool
+
+        self.__reader = None                                                    # CSVBatchReader
+        self.__documents = None                                                 # iterator
+
+        self.__logger = Logging.getLogger()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_pending(self):
+        return self.__documents is not None or len(self.__cursors) > 0
+
+
+    def next_batch(self, encode, max_count, max_bytes):
+        lines = []
+        size = 0
+        rec = None
+
+        while len(lines) < max_count and size < max_bytes:
+            document = self.__next_document()
+
+            if document is None:
+                break
+
+            line = encode(document)
+
+            lines.append(line)
+            size += len(line) + 1
+            rec = document.get('rec', rec)
+
+        return lines, rec
+
+
+    def exclude(self, file_path):
+        file_paths = (file_path, ) + tuple(file_path + suffix for suffix in CSVCompression.suffixes())
+
+        self.__cursors = [cursor for cursor in self.__cursors if cursor.file_path not in file_paths]
+
+        if self.__reader is not None and self.__reader.filename in file_paths:
+            self.close()
+
+
+    def close(self):
+        if self.__reader is not None:
+            self.__reader.close()
+
+        self.__reader = None
+        self.__documents = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __next_document(self):
+        while True:
+            if self.__documents is None:
+                if not self.__cursors:
+                    return None
+
+                cursor = self.__cursors.pop(0)
+                file_path = CSVCompression.find(cursor.file_path)
+
+                try:
+                    self.__reader = CSVBatchReader.construct_for_file(file_path, nullify=self.__nullify)
+                except (CSVReaderException, FileNotFoundError) as ex:
+                    self.__logger.error("backlog: %s: %s" % (file_path, ex))          # e.g. deleted for space
+                    continue
+
+                self.__documents = islice(self.__reader.documents(), cursor.row, None)
+
+            try:
+                return next(self.__documents)
+
+            except StopIteration:
+                pass
+
+            except CSVReaderException as ex:
+                self.__logger.error("backlog: %s: %s" % (self.__reader.filename, ex))
+
+            self.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVCatchUpBacklog:{cursors:%s, reader:%s}" % (len(self.__cursors), self.__reader)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVCatchUpProgress(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, start, end):
+        """
+        Constructor
+        """
+        self.__start = start                                                    # float timestamp or None
+        self.__end = end                                                        # float timestamp
+
+        self.__started = time.time()                                            # float timestamp
+        self.__rec = start                                                      # float timestamp or None
+        self.__count = 0                                                        # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def update(self, rec, count):
+        if rec is not None:
+            self.__rec = rec.timestamp()
+
+        self.__count += count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def fraction(self):
+        if self.__start is None or self.__rec is None or self.__end <= self.__start:
+            return 1.0
+
+        return min(1.0, max(0.0, (self.__rec - self.__start) / (self.__end - self.__start)))
+
+
+    @property
+    def rate(self):
+        elapsed = time.time() - self.__started
+
+        return self.__count / elapsed if elapsed > 0 else 0.0
+
+
+    @property
+    def eta(self):
+        fraction = self.fraction
+
+        if fraction <= 0.0:
+            return None
+
+        return round((time.time() - self.__started) * (1.0 - fraction) / fraction, 1)
+
+
+    @property
+    def count(self):
+        return self.__count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVCatchUpProgress:{count:%s, fraction:%0.3f, rate:%0.1f, eta:%s}" % \
+               (self.count, self.fraction, self.rate, self.eta)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVCatchUpCheckpoint(JSONReport):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def filename_for(cls, root_path, topic_subject):
+        return os.path.join(root_path, '.catch-up-%s.json' % topic_subject.replace('/', '-'))
+
+
+    @classmethod
+    def construct_from_jdict(cls, jdict, skeleton=False):
+        if not jdict:
+            return cls(None, None, None, False)
+
+        topic = jdict.get('topic')
+        tag = jdict.get('tag')
+        rec = LocalizedDatetime.construct_from_iso8601(jdict.get('rec'))
+        caught_up = jdict.get('caught-up', False)
+
+        return cls(topic, tag, rec, caught_up)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, topic, tag, rec, caught_up):
+        """
+        Constructor
+        """
+        self.__topic = topic                                    # string
+        self.__tag = tag                                        # string
+        self.__rec = rec                                        # LocalizedDatetime or None
+        self.__caught_up = bool(caught_up)                      # bool
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def matches(self, topic, tag):
+        return self.rec is not None and self.topic == topic and self.tag == tag
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['topic'] = self.topic
+        jdict['tag'] = self.tag
+        jdict['rec'] = None if self.rec is None else self.rec.as_iso8601()
+        jdict['caught-up'] = self.caught_up
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def topic(self):
+        return self.__topic
+
+
+    @property
+    def tag(self):
+        return self.__tag
+
+
+    @property
+    def rec(self):
+        return self.__rec
+
+
+    @rec.setter
+    def rec(self, rec):
+        self.__rec = rec
+
+
+    @property
+    def caught_up(self):
+        return self.__caught_up
+
+
+    @caught_up.setter
+    def caught_up(self, caught_up):
+        self.__caught_up = bool(caught_up)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVCatchUpCheckpoint:{topic:%s, tag:%s, rec:%s, caught_up:%s}" % \
+               (self.topic, self.tag, self.rec, self.caught_up)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVLiveFile(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, file_path):
+        """
+        Constructor
+        """
+        self.__file_path = file_path                            # string
+        self.__file = None                                      # text file
+
+        self.__partial = ''                                     # string
+        self.__lookahead = []                                   # list of string
+
+
+    def __iter__(self):
+        return self
+
+
+    def __next__(self):
+        if self.__lookahead:
+            return self.__lookahead.pop(0)
+
+        line = self.__next_line()
+
+        if line is None:
+            raise StopIteration                                 # the csv reader may be resumed later
+
+        return line
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_ready(self):
+        if self.__lookahead:
+            return True
+
+        line = self.__next_line()
+
+        if line is None:
+            return False
+
+        self.__lookahead.append(line)
+
+        return True
+
+
+    def close(self):
+        if self.__file is not None:
+            self.__file.close()
+
+        self.__file = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __next_line(self):
+        if self.__file is None:
+            try:
+                self.__file = CSVCompression.open_for_reading(CSVCompression.find(self.__file_path))
+            except FileNotFoundError:
+                return None                                     # not yet written
+
+        line = self.__file.readline()
+
+        if not line:
+            return None
+
+        if not line.endswith('\n'):
+            self.__partial += line                              # the rest of the line is still to be written
+            return None
+
+        line = self.__partial + line
+        self.__partial = ''
+
+        return line
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def file_path(self):
+        return self.__file_path
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVLiveFile:{file_path:%s, open:%s}" % (self.file_path, self.__file is not None)
@@ -0,0 +1,268 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A CSVFilePool converts CSV files to JSON documents in a pool of worker processes. Each worker converts one file to a
+spool file of JSON lines in a temporary directory. The parent then reads the spool files, either in the order in which
+the CSV files were given, or as a k-way merge ordered by the rec field of each document.
+
+The merge mode assumes that each CSV file is itself ordered by rec, as is the case for csv_logger files. Documents with
+a missing or unreadable rec field take the rec of the preceding document in the same file.
+"""
+
+import heapq
+import os
+import shutil
+import tempfile
+
+from multiprocessing import Pool
+
+from scs_core.csv.csv_dict import CSVHeaderError
+from scs_core.csv.csv_reader import CSVReaderException
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.json import JSONify
+
+from scs_dev.reader.csv_batch_reader import CSVBatchReader
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVFilePool(object):
+    """
+    classdocs
+    """
+
+    REC_FIELD = 'rec'
+
+    __SPOOL_PREFIX = 'csv_reader-'
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def convert(cls, task):
+        index, filename, spool_path, cast, nullify, limit, keyed = task
+
+        # reader...
+        try:
+            reader = CSVBatchReader.construct_for_file(filename, cast=cast, nullify=nullify)
+
+        except FileNotFoundError:
+            return CSVFileConversion(index, filename, spool_path, error="file not found: %s" % filename)
+
+        except KeyError as ex:
+            return CSVFileConversion(index, filename, spool_path, error="empty header cell in: %s." % ex)
+
+        except ValueError as ex:
+            return CSVFileConversion(index, filename, spool_path, error="duplicate column names in: %s." % ex)
+
+        except CSVHeaderError as ex:
+            return CSVFileConversion(index, filename, spool_path,
+                                     error="clashing column names: '%s' and '%s'" % (ex.left, ex.right))
+
+        # spool...
+        encode = JSONify(ensure_ascii=False).encode
+        key = float('-inf')
+        rows = 0
+        warning = None
+
+        try:
+            with open(spool_path, 'w') as spool:
+                for document in reader.documents():
+                    if limit is not None and rows >= limit:
+                        break
+
+                    if keyed:
+                        key = cls.rec_key(document, key)
+                        spool.write("%r\t%s\n" % (key, encode(document)))
+
+                    else:
+                        spool.write(encode(document) + '\n')
+
+                    rows += 1
+
+        except CSVReaderException as ex:
+            warning = "ending file on row %d: %s" % (rows, ex)
+
+        finally:
+            reader.close()
+
+        return CSVFileConversion(index, filename, spool_path, reader=str(reader), rows=rows, warning=warning)
+
+
+    @classmethod
+    def rec_key(cls, document, default):
+        try:
+            rec = LocalizedDatetime.construct_from_iso8601(document.get(cls.REC_FIELD))
+        except (AttributeError, TypeError, ValueError):
+            return default
+
+        return default if rec is None else rec.timestamp()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def merge(conversions):
+        spools = [conversion.keyed_lines() for conversion in conversions]
+
+        for _, jstr in heapq.merge(*spools, key=lambda pair: pair[0]):
+            yield jstr
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, jobs, cast=True, nullify=False, limit=None, keyed=False):
+        """
+        Constructor
+        """
+        self.__jobs = int(jobs)                                     # int
+        self.__cast = bool(cast)                                    # bool
+        self.__nullify = bool(nullify)                              # bool
+        self.__limit = limit                                        # int or None
+        self.__keyed = bool(keyed)                                  # bool - spool with rec keys for merge
+
+        self.__pool = None                                          # multiprocessing.Pool
+        self.__spool_dir = None                                     # string
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def open(self):
+        self.__spool_dir = tempfile.mkdtemp(prefix=self.__SPOOL_PREFIX)
+        self.__pool = Pool(processes=self.__jobs)
+
+
+    def close(self):
+        if self.__pool is not None:
+            self.__pool.terminate()
+            self.__pool.join()
+            self.__pool = None
+
+        if self.__spool_dir is not None:
+            shutil.rmtree(self.__spool_dir, ignore_errors=True)
+            self.__spool_dir = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def conversions(self, filenames):
+        tasks = [(index, filename, os.path.join(self.__spool_dir, '%06d.jstr' % index), self.__cast, self.__nullify,
+                  self.__limit, self.__keyed) for index, filename in enumerate(filenames)]
+
+        # results are yielded in input order, while later files are converted in the background...
+        for conversion in self.__pool.imap(self.convert, tasks):
+            yield conversion
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def jobs(self):
+        return self.__jobs
+
+
+    @property
+    def keyed(self):
+        return self.__keyed
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVFilePool:{jobs:%s, cast:%s, nullify:%s, limit:%s, keyed:%s, spool_dir:%s}" % \
+               (self.jobs, self.__cast, self.__nullify, self.__limit, self.keyed, self.__spool_dir)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVFileConversion(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, index, filename, spool_path, reader=None, rows=0, warning=None, error=None):
+        """
+        Constructor
+        """
+        self.__index = index                                        # int
+        self.__filename = filename                                  # string
+        self.__spool_path = spool_path                              # string
+
+        self.__reader = reader                                      # string
+        self.__rows = rows                                          # int
+        self.__warning = warning                                    # string
+        self.__error = error                                        # string
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def lines(self):
+        try:
+            with open(self.spool_path) as spool:
+                for line in spool:
+                    yield line.rstrip('\n')
+
+        finally:
+            self.discard()
+
+
+    def keyed_lines(self):
+        for line in self.lines():
+            key, jstr = line.split('\t', 1)
+            yield float(key), jstr
+
+
+    def discard(self):
+        try:
+            os.remove(self.spool_path)
+        except OSError:
+            pass
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def index(self):
+        return self.__index
+
+
+    @property
+    def filename(self):
+        return self.__filename
+
+
+    @property
+    def spool_path(self):
+        return self.__spool_path
+
+
+    @property
+    def reader(self):
+        return self.__reader
+
+
+    @property
+    def rows(self):
+        return self.__rows
+
+
+    @property
+    def warning(self):
+        return self.__warning
+
+
+    @property
+    def error(self):
+        return self.__error
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVFileConversion:{index:%s, filename:%s, spool_path:%s, reader:%s, rows:%s, warning:%s, " \
+               "error:%s}" % \
+               (self.index, self.filename, self.spool_path, self.reader, self.rows, self.warning, self.error)
@@ -0,0 +1,205 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Equivalents of the scs_core CSVLogReader and CSVLogQueueBuilder that read compressed log files transparently, as a
+stream. Their interfaces match those of the scs_core classes, so that either may be used by the csv_logger.
+
+scs_core opens each log file with CSVReader.construct_for_file(..). The only new step here is the opening of the file:
+while the reader runs - in its own process - or while cursors are found, CSVLogFileReader.installed() substitutes a
+constructor that resolves the compressed form of the file if the plain file no longer exists, and decompresses it. A
+file may therefore be compressed by the csv_logger while it is queued. Where both forms exist - if compression was
+interrupted after the compressed file was complete - only the compressed file is read.
+
+The CSVLogQueueBuilder separates the byline query from the search for cursors, so that a reader may resume from a
+known timeline start without querying the byline API.
+"""
+
+import os
+import sys
+import time
+
+from contextlib import contextmanager
+
+from requests.exceptions import ConnectionError
+
+from scs_core.aws.manager.byline.byline_finder import DeviceBylineFinder
+from scs_core.aws.security.cognito_login_manager import CognitoLoginManager
+
+from scs_core.csv import csv_log_reader
+from scs_core.csv.csv_log_cursor_queue import CSVLogCursorQueue
+from scs_core.csv.csv_reader import CSVReader, CSVReaderException
+
+from scs_core.sys.logging import Logging
+
+from scs_dev.writer.csv_compression import CSVCompression
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVLogFileReader(CSVReader):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    @contextmanager
+    def installed(cls):
+        construct_for_file = CSVReader.__dict__['construct_for_file']
+        CSVReader.construct_for_file = cls.construct_for_file
+
+        try:
+            yield
+
+        finally:
+            CSVReader.construct_for_file = construct_for_file
+
+
+    @classmethod
+    def is_readable(cls, file_path):
+        if CSVCompression.is_compressed(file_path):
+            return True
+
+        if not file_path.endswith('.csv'):
+            return False                                                        # e.g. an incomplete compression
+
+        return not any(os.path.exists(file_path + suffix) for suffix in CSVCompression.suffixes())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_for_file(cls, filename, cast=True, nullify=False, start_row=0):
+        if filename is None:
+            return cls(sys.stdin, cast=cast, nullify=nullify, start_row=start_row)
+
+        file_path = CSVCompression.find(filename)
+        iterable = CSVCompression.open_for_reading(file_path)
+
+        try:
+            return cls(iterable, filename=file_path, cast=cast, nullify=nullify, start_row=start_row)
+
+        except CSVCompression.reading_errors() as ex:
+            iterable.close()
+            raise CSVReaderException(repr(ex))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def rows(self):
+        try:
+            yield from super().rows()
+
+        except CSVCompression.reading_errors() as ex:
+            raise CSVReaderException(repr(ex))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVLogReader(csv_log_reader.CSVLogReader):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def run(self, halt_on_empty_queue=False):
+        with CSVLogFileReader.installed():
+            super().run(halt_on_empty_queue=halt_on_empty_queue)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVLogQueueBuilder(object):
+    """
+    classdocs
+    """
+
+    __BYLINE_WAIT_TIME = 30.0           # seconds
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, conf, credentials, message_tag, topic_name, topic_path):
+        """
+        Constructor
+        """
+        self.__conf = conf                                      # CSVLoggerConf
+        self.__credentials = credentials                        # CognitoDeviceCredentials
+        self.__message_tag = message_tag                        # string
+        self.__topic_name = topic_name                          # string
+        self.__topic_path = topic_path                          # string
+
+        self.__logger = Logging.getLogger()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def find_cursors(self):
+        byline_start = self.find_byline_start()                                 # waits indefinitely for network
+        timeline_start = self.__conf.utc_retrospection_start(byline_start)
+
+        return timeline_start, self.find_cursors_from(timeline_start)           # may raise FileNotFoundError
+
+
+    def find_byline_start(self):
+        gatekeeper = CognitoLoginManager()
+        finder = DeviceBylineFinder()
+
+        while True:
+            try:
+                auth = gatekeeper.device_login(self.__credentials)
+
+                if not auth.is_ok():
+                    self.__logger.error(auth.authentication_status.description)
+
+                byline = finder.find_byline_for_topic(auth.id_token, self.__topic_path, include_messages=False)
+                break
+
+            except ConnectionError as ex:
+                self.__logger.info(ex)
+                time.sleep(self.__BYLINE_WAIT_TIME)
+
+        rec = None if byline is None else byline.rec
+
+        return None if rec is None else rec.utc_datetime
+
+
+    def find_cursors_from(self, timeline_start):
+        read_log = self.__conf.csv_log(self.__topic_name, tag=self.__message_tag, timeline_start=timeline_start)
+
+        with CSVLogFileReader.installed():
+            cursors = CSVLogCursorQueue.find_cursors_for_log(read_log, 'rec')   # may raise FileNotFoundError
+
+        return [cursor for cursor in cursors if CSVLogFileReader.is_readable(cursor.file_path)]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def conf(self):
+        return self.__conf
+
+
+    @property
+    def message_tag(self):
+        return self.__message_tag
+
+
+    @property
+    def topic_name(self):
+        return self.__topic_name
+
+
+    @property
+    def topic_path(self):
+        return self.__topic_path
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self):
+        return "CSVLogQueueBuilder:{conf:%s, credentials:%s, message_tag:%s, topic_name:%s, topic_path:%s}" % \
+               (self.__conf, self.__credentials, self.__message_tag, self.__topic_name, self.__topic_path)
@@ -0,0 +1,191 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A CSVPathPlan is a compiled form of a CSV header row. The header paths are split once, and mapped onto a tree of
+container slots, so that each row can be materialised as a JSON document without re-parsing the header paths.
+
+Semantics follow scs_core.csv.csv_dict.CSVHeader: dictionary fields are separated from their container by a period
+('.') character, list members by a colon (':') character, and list members are placed in column order.
+
+example:
+tag,rec,val.hmd,val.tmp,val.bin:0,val.bin:1
+=> {"tag": r[0], "rec": r[1], "val": {"hmd": r[2], "tmp": r[3], "bin": [r[4], r[5]]}}
+"""
+
+import re
+
+from collections import OrderedDict
+from operator import itemgetter
+
+from scs_core.csv.csv_dict import CSVHeaderError
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVPathPlan(object):
+    """
+    classdocs
+    """
+
+    __NODES = re.compile(r'([^.:]+)([.:])?')
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_paths(cls, paths):
+        if len(paths) != len(set(paths)):
+            raise ValueError(paths)                                 # duplicate column names
+
+        root = CSVPathPlanNode(False)
+
+        for index, path in enumerate(paths):
+            nodes = cls.__NODES.findall(path)
+
+            if not nodes:
+                raise KeyError(path)                                # empty header cell
+
+            root.insert(path, nodes, index)
+
+        root.compile()
+
+        return cls(paths, root)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, paths, root):
+        """
+        Constructor
+        """
+        self.__paths = tuple(paths)                                 # tuple of string
+        self.__root = root                                          # CSVPathPlanNode
+
+
+    def __len__(self):
+        return len(self.__paths)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_dict(self, row):
+        if len(row) != len(self.__paths):
+            raise ValueError("unmatched lengths: header: %s row: %s" % (list(self.__paths), row))
+
+        return self.__root.materialise(row)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def paths(self):
+        return self.__paths
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVPathPlan:{paths:%d, root:%s}" % (len(self), self.__root)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVPathPlanNode(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, is_list):
+        """
+        Constructor
+        """
+        self.__is_list = is_list                                    # bool
+        self.__slots = OrderedDict()                                # key: (path, int or CSVPathPlanNode)
+
+        self.__keys = None                                          # tuple of key
+        self.__getter = None                                        # itemgetter - only if all slots are leaves
+        self.__items = None                                         # tuple of (key, int or CSVPathPlanNode)
+
+
+    def __len__(self):
+        return len(self.__slots)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def insert(self, path, nodes, index, i=0):
+        name, separator = nodes[i]
+        key = int(name) if self.__is_list else name
+        existing = self.__slots.get(key)
+
+        # leaf node...
+        if i == len(nodes) - 1:
+            if existing is not None:
+                raise CSVHeaderError(existing[0], path)             # clashing column names
+
+            self.__slots[key] = (path, index)
+            return
+
+        # sub-container...
+        if existing is None:
+            existing = (path, CSVPathPlanNode(separator == ':'))
+            self.__slots[key] = existing
+
+        elif not isinstance(existing[1], CSVPathPlanNode):
+            raise CSVHeaderError(existing[0], path)                 # clashing column names
+
+        existing[1].insert(path, nodes, index, i + 1)
+
+
+    def compile(self):
+        self.__keys = tuple(self.__slots.keys())
+        self.__items = tuple((key, slot[1]) for key, slot in self.__slots.items())
+
+        for _, target in self.__items:
+            if isinstance(target, CSVPathPlanNode):
+                target.compile()
+
+        indices = [target for _, target in self.__items if not isinstance(target, CSVPathPlanNode)]
+
+        if len(indices) < len(self.__items) or not indices:
+            return
+
+        getter = itemgetter(*indices)
+        self.__getter = getter if len(indices) > 1 else lambda row: (getter(row), )
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def materialise(self, row):
+        # leaves only...
+        if self.__getter is not None:
+            values = self.__getter(row)
+
+            return list(values) if self.__is_list else OrderedDict(zip(self.__keys, values))
+
+        # mixed...
+        if self.__is_list:
+            return [target.materialise(row) if isinstance(target, CSVPathPlanNode) else row[target]
+                    for _, target in self.__items]
+
+        container = OrderedDict()
+
+        for key, target in self.__items:
+            container[key] = target.materialise(row) if isinstance(target, CSVPathPlanNode) else row[target]
+
+        return container
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def is_list(self):
+        return self.__is_list
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVPathPlanNode:{is_list:%s, slots:%d}" % (self.is_list, len(self))
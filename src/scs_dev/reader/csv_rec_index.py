@@ -0,0 +1,251 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A CSVRecIndex is a sparse index of byte offsets into a CSV file, keyed on the rec column. Entries are taken at the first
+row boundary after every INTERVAL bytes, so building the index touches only a few pages of a memory-mapped file, rather
+than parsing every row.
+
+The index may be cached beside the CSV file, with the suffix .rec-index.json. A cached index is used only if the size
+and modification time of the CSV file are unchanged.
+
+The index assumes that the file is ordered by rec, and that no cell contains a newline - as is the case for csv_logger
+files.
+
+example JSON:
+{"rec-field": "rec", "rec-column": 1, "size": 27590412, "mtime": 1697587200.0, "data-offset": 241,
+"entries": [[1697587200.0, 241], [1697587404.0, 65795], [1697587609.0, 131378]]}
+"""
+
+import csv
+import json
+import mmap
+import os
+
+from bisect import bisect_left
+from collections import OrderedDict
+
+from scs_core.csv.csv_reader import CSVReaderException
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.json import JSONable, JSONify
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVRecIndex(JSONable):
+    """
+    classdocs
+    """
+
+    SUFFIX = '.rec-index.json'
+
+    __INTERVAL = 65536                                              # bytes
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def index_path(cls, filename):
+        return filename + cls.SUFFIX
+
+
+    @staticmethod
+    def timestamp(value):
+        try:
+            rec = LocalizedDatetime.construct_from_iso8601(value)
+        except (AttributeError, TypeError, ValueError):
+            return None
+
+        return None if rec is None else rec.timestamp()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_for_file(cls, filename, rec_field='rec', cache=False):
+        index = cls.load(filename)
+
+        if index is not None and index.rec_field == rec_field and index.is_current(filename):
+            return index
+
+        index = cls.build(filename, rec_field)
+
+        if cache:
+            index.save(filename)
+
+        return index
+
+
+    @classmethod
+    def load(cls, filename):
+        try:
+            with open(cls.index_path(filename)) as file:
+                jdict = json.load(file)
+
+        except (OSError, ValueError):
+            return None
+
+        return cls.construct_from_jdict(jdict)
+
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict:
+            return None
+
+        rec_field = jdict.get('rec-field')
+        rec_column = jdict.get('rec-column')
+        size = jdict.get('size')
+        mtime = jdict.get('mtime')
+        data_offset = jdict.get('data-offset')
+        entries = [tuple(entry) for entry in jdict.get('entries', [])]
+
+        return cls(rec_field, rec_column, size, mtime, data_offset, entries)
+
+
+    @classmethod
+    def build(cls, filename, rec_field='rec'):
+        stat = os.stat(filename)
+
+        with open(filename, 'rb') as file:
+            if stat.st_size == 0:
+                return cls(rec_field, None, 0, stat.st_mtime, 0, [])
+
+            mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+            try:
+                header = mm.readline()
+                data_offset = mm.tell()
+
+                paths = next(csv.reader([header.decode()], skipinitialspace=True), [])
+
+                try:
+                    rec_column = paths.index(rec_field)
+                except ValueError:
+                    raise CSVReaderException("no %s column in: %s" % (rec_field, filename))
+
+                entries = []
+                offset = data_offset
+
+                while offset < stat.st_size:
+                    mm.seek(offset)
+                    line = mm.readline()
+
+                    row = next(csv.reader([line.decode(errors='replace')], skipinitialspace=True), [])
+                    timestamp = cls.timestamp(row[rec_column]) if len(row) > rec_column else None
+
+                    if timestamp is not None and (not entries or timestamp >= entries[-1][0]):
+                        entries.append((timestamp, offset))
+
+                    # next row boundary after the interval...
+                    boundary = mm.find(b'\n', offset + max(len(line), cls.__INTERVAL) - 1)
+
+                    if boundary < 0:
+                        break
+
+                    offset = boundary + 1
+
+            finally:
+                mm.close()
+
+        return cls(rec_field, rec_column, stat.st_size, stat.st_mtime, data_offset, entries)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, rec_field, rec_column, size, mtime, data_offset, entries):
+        """
+        Constructor
+        """
+        self.__rec_field = rec_field                                # string
+        self.__rec_column = rec_column                              # int
+        self.__size = size                                          # int
+        self.__mtime = mtime                                        # float
+        self.__data_offset = data_offset                            # int - first row after the header
+        self.__entries = entries                                    # list of (float timestamp, int offset)
+
+        self.__timestamps = [entry[0] for entry in entries]         # list of float
+
+
+    def __len__(self):
+        return len(self.__entries)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def is_current(self, filename):
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return False
+
+        return stat.st_size == self.size and stat.st_mtime == self.mtime
+
+
+    def offset(self, start=None):
+        if start is None:
+            return self.data_offset
+
+        # the last entry strictly before start - rows with equal rec may precede an entry with that rec...
+        i = bisect_left(self.__timestamps, start.timestamp())
+
+        return self.data_offset if i == 0 else self.__entries[i - 1][1]
+
+
+    def save(self, filename):
+        try:
+            with open(self.index_path(filename), 'w') as file:
+                file.write(JSONify.dumps(self))
+
+        except OSError:
+            pass                                                    # the index is only a cache
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['rec-field'] = self.rec_field
+        jdict['rec-column'] = self.rec_column
+        jdict['size'] = self.size
+        jdict['mtime'] = self.mtime
+        jdict['data-offset'] = self.data_offset
+        jdict['entries'] = [list(entry) for entry in self.__entries]
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def rec_field(self):
+        return self.__rec_field
+
+
+    @property
+    def rec_column(self):
+        return self.__rec_column
+
+
+    @property
+    def size(self):
+        return self.__size
+
+
+    @property
+    def mtime(self):
+        return self.__mtime
+
+
+    @property
+    def data_offset(self):
+        return self.__data_offset
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVRecIndex:{rec_field:%s, rec_column:%s, size:%s, mtime:%s, data_offset:%s, entries:%d}" % \
+               (self.rec_field, self.rec_column, self.size, self.mtime, self.data_offset, len(self))
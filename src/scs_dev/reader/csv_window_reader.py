@@ -0,0 +1,145 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A CSVWindowReader presents the rows of a CSV file whose rec field lies within the interval start <= rec < end. For a
+named file, the file is memory-mapped, and reading begins at the offset given by a CSVRecIndex, rather than at the top
+of the file. Reading stops at the first row on or after end. For stdin, and for compressed files, rows are filtered
+without seeking.
+"""
+
+import itertools
+import mmap
+import os
+import sys
+
+from scs_core.data.json import JSONify
+
+from scs_dev.reader.csv_batch_reader import CSVBatchReader
+from scs_dev.reader.csv_rec_index import CSVRecIndex
+from scs_dev.writer.csv_compression import CSVCompression
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVWindowReader(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_for_file(cls, filename, start=None, end=None, cast=True, nullify=False, rec_field='rec',
+                           cache_index=False):
+        if filename is None:
+            reader = CSVBatchReader(sys.stdin, cast=cast, nullify=nullify)
+
+            return cls(reader, None, None, None, start, end, rec_field)
+
+        if not os.path.isfile(filename):
+            raise FileNotFoundError(filename)
+
+        if CSVCompression.is_compressed(filename):
+            reader = CSVBatchReader.construct_for_file(filename, cast=cast, nullify=nullify)
+
+            return cls(reader, None, None, None, start, end, rec_field)
+
+        index = CSVRecIndex.construct_for_file(filename, rec_field=rec_field, cache=cache_index)
+
+        file = open(filename, 'rb')
+
+        if index.size == 0:
+            return cls(CSVBatchReader([], filename=None, cast=cast, nullify=nullify), file, None, index, start, end,
+                       rec_field)
+
+        mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        header = mm.readline()
+        mm.seek(index.offset(start))
+
+        lines = (line.decode() for line in itertools.chain((header, ), iter(mm.readline, b'')))
+        reader = CSVBatchReader(lines, filename=None, cast=cast, nullify=nullify)
+
+        return cls(reader, file, mm, index, start, end, rec_field)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, reader, file, mm, index, start, end, rec_field):
+        """
+        Constructor
+        """
+        self.__reader = reader                                      # CSVBatchReader
+        self.__file = file                                          # binary file or None
+        self.__mm = mm                                              # mmap or None
+        self.__index = index                                        # CSVRecIndex or None
+
+        self.__start = start                                        # LocalizedDatetime or None
+        self.__end = end                                            # LocalizedDatetime or None
+        self.__rec_field = rec_field                                # string
+
+        self.__encoder = JSONify(ensure_ascii=False)
+        self.__read_count = 0                                       # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def close(self):
+        self.__reader.close()
+
+        if self.__mm is not None:
+            self.__mm.close()
+
+        if self.__file is not None:
+            self.__file.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def documents(self):
+        start = None if self.__start is None else self.__start.timestamp()
+        end = None if self.__end is None else self.__end.timestamp()
+
+        for document in self.__reader.documents():
+            timestamp = CSVRecIndex.timestamp(document.get(self.__rec_field))
+
+            if timestamp is None:
+                continue
+
+            if start is not None and timestamp < start:
+                continue
+
+            if end is not None and timestamp >= end:
+                break
+
+            yield document
+
+            self.__read_count += 1
+
+
+    def rows(self):
+        encode = self.__encoder.encode
+
+        for document in self.documents():
+            yield encode(document)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def read_count(self):
+        return self.__read_count
+
+
+    @property
+    def index(self):
+        return self.__index
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVWindowReader:{start:%s, end:%s, rec_field:%s, read_count:%s, index:%s, reader:%s}" % \
+               (self.__start, self.__end, self.__rec_field, self.read_count, self.index, self.__reader)
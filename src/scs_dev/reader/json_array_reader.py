@@ -0,0 +1,187 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A JSONArrayReader presents the members of a JSON array as they are read, rather than when the whole array has been
+read. Input is read in chunks of whatever is available, up to chunk_size bytes, so the first member is presented as soon
+as it has arrived on a pipe. Consumed input is discarded, so memory use is bounded by the size of the largest member.
+
+A number is presented only when it is followed by a ',' or ']' delimiter, so that a number divided between chunks is
+not truncated. Other members are presented as soon as they are complete. Where a member is divided between chunks,
+successive reads are doubled in size.
+
+Invalid input raises ValueError, possibly after members have been presented. Empty input presents no members.
+"""
+
+import codecs
+import json
+import re
+import sys
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class JSONArrayReader(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_CHUNK_SIZE = 65536                                      # bytes
+
+    __WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_for_file(cls, filename, chunk_size=DEFAULT_CHUNK_SIZE):
+        file = sys.stdin.buffer if filename is None else open(filename, 'rb')
+
+        return cls(file, filename=filename, chunk_size=chunk_size)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, file, filename=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Constructor
+        """
+        self.__file = file                                          # binary file
+        self.__filename = filename                                  # string
+        self.__chunk_size = int(chunk_size)                         # int
+
+        self.__read = getattr(file, 'read1', file.read)             # returns what is available, if supported
+        self.__decoder = codecs.getincrementaldecoder('utf-8')()
+
+        self.__buffer = ''                                          # string
+        self.__eof = False                                          # bool
+
+        self.__read_count = 0                                       # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def close(self):
+        if self.__filename is None:
+            return
+
+        self.__file.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def items(self):
+        decode = json.JSONDecoder().raw_decode
+
+        # opening bracket...
+        pos = self.__skip(0)
+
+        if pos is None:
+            return                                                  # empty input
+
+        if self.__buffer[pos] != '[':
+            raise ValueError("not a JSON array at character %d" % pos)
+
+        pos += 1
+        size = self.__chunk_size
+
+        # members...
+        while True:
+            pos = self.__skip(pos)
+
+            if pos is None:
+                raise ValueError("unterminated JSON array")
+
+            if self.__buffer[pos] == ']':
+                return
+
+            if self.__read_count > 0:
+                if self.__buffer[pos] != ',':
+                    raise ValueError("expected ',' or ']' at: %s" % self.__buffer[pos:pos + 40])
+
+                pos = self.__skip(pos + 1)
+
+                if pos is None:
+                    raise ValueError("unterminated JSON array")
+
+            # member...
+            while True:
+                try:
+                    item, end = decode(self.__buffer, pos)
+
+                except json.JSONDecodeError:
+                    if not self.__fill(size):
+                        raise
+
+                    size *= 2                                       # the member is divided between chunks
+                    continue
+
+                if not self.__buffer[end - 1].isdigit():
+                    break                                           # the member is not a number, so is complete
+
+                delimiter = self.__WHITESPACE.match(self.__buffer, end).end()
+
+                if self.__buffer[delimiter:delimiter + 1] in (',', ']') or self.__eof:
+                    break                                           # the number is delimited
+
+                self.__fill(size)
+
+            self.__read_count += 1
+            size = self.__chunk_size
+
+            yield item
+
+            # discard consumed input...
+            if end > self.__chunk_size:
+                self.__buffer = self.__buffer[end:]
+                end = 0
+
+            pos = end
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __skip(self, pos):
+        while True:
+            pos = self.__WHITESPACE.match(self.__buffer, pos).end()
+
+            if pos < len(self.__buffer):
+                return pos
+
+            if not self.__fill(self.__chunk_size):
+                return None
+
+
+    def __fill(self, size):
+        if self.__eof:
+            return False
+
+        chunk = self.__read(size)
+
+        if not chunk:
+            self.__buffer += self.__decoder.decode(b'', final=True)
+            self.__eof = True
+            return False
+
+        self.__buffer += self.__decoder.decode(chunk)
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def filename(self):
+        return self.__filename
+
+
+    @property
+    def read_count(self):
+        return self.__read_count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "JSONArrayReader:{filename:%s, chunk_size:%s, read_count:%s}" % \
+               (self.filename, self.__chunk_size, self.read_count)
@@ -0,0 +1,206 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Schedules the sensor reads of a sampler, and records the time of each read as an Acquisition.
+
+Reads on the same bus are serialised by the bus's lock - reads on different buses may proceed concurrently. A periodic
+read is made on a background thread, interval seconds after the previous read completed - when a self-timed sensor
+has its next measurement ready. Its latest Acquisition is held, and the sampler takes the held datum, rather than
+waiting on the sensor. A direct read is made on the caller's thread, but also holds the bus lock, so that it is never
+interleaved with a background read. A read function may itself make a direct read on its bus.
+
+held(..) bounds the staleness of a held datum: if the latest Acquisition is too old - for example, if the sensor is
+failing - the sensor is read directly.
+
+A read function should return a datum, or a null datum if the sensor fails. Any other exception raised by a periodic
+read is logged, and the previous Acquisition is retained.
+"""
+
+import time
+
+from collections import OrderedDict
+from threading import Event, Lock, RLock, Thread
+
+from scs_core.sys.logging import Logging
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class AcquisitionScheduler(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_BUS =       'default'
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__bus_locks = {}                                       # dict of bus: RLock
+        self.__periodic = OrderedDict()                             # dict of name: (read, interval, bus)
+        self.__latest = {}                                          # dict of name: Acquisition
+
+        self.__lock = Lock()                                        # guards bus_locks and latest
+        self.__stopping = Event()
+        self.__threads = []                                         # list of Thread
+
+        self.__logger = Logging.getLogger()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def add_periodic(self, name, read, interval, bus=DEFAULT_BUS):
+        self.__periodic[name] = (read, float(interval), bus)
+
+
+    def start(self):
+        if self.__threads:
+            return
+
+        self.__stopping.clear()
+
+        for name, (read, interval, bus) in self.__periodic.items():
+            thread = Thread(target=self.__run_periodic, args=(name, read, interval, bus), daemon=True)
+            thread.start()
+
+            self.__threads.append(thread)
+
+
+    def stop(self):
+        self.__stopping.set()
+
+        for thread in self.__threads:
+            thread.join()
+
+        self.__threads = []
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def acquire(self, name, read, bus=DEFAULT_BUS):
+        """
+        reads now, on the caller's thread, and returns the Acquisition
+        """
+        with self.bus_lock(bus):
+            start = time.time()
+            datum = read()
+            acquired = time.time()
+
+        acquisition = Acquisition(name, datum, acquired, acquired - start)
+
+        with self.__lock:
+            self.__latest[name] = acquisition
+
+        return acquisition
+
+
+    def held(self, name, read, max_age=None, bus=DEFAULT_BUS):
+        """
+        returns the latest Acquisition, or reads now if there is none, or if it is more than max_age seconds old
+        """
+        acquisition = self.latest(name)
+
+        if acquisition is None or (max_age is not None and acquisition.age() > max_age):
+            return self.acquire(name, read, bus=bus)
+
+        return acquisition
+
+
+    def latest(self, name):
+        with self.__lock:
+            return self.__latest.get(name)
+
+
+    def bus_lock(self, bus=DEFAULT_BUS):
+        with self.__lock:
+            if bus not in self.__bus_locks:
+                self.__bus_locks[bus] = RLock()
+
+            return self.__bus_locks[bus]
+
+
+    def is_periodic(self, name):
+        return name in self.__periodic
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __run_periodic(self, name, read, interval, bus):
+        acquisition = self.latest(name)
+        due = time.time() + interval if acquisition is None else acquisition.acquired + interval
+
+        while not self.__stopping.wait(max(0.0, due - time.time())):
+            try:
+                due = self.acquire(name, read, bus=bus).acquired + interval
+
+            except Exception as ex:
+                self.__logger.error("%s: %s" % (name, repr(ex)))
+                due = time.time() + interval
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        periodic = ', '.join("%s:%s" % (name, interval) for name, (_, interval, _) in self.__periodic.items())
+
+        return "AcquisitionScheduler:{periodic:{%s}, buses:%s, running:%s}" % \
+               (periodic, sorted(self.__bus_locks), bool(self.__threads))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class Acquisition(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, name, datum, acquired, elapsed):
+        """
+        Constructor
+        """
+        self.__name = name                                          # string
+        self.__datum = datum                                        # datum
+        self.__acquired = acquired                                  # float time - at the end of the read
+        self.__elapsed = elapsed                                    # float seconds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def age(self, now=None):
+        return (time.time() if now is None else now) - self.acquired
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def name(self):
+        return self.__name
+
+
+    @property
+    def datum(self):
+        return self.__datum
+
+
+    @property
+    def acquired(self):
+        return self.__acquired
+
+
+    @property
+    def elapsed(self):
+        return self.__elapsed
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "Acquisition:{name:%s, datum:%s, acquired:%0.3f, elapsed:%0.3f}" % \
+               (self.name, self.datum, self.acquired, self.elapsed)
@@ -2,14 +2,23 @@
 Created on 18 Feb 2017
 
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+If a pre_sample_interval is given, the SHT and barometer are read in the background, every pre_sample_interval
+seconds, and each sample takes their latest data - a schedule tick is then served without waiting on the sensors, and
+the sample is recorded at the tick. A datum more than MAX_AGE_INTERVALS pre-sample intervals old is not used - the
+sensor is then read directly.
 """
 
+from collections import OrderedDict
+
 from scs_core.data.datetime import LocalizedDatetime
 
 from scs_core.sample.climate_sample import ClimateSample
 
 from scs_core.sampler.sampler import Sampler
 
+from scs_dev.sampler.acquisition_scheduler import AcquisitionScheduler
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -18,9 +27,11 @@ class ClimateSampler(Sampler):
     classdocs
     """
 
+    MAX_AGE_INTERVALS =     2
+
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, runner, tag, sht, barometer=None, altitude=None):
+    def __init__(self, runner, tag, sht, barometer=None, altitude=None, pre_sample_interval=None):
         """
         Constructor
         """
@@ -32,32 +43,84 @@ class ClimateSampler(Sampler):
         self.__barometer = barometer
         self.__altitude = altitude
 
+        self.__pre_sample_interval = pre_sample_interval            # float seconds
+
+        self.__scheduler = AcquisitionScheduler()
+        self.__acquisitions = OrderedDict()                         # dict of name: Acquisition
+
 
     # ----------------------------------------------------------------------------------------------------------------
 
+    def start(self):
+        if not self.__pre_sample_interval:
+            return
+
+        self.__scheduler.acquire('sht', self.__sht.sample)
+        self.__scheduler.add_periodic('sht', self.__sht.sample, self.__pre_sample_interval)
+
+        if self.__barometer:
+            self.__scheduler.acquire('barometer', self.__read_barometer)
+            self.__scheduler.add_periodic('barometer', self.__read_barometer, self.__pre_sample_interval)
+
+        self.__scheduler.start()
+
+
+    def stop(self):
+        self.__scheduler.stop()
+
+
     def reset(self):
         Sampler.reset(self)
 
-        self.__sht.reset()
+        with self.__scheduler.bus_lock():
+            self.__sht.reset()
 
 
     def sample(self):
-        sht_sample = self.__sht.sample()
+        if self.__pre_sample_interval:
+            recorded = LocalizedDatetime.now().utc()                # the data are held - record the tick
+            max_age = self.__pre_sample_interval * self.MAX_AGE_INTERVALS
 
-        # TODO: get the altitude from GPS if necessary
+            acquisitions = OrderedDict()
+            acquisitions['sht'] = self.__scheduler.held('sht', self.__sht.sample, max_age=max_age)
+
+            if self.__barometer:
+                acquisitions['barometer'] = self.__scheduler.held('barometer', self.__read_barometer, max_age=max_age)
 
-        if self.__barometer:
-            barometer_sample = self.__barometer.sample(altitude=self.__altitude, include_temp=False)
         else:
-            barometer_sample = None
+            acquisitions = OrderedDict()
+            acquisitions['sht'] = self.__scheduler.acquire('sht', self.__sht.sample)
+
+            # TODO: get the altitude from GPS if necessary
+
+            if self.__barometer:
+                acquisitions['barometer'] = self.__scheduler.acquire('barometer', self.__read_barometer)
 
-        recorded = LocalizedDatetime.now().utc()        # after sampling, so that we can monitor resource contention
+            recorded = LocalizedDatetime.now().utc()    # after sampling, so that we can monitor resource contention
+
+        self.__acquisitions = acquisitions
+
+        sht_sample = acquisitions['sht'].datum
+        barometer_sample = acquisitions['barometer'].datum if 'barometer' in acquisitions else None
 
         return ClimateSample(self.__tag, recorded, sht_sample, barometer_sample)
 
 
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __read_barometer(self):
+        return self.__barometer.sample(altitude=self.__altitude, include_temp=False)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def acquisitions(self):
+        return self.__acquisitions
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
-        return "ClimateSampler:{runner:%s, tag:%s, sht:%s, barometer:%s, altitude:%s}" % \
-               (self.runner, self.__tag, self.__sht, self.__barometer, self.__altitude)
+        return "ClimateSampler:{runner:%s, tag:%s, sht:%s, barometer:%s, altitude:%s, pre_sample_interval:%s}" % \
+               (self.runner, self.__tag, self.__sht, self.__barometer, self.__altitude, self.__pre_sample_interval)
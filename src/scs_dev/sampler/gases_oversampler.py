@@ -0,0 +1,275 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Accumulates the electrochemical data read from a gas sensor interface between reports, in a RunningAggregate for each
+numeric field of each sensor, and of the Pt1000. On report(..), each field is given by the chosen aggregate - mean,
+median or trimmed mean - and the accumulators are reset.
+
+Each sensor's report also carries an "ovs" node, summarising its concentration (or, without a concentration, its
+first numeric field): the number of readings, the mean, median, trimmed mean and standard deviation.
+
+example sensor report:
+{"weV": 0.29019, "aeV": 0.29494, "weC": 0.00181, "cnc": 22.8, "vCal": 15.858,
+"ovs": {"n": 10, "avg": 22.9, "med": 22.8, "tmn": 22.8, "sd": 1.4}}
+"""
+
+from collections import OrderedDict
+from threading import Lock
+
+from scs_core.data.json import JSONable
+from scs_core.data.str import Str
+
+from scs_dev.sampler.running_aggregate import RunningAggregate
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class GasesOversampler(object):
+    """
+    classdocs
+    """
+
+    MEAN =              'mean'
+    MEDIAN =            'median'
+    TRIMMED_MEAN =      'trimmed'
+
+    AGGREGATES =        (MEAN, MEDIAN, TRIMMED_MEAN)
+
+    __SUMMARY_FIELD =   'cnc'
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, aggregate=TRIMMED_MEAN):
+        """
+        Constructor
+        """
+        if aggregate not in self.AGGREGATES:
+            raise ValueError("aggregate: %s" % aggregate)
+
+        self.__aggregate = aggregate                                # string
+
+        self.__sensors = OrderedDict()                              # dict of name: dict of field: RunningAggregate
+        self.__pt1000 = OrderedDict()                               # dict of field: RunningAggregate
+        self.__count = 0                                            # int
+
+        self.__lock = Lock()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, datum):                                        # AFEDatum or ISIDatum
+        if datum is None:
+            return
+
+        with self.__lock:
+            for name, sensor_datum in datum.sns.items():
+                if name not in self.__sensors:
+                    self.__sensors[name] = OrderedDict()
+
+                self.__append_fields(self.__sensors[name], sensor_datum)
+
+            pt1000 = getattr(datum, 'pt1000', None)
+
+            if pt1000 is not None:
+                self.__append_fields(self.__pt1000, pt1000)
+
+            self.__count += 1
+
+
+    def report(self):
+        """
+        returns an OversampledDatum, or None if nothing has been accumulated, and resets the accumulators
+        """
+        with self.__lock:
+            if not self.__count:
+                return None
+
+            sensors, pt1000, count = self.__sensors, self.__pt1000, self.__count
+
+            self.__sensors = OrderedDict()
+            self.__pt1000 = OrderedDict()
+            self.__count = 0
+
+        sns = [(name, self.__sensor_datum(fields)) for name, fields in sensors.items()]
+        pt1000_datum = OversampledSensorDatum(self.__values(pt1000)) if pt1000 else None
+
+        return OversampledDatum(count, pt1000_datum, *sns)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __sensor_datum(self, fields):
+        summary_field = self.__SUMMARY_FIELD if self.__SUMMARY_FIELD in fields else next(iter(fields), None)
+
+        return OversampledSensorDatum(self.__values(fields), None if summary_field is None else fields[summary_field])
+
+
+    def __values(self, fields):
+        values = OrderedDict()
+
+        for field, aggregate in fields.items():
+            if self.__aggregate == self.MEAN:
+                values[field] = aggregate.mean()
+
+            elif self.__aggregate == self.MEDIAN:
+                values[field] = aggregate.median()
+
+            else:
+                values[field] = aggregate.trimmed_mean()
+
+        return values
+
+
+    @staticmethod
+    def __append_fields(fields, datum):
+        for field, value in datum.as_json().items():
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                continue
+
+            if field not in fields:
+                fields[field] = RunningAggregate()
+
+            fields[field].append(value)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def aggregate(self):
+        return self.__aggregate
+
+
+    @property
+    def count(self):
+        return self.__count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "GasesOversampler:{aggregate:%s, sensors:%s, count:%s}" % \
+               (self.aggregate, list(self.__sensors.keys()), self.count)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class OversampledDatum(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, count, pt1000, *sns):
+        """
+        Constructor
+        """
+        self.__count = count                                        # int
+        self.__pt1000 = pt1000                                      # OversampledSensorDatum
+        self.__sns = OrderedDict(sns)                               # dict of name: OversampledSensorDatum
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['ovs'] = self.count
+
+        if self.pt1000:
+            jdict['pt1'] = self.pt1000
+
+        jdict['sns'] = self.sns
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def count(self):
+        return self.__count
+
+
+    @property
+    def pt1000(self):
+        return self.__pt1000
+
+
+    @property
+    def sns(self):
+        return self.__sns
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "OversampledDatum:{count:%s, pt1000:%s, sns:%s}" % (self.count, self.pt1000, Str.collection(self.sns))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class OversampledSensorDatum(JSONable):
+    """
+    classdocs
+    """
+
+    __PRECISION =       6
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, values, summary=None):
+        """
+        Constructor
+        """
+        self.__values = values                                      # dict of field: float
+        self.__summary = summary                                    # RunningAggregate
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        for field, value in self.values.items():
+            jdict[field] = self.__round(value)
+
+        if self.summary is not None:
+            summary = OrderedDict()
+
+            summary['n'] = self.summary.count
+            summary['avg'] = self.__round(self.summary.mean())
+            summary['med'] = self.__round(self.summary.median())
+            summary['tmn'] = self.__round(self.summary.trimmed_mean())
+            summary['sd'] = self.__round(self.summary.std_dev())
+
+            jdict['ovs'] = summary
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def __round(cls, value):
+        return None if value is None else round(value, cls.__PRECISION)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def values(self):
+        return self.__values
+
+
+    @property
+    def summary(self):
+        return self.__summary
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "OversampledSensorDatum:{values:%s, summary:%s}" % (Str.collection(self.values), self.summary)
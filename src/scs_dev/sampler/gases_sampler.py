@@ -2,8 +2,22 @@
 Created on 20 Oct 2016
 
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The SHT and the electrochemical interface are read for each sample - the electrochemical interface requires the SHT
+datum for temperature compensation. The barometer and the SCD30 are read on their own cadence, in the background:
+the barometer every barometer_interval seconds, and the SCD30 at its measurement interval, with the latest actual
+pressure. Each sample takes their latest data, so the sampling interval may be shorter than the SCD30 measurement
+interval. All sensors share a bus, so reads are never interleaved.
+
+If an oversample_interval is given, the SHT and the electrochemical interface are also read in the background, every
+oversample_interval seconds, and the electrochemical data are accumulated by a GasesOversampler. Each sample then
+reports the aggregate of the readings since the previous sample, and the latest SHT datum.
+
+The Acquisition for each sensor - the time at which it was read - is available after each sample.
 """
 
+from collections import OrderedDict
+
 from scs_core.data.datetime import LocalizedDatetime
 
 from scs_core.sample.gases_sample import GasesSample
@@ -11,6 +25,9 @@ from scs_core.sampler.sampler import Sampler
 
 from scs_core.sys.logging import Logging
 
+from scs_dev.sampler.acquisition_scheduler import AcquisitionScheduler
+from scs_dev.sampler.gases_oversampler import GasesOversampler
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -19,9 +36,15 @@ class GasesSampler(Sampler):
     classdocs
     """
 
+    BUS =                           'sensors'
+
+    DEFAULT_BAROMETER_INTERVAL =    60.0        # seconds
+
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, runner, tag, barometer, scd30, sht, sensor_interface):
+    def __init__(self, runner, tag, barometer, scd30, sht, sensor_interface,
+                 barometer_interval=DEFAULT_BAROMETER_INTERVAL, oversample_interval=None,
+                 aggregate=GasesOversampler.TRIMMED_MEAN):
         """
         Constructor
         """
@@ -34,6 +57,15 @@ class GasesSampler(Sampler):
         self.__sht = sht                                            # SHT31
         self.__sensor_interface = sensor_interface                  # GasSensorInterface
 
+        self.__barometer_interval = barometer_interval              # float seconds
+        self.__oversample_interval = oversample_interval            # float seconds
+
+        self.__oversampler = None if oversample_interval is None or sensor_interface is None else \
+            GasesOversampler(aggregate=aggregate)
+
+        self.__scheduler = AcquisitionScheduler()
+        self.__acquisitions = OrderedDict()                         # dict of name: Acquisition
+
         self.__src = None if sensor_interface is None else sensor_interface.src()
         self.__logger = Logging.getLogger()
 
@@ -43,72 +75,157 @@ class GasesSampler(Sampler):
     def init(self, scd30_conf):
         if self.__barometer:
             self.__barometer.init()
-            pressure_datum = self.__barometer.sample()
 
-        else:
-            pressure_datum = None
+            self.__scheduler.acquire('barometer', self.__read_barometer, bus=self.BUS)
+            self.__scheduler.add_periodic('barometer', self.__read_barometer, self.__barometer_interval, bus=self.BUS)
 
-        if not self.__scd30:
-            return
+        if self.__scd30:
+            pressure_datum = self.__latest_datum('barometer')
+            actual_press = None if pressure_datum is None else pressure_datum.actual_press
 
-        actual_press = None if pressure_datum is None else pressure_datum.actual_press
+            self.__scd30.set_auto_self_calib(True)
+            self.__scd30.set_measurement_interval(scd30_conf.sample_interval)
+
+            self.__scd30.stop_periodic_measurement()
+            self.__scd30.start_periodic_measurement(ambient_pressure_kpa=actual_press)
+
+            self.__scheduler.acquire('scd30', self.__read_scd30, bus=self.BUS)
+            self.__scheduler.add_periodic('scd30', self.__read_scd30, scd30_conf.sample_interval, bus=self.BUS)
+
+        if self.__oversampler:
+            self.__scheduler.acquire('electrochem', self.__read_oversample, bus=self.BUS)
+            self.__scheduler.add_periodic('electrochem', self.__read_oversample, self.__oversample_interval,
+                                          bus=self.BUS)
 
-        self.__scd30.set_auto_self_calib(True)
-        self.__scd30.set_measurement_interval(scd30_conf.sample_interval)
+        self.__scheduler.start()
 
-        self.__scd30.stop_periodic_measurement()
-        self.__scd30.start_periodic_measurement(ambient_pressure_kpa=actual_press)
 
-        self.__scd30.sample()
-        self.__scd30.start_periodic_measurement(ambient_pressure_kpa=actual_press)
+    def stop(self):
+        self.__scheduler.stop()
 
 
     def sample(self):
+        acquisitions = OrderedDict()
+
+        if self.__barometer:
+            acquisitions['barometer'] = self.__scheduler.held('barometer', self.__read_barometer, bus=self.BUS)
+
+        if self.__scd30:
+            acquisitions['scd30'] = self.__scheduler.held('scd30', self.__read_scd30, bus=self.BUS)
+
+        if self.__oversampler:
+            electrochem_datum = self.__oversampler.report()
+
+            if electrochem_datum is None:
+                self.__scheduler.acquire('electrochem', self.__read_oversample, bus=self.BUS)     # not initialised
+                electrochem_datum = self.__oversampler.report()
+
+            if self.__sht:
+                acquisitions['sht'] = self.__scheduler.held('sht', self.__read_sht, bus=self.BUS)
+
+            acquisitions['electrochem'] = self.__scheduler.latest('electrochem')
+
+        else:
+            if self.__sht:
+                acquisitions['sht'] = self.__scheduler.acquire('sht', self.__read_sht, bus=self.BUS)
+
+            if self.__sensor_interface:
+                sht_datum = acquisitions['sht'].datum if 'sht' in acquisitions else None
+
+                acquisitions['electrochem'] = self.__scheduler.acquire('electrochem',
+                                                                       lambda: self.__read_electrochem(sht_datum),
+                                                                       bus=self.BUS)
+
+            electrochem_datum = acquisitions['electrochem'].datum if 'electrochem' in acquisitions else None
+
+        self.__acquisitions = acquisitions
+
+        scd30_datum = acquisitions['scd30'].datum if 'scd30' in acquisitions else None
+        sht_datum = acquisitions['sht'].datum if 'sht' in acquisitions else None
+
+        recorded = LocalizedDatetime.now().utc()        # after sampling, so that we can monitor resource contention
+
+        return GasesSample(self.__tag, recorded, scd30_datum, electrochem_datum, sht_datum, src=self.__src)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __latest_datum(self, name):
+        acquisition = self.__scheduler.latest(name)
+
+        return None if acquisition is None else acquisition.datum
+
+
+    def __read_barometer(self):
         try:
-            pressure_datum = self.__barometer.sample() if self.__barometer else None
+            return self.__barometer.sample()
         except OSError as ex:
             self.__logger.error("sample error 1: %s" % repr(ex))
-            pressure_datum = self.__barometer.null_datum()
+            return self.__barometer.null_datum()
 
+
+    def __read_scd30(self):
+        pressure_datum = self.__latest_datum('barometer')
         actual_press = None if pressure_datum is None else pressure_datum.actual_press
 
         try:
-            if self.__scd30:
-                if self.__barometer and actual_press is None:
-                    self.__logger.error("sample error 2: pA specified but unavailable")
-                    scd30_datum = self.__scd30.null_datum()
-
-                else:
-                    scd30_datum = self.__scd30.sample()
-
-                self.__scd30.start_periodic_measurement(ambient_pressure_kpa=actual_press)
+            if self.__barometer and actual_press is None:
+                self.__logger.error("sample error 2: pA specified but unavailable")
+                scd30_datum = self.__scd30.null_datum()
 
             else:
-                scd30_datum = None
+                scd30_datum = self.__scd30.sample()
+
+            self.__scd30.start_periodic_measurement(ambient_pressure_kpa=actual_press)
 
         except OSError as ex:
             self.__logger.error("sample error 3: %s" % repr(ex))
             scd30_datum = self.__scd30.null_datum()
 
+        return scd30_datum
+
+
+    def __read_sht(self):
         try:
-            sht_datum = self.__sht.sample() if self.__sht else None
+            return self.__sht.sample()
         except OSError as ex:
             self.__logger.error("sample error 4: %s" % repr(ex))
-            sht_datum = self.__sht.null_datum()
+            return self.__sht.null_datum()
+
+
+    def __read_oversample(self):                                    # the bus lock is held
+        sht_datum = self.__scheduler.acquire('sht', self.__read_sht, bus=self.BUS).datum if self.__sht else None
+
+        electrochem_datum = self.__read_electrochem(sht_datum)
+        self.__oversampler.append(electrochem_datum)
+
+        return electrochem_datum
 
+
+    def __read_electrochem(self, sht_datum):
         try:
-            electrochem_datum = self.__sensor_interface.sample(sht_datum) if self.__sensor_interface else None
+            return self.__sensor_interface.sample(sht_datum)
         except OSError as ex:
             self.__logger.error("sample error 5: %s" % repr(ex))
-            electrochem_datum = self.__sensor_interface.null_datum()
+            return self.__sensor_interface.null_datum()
 
-        recorded = LocalizedDatetime.now().utc()        # after sampling, so that we can monitor resource contention
 
-        return GasesSample(self.__tag, recorded, scd30_datum, electrochem_datum, sht_datum, src=self.__src)
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def acquisitions(self):
+        return self.__acquisitions
+
+
+    @property
+    def bus_lock(self):
+        return self.__scheduler.bus_lock(self.BUS)
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
-        return "GasesSampler:{runner:%s, tag:%s, src:%s, barometer:%s, scd30:%s, sht:%s}" % \
-                    (self.runner, self.__tag, self.__src, self.__barometer, self.__scd30, self.__sht)
+        return "GasesSampler:{runner:%s, tag:%s, src:%s, barometer:%s, scd30:%s, sht:%s, barometer_interval:%s, " \
+               "oversample_interval:%s, oversampler:%s, scheduler:%s}" % \
+                    (self.runner, self.__tag, self.__src, self.__barometer, self.__scd30, self.__sht,
+                     self.__barometer_interval, self.__oversample_interval, self.__oversampler, self.__scheduler)
@@ -2,6 +2,11 @@
 Created on 21 Jun 2018
 
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+If a pre_sample_interval is given, the barometer is read in the background, every pre_sample_interval seconds, and
+each sample takes its latest datum - a schedule tick is then served without waiting on the sensor, and the sample is
+recorded at the tick. A datum more than MAX_AGE_INTERVALS pre-sample intervals old is not used - the barometer is
+then read directly.
 """
 
 from scs_core.data.datetime import LocalizedDatetime
@@ -10,6 +15,8 @@ from scs_core.sample.pressure_sample import PressureSample
 
 from scs_core.sampler.sampler import Sampler
 
+from scs_dev.sampler.acquisition_scheduler import AcquisitionScheduler
+
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -18,9 +25,11 @@ class PressureSampler(Sampler):
     classdocs
     """
 
+    MAX_AGE_INTERVALS =     2
+
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, runner, tag, barometer, altitude):
+    def __init__(self, runner, tag, barometer, altitude, pre_sample_interval=None):
         """
         Constructor
         """
@@ -30,6 +39,11 @@ class PressureSampler(Sampler):
         self.__barometer = barometer
         self.__altitude = altitude
 
+        self.__pre_sample_interval = pre_sample_interval            # float seconds
+
+        self.__scheduler = AcquisitionScheduler()
+        self.__acquisition = None                                   # Acquisition
+
 
     # ----------------------------------------------------------------------------------------------------------------
 
@@ -37,15 +51,49 @@ class PressureSampler(Sampler):
         self.__barometer.init()
 
 
+    def start(self):
+        if not self.__pre_sample_interval:
+            return
+
+        self.__scheduler.acquire('barometer', self.__read_barometer)
+        self.__scheduler.add_periodic('barometer', self.__read_barometer, self.__pre_sample_interval)
+
+        self.__scheduler.start()
+
+
+    def stop(self):
+        self.__scheduler.stop()
+
+
     def sample(self):
-        barometer_sample = self.__barometer.sample(altitude=self.__altitude)
-        rec = LocalizedDatetime.now().utc()         # after sampling, so that we can monitor resource contention
+        if self.__pre_sample_interval:
+            rec = LocalizedDatetime.now().utc()                     # the datum is held - record the tick
+            max_age = self.__pre_sample_interval * self.MAX_AGE_INTERVALS
+
+            self.__acquisition = self.__scheduler.held('barometer', self.__read_barometer, max_age=max_age)
+
+        else:
+            self.__acquisition = self.__scheduler.acquire('barometer', self.__read_barometer)
+            rec = LocalizedDatetime.now().utc()     # after sampling, so that we can monitor resource contention
+
+        return PressureSample(self.__tag, rec, self.__acquisition.datum)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __read_barometer(self):
+        return self.__barometer.sample(altitude=self.__altitude)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
 
-        return PressureSample(self.__tag, rec, barometer_sample)
+    @property
+    def acquisition(self):
+        return self.__acquisition
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
-        return "PressureSampler:{runner:%s, tag:%s, barometer:%s, altitude:%s}" % \
-               (self.runner, self.__tag, self.__barometer, self.__altitude)
+        return "PressureSampler:{runner:%s, tag:%s, barometer:%s, altitude:%s, pre_sample_interval:%s}" % \
+               (self.runner, self.__tag, self.__barometer, self.__altitude, self.__pre_sample_interval)
@@ -0,0 +1,204 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Summary statistics of a stream of values, held in running accumulators - the values themselves are not retained:
+
+* mean and standard deviation - by Welford's method
+* median - by the P-square algorithm, which is exact for up to five values, and an estimate thereafter
+* trimmed mean - the mean of the values, excluding the smallest and the largest, where there are at least three
+
+Values of None are ignored.
+
+https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance#Welford's_online_algorithm
+https://www.cse.wustl.edu/~jain/papers/ftp/psqr.pdf
+"""
+
+import math
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class RunningAggregate(object):
+    """
+    classdocs
+    """
+
+    __MARKERS =         5
+    __INCREMENTS =      (0.0, 0.25, 0.5, 0.75, 1.0)                 # for the median
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__count = 0                                            # int
+        self.__mean = 0.0                                           # float
+        self.__m2 = 0.0                                             # float - sum of squared differences from the mean
+        self.__sum = 0.0                                            # float
+        self.__min = None                                           # float
+        self.__max = None                                           # float
+
+        self.__heights = []                                         # list of float - P-square marker heights
+        self.__positions = None                                     # list of int - P-square marker positions
+        self.__desired = None                                       # list of float - P-square desired positions
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, value):
+        if value is None:
+            return
+
+        value = float(value)
+
+        # Welford...
+        self.__count += 1
+
+        delta = value - self.__mean
+        self.__mean += delta / self.__count
+        self.__m2 += delta * (value - self.__mean)
+
+        # extremes...
+        self.__sum += value
+        self.__min = value if self.__min is None else min(self.__min, value)
+        self.__max = value if self.__max is None else max(self.__max, value)
+
+        # median...
+        self.__append_p2(value)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def mean(self):
+        return self.__mean if self.__count else None
+
+
+    def median(self):
+        if not self.__count:
+            return None
+
+        if self.__positions is not None:
+            return self.__heights[2]
+
+        heights = self.__heights                                    # sorted, while there are five values or fewer
+        middle = len(heights) // 2
+
+        return heights[middle] if len(heights) % 2 else (heights[middle - 1] + heights[middle]) / 2
+
+
+    def trimmed_mean(self):
+        if self.__count < 3:
+            return self.mean()
+
+        return (self.__sum - self.__min - self.__max) / (self.__count - 2)
+
+
+    def std_dev(self):
+        if self.__count < 2:
+            return None
+
+        return math.sqrt(self.__m2 / (self.__count - 1))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __append_p2(self, value):
+        heights = self.__heights
+
+        # initial values...
+        if self.__positions is None:
+            heights.insert(self.__insertion_index(value), value)
+
+            if len(heights) == self.__MARKERS:
+                self.__positions = list(range(self.__MARKERS))
+                self.__desired = [4.0 * increment for increment in self.__INCREMENTS]
+
+            return
+
+        positions = self.__positions
+
+        # cell...
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+
+        else:
+            cell = 0
+
+            while value >= heights[cell + 1]:
+                cell += 1
+
+        for i in range(cell + 1, self.__MARKERS):
+            positions[i] += 1
+
+        for i in range(self.__MARKERS):
+            self.__desired[i] += self.__INCREMENTS[i]
+
+        # adjust the middle markers...
+        for i in range(1, self.__MARKERS - 1):
+            offset = self.__desired[i] - positions[i]
+
+            if (offset >= 1 and positions[i + 1] - positions[i] > 1) or \
+                    (offset <= -1 and positions[i - 1] - positions[i] < -1):
+                step = 1 if offset > 0 else -1
+
+                height = self.__parabolic(i, step)
+
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = heights[i] + step * (heights[i + step] - heights[i]) / (positions[i + step] - positions[i])
+
+                heights[i] = height
+                positions[i] += step
+
+
+    def __parabolic(self, i, step):
+        heights = self.__heights
+        positions = self.__positions
+
+        above = (positions[i] - positions[i - 1] + step) * (heights[i + 1] - heights[i]) / \
+            (positions[i + 1] - positions[i])
+
+        below = (positions[i + 1] - positions[i] - step) * (heights[i] - heights[i - 1]) / \
+            (positions[i] - positions[i - 1])
+
+        return heights[i] + step * (above + below) / (positions[i + 1] - positions[i - 1])
+
+
+    def __insertion_index(self, value):
+        index = 0
+
+        while index < len(self.__heights) and self.__heights[index] <= value:
+            index += 1
+
+        return index
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def count(self):
+        return self.__count
+
+
+    @property
+    def min(self):
+        return self.__min
+
+
+    @property
+    def max(self):
+        return self.__max
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "RunningAggregate:{count:%s, mean:%s, median:%s, trimmed_mean:%s, std_dev:%s, min:%s, max:%s}" % \
+               (self.count, self.mean(), self.median(), self.trimmed_mean(), self.std_dev(), self.min, self.max)
@@ -0,0 +1,241 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A NodeAggregate reduces a stream of documents to one report per tumbling window. Windows are aligned to the unix
+epoch, and are keyed on the rec field of each document. Each report is labelled with the end of its window.
+
+Each leaf node is reduced by a NodeAccumulator, which holds running values - no documents are retained. The
+operations are:
+* mean - mean of the numeric values, at the precision of the input values
+* min, max - of the numeric values
+* count - the number of values
+* last - the last value, which may be of any type
+
+Null and empty values are ignored. Documents are expected in rec order - a document that falls outside the current
+window closes it, and opens the window that contains the document.
+"""
+
+import math
+
+from collections import OrderedDict
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.path_dict import PathDict
+from scs_core.data.precision import Precision
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NodeAggregate(object):
+    """
+    classdocs
+    """
+
+    OPERATIONS = ('mean', 'min', 'max', 'count', 'last')
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, interval, operations, iso_path='rec'):
+        """
+        Constructor
+        """
+        self.__interval = interval                      # float seconds
+        self.__operations = operations                  # list of string
+        self.__iso_path = iso_path                      # string
+
+        self.__window_end = None                        # float timestamp
+        self.__tzinfo = None                            # tzinfo
+        self.__accumulators = OrderedDict()             # dict of path: NodeAccumulator
+        self.__document_count = 0                       # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, rec: LocalizedDatetime, node):
+        window_end = (math.floor(rec.timestamp() / self.__interval) + 1) * self.__interval
+
+        report = None
+
+        if self.__window_end is not None and window_end != self.__window_end:
+            report = self.report()
+            self.reset()
+
+        self.__window_end = window_end
+        self.__tzinfo = rec.tzinfo
+
+        self.__accumulate(node, None)
+        self.__document_count += 1
+
+        return report                                   # the report of the window that was closed, if any
+
+
+    def has_report(self):
+        return self.__document_count > 0
+
+
+    def report(self):
+        if not self.has_report():
+            return None
+
+        report = PathDict()
+
+        # rec...
+        window_end = LocalizedDatetime.construct_from_timestamp(self.__window_end, tz=self.__tzinfo)
+        report.append(self.__iso_path, window_end.as_iso8601())
+
+        # values...
+        for path, accumulator in self.__accumulators.items():
+            for operation in self.__operations:
+                value = accumulator.value(operation)
+
+                if value is not None:
+                    report.append(path + '.' + operation, value)
+
+        return report
+
+
+    def reset(self):
+        self.__window_end = None
+        self.__accumulators = OrderedDict()
+        self.__document_count = 0
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __accumulate(self, node, path):
+        if isinstance(node, PathDict):
+            node = node.node()
+
+        if isinstance(node, dict):
+            for key, member in node.items():
+                self.__accumulate(member, key if path is None else path + '.' + key)
+
+        elif isinstance(node, list):
+            for index, member in enumerate(node):
+                if path is not None:
+                    self.__accumulate(member, path + ':' + str(index))
+
+        elif path is not None and path != self.__iso_path:
+            accumulator = self.__accumulators.get(path)
+
+            if accumulator is None:
+                accumulator = self.__accumulators[path] = NodeAccumulator()
+
+            accumulator.append(node)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def interval(self):
+        return self.__interval
+
+
+    @property
+    def operations(self):
+        return self.__operations
+
+
+    @property
+    def iso_path(self):
+        return self.__iso_path
+
+
+    @property
+    def document_count(self):
+        return self.__document_count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "NodeAggregate:{interval:%s, operations:%s, iso_path:%s, window_end:%s, document_count:%s}" % \
+               (self.interval, self.operations, self.iso_path, self.__window_end, self.document_count)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NodeAccumulator(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__count = 0                                # int
+        self.__last = None                              # any
+
+        self.__numeric_count = 0                        # int
+        self.__total = 0.0                              # float
+        self.__min = None                               # int or float
+        self.__max = None                               # int or float
+        self.__precision = Precision()                  # Precision
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, value):
+        if value is None or value == '':
+            return
+
+        self.__count += 1
+        self.__last = value
+
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return
+
+        self.__numeric_count += 1
+        self.__total += value
+
+        if self.__min is None or value < self.__min:
+            self.__min = value
+
+        if self.__max is None or value > self.__max:
+            self.__max = value
+
+        self.__precision.widen(value)
+
+
+    def value(self, operation):
+        if operation == 'count':
+            return self.__count
+
+        if operation == 'last':
+            return self.__last
+
+        if operation == 'min':
+            return self.__min
+
+        if operation == 'max':
+            return self.__max
+
+        if operation == 'mean':
+            if self.__numeric_count == 0:
+                return None
+
+            mean = self.__total / self.__numeric_count
+
+            return mean if self.__precision.digits is None else round(mean, self.__precision.digits)
+
+        raise ValueError(operation)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def count(self):
+        return self.__count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "NodeAccumulator:{count:%s, numeric_count:%s, total:%s, min:%s, max:%s, last:%s, precision:%s}" % \
+               (self.count, self.__numeric_count, self.__total, self.__min, self.__max, self.__last,
+                self.__precision)
@@ -0,0 +1,303 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A NodeProjection is a compiled alternative to building a PathDict for each document in the node utility. The sub-paths
+are parsed once into a trie, and the included (or excluded) nodes of each document are found in a single pass over the
+parsed JSON. Nodes are not copied.
+
+The output matches that of the PathDict method:
+* include mode - nodes are ordered by the first sub-path that matches, and array members are placed at their index,
+padded with nulls
+* exclude mode - nodes are ordered by the document, and empty objects and arrays are dropped, as are trailing
+excluded array members
+
+Documents that are not JSON objects are not projected - the caller should use the PathDict method for these.
+"""
+
+import re
+
+from collections import OrderedDict
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NodeProjection(object):
+    """
+    classdocs
+    """
+
+    EMPTY = object()                                    # the projection of a node with no included content
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, sub_paths, exclude=False):
+        root = NodeProjectionTrie()
+
+        for index, sub_path in enumerate(sub_paths):
+            if sub_path is not None:
+                root.insert(re.split(r"[.:]", sub_path), index)
+
+        return cls(root, exclude)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, root, exclude):
+        """
+        Constructor
+        """
+        self.__root = root                              # NodeProjectionTrie
+        self.__exclude = bool(exclude)                  # bool
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def project(self, document):
+        if not self.__root.children:
+            return self.EMPTY if self.exclude else document
+
+        if self.exclude:
+            return self.__excluded(document, self.__root)
+
+        projection, _ = self.__selected(document, self.__root)
+
+        return projection
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __included(self, value, node):
+        if not node.is_terminal:
+            return self.__selected(value, node)
+
+        if node.children:
+            projection, order = self.__selected(value, node)      # a deeper sub-path may have been given first
+
+            if projection is not self.EMPTY and order < node.index:
+                return value, order
+
+        return value, node.index
+
+
+    def __selected(self, value, node):
+        # object...
+        if isinstance(value, dict):
+            matches = []
+
+            for key, child in node.children.items():
+                if key not in value:
+                    continue
+
+                projection, order = self.__included(value[key], child)
+
+                if projection is not self.EMPTY:
+                    matches.append((order, key, projection))
+
+            if not matches:
+                return self.EMPTY, None
+
+            matches.sort(key=lambda match: match[0])    # ordered by the first matching sub-path
+
+            return OrderedDict((key, projection) for _, key, projection in matches), matches[0][0]
+
+        # array...
+        if isinstance(value, list):
+            members = {}
+            first = None
+
+            for key, child in node.children.items():
+                try:
+                    index = int(key)
+                except ValueError:
+                    continue
+
+                if not 0 <= index < len(value):
+                    continue
+
+                projection, order = self.__included(value[index], child)
+
+                if projection is not self.EMPTY:
+                    members[index] = projection
+                    first = order if first is None else min(first, order)
+
+            if not members:
+                return self.EMPTY, None
+
+            return [members.get(index) for index in range(max(members) + 1)], first
+
+        # leaf...
+        return self.EMPTY, None                         # the sub-path extends beyond a leaf
+
+
+    def __excluded(self, value, node):
+        # object...
+        if isinstance(value, dict):
+            target = OrderedDict()
+
+            for key, member in value.items():
+                child = node.children.get(key)
+
+                if child is None:
+                    projection = self.__pruned(member)
+
+                elif child.is_terminal:
+                    continue
+
+                else:
+                    projection = self.__excluded(member, child)
+
+                if projection is not self.EMPTY:
+                    target[key] = projection
+
+            return target if target else self.EMPTY
+
+        # array...
+        if isinstance(value, list):
+            target = []
+
+            for index, member in enumerate(value):
+                child = node.children.get(str(index))
+
+                if child is None:
+                    projection = self.__pruned(member)
+
+                elif child.is_terminal:
+                    continue
+
+                else:
+                    projection = self.__excluded(member, child)
+
+                if projection is self.EMPTY:
+                    continue
+
+                target.extend([None] * (index - len(target)))
+                target.append(projection)
+
+            return target if target else self.EMPTY
+
+        # leaf...
+        return value
+
+
+    def __pruned(self, value):                          # nothing is excluded, but empty nodes are dropped
+        # leaf...
+        if not isinstance(value, (dict, list)):
+            return value
+
+        if not value:
+            return self.EMPTY
+
+        members = value.values() if isinstance(value, dict) else value
+
+        if not any(isinstance(member, (dict, list)) for member in members):
+            return value                                # no copy is required
+
+        # object...
+        if isinstance(value, dict):
+            target = OrderedDict()
+
+            for key, member in value.items():
+                projection = self.__pruned(member)
+
+                if projection is not self.EMPTY:
+                    target[key] = projection
+
+            return target if target else self.EMPTY
+
+        # array...
+        target = []
+
+        for index, member in enumerate(value):
+            projection = self.__pruned(member)
+
+            if projection is self.EMPTY:
+                continue
+
+            target.extend([None] * (index - len(target)))
+            target.append(projection)
+
+        return target if target else self.EMPTY
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def exclude(self):
+        return self.__exclude
+
+
+    @property
+    def root(self):
+        return self.__root
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "NodeProjection:{exclude:%s, root:%s}" % (self.exclude, self.root)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NodeProjectionTrie(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__children = OrderedDict()                 # dict of string: NodeProjectionTrie
+        self.__is_terminal = False                      # bool
+        self.__index = None                             # int index of the sub-path that selects the whole node
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def insert(self, nodes, index):
+        if self.__is_terminal:
+            return                                      # the whole node is already selected
+
+        if not nodes:
+            self.__is_terminal = True
+            self.__index = index
+            return
+
+        child = self.__children.get(nodes[0])
+
+        if child is None:
+            child = self.__children[nodes[0]] = NodeProjectionTrie()
+
+        child.insert(nodes[1:], index)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def children(self):
+        return self.__children
+
+
+    @property
+    def is_terminal(self):
+        return self.__is_terminal
+
+
+    @property
+    def index(self):
+        return self.__index
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        if self.is_terminal:
+            return "*"
+
+        return "{%s}" % ', '.join("%s:%s" % (key, child) for key, child in self.children.items())
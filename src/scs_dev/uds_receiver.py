@@ -11,8 +11,11 @@ DESCRIPTION
 The uds_receiver utility is used to accept data via a Unix domain socket, with data sourced from the same host, or
 another host on the same local area network.
 
+If the --persistent (-k) flag is set, the UDS accepts persistent connections, carrying newline-framed messages, as
+written by aws_topic_publisher in its persistent mode. Connections carrying a single message are also accepted.
+
 SYNOPSIS
-uds_receiver.py [-v] UDS_SUB
+uds_receiver.py [-k] [-v] UDS_SUB
 
 EXAMPLES
 ./uds_receiver.py scs-particulates.uds
@@ -27,6 +30,9 @@ from scs_dev.cmd.cmd_uds import CmdUDS
 
 from scs_core.comms.uds_reader import UDSReader
 
+from scs_dev.comms.domain_stream import DomainStreamReader
+from scs_dev.comms.publication_frame import PublicationFrame
+
 from scs_host.comms.domain_socket import DomainSocket
 
 
@@ -50,7 +56,7 @@ if __name__ == '__main__':
     # ----------------------------------------------------------------------------------------------------------------
     # resources...
 
-    uds = UDSReader(DomainSocket, cmd.path)
+    uds = DomainStreamReader(cmd.path) if cmd.persistent else UDSReader(DomainSocket, cmd.path)
 
     if cmd.verbose:
         print("uds_receiver: %s" % uds, file=sys.stderr)
@@ -63,7 +69,7 @@ if __name__ == '__main__':
         uds.connect()
 
         for message in uds.messages():
-            print(message)
+            print(message.as_message() if isinstance(message, PublicationFrame) else message)
             sys.stdout.flush()
 
 
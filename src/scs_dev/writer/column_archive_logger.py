@@ -0,0 +1,179 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A ColumnArchiveLogger is the columnar equivalent of the CSVBatchLogger. Archive files are named and rolled over as CSV
+log files are, but with the suffix .sca. A block is written to the archive - and synced - when it holds max_count
+documents, or when its oldest document is max_age seconds old, and on close.
+
+The interface matches that of the CSVBatchLogger, so that either may be used by the csv_logger.
+"""
+
+import time
+
+from scs_core.data.datetime import LocalizedDatetime
+
+from scs_dev.writer.column_archive_writer import ColumnArchiveWriter
+from scs_dev.writer.csv_batch_logger import CSVSpaceManager
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ColumnArchiveLogger(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_MAX_COUNT = 600                             # documents
+
+    __MIN_FREE_SPACE = 10485760                         # 10MB
+    __CHECK_INTERVAL = 4                                # normally once per day
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def archive_path(cls, log):
+        file_path = log.file_path()
+
+        return (file_path[:-4] if file_path.endswith('.csv') else file_path) + ColumnArchiveWriter.SUFFIX
+
+
+    @classmethod
+    def construct(cls, host, log, delete_oldest, max_age=None, max_count=None):
+        manager = CSVSpaceManager(host, log, delete_oldest, cls.__MIN_FREE_SPACE, cls.__CHECK_INTERVAL)
+
+        return cls(host, log, manager, max_age=max_age, max_count=max_count)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, host, log, manager, max_age=None, max_count=None):
+        """
+        Constructor
+        """
+        self.__host = host                              # PersistenceManager
+        self.__log = log                                # CSVLog
+        self.__manager = manager                        # CSVSpaceManager
+
+        self.__max_age = max_age if max_age else None   # float seconds or None
+        self.__max_count = self.DEFAULT_MAX_COUNT if max_count is None else max_count
+
+        self.__writer = None                            # ColumnArchiveWriter
+        self.__writing_inhibited = False                # bool
+
+        self.__batch_start = None                       # timestamp
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write(self, jstr):
+        if self.writing_inhibited:
+            return None
+
+        if jstr is None or self.log is None:
+            return None
+
+        # first run...
+        if self.__writer is None:
+            self.__open_writer()
+
+        # start archive for new day...
+        elif not self.log.in_timeline(LocalizedDatetime.now().utc()):
+            self.__writer.close()
+            self.__open_writer()
+
+        if self.writing_inhibited:
+            return None
+
+        if not self.__writer.write(jstr):
+            return None
+
+        now = time.time()
+
+        if self.__batch_start is None:
+            self.__batch_start = now
+
+        if len(self.__writer) >= self.max_count or \
+                (self.max_age is not None and now - self.__batch_start >= self.max_age):
+            self.flush()
+
+        return self.__writer.filename
+
+
+    def flush(self):
+        if self.__writer is None or len(self.__writer) == 0:
+            return
+
+        self.__writer.flush()
+        self.__writer.sync()
+
+        self.__batch_start = None
+
+
+    def take_unwritten(self):
+        return []                                       # pending documents are written when the archive is closed
+
+
+    def close(self):
+        if self.__writer is None:
+            return
+
+        try:
+            if not self.writing_inhibited:
+                self.flush()
+
+        finally:
+            self.__writer.close()
+            self.__writer = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __open_writer(self):
+        self.log.timeline_start = LocalizedDatetime.now().utc()
+
+        # check...
+        if not self.__manager.clear_space():
+            self.writing_inhibited = True
+
+        self.log.mkdir()
+
+        self.__writer = ColumnArchiveWriter(self.archive_path(self.log))
+        self.__batch_start = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def log(self):
+        return self.__log
+
+
+    @property
+    def max_age(self):
+        return self.__max_age
+
+
+    @property
+    def max_count(self):
+        return self.__max_count
+
+
+    @property
+    def writing_inhibited(self):
+        return self.__writing_inhibited
+
+
+    @writing_inhibited.setter
+    def writing_inhibited(self, writing_inhibited):
+        self.__writing_inhibited = writing_inhibited
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ColumnArchiveLogger:{log:%s, manager:%s, max_age:%s, max_count:%s, writer:%s, " \
+               "writing_inhibited:%s}" % \
+               (self.log, self.__manager, self.max_age, self.max_count, self.__writer, self.writing_inhibited)
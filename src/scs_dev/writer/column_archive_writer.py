@@ -0,0 +1,370 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A ColumnArchiveWriter writes JSON documents to a binary columnar archive. Documents are accumulated in memory, and
+written as a block on flush(). Blocks are appended to the file, so a file may be extended by successive writers.
+
+File format:
+MAGIC BLOCK*
+
+Block format:
+HEADER_LENGTH (uint32, little-endian) HEADER (UTF-8 JSON) DATA
+
+The header gives the number of rows, the byte order of the data, the minimum and maximum rec field (as epoch
+milliseconds), and a list of columns - one for each leaf path of the documents in the block, in document order. For
+each column, the header gives the path, the type, and the offset and length of the column within the block data.
+
+Column types:
+f   float32, with NaN as null - used where every value survives conversion to float32 and back to 7 digits
+d   float64, with NaN as null
+b   int8, with -2^7 as null
+h   int16, with -2^15 as null
+i   int32, with -2^31 as null
+q   int64, with -2^63 as null
+B   uint8 bool, with 255 as null - also used for a column that is entirely null
+H   uint16 index into the strings list given for the column in the header, with 65535 as null
+T   int64 epoch milliseconds, for the rec field - the header gives the timezone suffix and whether millis are shown
+J   UTF-8 JSON list of values, for columns of mixed type
+
+A float column that also holds int values - for example, 20 and 20.5 - is given an int mask: a bitmap, one bit per
+row in row order, least significant bit first, with a bit set for each int value. The mask follows the values within
+the column data, and the header gives its length in bytes as "ints", so that ints are restored as ints on reading.
+An int column whose values do not fit int64, or a mixed column whose ints do not survive conversion to float64, is J.
+
+If a path is both a leaf and an internal node within a block, the leaf column is dropped, as for CSVWriter.
+
+example header:
+{"rows": 3600, "byteorder": "little", "rec-min": 1689292800000, "rec-max": 1689296399000,
+"columns": [{"path": "tag", "type": "H", "offset": 0, "length": 7200, "strings": ["scs-opc-1"]},
+{"path": "rec", "type": "T", "offset": 7200, "length": 28800, "tz": "Z", "millis": false}, ...]}
+"""
+
+import json
+import os
+import struct
+import sys
+
+from array import array
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+from scs_core.data.datetime import LocalizedDatetime
+
+from scs_dev.writer.csv_schema_writer import CSVSchemaWriter
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ColumnArchiveWriter(object):
+    """
+    classdocs
+    """
+
+    MAGIC = b'SCSCOLv1'
+    SUFFIX = '.sca'
+
+    HEADER_LENGTH = struct.Struct('<I')
+
+    NULLS = {'f': float('nan'), 'd': float('nan'), 'b': -2 ** 7, 'h': -2 ** 15, 'i': -2 ** 31, 'q': -2 ** 63,
+             'B': 255, 'H': 65535, 'T': -2 ** 63}
+
+    __EPOCH = datetime(1970, 1, 1)
+    __MAX_EXACT_INT = 2 ** 53                                       # the largest int held exactly by float64
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def format_rec(cls, millis, tz, include_millis):
+        offset = 0 if tz == 'Z' else (int(tz[1:3]) * 60 + int(tz[4:6])) * (-1 if tz[0] == '-' else 1)
+        local = cls.__EPOCH + timedelta(milliseconds=millis + offset * 60000)
+
+        rec = '%04d-%02d-%02dT%02d:%02d:%02d' % (local.year, local.month, local.day,
+                                                 local.hour, local.minute, local.second)
+
+        if include_millis:
+            rec += '.%03d' % (local.microsecond // 1000)
+
+        return rec + tz
+
+
+    @classmethod
+    def parse_rec(cls, value):
+        try:
+            rec = LocalizedDatetime.construct_from_iso8601(value)
+        except (AttributeError, TypeError, ValueError):
+            return None
+
+        return None if rec is None else round(rec.timestamp() * 1000)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, filename, rec_field='rec'):
+        """
+        Constructor
+        """
+        self.__filename = filename                                  # string
+        self.__rec_field = rec_field                                # string
+
+        self.__file = None                                          # binary file
+        self.__rows = []                                            # list of list of (path, value)
+
+        self.__block_count = 0                                      # int
+        self.__row_count = 0                                        # int
+
+
+    def __len__(self):
+        return len(self.__rows)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write(self, jstr):
+        if jstr is None:
+            return False
+
+        try:
+            jdict = json.loads(jstr, object_hook=OrderedDict)
+        except ValueError:
+            return False
+
+        if not isinstance(jdict, dict):
+            return False
+
+        self.__rows.append(CSVSchemaWriter.leaves(jdict))
+
+        return True
+
+
+    def flush(self):
+        if not self.__rows:
+            return
+
+        if self.__file is None:
+            is_new = not os.path.exists(self.__filename) or os.path.getsize(self.__filename) == 0
+
+            self.__file = open(self.__filename, 'ab')
+
+            if is_new:
+                self.__file.write(self.MAGIC)
+
+        header, data = self.__block(self.__rows)
+        jheader = json.dumps(header, separators=(',', ':')).encode()
+
+        self.__file.write(self.HEADER_LENGTH.pack(len(jheader)))
+        self.__file.write(jheader)
+        self.__file.write(data)
+        self.__file.flush()
+
+        self.__block_count += 1
+        self.__row_count += len(self.__rows)
+
+        self.__rows = []
+
+
+    def sync(self):
+        if self.__file is not None:
+            os.fsync(self.__file.fileno())
+
+
+    def close(self):
+        try:
+            self.flush()
+
+        finally:
+            if self.__file is not None:
+                self.__file.close()
+                self.__file = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __block(self, rows):
+        count = len(rows)
+
+        # columns...
+        columns = OrderedDict()
+
+        for i, leaves in enumerate(rows):
+            for path, value in leaves:
+                column = columns.get(path)
+
+                if column is None:
+                    column = columns[path] = [None] * count
+
+                column[i] = value
+
+        # leaf / internal node clashes...
+        paths = list(columns.keys())
+
+        for path in paths:
+            if any(other != path and CSVSchemaWriter.is_sub_path(path, other) for other in paths):
+                del columns[path]
+
+        # encode...
+        header = OrderedDict()
+        header['rows'] = count
+        header['byteorder'] = sys.byteorder
+        header['rec-min'] = None
+        header['rec-max'] = None
+        header['columns'] = []
+
+        data = bytearray()
+
+        for path, values in columns.items():
+            jdict, encoded = self.__encode(path, values)
+
+            jdict['offset'] = len(data)
+            jdict['length'] = len(encoded)
+
+            header['columns'].append(jdict)
+            data.extend(encoded)
+
+            if jdict['type'] == 'T':
+                recs = [rec for rec in array('q', encoded) if rec != self.NULLS['T']]
+
+                header['rec-min'] = min(recs) if recs else None
+                header['rec-max'] = max(recs) if recs else None
+
+        return header, bytes(data)
+
+
+    def __encode(self, path, values):
+        jdict = OrderedDict()
+        jdict['path'] = path
+
+        kinds = set(type(value) for value in values if value is not None)
+
+        # bool or null...
+        if not kinds or kinds == {bool}:
+            return self.__array(jdict, 'B', values)
+
+        # int...
+        if kinds == {int}:
+            ints = [value for value in values if value is not None]
+            low, high = min(ints), max(ints)
+
+            for typecode in ('b', 'h', 'i', 'q'):
+                if self.NULLS[typecode] < low and high < -self.NULLS[typecode]:
+                    return self.__array(jdict, typecode, values)
+
+        # float...
+        if kinds <= {int, float} and all(type(value) is not int or abs(value) <= self.__MAX_EXACT_INT
+                                         for value in values):
+            typecode = 'f' if all(value is None or self.__is_float32(value) for value in values) else 'd'
+            jdict, encoded = self.__array(jdict, typecode, values)
+
+            if int not in kinds:
+                return jdict, encoded
+
+            mask = self.__int_mask(values)
+            jdict['ints'] = len(mask)
+
+            return jdict, encoded + mask
+
+        # string...
+        if kinds == {str}:
+            if path == self.__rec_field:
+                encoded = self.__recs(jdict, values)
+
+                if encoded is not None:
+                    return encoded
+
+            strings = list(OrderedDict.fromkeys(value for value in values if value is not None))
+
+            if len(strings) < self.NULLS['H']:
+                indices = {string: i for i, string in enumerate(strings)}
+                jdict['strings'] = strings
+
+                return self.__array(jdict, 'H', [None if value is None else indices[value] for value in values])
+
+        # mixed...
+        jdict['type'] = 'J'
+
+        return jdict, json.dumps(values, separators=(',', ':')).encode()
+
+
+    def __recs(self, jdict, values):
+        sample = next(value for value in values if value is not None)
+
+        include_millis = len(sample) > 19 and sample[19] == '.'
+        tz = sample[23:] if include_millis else sample[19:]
+
+        if tz != 'Z' and (len(tz) != 6 or tz[0] not in '+-' or tz[3] != ':'):
+            return None
+
+        millis = []
+
+        for value in values:
+            if value is None:
+                millis.append(None)
+                continue
+
+            epoch_millis = self.parse_rec(value)
+
+            if epoch_millis is None or self.format_rec(epoch_millis, tz, include_millis) != value:
+                return None
+
+            millis.append(epoch_millis)
+
+        jdict['tz'] = tz
+        jdict['millis'] = include_millis
+
+        return self.__array(jdict, 'T', millis)
+
+
+    def __array(self, jdict, typecode, values):
+        jdict['type'] = typecode
+
+        null = self.NULLS[typecode]
+        encoded = array('q' if typecode == 'T' else typecode,
+                        (null if value is None else value for value in values))
+
+        return jdict, encoded.tobytes()
+
+
+    @staticmethod
+    def __int_mask(values):
+        mask = bytearray((len(values) + 7) // 8)
+
+        for i, value in enumerate(values):
+            if type(value) is int:
+                mask[i // 8] |= 1 << (i % 8)
+
+        return bytes(mask)
+
+
+    @staticmethod
+    def __is_float32(value):
+        try:
+            packed = struct.unpack('f', struct.pack('f', value))[0]
+        except OverflowError:
+            return False
+
+        return float('%.7g' % packed) == value
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def filename(self):
+        return self.__filename
+
+
+    @property
+    def block_count(self):
+        return self.__block_count
+
+
+    @property
+    def row_count(self):
+        return self.__row_count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ColumnArchiveWriter:{filename:%s, rec_field:%s, pending:%s, block_count:%s, row_count:%s}" % \
+               (self.filename, self.__rec_field, len(self), self.block_count, self.row_count)
@@ -0,0 +1,429 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A CSVBatchLogger is a write-behind equivalent of scs_core.csv.csv_logger.CSVLogger. Documents are held in memory,
+and written to the log file as a batch - with a single flush and fsync - when the batch holds max_count documents, or
+max_size bytes of JSON, or when its oldest document is max_age seconds old, whichever comes first. If no threshold is
+given, max_count is 1.
+
+Thresholds are tested as each document arrives, so the data-loss window on power failure is max_age plus the input
+interval. Pending documents are always written on close, so a SIGTERM - raised as SystemExit by SignalledExit - loses
+no data, provided that close() is called in a finally block.
+
+If writing is inhibited part-way through a batch - because the volume is full when the file for a new day is opened -
+the rows already written are flushed and synced, and the documents that were not written are retained. They are
+collected with take_unwritten(), so that they can be reported or echoed by the caller.
+
+With max_count of 1, every document is written and flushed immediately, as for CSVLogger with a write_interval of 0.
+Otherwise, each batch is also synced to storage.
+
+If a CSVCompression is given, each log file is compressed when it is closed - at the end of the day, or when the
+logger is closed. Compression is performed on a background thread, so that the day roll does not hold up the writing
+of documents. On close, the logger waits for the compression of its files to complete.
+
+The CSVSpaceManager here deletes compressed log files and columnar archives, as well as plain log files. It has
+the interface and the policy of scs_core.csv.csv_logger.CSVSpaceManager.
+"""
+
+import csv
+import os
+import time
+
+from scs_core.csv.csv_dict import CSVDict
+
+from scs_core.data.datetime import LocalizedDatetime
+
+from scs_core.sys.filesystem import Filesystem
+from scs_core.sys.logging import Logging
+
+from scs_dev.writer.column_archive_writer import ColumnArchiveWriter
+from scs_dev.writer.csv_compression import CSVCompression, CSVCompressionQueue
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVBatchLogger(object):
+    """
+    classdocs
+    """
+
+    __MIN_FREE_SPACE = 10485760                         # 10MB
+    __CHECK_INTERVAL = 4                                # normally once per day
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, host, log, delete_oldest, max_age=None, max_count=None, max_size=None, compression=None):
+        manager = CSVSpaceManager(host, log, delete_oldest, cls.__MIN_FREE_SPACE, cls.__CHECK_INTERVAL)
+
+        return cls(host, log, manager, max_age=max_age, max_count=max_count, max_size=max_size,
+                   compression=compression)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, host, log, manager, max_age=None, max_count=None, max_size=None, compression=None):
+        """
+        Constructor
+        """
+        self.__host = host                              # PersistenceManager
+        self.__log = log                                # CSVLog
+        self.__manager = manager                        # CSVSpaceManager
+
+        self.__max_age = max_age if max_age else None   # float seconds or None
+        self.__max_count = max_count                    # int or None
+        self.__max_size = max_size                      # int bytes or None
+
+        if self.__max_age is None and self.__max_count is None and self.__max_size is None:
+            self.__max_count = 1
+
+        self.__compression = compression                # CSVCompression or None
+        self.__compression_queue = None if compression is None else CSVCompressionQueue(compression)
+
+        self.__paths = None                             # array of string
+        self.__file = None                              # file handle
+        self.__writer = None                            # csv.writer
+        self.__writing_inhibited = False                # bool
+
+        self.__batch = []                               # array of (CSVDict, string)
+        self.__batch_size = 0                           # int bytes
+        self.__batch_start = None                       # timestamp
+
+        self.__flush_count = 0                          # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write(self, jstr):
+        if self.writing_inhibited:
+            return None
+
+        if jstr is None or self.log is None:
+            return None
+
+        datum = CSVDict.construct_from_jstr(jstr)
+
+        if datum is None:
+            return None
+
+        now = time.time()
+
+        if not self.__batch:
+            self.__batch_start = now
+
+        self.__batch.append((datum, jstr))
+        self.__batch_size += len(jstr)
+
+        if self.is_due(now):
+            self.flush()
+
+        return None if self.__file is None else self.log.file_path()         # None until the first batch is written
+
+
+    def is_due(self, now=None):
+        if self.max_count is not None and len(self.__batch) >= self.max_count:
+            return True
+
+        if self.max_size is not None and self.__batch_size >= self.max_size:
+            return True
+
+        if self.max_age is not None and self.__batch:
+            return (time.time() if now is None else now) - self.__batch_start >= self.max_age
+
+        return False
+
+
+    def flush(self):
+        if not self.__batch:
+            return
+
+        written = 0
+
+        try:
+            for datum, _ in self.__batch:
+                if not self.__write(datum):
+                    break
+
+                written += 1
+
+        finally:
+            for _, jstr in self.__batch[:written]:
+                self.__batch_size -= len(jstr)
+
+            del self.__batch[:written]
+
+            if not self.__batch:
+                self.__batch_start = None
+
+            if self.__file is not None:
+                self.__sync_file()
+
+        if written > 0:
+            self.__flush_count += 1
+
+
+    def take_unwritten(self):
+        unwritten = [jstr for _, jstr in self.__batch]
+
+        self.__batch = []
+        self.__batch_size = 0
+        self.__batch_start = None
+
+        return unwritten
+
+
+    def close(self):
+        try:
+            if not self.writing_inhibited:
+                self.flush()
+
+        finally:
+            self.__close_file()
+
+            if self.__compression_queue is not None:
+                self.__compression_queue.stop()
+
+        if self.__batch:
+            Logging.getLogger().error("CSVBatchLogger: documents not written: %d" % len(self.__batch))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __write(self, datum):
+        if self.writing_inhibited:
+            return False
+
+        # first run...
+        if not self.__file:
+            tag = datum.row(('tag', ))[0]
+
+            if self.log.tag is None and tag is not None:
+                self.log.tag = tag
+
+            self.__open_file()
+
+        # start log for new day...
+        elif not self.log.in_timeline(LocalizedDatetime.now().utc()):
+            self.__close_file()
+            self.__open_file()
+
+        if self.writing_inhibited:
+            return False
+
+        # write header...
+        if not self.__paths:
+            self.__paths = datum.paths()
+            self.__writer.writerow(self.__paths)
+
+        # write row...
+        self.__writer.writerow(datum.row(self.__paths))
+
+        return True
+
+
+    def __open_file(self):
+        self.log.timeline_start = LocalizedDatetime.now().utc()
+
+        # check...
+        if not self.__manager.clear_space():
+            self.writing_inhibited = True
+
+        self.log.mkdir()
+
+        # file...
+        self.__file = open(self.log.file_path(), "w")
+        self.__writer = csv.writer(self.__file, quoting=csv.QUOTE_MINIMAL)
+
+        # header...
+        if self.__paths:
+            self.__writer.writerow(self.__paths)
+
+
+    def __close_file(self):
+        if self.__file is None:
+            return
+
+        file_path = self.__file.name
+
+        self.__sync_file()
+        self.__file.close()
+        self.__file = None
+
+        if self.__compression_queue is not None:
+            self.__compression_queue.submit(file_path)
+
+
+    def __sync_file(self):
+        self.__file.flush()
+
+        if self.max_count != 1:
+            os.fsync(self.__file.fileno())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def log(self):
+        return self.__log
+
+
+    @property
+    def max_age(self):
+        return self.__max_age
+
+
+    @property
+    def max_count(self):
+        return self.__max_count
+
+
+    @property
+    def max_size(self):
+        return self.__max_size
+
+
+    @property
+    def compression(self):
+        return self.__compression
+
+
+    @property
+    def pending_count(self):
+        return len(self.__batch)
+
+
+    @property
+    def flush_count(self):
+        return self.__flush_count
+
+
+    @property
+    def writing_inhibited(self):
+        return self.__writing_inhibited
+
+
+    @writing_inhibited.setter
+    def writing_inhibited(self, writing_inhibited):
+        self.__writing_inhibited = writing_inhibited
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVBatchLogger:{log:%s, manager:%s, max_age:%s, max_count:%s, max_size:%s, compression:%s, " \
+               "pending_count:%s, flush_count:%s, writing_inhibited:%s}" % \
+               (self.log, self.__manager, self.max_age, self.max_count, self.max_size, self.compression,
+                self.pending_count, self.flush_count, self.writing_inhibited)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVSpaceManager(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, host, log, delete_oldest, min_free_space, check_interval):
+        """
+        Constructor
+        """
+        self.__host = host                              # PersistenceManager
+        self.__log = log                                # CSVLog
+        self.__delete_oldest = bool(delete_oldest)      # bool
+        self.__min_free_space = int(min_free_space)     # int bytes
+        self.__check_interval = int(check_interval)     # int
+
+        self.__check_count = self.__check_interval      # int - the first call checks
+
+        self.__logger = Logging.getLogger()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def clear_space(self):
+        self.__check_count += 1
+
+        if self.__check_count < self.__check_interval:
+            return True
+
+        self.__check_count = 0
+
+        return self.__clear_space()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __clear_space(self):
+        if self.__has_sufficient_space():
+            return True
+
+        if not self.__delete_oldest:
+            self.__logger.error("CSVSpaceManager.clear_space: volume full.")
+            return False
+
+        while not self.__has_sufficient_space():
+            if not self.__delete_oldest_log():
+                self.__logger.error("CSVSpaceManager.clear_space: delete failed.")
+                return False
+
+        return True
+
+
+    def __has_sufficient_space(self):
+        du = self.__host.disk_usage(self.__log.root_path)
+
+        if du is None:
+            raise OSError("has_sufficient_space: '%s' is not available." % self.__log.root_path)
+
+        return du.free > self.__min_free_space
+
+
+    def __delete_oldest_log(self):
+        suffixes = tuple('.csv' + suffix for suffix in ('', ) + CSVCompression.suffixes()) + \
+            (ColumnArchiveWriter.SUFFIX, )
+
+        # walk the directories...
+        containers = Filesystem.ls(self.__log.root_path)
+
+        for container in containers:
+            if not container.is_directory:
+                continue
+
+            # walk the files...
+            for file in Filesystem.ls(container.path()):
+                if not file.is_directory and file.name.endswith(suffixes):
+                    self.__logger.error("CSVSpaceManager.clear_space: deleting: %s" % file)
+
+                    success = file.delete()
+
+                    if not success:
+                        return False
+
+                    Filesystem.rmdir(container.path())          # remove empty directories
+
+                    return True
+
+        return False
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def delete_oldest(self):
+        return self.__delete_oldest
+
+
+    @property
+    def min_free_space(self):
+        return self.__min_free_space
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVSpaceManager:{delete_oldest:%s, min_free_space:%s}" % (self.delete_oldest, self.min_free_space)
@@ -0,0 +1,274 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A CSVCompression compresses closed CSV log files, and opens compressed or plain CSV files for streaming reads. The
+codec is identified by the file suffix, so that readers need not know how a file was written.
+
+Supported codecs are gzip (.gz), bz2 (.bz2) and xz (.xz), from the standard library, and zstd (.zst), which requires
+the zstandard package.
+
+Files are compressed to a temporary file, which is synced and renamed before the plain file is deleted, so that an
+interruption never loses data. The modification time of the plain file is retained.
+
+A CSVCompressionQueue compresses files on a background thread, so that a writer need not wait for the compression of
+the file that it has closed. On stop, files that are still queued are compressed before the thread exits.
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+import os
+import zlib
+
+from queue import Queue
+from threading import Thread
+
+from scs_core.sys.logging import Logging
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVCompression(object):
+    """
+    classdocs
+    """
+
+    __SUFFIXES = {
+        'gzip': '.gz',
+        'bz2': '.bz2',
+        'xz': '.xz',
+        'zstd': '.zst'
+    }
+
+    __BLOCK_SIZE = 1048576                                          # bytes
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def codecs(cls):
+        return tuple(codec for codec in cls.__SUFFIXES.keys() if codec != 'zstd' or zstandard is not None)
+
+
+    @classmethod
+    def suffixes(cls):
+        return tuple(cls.__SUFFIXES.values())
+
+
+    @classmethod
+    def is_compressed(cls, filename):
+        return filename.endswith(cls.suffixes())
+
+
+    @classmethod
+    def reading_errors(cls):                                        # raised by a truncated or corrupt file
+        errors = (EOFError, OSError, lzma.LZMAError, zlib.error)
+
+        return errors if zstandard is None else errors + (zstandard.ZstdError, )
+
+
+    @classmethod
+    def find(cls, filename):
+        if os.path.exists(filename):
+            return filename
+
+        for suffix in cls.suffixes():
+            if os.path.exists(filename + suffix):
+                return filename + suffix
+
+        return filename
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, codec):
+        if codec is None:
+            return None
+
+        if codec not in cls.__SUFFIXES:
+            raise ValueError("unknown codec: %s" % codec)
+
+        if codec == 'zstd' and zstandard is None:
+            raise ValueError("zstd requires the zstandard package")
+
+        return cls(codec)
+
+
+    @classmethod
+    def construct_for_file(cls, filename):
+        for codec, suffix in cls.__SUFFIXES.items():
+            if filename.endswith(suffix):
+                return cls.construct(codec)
+
+        return None
+
+
+    @classmethod
+    def open_for_reading(cls, filename, buffering=-1):
+        compression = cls.construct_for_file(filename)
+
+        if compression is None:
+            return open(filename, newline='', buffering=buffering)
+
+        return compression.open(filename)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, codec):
+        """
+        Constructor
+        """
+        self.__codec = codec                                        # string
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def open(self, filename, mode='r'):
+        binary_mode = mode[0] + 'b'
+
+        if self.codec == 'gzip':
+            file = gzip.open(filename, binary_mode)
+
+        elif self.codec == 'bz2':
+            file = bz2.open(filename, binary_mode)
+
+        elif self.codec == 'xz':
+            file = lzma.open(filename, binary_mode)
+
+        else:
+            raw = open(filename, binary_mode)
+
+            if binary_mode == 'rb':
+                file = zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+            else:
+                file = zstandard.ZstdCompressor().stream_writer(raw, closefd=True)
+
+        return file if 'b' in mode else io.TextIOWrapper(file, newline='')
+
+
+    def compress(self, filename):
+        compressed = filename + self.suffix
+        tmp_compressed = compressed + '.tmp'
+
+        stat = os.stat(filename)
+
+        try:
+            with open(filename, 'rb') as source:
+                with self.open(tmp_compressed, 'wb') as destination:
+                    for block in iter(lambda: source.read(self.__BLOCK_SIZE), b''):
+                        destination.write(block)
+
+            with open(tmp_compressed, 'rb') as file:
+                os.fsync(file.fileno())
+
+        except Exception:                                           # OSError, or a codec error
+            if os.path.exists(tmp_compressed):
+                os.remove(tmp_compressed)
+
+            raise
+
+        os.utime(tmp_compressed, (stat.st_atime, stat.st_mtime))
+        os.replace(tmp_compressed, compressed)
+        os.remove(filename)
+
+        return compressed
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def codec(self):
+        return self.__codec
+
+
+    @property
+    def suffix(self):
+        return self.__SUFFIXES[self.codec]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVCompression:{codec:%s}" % self.codec
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVCompressionQueue(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, compression: CSVCompression):
+        """
+        Constructor
+        """
+        self.__compression = compression                            # CSVCompression
+        self.__files = Queue()
+        self.__worker = None                                        # Thread
+
+        self.__logger = Logging.getLogger()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def submit(self, filename):
+        if self.__worker is None:
+            self.__worker = Thread(target=self.__run, daemon=True)
+            self.__worker.start()
+
+        self.__files.put(filename)
+
+
+    def stop(self):
+        if self.__worker is None:
+            return
+
+        self.__files.put(None)
+        self.__worker.join()                                        # pending files are compressed before exit
+        self.__worker = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __run(self):
+        while True:
+            filename = self.__files.get()
+
+            if filename is None:
+                return
+
+            try:
+                self.__compression.compress(filename)
+
+            except Exception as ex:                                 # the file is left uncompressed
+                self.__logger.error("CSVCompressionQueue: compression failed: %s: %s" % (filename, repr(ex)))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def compression(self):
+        return self.__compression
+
+
+    @property
+    def pending_count(self):
+        return self.__files.qsize()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVCompressionQueue:{compression:%s, pending_count:%s}" % (self.compression, self.pending_count)
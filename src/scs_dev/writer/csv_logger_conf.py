@@ -0,0 +1,91 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A CSVLoggerConf with an optional compression codec for closed log files. The document is stored in the same file
+as scs_core's CSVLoggerConf, which ignores the compression field.
+
+example JSON:
+{"root-path": "/srv/removable_data_storage", "delete-oldest": true, "write-interval": 0,
+"retrospection-limit": "2023-07-25T11:36:30Z", "compression": "gzip"}
+"""
+
+from scs_core.csv import csv_logger_conf
+
+from scs_core.data.datetime import LocalizedDatetime
+
+from scs_dev.writer.csv_compression import CSVCompression
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVLoggerConf(csv_logger_conf.CSVLoggerConf):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict, skeleton=False):
+        if not jdict:
+            return None
+
+        root_path = jdict.get('root-path')
+        delete_oldest = jdict.get('delete-oldest')
+        write_interval = jdict.get('write-interval')
+        retrospection_limit = LocalizedDatetime.construct_from_iso8601(jdict.get('retrospection-limit'))
+        compression = jdict.get('compression')
+
+        return cls(root_path, delete_oldest, write_interval, retrospection_limit, compression=compression)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, root_path, delete_oldest, write_interval, retrospection_limit, compression=None):
+        """
+        Constructor
+        """
+        super().__init__(root_path, delete_oldest, write_interval, retrospection_limit)
+
+        self.__compression = compression                            # string or None
+
+
+    def __eq__(self, other):
+        try:
+            return super().__eq__(other) and self.compression == other.compression
+
+        except (TypeError, AttributeError):
+            return False
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def csv_compression(self):
+        return CSVCompression.construct(self.compression)           # may raise ValueError
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self, **kwargs):
+        jdict = super().as_json(**kwargs)
+
+        jdict['compression'] = self.compression
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def compression(self):
+        return self.__compression
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVLoggerConf:{root_path:%s, delete_oldest:%s, write_interval:%s, retrospection_limit:%s, " \
+               "compression:%s}" % \
+               (self.root_path, self.delete_oldest, self.write_interval, self.retrospection_limit, self.compression)
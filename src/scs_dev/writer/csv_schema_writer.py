@@ -0,0 +1,289 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A CSVSchemaWriter converts JSON documents to CSV rows where the header is the union of the leaf paths of all the
+documents, rather than the paths of the first document only.
+
+In union mode, rows are spooled to a temporary file, each tagged with the version of the schema that was current when
+it was written. On close, the header is written for the final schema, and the spooled rows are mapped onto it. Only
+the schema versions are held in memory.
+
+In roll mode, rows are written directly to the output file. When the schema widens, the current file segment is
+closed and a new segment is opened, with the new header. Segments after the first are named FILE.N.csv. Documents
+with no leaves that arrive before the first segment is opened are written as empty rows, following its header.
+
+As for scs_core.csv.csv_writer.CSVWriter, if a new path extends a path that was a leaf, the leaf column is dropped,
+and a new path that is an internal node of the schema is ignored.
+"""
+
+import csv
+import json
+import os
+import sys
+import tempfile
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONify
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CSVSchemaWriter(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def leaves(cls, container, prefix=None, leaves=None):
+        if leaves is None:
+            leaves = []
+
+        if isinstance(container, dict):
+            for key, value in container.items():
+                cls.leaves(value, key if prefix is None else prefix + '.' + key, leaves)
+
+        elif isinstance(container, list):
+            for i, value in enumerate(container):
+                cls.leaves(value, str(i) if prefix is None else prefix + ':' + str(i), leaves)
+
+        else:
+            leaves.append((prefix, container))
+
+        return leaves
+
+
+    @staticmethod
+    def is_sub_path(sub_path, path):
+        return path == sub_path or path.startswith(sub_path + '.') or path.startswith(sub_path + ':')
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, filename=None, exclude_header=False, roll=False, quote_all=False):
+        """
+        Constructor
+        """
+        if roll and filename is None:
+            raise ValueError("roll mode requires a filename")
+
+        self.__filename = filename                                  # string or None
+        self.__exclude_header = exclude_header                      # bool
+        self.__roll = roll                                          # bool
+        self.__quoting = csv.QUOTE_ALL if quote_all else csv.QUOTE_MINIMAL
+
+        self.__paths = []                                           # list of string - the union schema
+        self.__columns = {}                                         # dict of path: int
+        self.__versions = [()]                                      # list of tuple of string - initially empty
+
+        self.__segments = []                                        # list of string
+        self.__file = None                                          # file
+        self.__writer = None                                        # csv.writer
+        self.__pending_rows = 0                                     # int - leafless rows before the first segment
+
+        self.__spool = None if roll else tempfile.TemporaryFile(mode='w+', prefix='csv_writer-')
+        self.__encoder = JSONify(ensure_ascii=False)
+
+        self.__row_count = 0                                        # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write(self, jstr):
+        if jstr is None:
+            return False
+
+        try:
+            jdict = json.loads(jstr, object_hook=OrderedDict)
+        except ValueError:
+            return False
+
+        if not isinstance(jdict, (dict, list)):
+            return False
+
+        leaves = self.leaves(jdict)
+
+        # schema...
+        columns = self.__columns
+
+        for path, _ in leaves:
+            if path not in columns:
+                self.__widen([path for path, _ in leaves])
+                columns = self.__columns
+                break
+
+        # row...
+        row = [None] * len(self.__paths)
+
+        for path, value in leaves:
+            index = columns.get(path)
+
+            if index is not None:
+                row[index] = value
+
+        if self.__roll:
+            if self.__writer is None:
+                self.__pending_rows += 1                            # no schema - no segment yet
+            else:
+                self.__writer.writerow(row)
+
+        else:
+            self.__spool.write("%d\t%s\n" % (len(self.__versions) - 1, self.__encoder.encode(row)))
+
+        self.__row_count += 1
+
+        return True
+
+
+    def close(self):
+        if not self.__roll and self.__spool is not None:
+            self.__open_segment(self.__filename)
+            self.__write_spool()
+
+            self.__spool.close()
+            self.__spool = None
+
+        if self.__roll and self.__writer is None and self.__pending_rows:
+            self.__open_segment(self.__filename)
+            self.__write_pending_rows()
+
+        self.__close_segment()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __widen(self, datum_paths):
+        paths = self.__paths
+        appended = []
+        preceding = None
+
+        for path in datum_paths:
+            if path in self.__columns:
+                preceding = path
+                continue
+
+            if any(self.is_sub_path(path, existing) for existing in paths):
+                continue                                            # an internal node of the schema
+
+            # place after the preceding path of the datum, or at the end...
+            index = len(paths) if preceding is None or preceding not in paths else paths.index(preceding) + 1
+            paths.insert(index, path)
+
+            appended.append(path)
+            preceding = path
+
+        if not appended:
+            return
+
+        # remove leaves that have become internal nodes...
+        self.__paths = [path for path in paths
+                        if path in appended or not any(self.is_sub_path(path, new) for new in appended)]
+
+        self.__columns = {path: index for index, path in enumerate(self.__paths)}
+        self.__versions.append(tuple(self.__paths))
+
+        if self.__roll:
+            self.__close_segment()
+            self.__open_segment(self.__segment_name(len(self.__segments)))
+
+            if not self.__exclude_header:
+                self.__writer.writerow(self.__paths)
+
+            self.__write_pending_rows()
+
+
+    def __write_pending_rows(self):
+        for _ in range(self.__pending_rows):
+            self.__writer.writerow([None] * len(self.__paths))
+
+        self.__pending_rows = 0
+
+
+    def __write_spool(self):
+        if not self.__exclude_header and self.__paths:
+            self.__writer.writerow(self.__paths)
+
+        # index maps from each schema version to the final schema...
+        mappings = [[self.__columns.get(path) for path in version] for version in self.__versions]
+        width = len(self.__paths)
+
+        self.__spool.seek(0)
+
+        for line in self.__spool:
+            version, jstr = line.split('\t', 1)
+            values = json.loads(jstr)
+
+            row = [None] * width
+
+            for index, value in zip(mappings[int(version)], values):
+                if index is not None:
+                    row[index] = value
+
+            self.__writer.writerow(row)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __segment_name(self, number):
+        if number == 0:
+            return self.__filename
+
+        root, ext = os.path.splitext(self.__filename)
+
+        return "%s.%d%s" % (root, number, ext)
+
+
+    def __open_segment(self, filename):
+        self.__file = sys.stdout if filename is None else open(filename, 'w', newline='')
+        self.__writer = csv.writer(self.__file, quoting=self.__quoting)
+
+        if filename is not None:
+            self.__segments.append(filename)
+
+
+    def __close_segment(self):
+        if self.__file is None:
+            return
+
+        if self.__file is sys.stdout:
+            self.__file.flush()
+        else:
+            self.__file.close()
+
+        self.__file = None
+        self.__writer = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def filename(self):
+        return self.__filename
+
+
+    @property
+    def paths(self):
+        return tuple(self.__paths)
+
+
+    @property
+    def segments(self):
+        return tuple(self.__segments)
+
+
+    @property
+    def row_count(self):
+        return self.__row_count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "CSVSchemaWriter:{filename:%s, exclude_header:%s, roll:%s, paths:%d, versions:%d, segments:%s, " \
+               "row_count:%s}" % \
+               (self.filename, self.__exclude_header, self.__roll, len(self.__paths), len(self.__versions),
+                list(self.segments), self.row_count)
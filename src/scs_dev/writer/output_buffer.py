@@ -0,0 +1,98 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+An OutputBuffer accumulates text for a file-like sink (typically stdout), and writes it in large chunks. The buffer is
+flushed when it holds max_count items, or when max_interval seconds have passed since the previous flush - whichever
+comes first. With the default max_count of 1, every item is written and flushed immediately.
+"""
+
+import sys
+import time
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class OutputBuffer(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, file=None, max_count=1, max_interval=None):
+        """
+        Constructor
+        """
+        self.__file = sys.stdout if file is None else file          # file-like
+        self.__max_count = max(1, int(max_count))                   # int
+        self.__max_interval = max_interval                          # float seconds or None
+
+        self.__items = []                                           # list of string
+        self.__latest_flush = time.time()                           # float
+
+        self.__item_count = 0                                       # int
+        self.__flush_count = 0                                      # int
+
+
+    def __len__(self):
+        return len(self.__items)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write(self, text):
+        self.__items.append(text)
+        self.__item_count += 1
+
+        if len(self.__items) >= self.__max_count:
+            self.flush()
+            return
+
+        if self.__max_interval is not None and time.time() - self.__latest_flush >= self.__max_interval:
+            self.flush()
+
+
+    def print(self, text=''):
+        self.write(text + '\n')
+
+
+    def flush(self):
+        if self.__items:
+            self.__file.write(''.join(self.__items))
+            self.__items = []
+
+        self.__file.flush()
+
+        self.__latest_flush = time.time()
+        self.__flush_count += 1
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def max_count(self):
+        return self.__max_count
+
+
+    @property
+    def max_interval(self):
+        return self.__max_interval
+
+
+    @property
+    def item_count(self):
+        return self.__item_count
+
+
+    @property
+    def flush_count(self):
+        return self.__flush_count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "OutputBuffer:{max_count:%s, max_interval:%s, buffered:%s, item_count:%s, flush_count:%s}" % \
+               (self.max_count, self.max_interval, len(self), self.item_count, self.flush_count)
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Publishes from a durable PublicationQueue through an AWSMQTTPublisher - as aws_mqtt_client does with --queue - to a
+stand-in MQTT client that is offline: each publication is queued by the stand-in SDK, and no PUBACK is received. The
+queue is then abandoned, as on a power cut, and reopened. The run is made with and without a window. Reports the
+first document read after the restart, and whether any document was lost. Finally, the reopened queue is published
+online, and the backlog remaining after a second restart is reported.
+"""
+
+import json
+import shutil
+import tempfile
+import threading
+import time
+
+from scs_dev.aws_mqtt_client import dequeue
+from scs_dev.handler.aws_mqtt_publisher import AWSMQTTPublisher
+from scs_dev.handler.mqtt_metrics import MQTTMetrics
+from scs_dev.handler.mqtt_reporter import MQTTReporter
+from scs_dev.handler.publication_queue import PublicationQueue
+
+from scs_core.data.publication import Publication
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+DOCUMENTS = 200
+ACK_TIMEOUT = 0.2                           # seconds
+OFFLINE_TIME = 2.5                          # seconds
+TOPIC = 'south-coast-science-dev/development/loc/1/climate'
+
+
+class StandInClient(object):
+    """
+    a stand-in for the MQTTClient - while offline, publications are queued by the SDK, and are not acknowledged
+    """
+
+    def __init__(self, online):
+        self.online = online
+        self.queued = 0
+        self.__mid = 0
+
+    def connect(self, auth, debug=False):
+        return True
+
+    def disconnect(self):
+        pass
+
+    def publish(self, publication):
+        if not self.online:
+            self.queued += 1
+
+        return self.online
+
+    def publish_async(self, publication, ack_callback):
+        if not self.online:
+            self.queued += 1
+            return None
+
+        self.__mid += 1
+        threading.Timer(0.005, ack_callback, kwargs={'mid': self.__mid}).start()
+
+        return self.__mid
+
+
+class LocalConf(object):
+    """
+    a stand-in for MQTTConf, without a report file
+    """
+
+    inhibit_publishing = False
+    debug = False
+    report_file = None
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def seq(jstr):
+    return json.loads(jstr)[TOPIC]['seq']
+
+
+def publish(queue, client, max_in_flight):
+    publisher = AWSMQTTPublisher(LocalConf(), None, client, MQTTReporter(False), max_in_flight=max_in_flight,
+                                 ack_timeout=ACK_TIMEOUT)
+    producer = threading.Thread(target=lambda: None)
+    producer.start()
+    producer.join()
+
+    for message in dequeue(queue, publisher, producer, MQTTMetrics()):
+        publisher.publish(Publication.construct_from_jdict(json.loads(message)))
+
+
+def run(max_in_flight):
+    directory = tempfile.mkdtemp()
+
+    try:
+        queue = PublicationQueue.open(directory)
+
+        for i in range(DOCUMENTS):
+            queue.append(json.dumps({TOPIC: {'seq': i}}))
+
+        queue.sync()
+
+        # offline...
+        client = StandInClient(False)
+        threading.Thread(target=publish, args=(queue, client, max_in_flight), daemon=True).start()
+
+        time.sleep(OFFLINE_TIME)            # the queue is abandoned - a power cut
+
+        queue = PublicationQueue.open(directory)
+        length = queue.length
+        first = seq(queue.next())
+
+        print("window %2d: queued by SDK: %d length after restart: %d first after restart: %d lost: %s" %
+              (max_in_flight, client.queued, length, first, first != 0 or length != DOCUMENTS))
+
+        # online...
+        queue.close()
+        queue = PublicationQueue.open(directory)
+
+        publish(queue, StandInClient(True), max_in_flight)
+        queue.close()
+
+        queue = PublicationQueue.open(directory)
+        print("window %2d: online: length after restart: %d" % (max_in_flight, queue.length))
+        queue.close()
+
+    finally:
+        shutil.rmtree(directory)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+run(1)
+run(16)
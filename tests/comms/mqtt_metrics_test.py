@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Exercises MQTTMetrics with synthetic times: publish latencies and queue waits over a rolling window, an outage and
+reconnection, and the expiry of old slots. Then saves a snapshot, queries a running MQTTMetricsMonitor over its UDS,
+and reports the cost of recording each publication.
+
+example:
+./mqtt_metrics_test.py 100000
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+from scs_core.data.json import JSONify
+
+from scs_dev.comms.domain_query import DomainQueryClient
+from scs_dev.handler.mqtt_metrics import MQTTMetrics, MQTTMetricsMonitor
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+START = 1_800_000_000.0
+WINDOW = 300.0
+
+record_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+metrics = MQTTMetrics(window=WINDOW, now=START)
+
+# one publication per second, for four minutes...
+for i in range(240):
+    now = START + i
+    metrics.record_wait(0.002, now=now)
+    metrics.record_sent(400, now=now)
+    metrics.record_publish(0.1 if i % 10 else 0.9, now=now)
+
+# outage of 30 seconds...
+for i in range(240, 270):
+    now = START + i
+    metrics.record_sent(400, now=now)
+    metrics.record_failure(now=now)
+
+metrics.record_publish(0.2, now=START + 270)
+
+jdict = metrics.as_json(now=START + 271)
+print(JSONify.dumps(jdict))
+print("-")
+
+latency = jdict['publish-latency']
+connection = jdict['connection']
+
+print("latency count: %s p50: %s p99: %s max: %s" % (latency['count'], latency['p50'], latency['p99'], latency['max']))
+print("msgs/sec: %s bytes/sec: %s" % (jdict['sent']['msgs-per-sec'], jdict['sent']['bytes-per-sec']))
+print("reconnects: %s downtime: %s connected: %s" %
+      (connection['reconnects'], connection['downtime'], connection['connected']))
+
+assert latency['count'] == 241
+assert latency['p50'] == 0.128 and latency['max'] == 0.9
+assert connection['reconnects'] == 1 and connection['downtime'] == 30.0 and connection['connected']
+
+# ten minutes later - the window has rolled on...
+jdict = metrics.as_json(now=START + 871)
+
+print("after window: latency count: %s msgs/sec: %s msgs: %s" %
+      (jdict['publish-latency']['count'], jdict['sent']['msgs-per-sec'], jdict['sent']['msgs']))
+
+assert jdict['publish-latency']['count'] == 0 and jdict['sent']['msgs'] == 270
+
+# open outage...
+metrics.record_failure(now=START + 900)
+connection = metrics.as_json(now=START + 905)['connection']
+
+print("open outage: %s" % connection)
+assert not connection['connected'] and connection['outage'] == 5.0 and connection['downtime'] == 35.0
+
+print("-")
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# snapshot and query...
+
+directory = tempfile.mkdtemp()
+
+filename = MQTTMetrics.filename(os.path.join(directory, 'mqtt_queue_report.json'))
+uds_path = os.path.join(directory, 'mqtt_metrics.uds')
+
+live = MQTTMetrics()
+monitor = MQTTMetricsMonitor(live, filename, uds_path=uds_path, interval=0.1)
+monitor.start()
+
+try:
+    live.record_publish(0.05)
+    time.sleep(0.3)
+
+    with open(filename) as f:
+        saved = json.load(f)
+
+    queried = json.loads(DomainQueryClient(uds_path).query())
+
+    print("snapshot: %s" % os.path.basename(filename))
+    print("saved latency count: %s queried latency count: %s" %
+          (saved['publish-latency']['count'], queried['publish-latency']['count']))
+
+    assert saved['publish-latency']['count'] == 1 and queried['publish-latency']['count'] == 1
+
+finally:
+    monitor.stop()
+
+print("removed on stop: %s" % (not os.path.exists(filename) and not os.path.exists(uds_path)))
+os.rmdir(directory)
+
+print("-")
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# overhead...
+
+busy = MQTTMetrics()
+
+start = time.process_time()
+
+for i in range(record_count):
+    busy.record_wait(0.001)
+    busy.record_sent(512)
+    busy.record_publish(0.1)
+
+elapsed = time.process_time() - start
+
+start = time.process_time()
+
+for i in range(100):
+    JSONify.dumps(busy)
+
+snapshot_elapsed = time.process_time() - start
+
+print("records: %d per publication: %0.1f us snapshot: %0.1f us" %
+      (record_count, elapsed * 1e6 / record_count, snapshot_elapsed * 1e6 / 100))
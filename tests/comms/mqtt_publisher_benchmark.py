@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Compares documents / second and PUBACK latency for the AWSMQTTPublisher, synchronous and pipelined, against a local
+stand-in MQTT broker. The broker delays each PUBACK by an injected latency - LATENCY seconds, with one in fifty delayed
+by ten times as much. In the final run, one in a hundred PUBACKs is dropped, to exercise the retry of failed
+publications. Reports whether every document reached the broker.
+
+Latency is measured from the presentation of a document to the receipt of its PUBACK.
+
+example:
+./mqtt_publisher_benchmark.py 2000 0.05
+"""
+
+import asyncio
+import random
+import sys
+import threading
+import time
+
+from AWSIoTPythonSDK.MQTTLib import AWSIoTMQTTClient
+
+from scs_core.data.publication import Publication
+
+from scs_dev.handler.aws_mqtt_publisher import AWSMQTTPublisher
+from scs_dev.handler.mqtt_client import MQTTClient
+from scs_dev.handler.mqtt_reporter import MQTTReporter
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class StandInBroker(object):
+    """
+    a minimal MQTT 3.1.1 broker: CONNECT, PUBLISH QoS 1 with delayed or dropped PUBACK, PINGREQ, DISCONNECT
+    """
+
+    def __init__(self, latency, drop_ratio=0.0):
+        self.latency = latency
+        self.drop_ratio = drop_ratio
+
+        self.received = set()
+        self.publish_count = 0
+
+        self.loop = asyncio.new_event_loop()
+        self.port = None
+
+        ready = threading.Event()
+        threading.Thread(target=self.__run, args=(ready, ), daemon=True).start()
+        ready.wait()
+
+
+    def __run(self, ready):
+        asyncio.set_event_loop(self.loop)
+
+        server = self.loop.run_until_complete(asyncio.start_server(self.__session, '127.0.0.1', 0))
+        self.port = server.sockets[0].getsockname()[1]
+
+        ready.set()
+        self.loop.run_forever()
+
+
+    async def __session(self, reader, writer):
+        try:
+            while True:
+                header = await reader.readexactly(1)
+                length = 0
+                multiplier = 1
+
+                while True:
+                    byte = (await reader.readexactly(1))[0]
+                    length += (byte & 0x7f) * multiplier
+                    multiplier *= 128
+
+                    if not byte & 0x80:
+                        break
+
+                body = await reader.readexactly(length)
+                packet_type = header[0] >> 4
+
+                if packet_type == 1:                                # CONNECT
+                    writer.write(b'\x20\x02\x00\x00')
+
+                elif packet_type == 3:                              # PUBLISH
+                    topic_length = int.from_bytes(body[:2], 'big')
+                    mid = body[2 + topic_length:4 + topic_length]
+                    payload = body[4 + topic_length:]
+
+                    self.received.add(payload)
+                    self.publish_count += 1
+
+                    if random.random() < self.drop_ratio:
+                        continue
+
+                    delay = self.latency * (10 if random.random() < 0.02 else 1)
+                    self.loop.call_later(delay, writer.write, b'\x40\x02' + mid)
+
+                elif packet_type == 12:                             # PINGREQ
+                    writer.write(b'\xd0\x00')
+
+                elif packet_type == 14:                             # DISCONNECT
+                    break
+
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+
+        writer.close()
+
+
+class LocalMQTTClient(MQTTClient):
+    """
+    connects to the stand-in broker, without TLS
+    """
+
+    def __init__(self, port):
+        super().__init__()
+        self.port = port
+
+
+    def sdk_client(self, auth):
+        client = AWSIoTMQTTClient('benchmark')
+        client.configureEndpoint('127.0.0.1', self.port)
+        client.configureMQTTOperationTimeout(60)
+
+        return client
+
+
+class LocalConf(object):
+    """
+    a stand-in for MQTTConf, without a report file
+    """
+
+    inhibit_publishing = False
+    debug = False
+    report_file = None
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def run(max_in_flight, latency, drop_ratio=0.0, ack_timeout=60.0):
+    random.seed(1)
+
+    broker = StandInBroker(latency, drop_ratio=drop_ratio)
+    client = LocalMQTTClient(broker.port)
+    publisher = AWSMQTTPublisher(LocalConf(), None, client, MQTTReporter(False), max_in_flight=max_in_flight,
+                                 ack_timeout=ack_timeout)
+    publisher.connect()
+
+    latencies = []
+    start_time = time.time()
+
+    for i in range(document_count):
+        publication = Publication('benchmark/topic', {'rec': i, 'val': {'tmp': 20.0 + i % 50 / 10}})
+
+        presented = time.time()
+        publisher.publish(publication)
+
+        if not publisher.is_pipelined():
+            latencies.append(time.time() - presented)
+
+    complete = publisher.flush(120) if publisher.is_pipelined() else True
+    elapsed = time.time() - start_time
+
+    if publisher.is_pipelined():
+        latencies = publisher.latencies
+
+    publisher.disconnect()
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2]
+    p99 = latencies[int(len(latencies) * 0.99)]
+
+    label = "window %2d%s" % (max_in_flight, " drop %0.0f%%" % (drop_ratio * 100) if drop_ratio else "")
+
+    print("%s: docs/s: %7.1f p50: %0.3f p99: %0.3f retries: %d received: %d/%d flushed: %s" %
+          (label, document_count / elapsed, p50, p99, publisher.retry_count, len(broker.received), document_count,
+           complete))
+    sys.stdout.flush()
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+document_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+injected_latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.05
+
+print("documents: %d latency: %0.3f" % (document_count, injected_latency))
+
+run(1, injected_latency)
+run(8, injected_latency)
+run(16, injected_latency)
+run(16, injected_latency, drop_ratio=0.01, ack_timeout=2.0)
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Compares bytes-on-wire for an hour of a typical device's publications - climate, gases and particulates every ten
+seconds, and status every minute - published one document per message, and in PublicationBatcher batches, with and
+without compression. Checks that every batch unpacks to the original documents.
+
+MQTT bytes are exact, for QoS 1 PUBLISH packets and their PUBACKs. Wire bytes are an estimate: each MQTT packet is
+taken to occupy its own TLS 1.2 AES-GCM record (29 bytes) and TCP/IPv4 segment(s) (40 bytes per 1448 byte segment),
+with acknowledgements piggy-backed.
+
+example:
+./publication_batcher_test.py 60
+"""
+
+import math
+import random
+import sys
+
+from scs_core.data.json import JSONify
+from scs_core.data.publication import Publication
+
+from scs_dev.handler.publication_batcher import PublicationBatcher, PublicationBatch
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+TAG = 'scs-bgx-431'
+PATH = 'south-coast-science-demo/brighton/loc/1/'
+
+PUBACK_SIZE = 4                                             # bytes
+TLS_RECORD_OVERHEAD = 29                                    # bytes
+TCP_IP_OVERHEAD = 40                                        # bytes
+TCP_MSS = 1448                                              # bytes
+
+
+def rec(t):
+    return '2026-10-18T%02d:%02d:%02dZ' % (10 + t // 3600, t // 60 % 60, t % 60)
+
+
+def sht():
+    return {'hmd': round(random.uniform(40, 60), 1), 'tmp': round(random.uniform(15, 20), 1)}
+
+
+def climate(t):
+    return {'tag': TAG, 'rec': rec(t), 'val': {'hmd': round(random.uniform(40, 60), 1),
+                                               'tmp': round(random.uniform(15, 20), 1),
+                                               'bar': {'pA': round(random.uniform(99, 101), 1)}}}
+
+
+def electrochem(wev, aev):
+    return {'weV': round(wev + random.uniform(-0.002, 0.002), 6), 'aeV': round(aev + random.uniform(-0.002, 0.002), 6),
+            'weC': round(random.uniform(-0.01, 0.01), 6), 'cnc': round(random.uniform(0, 40), 1)}
+
+
+def gases(t):
+    return {'tag': TAG, 'src': 'AFE', 'rec': rec(t),
+            'val': {'NO2': electrochem(0.294, 0.312), 'CO': electrochem(0.323, 0.288),
+                    'SO2': electrochem(0.276, 0.270), 'H2S': electrochem(0.262, 0.259),
+                    'sht': sht()},
+            'exg': {'vE-20-1': {'NO2': {'cnc': round(random.uniform(0, 40), 1)}}}}
+
+
+def particulates(t):
+    return {'tag': TAG, 'src': 'N3', 'rec': rec(t),
+            'val': {'per': 4.9, 'pm1': round(random.uniform(0, 10), 1), 'pm2p5': round(random.uniform(0, 20), 1),
+                    'pm10': round(random.uniform(0, 40), 1), 'bin': [random.randint(0, 400) for _ in range(24)],
+                    'mtf1': random.randint(20, 40), 'mtf3': random.randint(20, 40), 'mtf5': random.randint(0, 40),
+                    'mtf7': random.randint(0, 40), 'sfr': round(random.uniform(5, 6), 2), 'sht': sht()}}
+
+
+def status(t):
+    return {'tag': TAG, 'rec': rec(t),
+            'val': {'tz': {'name': 'Europe/London', 'utc-offset': '+01:00'},
+                    'sch': {'scs-climate': {'interval': 10.0, 'tally': 1},
+                            'scs-gases': {'interval': 10.0, 'tally': 1},
+                            'scs-particulates': {'interval': 10.0, 'tally': 1},
+                            'scs-status': {'interval': 60.0, 'tally': 1}},
+                    'gps': {'pos': [50.82313, -0.12218], 'elv': 40.3, 'qual': 1},
+                    'airnow': None,
+                    'up': {'period': '00-%02d:%02d:00' % (t // 3600, t // 60 % 60), 'users': 1,
+                           'load': {'av1': 0.2, 'av5': 0.18, 'av15': 0.17}},
+                    'psu': {'standby': False, 'in': True, 'pwr-in': 12.4, 'chg': '1111', 'tmp': 27.9},
+                    'sht': sht()}}
+
+
+def publications(duration):                                 # list of (seconds, Publication)
+    documents = []
+
+    for t in range(0, duration, 10):
+        documents.append((t, Publication(PATH + 'climate', climate(t))))
+        documents.append((t, Publication(PATH + 'gases', gases(t))))
+        documents.append((t, Publication(PATH + 'particulates', particulates(t))))
+
+        if t % 60 == 0:
+            documents.append((t, Publication(PATH + 'status', status(t))))
+
+    return documents
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def mqtt_size(publication):
+    payload = JSONify.dumps(publication.payload).encode()           # as MQTTClient
+    remaining = 2 + len(publication.topic.encode()) + 2 + len(payload)
+
+    return 1 + len(encoded_length(remaining)) + remaining
+
+
+def encoded_length(length):
+    encoded = bytearray()
+
+    while True:
+        byte = length % 128
+        length //= 128
+
+        encoded.append(byte | 0x80 if length else byte)
+
+        if not length:
+            return encoded
+
+
+def wire_size(packet_size):
+    record = packet_size + TLS_RECORD_OVERHEAD
+
+    return record + math.ceil(record / TCP_MSS) * TCP_IP_OVERHEAD
+
+
+def measure(messages):
+    mqtt = sum(mqtt_size(message) + PUBACK_SIZE for message in messages)
+    wire = sum(wire_size(mqtt_size(message)) + wire_size(PUBACK_SIZE) for message in messages)
+
+    return len(messages), mqtt, wire
+
+
+def batched(documents, interval, compress):
+    batcher = PublicationBatcher(interval, compress=compress)
+    messages = []
+    window_end = None
+
+    for t, document in documents:
+        if window_end is not None and t >= window_end:
+            messages.extend(batcher.flush())                        # simulated time - the window has closed
+            window_end = None
+
+        if window_end is None:
+            window_end = t + interval
+
+        messages.extend(batcher.append(document))
+
+    messages.extend(batcher.flush())
+
+    return messages
+
+
+def unpacked(messages):
+    topics = {}
+
+    for message in messages:
+        batch = PublicationBatch.construct_from_jdict(message.payload)
+        topics.setdefault(message.topic, []).extend(batch.docs)
+
+    return topics
+
+
+def report(label, measurement, baseline):
+    count, mqtt, wire = measurement
+
+    print("%-28s messages: %5d MQTT bytes: %8d wire bytes: %8d (%5.1f%%)" %
+          (label, count, mqtt, wire, 100.0 * wire / baseline[2]))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+random.seed(1)
+
+batch_interval = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+hour = publications(3600)
+
+expected = {}
+
+for _, doc in hour:
+    expected.setdefault(doc.topic, []).append(JSONify.dumps(doc.payload))
+
+single = measure([doc for _, doc in hour])
+report("one document per message:", single, single)
+
+for interval in (batch_interval, batch_interval * 5):
+    for compress in (False, True):
+        batches = batched(hour, interval, compress)
+
+        complete = {topic: [JSONify.dumps(doc) for doc in docs] for topic, docs in unpacked(batches).items()}
+        label = "batch %ds%s:" % (interval, " compressed" if compress else "")
+
+        report(label, measure(batches), single)
+        print("%-28s unpacked: %s largest payload: %d" %
+              ("", complete == expected, max(len(JSONify.dumps(batch.payload)) for batch in batches)))
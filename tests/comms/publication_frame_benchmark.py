@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Compares the CPU time per document across the chain of scs_dev utilities - aws_topic_publisher, aws_mqtt_client
+(publication), aws_mqtt_client (subscription) and aws_topic_subscriber - with newline-framed documents, and with
+length-prefixed publication frames. Each hop does the work that the utility does for one document, including the
+framing on the persistent UDS connection, but without the socket or MQTT I/O. The documents presented to MQTT, and
+written by the subscriber, are compared.
+
+example:
+./publication_frame_benchmark.py 20000
+"""
+
+import json
+import sys
+import time
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONify
+from scs_core.data.publication import Publication
+
+from scs_dev.comms.domain_stream import DomainStreamConnection
+from scs_dev.comms.publication_frame import PublicationFrame
+from scs_dev.handler.mqtt_client import MQTTClient
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+TOPIC = 'south-coast-science-dev/development/loc/1/gases'
+
+RECEIVE_SIZE = 65536
+
+
+def documents(count):
+    lines = []
+
+    for i in range(count):
+        lines.append(json.dumps({'tag': 'scs-be2-2', 'rec': '2026-10-18T10:00:00.675+00:00',
+                                 'val': {'NO2': {'weV': 0.316192, 'aeV': 0.310317, 'weC': 0.002991, 'cnc': 22.6},
+                                         'CO': {'weV': 0.286567, 'aeV': 0.258941, 'weC': 0.043378, 'cnc': 181.5},
+                                         'SO2': {'weV': 0.263879, 'aeV': 0.267942, 'weC': -0.01022, 'cnc': -12.8},
+                                         'H2S': {'weV': 0.209753, 'aeV': 0.255191, 'weC': -0.031478, 'cnc': 11.9},
+                                         'sht': {'hmd': 57.0, 'tmp': 21.3}, 'seq': i}}))
+
+    return lines
+
+
+def receive(data):
+    connection = DomainStreamConnection()
+    messages = []
+
+    for start in range(0, len(data), RECEIVE_SIZE):
+        messages.extend(connection.messages(data[start:start + RECEIVE_SIZE]))
+
+    return messages
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# newline-framed...
+
+def newline_publisher(lines):
+    data = bytearray()
+
+    for line in lines:
+        publication = Publication(TOPIC, json.loads(line, object_hook=OrderedDict))
+        data += JSONify.dumps(publication).encode() + b'\n'
+
+    return bytes(data)
+
+
+def newline_client(data):
+    payloads = []
+
+    for message in receive(data):
+        publication = Publication.construct_from_jdict(json.loads(message))
+        payloads.append((publication.topic, MQTTClient.payload(publication)))
+
+    return payloads
+
+
+def newline_handler(payloads):
+    data = bytearray()
+
+    for topic, payload in payloads:
+        publication = Publication(topic, json.loads(payload))
+        data += JSONify.dumps(publication).encode() + b'\n'
+
+    return bytes(data)
+
+
+def newline_subscriber(data):
+    output = []
+
+    for message in receive(data):
+        publication = Publication.construct_from_jdict(json.loads(message, object_hook=OrderedDict))
+
+        if publication.topic == TOPIC:
+            output.append(JSONify.dumps(publication.payload))
+
+    return output
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# publication frames...
+
+def framed_publisher(lines):
+    data = bytearray()
+
+    for line in lines:
+        payload = json.loads(line, object_hook=OrderedDict)
+        data += PublicationFrame(TOPIC, JSONify.dumps(payload).encode()).as_bytes()
+
+    return bytes(data)
+
+
+def framed_client(data):
+    return [(frame.topic, MQTTClient.payload(frame)) for frame in receive(data)]
+
+
+def framed_handler(payloads):
+    data = bytearray()
+
+    for topic, payload in payloads:
+        data += PublicationFrame(topic, payload).as_bytes()
+
+    return bytes(data)
+
+
+def framed_subscriber(data):
+    return [frame.text for frame in receive(data) if frame.topic == TOPIC]
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def run(label, hops, lines):
+    times = []
+    value = lines
+
+    for hop in hops:
+        start = time.process_time()
+        value = hop(value)
+        times.append(time.process_time() - start)
+
+    per_document = [elapsed * 1e6 / len(lines) for elapsed in times]
+
+    print("%-8s publisher: %5.1f client: %5.1f handler: %5.1f subscriber: %5.1f total: %6.1f us/doc" %
+          ((label,) + tuple(per_document) + (sum(per_document),)))
+    sys.stdout.flush()
+
+    return sum(per_document), value
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+document_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+sample = documents(document_count)
+
+newline_total, newline_output = run("newline:", (newline_publisher, newline_client, newline_handler,
+                                                 newline_subscriber), sample)
+
+framed_total, framed_output = run("framed:", (framed_publisher, framed_client, framed_handler, framed_subscriber),
+                                  sample)
+
+# MQTT payloads...
+newline_payloads = newline_client(newline_publisher(sample))
+framed_payloads = framed_client(framed_publisher(sample))
+
+print("-")
+print("documents: %d CPU saved: %0.0f%% MQTT payloads match: %s subscriber output matches: %s" %
+      (document_count, 100.0 * (1.0 - framed_total / newline_total),
+       [(topic, payload.encode()) for topic, payload in newline_payloads] == framed_payloads,
+       newline_output == framed_output))
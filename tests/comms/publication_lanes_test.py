@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Simulates the publication path after an outage: an upstream writer presents BACKLOG_COUNT backlog samples as fast as
+it can, interleaved with live samples, a status document and a control receipt, while the publisher takes
+PUBLISH_TIME seconds per document. Compares the latency of the control receipt and status document - from
+presentation to publication - for a single unbounded FIFO and for PublicationLanes, and reports the backpressure
+applied to the writer and the largest number of documents held.
+
+example:
+./publication_lanes_test.py 5000 0.002
+"""
+
+import json
+import sys
+import threading
+import time
+
+from queue import Queue
+
+from scs_dev.handler.publication_lanes import PublicationLanes
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+PATH = 'south-coast-science-demo/brighton/'
+CAPACITY = 100
+
+
+def document(subject, rec, i):
+    topic = PATH + ('device/scs-bgx-431/' if subject in ('control', 'status') else 'loc/1/') + subject
+    return json.dumps({topic: {'tag': 'scs-bgx-431', 'rec': rec, 'val': {'seq': i}}})
+
+
+def upstream(count):                                        # list of (subject, message)
+    now = time.time()
+    stale = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(now - 3600))
+    fresh = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(now))
+
+    messages = []
+
+    for i in range(count):
+        messages.append(('backlog', document('particulates', stale, i)))
+
+        if i % 100 == 0:
+            messages.append(('live', document('particulates', fresh, i)))
+
+        if i == count // 5:
+            messages.append(('status', document('status', fresh, i)))
+            messages.append(('control', document('control', fresh, i)))
+
+    return messages
+
+
+def writer(messages, received, presented, held):
+    for subject, message in messages:
+        presented[message] = time.time()
+        received.put(message)                               # may block
+
+        held.append(received.qsize() if isinstance(received, Queue) else sum(received.lengths))
+
+    received.put(None)
+
+
+def run(label, received, messages):
+    presented = {}
+    held = []
+    published = {}
+
+    start = time.time()
+    thread = threading.Thread(target=writer, args=(messages, received, presented, held), daemon=True)
+    thread.start()
+
+    writer_time = None
+    order = []
+
+    while True:
+        message = received.get()
+
+        if message is None:
+            break
+
+        time.sleep(publish_time)                            # the publisher
+        published[message] = time.time()
+        order.append(message)
+
+        if writer_time is None and not thread.is_alive():
+            writer_time = time.time() - start
+
+    elapsed = time.time() - start
+    subjects = dict((message, subject) for subject, message in messages)
+
+    latencies = {}
+
+    for message, published_time in published.items():
+        latencies.setdefault(subjects[message], []).append(published_time - presented[message])
+
+    live = sorted(latencies['live'])
+
+    print("%-6s control: %6.3f s status: %6.3f s live p50: %6.3f s backlog p50: %6.3f s" %
+          (label, latencies['control'][0], latencies['status'][0], live[len(live) // 2],
+           sorted(latencies['backlog'])[len(latencies['backlog']) // 2]))
+
+    print("%-6s writer finished: %6.2f s of %6.2f s largest held: %5d published: %d/%d" %
+          (label, writer_time or elapsed, elapsed, max(held), len(order), len(messages)))
+
+    return received
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+backlog_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+publish_time = float(sys.argv[2]) if len(sys.argv) > 2 else 0.002
+
+upstream_messages = upstream(backlog_count)
+
+print("documents: %d publish time: %0.3f s lane capacity: %d" % (len(upstream_messages), publish_time, CAPACITY))
+
+# classification...
+lane_names = [PublicationLanes.NAMES[PublicationLanes.lane(message)] for _, message in upstream_messages]
+print("classified: %s" % (lane_names == [subject for subject, _ in upstream_messages]))
+print("-")
+
+run("fifo", Queue(), upstream_messages)
+
+lanes = run("lanes", PublicationLanes(CAPACITY), upstream_messages)
+print("lanes  backpressure: blocked: %d times for %0.2f s" % (lanes.blocked_count, lanes.blocked_time))
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Exercises the PublicationQueue: enqueue rate with group commit and with a sync per record, recovery of the backlog
+after an unclosed (crashed) queue - committed at a position taken before the last messages were read - discarding of
+a torn record, and segment rollover and deletion. The queue is created in DIRECTORY, which should be on the storage
+of interest - for example, an SD card.
+
+example:
+./publication_queue_test.py /srv/removable_data_storage/test-queue
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from scs_dev.handler.publication_queue import PublicationQueue, PublicationQueueSegment
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+TOPIC = 'south-coast-science-dev/development/loc/1/climate'
+
+
+def message(i):
+    payload = {'tag': 'scs-bgx-431', 'rec': '2023-07-14T10:00:%02dZ' % (i % 60),
+               'val': {'hmd': 50.0 + i % 100 / 10, 'tmp': 20.0 + i % 50 / 10, 'seq': i}}
+
+    return json.dumps({TOPIC: payload})                         # as a Publication
+
+
+def seq(jstr):
+    return json.loads(jstr)[TOPIC]['val']['seq']
+
+
+def enqueue_rate(directory, count, commit_count):
+    queue = PublicationQueue.open(directory, commit_count=commit_count)
+
+    start_time = time.time()
+
+    for i in range(count):
+        queue.append(message(i))
+
+    queue.sync()
+    elapsed = time.time() - start_time
+
+    queue.close()
+    shutil.rmtree(directory)
+
+    return count / elapsed
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+root = sys.argv[1] if len(sys.argv) > 1 else tempfile.mkdtemp()
+os.makedirs(root, exist_ok=True)
+
+try:
+    # rate...
+    grouped = enqueue_rate(os.path.join(root, 'grouped'), 100000, PublicationQueue.DEFAULT_COMMIT_COUNT)
+    single = enqueue_rate(os.path.join(root, 'single'), 2000, 1)
+
+    print("enqueue: group commit: %0.0f /s sync per record: %0.0f /s" % (grouped, single))
+    print("-")
+
+    # restart...
+    directory = os.path.join(root, 'restart')
+    queue = PublicationQueue.open(directory)
+
+    for i in range(5000):
+        queue.append(message(i))
+
+    read = [seq(queue.next()) for _ in range(2000)]
+    position = queue.position
+
+    read += [seq(queue.next()) for _ in range(500)]         # not yet delivered
+    queue.commit(position)
+
+    queue.sync()                                            # the queue is not closed - a crash
+
+    queue = PublicationQueue.open(directory)
+    length = queue.length
+    first = seq(queue.next())
+
+    print("restart: read: %d length after restart: %d first after restart: %d" % (len(read), length, first))
+
+    # torn record...
+    queue.sync()
+    numbers = PublicationQueueSegment.numbers(directory)
+    last = os.path.join(directory, "%020d.seg" % numbers[-1])
+
+    with open(last, 'r+b') as file:
+        file.seek(0)
+        contents = file.read()
+        end = len(contents.rstrip(b'\0'))
+
+        file.seek(end)
+        file.write(b'\x40\x00\x00\x00\x01\x02\x03\x04{"torn"')  # a header and a partial payload
+
+    queue = PublicationQueue.open(directory)
+    length = queue.length
+
+    queue.append(message(5000))
+    remaining = []
+
+    while True:
+        jstr = queue.next(timeout=0)
+
+        if jstr is None:
+            break
+
+        remaining.append(seq(jstr))
+
+    print("torn: length after recovery: %d remaining: %d..%d complete: %s" %
+          (length, remaining[0], remaining[-1], remaining == list(range(2000, 5001))))
+
+    queue.close()
+    print("-")
+
+    # rollover...
+    directory = os.path.join(root, 'rollover')
+    queue = PublicationQueue.open(directory, segment_size=16384)
+
+    for i in range(1000):
+        queue.append(message(i))
+
+    segments = len(PublicationQueueSegment.numbers(directory))
+    read = [seq(queue.next()) for _ in range(1000)]
+
+    queue.commit()
+    remaining_segments = len(PublicationQueueSegment.numbers(directory))
+
+    print("rollover: segments: %d in order: %s segments after commit: %d" %
+          (segments, read == list(range(1000)), remaining_segments))
+
+    queue.close()
+
+finally:
+    shutil.rmtree(root)
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Exercises the AWSMQTTSubscriptionHandler as the MQTT client would: a burst of messages is handled on a single thread,
+and the longest time that handle(..) blocks that thread is reported. Runs are made with a slow consumer - with a
+connection per message, and with a persistent connection - and with an absent consumer, to show that the oldest
+messages are dropped and counted, and that delivery resumes when the consumer appears. Finally, the handler is
+stopped while its consumer is absent, and the time that stop() takes is reported.
+
+example:
+./subscription_handler_test.py 2000
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from scs_core.comms.uds_writer import UDSWriter
+
+from scs_dev.comms.domain_stream import DomainStreamReader, DomainStreamWriter
+from scs_dev.handler.aws_mqtt_subscription_handler import AWSMQTTSubscriptionHandler
+from scs_dev.handler.mqtt_reporter import MQTTReporter
+
+from scs_host.comms.domain_socket import DomainSocket
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+TOPIC = 'south-coast-science-dev/development/device/alpha-pi-eng-000006/control'
+
+
+class Message(object):
+    """
+    a stand-in for the paho MQTTMessage
+    """
+
+    def __init__(self, i):
+        self.topic = TOPIC
+        self.payload = json.dumps({'seq': i, 'cmd_tokens': ['hello']}).encode()
+
+
+def consume(path, count, received, delay):
+    reader = DomainStreamReader(path)
+    reader.connect()
+
+    for message in reader.read():
+        received.append(json.loads(message)[TOPIC]['seq'])
+        time.sleep(delay)                                   # a slow consumer
+
+        if len(received) == count:
+            break
+
+    reader.close()
+
+
+def burst(handler, count):
+    longest = 0.0
+
+    for i in range(count):
+        start = time.time()
+        handler.handle(None, None, Message(i))
+        longest = max(longest, time.time() - start)
+
+    return longest
+
+
+def wait_for(handler, count, timeout=60.0):
+    end_time = time.time() + timeout
+
+    while handler.delivered_count + handler.drop_count < count and time.time() < end_time:
+        time.sleep(0.01)
+
+
+def run(label, persistent, count, delay):
+    path = os.path.join(tempfile.mkdtemp(), 'subscription.uds')
+    received = []
+
+    consumer = threading.Thread(target=consume, args=(path, count, received, delay), daemon=True)
+    consumer.start()
+
+    while not os.path.exists(path):
+        time.sleep(0.01)
+
+    comms = UDSWriter(DomainStreamWriter if persistent else DomainSocket, path)
+    handler = AWSMQTTSubscriptionHandler(MQTTReporter(False), comms, persistent=persistent, queue_size=count)
+    handler.start()
+
+    start = time.time()
+    longest = burst(handler, count)
+
+    wait_for(handler, count)
+    elapsed = time.time() - start
+
+    consumer.join(10)
+    handler.stop()
+
+    print("%-26s handle max: %0.6f s delivered: %d/%d in %0.2f s in order: %s dropped: %d" %
+          (label, longest, len(received), count, elapsed, received == list(range(count)), handler.drop_count))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+message_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+run("connection per message:", False, message_count, 0.0005)
+run("persistent:", True, message_count, 0.0005)
+
+# absent consumer...
+absent_path = os.path.join(tempfile.mkdtemp(), 'absent.uds')
+
+absent_handler = AWSMQTTSubscriptionHandler(MQTTReporter(False), UDSWriter(DomainStreamWriter, absent_path),
+                                            persistent=True, queue_size=100)
+absent_handler.start()
+
+absent_longest = burst(absent_handler, 1000)
+time.sleep(0.5)
+
+absent_received = []
+absent_consumer = threading.Thread(target=consume, args=(absent_path, 100, absent_received, 0.0), daemon=True)
+absent_consumer.start()
+absent_consumer.join(10)
+
+absent_handler.stop()
+
+print("%-26s handle max: %0.6f s delivered: %d dropped: %d first delivered: %s" %
+      ("absent consumer:", absent_longest, len(absent_received), absent_handler.drop_count,
+       absent_received[0] if absent_received else None))
+
+# stopped with no consumer...
+stopped_path = os.path.join(tempfile.mkdtemp(), 'stopped.uds')
+
+stopped_handler = AWSMQTTSubscriptionHandler(MQTTReporter(False), UDSWriter(DomainStreamWriter, stopped_path),
+                                             persistent=True, queue_size=100)
+stopped_handler.start()
+
+burst(stopped_handler, 10)
+time.sleep(0.5)                                             # the worker waits for the consumer
+
+stop_start = time.time()
+stopped_handler.stop()
+
+print("%-26s stop: %0.3f s delivered: %d queue length: %d" %
+      ("stopped, no consumer:", time.time() - stop_start, stopped_handler.delivered_count,
+       stopped_handler.queue_length))
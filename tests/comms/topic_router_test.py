@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Compares the CPU time needed to distribute a stream of subscription messages to N consumers: by N
+aws_topic_subscriber-style readers, each of which parses every message, and by a single TopicRouter, which scans the
+topic of each message, and parses only the payloads of routed topics. The documents delivered by each are compared.
+
+A FIFO sink is then written to, and read back.
+
+example:
+./topic_router_test.py 20000
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONify
+from scs_core.data.publication import Publication
+
+from scs_dev.comms.topic_router import TopicRouter, TopicSink
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+ROOT = 'south-coast-science-dev/development/loc/%d/%s'
+
+SUBJECTS = ('climate', 'gases', 'particulates', 'status', 'control')
+
+
+def messages(count, locations):
+    lines = []
+
+    for i in range(count):
+        topic = ROOT % (i % locations, SUBJECTS[i % len(SUBJECTS)])
+        payload = {'tag': 'scs-bgx-431', 'rec': '2026-10-18T10:00:00Z',
+                   'val': {'NO2': {'weV': 0.316192, 'aeV': 0.310317, 'cnc': 22.6}, 'seq': i}}
+
+        lines.append(json.dumps({topic: payload}))
+
+    return lines
+
+
+def subscribers(lines, topics):
+    delivered = []
+
+    for topic in topics:                                    # one process per topic
+        for message in lines:
+            try:
+                jdict = json.loads(message, object_hook=OrderedDict)
+            except ValueError:
+                continue
+
+            publication = Publication.construct_from_jdict(jdict)
+
+            if publication.topic == topic:
+                delivered.append(JSONify.dumps(publication.payload))
+
+    return delivered
+
+
+def routed(lines, router):
+    for message in lines:
+        try:
+            topic, payload = TopicRouter.split(message)
+        except ValueError:
+            continue
+
+        sinks = router.sinks(topic)
+
+        if not sinks:
+            continue
+
+        document = JSONify.dumps(json.loads(payload, object_hook=OrderedDict))
+
+        for sink in sinks:
+            sink.write(document)
+
+
+class ListSink(object):
+    """
+    a stand-in for a TopicSink
+    """
+
+    def __init__(self, delivered):
+        self.delivered = delivered
+
+    def write(self, document):
+        self.delivered.append(document)
+        return True
+
+
+def compare(lines, consumer_count, locations):
+    topics = [ROOT % (location, subject) for location in range(locations) for subject in SUBJECTS][:consumer_count]
+
+    start = time.process_time()
+    expected = subscribers(lines, topics)
+    subscriber_time = time.process_time() - start
+
+    router = TopicRouter()
+    delivered = []
+
+    for topic in topics:
+        router.add(topic, ListSink(delivered))
+
+    start = time.process_time()
+    routed(lines, router)
+    router_time = time.process_time() - start
+
+    print("consumers: %2d subscribers: %6.1f us/msg router: %6.1f us/msg ratio: %5.1f documents match: %s" %
+          (consumer_count, subscriber_time * 1e6 / len(lines), router_time * 1e6 / len(lines),
+           subscriber_time / router_time, sorted(expected) == sorted(delivered)))
+    sys.stdout.flush()
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+message_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+location_count = 4
+
+sample = messages(message_count, location_count)
+
+# split...
+split_topic, split_payload = TopicRouter.split('{"a\\"b/c" : {"x": "}"}}')
+print("split escaped: %s" % (split_topic == 'a"b/c' and json.loads(split_payload) == {'x': '}'}))
+
+for malformed in ('', '[]', '{}', '{"a/b"}', '{"a/b":}'):
+    try:
+        TopicRouter.split(malformed)
+        print("split %-10s: accepted" % malformed)
+
+    except ValueError:
+        pass
+
+# prefixes...
+prefix_router = TopicRouter()
+prefix_router.add(ROOT % (1, TopicRouter.WILDCARD), 'loc-1')
+prefix_router.add(ROOT % (1, 'gases'), 'loc-1-gases')
+prefix_router.add(TopicRouter.WILDCARD, 'all')
+
+print("prefix routes: %s" % (prefix_router.sinks(ROOT % (1, 'gases')) == ('loc-1-gases', 'loc-1', 'all') and
+                             prefix_router.sinks(ROOT % (2, 'gases')) == ('all',) and
+                             prefix_router.sinks('south-coast-science-dev/development/loc/10/gases') == ('all',)))
+print("-")
+
+# CPU...
+for consumers in (1, 2, 4, 8):
+    compare(sample, consumers, location_count)
+
+print("-")
+
+# FIFO...
+fifo_path = os.path.join(tempfile.mkdtemp(), 'router.fifo')
+os.mkfifo(fifo_path)
+
+fifo_sink = TopicSink.construct(fifo_path)
+print("FIFO absent reader: written: %s drop_count: %d" % (fifo_sink.write('{"seq": 0}'), fifo_sink.drop_count))
+
+fifo_received = []
+
+
+def read_fifo():
+    with open(fifo_path) as fifo:
+        for line in fifo:
+            fifo_received.append(json.loads(line)['seq'])
+
+
+reader = threading.Thread(target=read_fifo, daemon=True)
+reader.start()
+time.sleep(0.2)
+
+for seq in range(1, 101):
+    fifo_sink.write('{"seq": %d}' % seq)
+
+fifo_sink.close()
+reader.join(5)
+
+print("FIFO: %s received: %d in order: %s" % (fifo_sink, len(fifo_received), fifo_received == list(range(1, 101))))
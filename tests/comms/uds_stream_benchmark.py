@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Compares documents / second from aws_topic_publisher to uds_receiver over a local Unix domain socket: with a
+connection per document, with a persistent connection, and with a persistent connection and a write buffer. The
+utilities are run as separate processes - the rate is that of the whole pipeline, from the first document presented
+to the publisher, to the last document written by the receiver.
+
+The transport alone is then compared, in a single process: DomainSocket with a connection per document, against
+DomainStreamWriter, to a DomainStreamReader.
+
+example:
+./uds_stream_benchmark.py 20000
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from scs_dev.comms.domain_stream import DomainStreamReader, DomainStreamWriter
+
+from scs_host.comms.domain_socket import DomainSocket
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+SCRIPTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'src', 'scs_dev')
+
+TOPIC = 'south-coast-science-dev/development/loc/1/particulates'
+
+
+def documents(count):
+    lines = []
+
+    for i in range(count):
+        lines.append(json.dumps({'tag': 'scs-bgx-431', 'rec': '2026-10-18T10:00:00Z',
+                                 'val': {'pm1': 1.2, 'pm2p5': 3.4, 'pm10': 5.6, 'seq': i}}))
+
+    return ('\n'.join(lines) + '\n').encode()
+
+
+def feed(publisher, count):
+    publisher.stdin.write(documents(count))
+    publisher.stdin.close()
+
+
+def run(label, publisher_flags, receiver_flags, count):
+    path = os.path.join(tempfile.mkdtemp(), 'benchmark.uds')
+
+    receiver = subprocess.Popen([sys.executable, os.path.join(SCRIPTS, 'uds_receiver.py')] + receiver_flags + [path],
+                                stdout=subprocess.PIPE)
+
+    while not os.path.exists(path):
+        time.sleep(0.01)
+
+    start_time = time.time()
+
+    publisher = subprocess.Popen([sys.executable, os.path.join(SCRIPTS, 'aws_topic_publisher.py'), '-t', TOPIC,
+                                  '-p', path] + publisher_flags, stdin=subprocess.PIPE)
+
+    threading.Thread(target=feed, args=(publisher, count), daemon=True).start()
+
+    received = 0
+    last = None
+
+    for line in receiver.stdout:
+        received += 1
+        last = line
+
+        if received == count:
+            break
+
+    elapsed = time.time() - start_time
+
+    publisher.wait()
+    receiver.terminate()
+    receiver.wait()
+
+    in_order = json.loads(last)[TOPIC]['val']['seq'] == count - 1
+
+    print("%-32s docs/s: %8.0f received: %d/%d in order: %s" %
+          (label, count / elapsed, received, count, in_order))
+    sys.stdout.flush()
+
+
+def consume(reader, count, received):
+    for message in reader.read():
+        received.append(message)
+
+        if len(received) == count:
+            return
+
+
+def transport(label, writer, path, count):
+    reader = DomainStreamReader(path)
+    reader.connect()
+
+    received = []
+
+    thread = threading.Thread(target=consume, args=(reader, count, received), daemon=True)
+    thread.start()
+
+    message = documents(1).decode().strip()
+    start_time = time.time()
+
+    for _ in range(count):
+        writer.connect()
+        writer.write(message)
+
+        if isinstance(writer, DomainSocket):
+            writer.close()                                  # as aws_topic_publisher, by default
+
+    if isinstance(writer, DomainStreamWriter):
+        writer.close()
+
+    thread.join()
+    elapsed = time.time() - start_time
+
+    reader.close()
+
+    print("%-32s docs/s: %8.0f received: %d/%d" % (label, count / elapsed, len(received), count))
+    sys.stdout.flush()
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+document_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+print("documents: %d" % document_count)
+
+run("connection per document:", [], [], document_count)
+run("persistent:", ['-k'], ['-k'], document_count)
+run("persistent, buffer 4096:", ['-k', '-b', '4096'], ['-k'], document_count)
+run("persistent, buffer 65536:", ['-k', '-b', '65536'], ['-k'], document_count)
+print("-")
+
+transport_path = os.path.join(tempfile.mkdtemp(), 'transport.uds')
+
+transport("transport, per document:", DomainSocket(transport_path), transport_path, document_count)
+transport("transport, persistent:", DomainStreamWriter(transport_path), transport_path, document_count * 5)
+transport("transport, buffer 65536:", DomainStreamWriter(transport_path, buffer_size=65536), transport_path,
+          document_count * 5)
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Writes a synthetic day of 1 Hz particulates data - including histogram bins - to a CSV file and to a columnar archive,
+then exports both to JSON. Reports the file sizes, the export times, whether the exports match, and the time taken to
+read one hour from each. Finally, reports whether a column of mixed ints and floats is read with the types written.
+"""
+
+import os
+import shutil
+import tempfile
+import time
+
+from collections import OrderedDict
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.json import JSONify
+
+from scs_dev.reader.column_archive_reader import ColumnArchiveReader
+from scs_dev.reader.csv_batch_reader import CSVBatchReader
+from scs_dev.reader.csv_window_reader import CSVWindowReader
+from scs_dev.writer.column_archive_writer import ColumnArchiveWriter
+from scs_dev.writer.csv_schema_writer import CSVSchemaWriter
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def document(index):
+    val = OrderedDict()
+    val['per'] = 10.0
+    val['pm1'] = round(1.0 + index % 37 / 10, 1)
+    val['pm2p5'] = round(2.0 + index % 53 / 10, 1)
+    val['pm10'] = round(5.0 + index % 91 / 10, 1)
+    val['bin'] = [(index * (i + 3)) % (200 - i * 7) for i in range(24)]
+    val['mtf1'] = 20 + index % 11
+    val['mtf3'] = 21 + index % 13
+    val['mtf5'] = 0
+    val['mtf7'] = 0
+    val['sfr'] = round(5.5 + index % 7 / 100, 2)
+    val['sht'] = OrderedDict([('hmd', round(40.0 + index % 200 / 10, 1)), ('tmp', round(20.0 + index % 50 / 10, 1))])
+
+    jdict = OrderedDict()
+    jdict['tag'] = 'scs-test'
+    jdict['src'] = 'N3'
+    jdict['rec'] = day.timedelta(seconds=index).as_iso8601()
+    jdict['val'] = val
+    jdict['exg'] = OrderedDict([('src', 'sht'), ('mode', None)])
+
+    return JSONify.dumps(jdict)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+day = LocalizedDatetime.construct_from_iso8601('2023-07-14T00:00:00Z')
+hour_start = LocalizedDatetime.construct_from_iso8601('2023-07-14T13:00:00Z')
+hour_end = LocalizedDatetime.construct_from_iso8601('2023-07-14T14:00:00Z')
+
+directory = tempfile.mkdtemp()
+csv_path = os.path.join(directory, 'scs-test-particulates-2023-07-14-00-00-00.csv')
+archive_path = os.path.join(directory, 'scs-test-particulates-2023-07-14-00-00-00.sca')
+
+try:
+    # write...
+    csv_writer = CSVSchemaWriter(filename=csv_path)
+    archive_writer = ColumnArchiveWriter(archive_path)
+
+    for i in range(86400):
+        jstr = document(i)
+
+        csv_writer.write(jstr)
+        archive_writer.write(jstr)
+
+        if len(archive_writer) >= 600:
+            archive_writer.flush()
+
+    csv_writer.close()
+    archive_writer.close()
+
+    csv_size = os.path.getsize(csv_path)
+    archive_size = os.path.getsize(archive_path)
+
+    print("csv: size: %d" % csv_size)
+    print("archive: size: %d blocks: %d ratio: %0.1f" % (archive_size, archive_writer.block_count,
+                                                         csv_size / archive_size))
+    print("-")
+
+    # export...
+    start_time = time.time()
+    reader = CSVBatchReader.construct_for_file(csv_path, nullify=True)
+    csv_rows = list(reader.rows())
+    reader.close()
+    csv_elapsed = time.time() - start_time
+
+    start_time = time.time()
+    reader = ColumnArchiveReader.construct_for_file(archive_path)
+    archive_rows = list(reader.rows())
+    reader.close()
+    archive_elapsed = time.time() - start_time
+
+    print("csv: rows: %d elapsed: %0.3f" % (len(csv_rows), csv_elapsed))
+    print("archive: rows: %d elapsed: %0.3f speedup: %0.1f" % (len(archive_rows), archive_elapsed,
+                                                               csv_elapsed / archive_elapsed))
+    print("match: %s" % (archive_rows == csv_rows))
+    print("-")
+
+    # window...
+    start_time = time.time()
+    reader = CSVWindowReader.construct_for_file(csv_path, start=hour_start, end=hour_end, nullify=True)
+    csv_rows = list(reader.rows())
+    reader.close()
+    csv_elapsed = time.time() - start_time
+
+    start_time = time.time()
+    reader = ColumnArchiveReader.construct_for_file(archive_path, start=hour_start, end=hour_end)
+    archive_rows = list(reader.rows())
+    reader.close()
+    archive_elapsed = time.time() - start_time
+
+    print("csv window: rows: %d elapsed: %0.3f" % (len(csv_rows), csv_elapsed))
+    print("archive window: rows: %d blocks: %d elapsed: %0.3f" % (len(archive_rows), reader.block_count,
+                                                                  archive_elapsed))
+    print("match: %s" % (archive_rows == csv_rows))
+    print("-")
+
+    # mixed ints and floats...
+    mixed_path = os.path.join(directory, 'scs-test-mixed-2023-07-14-00-00-00.sca')
+    mixed_writer = ColumnArchiveWriter(mixed_path)
+
+    expected = [JSONify.dumps(OrderedDict([('rec', day.timedelta(seconds=i).as_iso8601()),
+                                           ('tmp', 20 + i % 3 if i % 2 else 20.5 + i % 3),
+                                           ('cnt', 2 ** 60 + i if i % 5 == 0 else i + 0.25)]))
+                for i in range(20)]
+
+    for jstr in expected:
+        mixed_writer.write(jstr)
+
+    mixed_writer.close()
+
+    reader = ColumnArchiveReader.construct_for_file(mixed_path)
+    mixed_rows = list(reader.rows())
+    reader.close()
+
+    print("mixed: rows: %d match: %s" % (len(mixed_rows), mixed_rows == expected))
+
+finally:
+    shutil.rmtree(directory)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Logs a synthetic stream of particulates documents, first with a write per document, then with a write-behind batch
+of 60 documents. Reports the number of flushes and the elapsed time for each. Then logs to a volume that is full:
+the documents that could not be written are reported.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+
+from collections import OrderedDict, namedtuple
+
+from scs_core.csv.csv_data_log import CSVDataLog
+
+from scs_dev.writer.csv_batch_logger import CSVBatchLogger
+
+from scs_host.sys.host import Host
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class FullHost(object):
+    @staticmethod
+    def disk_usage(_path):
+        return namedtuple('DiskUsage', 'free')(0)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def document(i):
+    jdict = OrderedDict()
+
+    jdict['tag'] = 'scs-opc-1'
+    jdict['rec'] = '2023-07-14T%02d:%02d:%02dZ' % ((i // 3600) % 24, (i // 60) % 60, i % 60)
+    jdict['val'] = OrderedDict([('pm1', i % 17 / 10.0), ('pm2p5', i % 23 / 10.0), ('pm10', i % 31 / 10.0)])
+
+    return json.dumps(jdict)
+
+
+def run(name, max_count, count):
+    log = CSVDataLog(root_path, name)
+    writer = CSVBatchLogger.construct(Host, log, False, max_count=max_count)
+    print(writer)
+
+    start_time = time.time()
+
+    try:
+        for i in range(count):
+            writer.write(document(i))
+
+        print("pending before close: %d" % writer.pending_count)
+
+    finally:
+        writer.close()
+
+    elapsed = time.time() - start_time
+
+    with open(log.file_path()) as file:
+        rows = len(file.readlines()) - 1
+
+    print("%s: rows: %d flushes: %d elapsed: %0.3f" % (name, rows, writer.flush_count, elapsed))
+    print("-")
+
+
+def run_full(name, max_count, count):
+    log = CSVDataLog(root_path, name)
+    writer = CSVBatchLogger.construct(FullHost, log, False, max_count=max_count)
+
+    try:
+        for i in range(count):
+            writer.write(document(i))
+
+    finally:
+        writer.close()
+
+    unwritten = writer.take_unwritten()
+
+    print("%s: writing_inhibited: %s unwritten: %d first: %s" %
+          (name, writer.writing_inhibited, len(unwritten), unwritten[0] == document(0)))
+    print("-")
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+root_path = tempfile.mkdtemp()
+
+try:
+    run('direct', 1, 3630)
+    run('batch', 60, 3630)
+    run_full('full', 60, 90)
+
+finally:
+    shutil.rmtree(root_path)
+    print("removed: %s" % (not os.path.exists(root_path)))
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Replays a synthetic backlog of 30 s climate data with a CSVCatchUpReader, against a local stand-in for the byline API.
+The first run is interrupted after ten batches, while live documents are written. The second run resumes from the
+checkpoint. Reports the byline queries, the live latency, the replay rate, and whether the backlog was fully replayed.
+"""
+
+import json
+import shutil
+import tempfile
+import threading
+import time
+
+from scs_core.csv.csv_data_log import CSVDataLog
+from scs_core.data.datetime import LocalizedDatetime
+
+from scs_dev.reader.csv_catch_up_reader import CSVCatchUpReader, CSVCatchUpCheckpoint
+from scs_dev.reader.csv_log_reader import CSVLogQueueBuilder
+from scs_dev.writer.csv_logger_conf import CSVLoggerConf
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class LocalBylineQueueBuilder(CSVLogQueueBuilder):
+    """
+    a stand-in for the byline API
+    """
+
+    def __init__(self, conf, message_tag, topic_name, byline_start):
+        super().__init__(conf, None, message_tag, topic_name, None)
+
+        self.byline_start = byline_start
+        self.queries = 0
+
+
+    def find_byline_start(self):
+        self.queries += 1
+
+        return self.byline_start.utc_datetime
+
+
+class Output(object):
+    """
+    records the output, and interrupts the reader after a number of backlog writes
+    """
+
+    def __init__(self, interrupt_after=None):
+        self.lines = []
+        self.latencies = []
+        self.backlog_writes = 0
+        self.interrupt_after = interrupt_after
+
+
+    def write(self, text):
+        now = time.time()
+        lines = text.splitlines()
+
+        if 'sent' not in lines[0]:
+            if self.interrupt_after is not None and self.backlog_writes >= self.interrupt_after:
+                raise KeyboardInterrupt
+
+            self.backlog_writes += 1
+
+        for line in lines:
+            datum = json.loads(line)
+
+            if 'sent' in datum['val']:
+                self.latencies.append(now - datum['val']['sent'])
+
+            self.lines.append(datum)
+
+
+    def flush(self):
+        pass
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def write_log(log, start, count, interval):
+    log.mkdir()
+
+    with open(log.file_path(), 'w') as file:
+        file.write('tag,rec,val.hmd,val.tmp\n')
+
+        for i in range(count):
+            rec = start.timedelta(seconds=i * interval).as_iso8601()
+            file.write('scs-test,%s,%0.1f,%0.1f\n' % (rec, 50.0 + i % 100 / 10, 20.0 + i % 50 / 10))
+
+
+def write_live(file_path, stop):
+    with open(file_path, 'w') as file:
+        file.write('tag,rec,val.sent\n')
+        file.flush()
+
+        while not stop.is_set():
+            file.write('scs-test,%s,%0.6f\n' % (LocalizedDatetime.now().utc().as_iso8601(), time.time()))
+            file.flush()
+
+            time.sleep(0.05)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+root_path = tempfile.mkdtemp()
+
+day1 = LocalizedDatetime.construct_from_iso8601('2023-07-13T00:00:00Z')
+day2 = LocalizedDatetime.construct_from_iso8601('2023-07-14T00:00:00Z')
+byline = LocalizedDatetime.construct_from_iso8601('2023-07-13T12:00:00Z')
+
+try:
+    conf = CSVLoggerConf(root_path, False, 0, None)
+
+    write_log(CSVDataLog(root_path, 'climate', tag='scs-test', timeline_start=day1.datetime), day1, 2880, 30)
+    write_log(CSVDataLog(root_path, 'climate', tag='scs-test', timeline_start=day2.datetime), day2, 2880, 30)
+
+    expected = [day1.timedelta(seconds=i * 30).as_iso8601() for i in range(1441, 2880)] + \
+               [day2.timedelta(seconds=i * 30).as_iso8601() for i in range(2880)]
+
+    builder = LocalBylineQueueBuilder(conf, 'scs-test', 'climate', byline)
+    checkpoint_filename = CSVCatchUpCheckpoint.filename_for(root_path, 'climate')
+
+    # run 1: interrupted, with live documents...
+    live_log = CSVDataLog(root_path, 'climate', tag='scs-test', timeline_start=LocalizedDatetime.now().utc().datetime)
+    live_log.mkdir()
+
+    stop_live = threading.Event()
+    live = threading.Thread(target=write_live, args=(live_log.file_path(), stop_live))
+    live.start()
+
+    output1 = Output(interrupt_after=10)
+    reader = CSVCatchUpReader(builder, checkpoint_filename, nullify=True, max_rate=500, max_count=100, output=output1)
+    reader.include(live_log.file_path())
+
+    start_time = time.time()
+    reader.run()
+    elapsed = time.time() - start_time
+
+    stop_live.set()
+    live.join()
+
+    backlog1 = [datum['rec'] for datum in output1.lines if 'sent' not in datum['val']]
+
+    print("run 1: backlog: %d live: %d elapsed: %0.3f rate: %0.1f" %
+          (len(backlog1), len(output1.latencies), elapsed, len(backlog1) / elapsed))
+    print("run 1: live latency: max: %0.3f mean: %0.3f" %
+          (max(output1.latencies), sum(output1.latencies) / len(output1.latencies)))
+    print("run 1: %s" % CSVCatchUpCheckpoint.load(checkpoint_filename))
+    print("-")
+
+    # run 2: resumed...
+    output2 = Output()
+    reader = CSVCatchUpReader(builder, checkpoint_filename, nullify=True, max_count=100, output=output2)
+
+    start_time = time.time()
+    reader.run(halt_on_caught_up=True)
+    elapsed = time.time() - start_time
+
+    backlog2 = [datum['rec'] for datum in output2.lines if 'sent' not in datum['val']]
+    replayed_live = len(output2.lines) - len(backlog2)
+
+    print("run 2: backlog: %d replayed live: %d elapsed: %0.3f" % (len(backlog2), replayed_live, elapsed))
+    print("run 2: %s" % CSVCatchUpCheckpoint.load(checkpoint_filename))
+    print("-")
+
+    replayed = backlog1 + backlog2
+
+    print("byline queries: %d" % builder.queries)
+    print("duplicates: %d" % (len(replayed) - len(set(replayed))))
+    print("complete: %s" % (sorted(set(replayed)) == expected))
+
+finally:
+    shutil.rmtree(root_path)
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Compresses a synthetic day of 10 s gases data with each available codec, then reads each file back as a stream.
+Reports the compression ratio, the compression time, and whether the documents read match the plain file. Then
+reports the time taken to submit a file to a CSVCompressionQueue, and to stop the queue. Finally, a codec error is
+raised while the queue compresses one file, and reports whether the following file is still compressed.
+"""
+
+import os
+import shutil
+import tempfile
+import time
+
+from scs_core.data.datetime import LocalizedDatetime
+
+from scs_dev.reader.csv_batch_reader import CSVBatchReader
+from scs_dev.writer.csv_compression import CSVCompression, CSVCompressionQueue
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class FailingCompression(CSVCompression):
+    """
+    a codec that fails on files named "corrupt", as zstandard.ZstdError would
+    """
+
+    def open(self, filename, mode='r'):
+        if 'corrupt' in filename and mode.startswith('w'):
+            raise ValueError("codec error")
+
+        return super().open(filename, mode=mode)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+day = LocalizedDatetime.construct_from_iso8601('2023-07-14T00:00:00Z')
+
+directory = tempfile.mkdtemp()
+plain_path = os.path.join(directory, 'scs-test-gases-2023-07-14-00-00-00.csv')
+
+with open(plain_path, 'w') as file:
+    file.write('tag,rec,val.NO2.weV,val.NO2.aeV,val.NO2.cnc,val.CO.weV,val.CO.aeV,val.CO.cnc,val.sht.hmd,val.sht.tmp\n')
+
+    for i in range(8640):
+        rec = day.timedelta(seconds=i * 10).as_iso8601()
+        file.write('scs-test,%s,%0.6f,%0.6f,%0.1f,%0.6f,%0.6f,%0.1f,%0.1f,%0.1f\n' %
+                   (rec, 0.29 + i % 97 / 10000, 0.28 + i % 89 / 10000, i % 71 / 10, 0.31 + i % 83 / 10000,
+                    0.30 + i % 79 / 10000, i % 61 / 10, 50.0 + i % 100 / 10, 20.0 + i % 50 / 10))
+
+try:
+    reader = CSVBatchReader.construct_for_file(plain_path)
+    expected = list(reader.rows())
+    reader.close()
+
+    plain_size = os.path.getsize(plain_path)
+    print("plain: size: %d rows: %d" % (plain_size, len(expected)))
+    print("-")
+
+    for codec in CSVCompression.codecs():
+        compression = CSVCompression.construct(codec)
+        copy_path = os.path.join(directory, codec + '.csv')
+        shutil.copyfile(plain_path, copy_path)
+
+        start_time = time.time()
+        compressed_path = compression.compress(copy_path)
+        elapsed = time.time() - start_time
+
+        reader = CSVBatchReader.construct_for_file(compressed_path)
+        rows = list(reader.rows())
+        reader.close()
+
+        print("%s: size: %d ratio: %0.1f elapsed: %0.3f match: %s" %
+              (codec, os.path.getsize(compressed_path), plain_size / os.path.getsize(compressed_path), elapsed,
+               rows == expected))
+
+    print("-")
+
+    queue = CSVCompressionQueue(CSVCompression.construct('xz'))
+    queued_path = os.path.join(directory, 'queued.csv')
+    shutil.copyfile(plain_path, queued_path)
+
+    start_time = time.time()
+    queue.submit(queued_path)
+    submitted = time.time() - start_time
+
+    queue.stop()
+    stopped = time.time() - start_time
+
+    print("queue: submit: %0.3f stop: %0.3f compressed: %s plain removed: %s" %
+          (submitted, stopped, os.path.exists(queued_path + '.xz'), not os.path.exists(queued_path)))
+
+    queue = CSVCompressionQueue(FailingCompression('gzip'))
+    corrupt_path = os.path.join(directory, 'corrupt.csv')
+    following_path = os.path.join(directory, 'following.csv')
+    shutil.copyfile(plain_path, corrupt_path)
+    shutil.copyfile(plain_path, following_path)
+
+    queue.submit(corrupt_path)
+    queue.submit(following_path)
+    queue.stop()
+
+    print("codec error: plain retained: %s temporary removed: %s following compressed: %s" %
+          (os.path.exists(corrupt_path), not os.path.exists(corrupt_path + '.gz.tmp'),
+           os.path.exists(following_path + '.gz')))
+
+finally:
+    shutil.rmtree(directory)
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Compares rows / second for the CSVReader path and the CSVBatchReader path of csv_reader, over a synthetic
+climate / gases CSV file. Output is written to /dev/null.
+
+example:
+./csv_reader_benchmark.py 1000000
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+from scs_core.csv.csv_reader import CSVReader
+
+from scs_dev.reader.csv_batch_reader import CSVBatchReader
+from scs_dev.writer.output_buffer import OutputBuffer
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+HEADER = ['tag', 'rec', 'ver', 'src',
+          'val.NO2.weV', 'val.NO2.aeV', 'val.NO2.weC', 'val.NO2.cnc', 'val.NO2.vCal',
+          'val.Ox.weV', 'val.Ox.aeV', 'val.Ox.weC', 'val.Ox.cnc', 'val.Ox.vCal',
+          'val.CO.weV', 'val.CO.aeV', 'val.CO.weC', 'val.CO.cnc', 'val.CO.vCal',
+          'val.sht.hmd', 'val.sht.tmp',
+          'exg.src', 'exg.val.NO2.cnc']
+
+
+def synthesise(path, count):
+    with open(path, 'w') as file:
+        file.write(','.join(HEADER) + '\n')
+
+        for i in range(count):
+            rec = '2023-%02d-%02dT%02d:%02d:%02dZ' % (1 + (i // 2678400) % 12, 1 + (i // 86400) % 28,
+                                                        (i // 3600) % 24, (i // 60) % 60, i % 60)
+
+            values = ['scs-bgx-431', rec, 2.0, 'AFE']
+            values.extend(round(random.uniform(0.2, 0.6), 5) for _ in range(15))
+            values.extend((round(random.uniform(30.0, 70.0), 1), round(random.uniform(5.0, 25.0), 1)))
+            values.extend(('vB20', round(random.uniform(0.0, 40.0), 1)))
+
+            file.write(','.join(str(value) for value in values) + '\n')
+
+
+def run_legacy(path, sink):
+    reader = CSVReader.construct_for_file(path)
+
+    for datum in reader.rows():
+        print(datum, file=sink)
+        sink.flush()
+
+    reader.close()
+
+
+def run_batch(path, sink):
+    reader = CSVBatchReader.construct_for_file(path)
+    output = OutputBuffer(sink, max_count=10000)
+
+    for datum in reader.rows():
+        output.print(datum)
+
+    output.flush()
+    reader.close()
+
+
+def timed(label, func, path, count):
+    with open(os.devnull, 'w') as sink:
+        start = time.time()
+        func(path, sink)
+        elapsed = time.time() - start
+
+    print("%s: rows: %d elapsed: %0.1f rows/sec: %d" % (label, count, elapsed, count / elapsed))
+
+    return elapsed
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+csv_path = os.path.join(tempfile.mkdtemp(), 'benchmark-gases.csv')
+
+try:
+    print("synthesising %d rows: %s" % (row_count, csv_path))
+    synthesise(csv_path, row_count)
+    print("-")
+
+    # equivalence...
+    legacy_reader = CSVReader.construct_for_file(csv_path)
+    batch_reader = CSVBatchReader.construct_for_file(csv_path)
+
+    for legacy, batch in zip(legacy_reader.rows(), batch_reader.rows()):
+        if legacy != batch:
+            print("MISMATCH:\n%s\n%s" % (legacy, batch))
+            exit(1)
+
+    legacy_reader.close()
+    batch_reader.close()
+
+    print("outputs match")
+    print("-")
+
+    # throughput...
+    legacy_elapsed = timed("legacy", run_legacy, csv_path, row_count)
+    batch_elapsed = timed("batch ", run_batch, csv_path, row_count)
+
+    print("-")
+    print("speedup: %0.1fx" % (legacy_elapsed / batch_elapsed))
+
+finally:
+    os.remove(csv_path)
+    os.rmdir(os.path.dirname(csv_path))
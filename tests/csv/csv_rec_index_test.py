@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Builds a CSVRecIndex for a synthetic day of 1 Hz climate data, then compares extraction of one hour via the
+CSVWindowReader against a full scan.
+"""
+
+import os
+import tempfile
+import time
+
+from scs_core.data.datetime import LocalizedDatetime
+
+from scs_dev.reader.csv_batch_reader import CSVBatchReader
+from scs_dev.reader.csv_rec_index import CSVRecIndex
+from scs_dev.reader.csv_window_reader import CSVWindowReader
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+day = LocalizedDatetime.construct_from_iso8601('2023-07-14T00:00:00Z')
+start = LocalizedDatetime.construct_from_iso8601('2023-07-14T13:00:00Z')
+end = LocalizedDatetime.construct_from_iso8601('2023-07-14T14:00:00Z')
+
+csv_path = os.path.join(tempfile.mkdtemp(), 'scs-test-climate-2023-07-14.csv')
+
+with open(csv_path, 'w') as file:
+    file.write('tag,rec,val.hmd,val.tmp\n')
+
+    for second in range(86400):
+        rec = day.timedelta(seconds=second).as_iso8601()
+        file.write('scs-test,%s,%0.1f,%0.1f\n' % (rec, 50.0 + second % 100 / 10.0, 20.0 + second % 50 / 10.0))
+
+try:
+    # index...
+    index = CSVRecIndex.construct_for_file(csv_path, cache=True)
+    print(index)
+    print("cached: %s" % os.path.exists(CSVRecIndex.index_path(csv_path)))
+    print("reloaded: %s" % CSVRecIndex.load(csv_path))
+    print("-")
+
+    # window...
+    start_time = time.time()
+    reader = CSVWindowReader.construct_for_file(csv_path, start=start, end=end)
+    window_rows = list(reader.rows())
+    reader.close()
+    window_elapsed = time.time() - start_time
+
+    print("window: rows: %d elapsed: %0.3f" % (len(window_rows), window_elapsed))
+    print("first: %s" % window_rows[0])
+    print("last:  %s" % window_rows[-1])
+    print("-")
+
+    # full scan...
+    start_time = time.time()
+    reader = CSVBatchReader.construct_for_file(csv_path)
+    scan_rows = [jstr for jstr in reader.rows() if '"2023-07-14T13:' in jstr]
+    reader.close()
+    scan_elapsed = time.time() - start_time
+
+    print("scan:   rows: %d elapsed: %0.3f" % (len(scan_rows), scan_elapsed))
+    print("match: %s" % (window_rows == scan_rows))
+
+finally:
+    os.remove(csv_path)
+    os.remove(CSVRecIndex.index_path(csv_path))
+    os.rmdir(os.path.dirname(csv_path))
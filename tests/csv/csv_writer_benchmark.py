@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Writes a synthetic stream of gases documents, where vCal and xCal fields appear mid-stream, with the scs_core
+CSVWriter and with the CSVSchemaWriter in union and roll modes. Reports rows per second, whether the late fields were
+retained, and peak memory use.
+
+usage: ./csv_writer_benchmark.py [DOCUMENT_COUNT]
+"""
+
+import csv
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+
+from collections import OrderedDict
+
+from scs_core.csv.csv_writer import CSVWriter
+
+from scs_dev.writer.csv_schema_writer import CSVSchemaWriter
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def document(i, calibrated):
+    gases = OrderedDict()
+
+    for gas in ('NO2', 'CO', 'SO2', 'H2S'):
+        field = OrderedDict()
+
+        field['weV'] = round(0.3 + i % 97 / 1000.0, 6)
+        field['aeV'] = round(0.29 + i % 89 / 1000.0, 6)
+        field['weC'] = round(i % 83 / 100.0, 3)
+        field['cnc'] = round(i % 71 / 10.0, 1)
+
+        if calibrated:
+            field['vCal'] = round(i % 67 / 10.0, 3)
+            field['xCal'] = round(i % 61 / 10.0, 3)
+
+        gases[gas] = field
+
+    gases['sht'] = OrderedDict([('hmd', 50.0 + i % 100 / 10.0), ('tmp', 20.0 + i % 50 / 10.0)])
+
+    jdict = OrderedDict()
+
+    jdict['tag'] = 'scs-bgx-401'
+    jdict['rec'] = '2023-07-14T%02d:%02d:%02dZ' % ((i // 3600) % 24, (i // 60) % 60, i % 60)
+    jdict['val'] = gases
+
+    return json.dumps(jdict)
+
+
+def run(name, writer, count):
+    start_time = time.time()
+
+    for i in range(count):
+        writer.write(document(i, i >= count // 2))
+
+    writer.close()
+
+    elapsed = time.time() - start_time
+    print("%s: rows: %d elapsed: %0.3f rows/sec: %d" % (name, count, elapsed, count / elapsed))
+
+
+def header(filename):
+    with open(filename, newline='') as file:
+        return next(csv.reader(file))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+directory = tempfile.mkdtemp()
+
+legacy_path = os.path.join(directory, 'legacy.csv')
+union_path = os.path.join(directory, 'union.csv')
+roll_path = os.path.join(directory, 'roll.csv')
+
+roll_writer = None
+
+try:
+    run("legacy", CSVWriter(filename=legacy_path), count)
+    print("legacy: vCal retained: %s" % ('val.NO2.vCal' in header(legacy_path)))
+    print("-")
+
+    run("union ", CSVSchemaWriter(filename=union_path), count)
+    print("union : vCal retained: %s" % ('val.NO2.vCal' in header(union_path)))
+    print("union : header: %s" % header(union_path))
+    print("-")
+
+    roll_writer = CSVSchemaWriter(filename=roll_path, roll=True)
+    run("roll  ", roll_writer, count)
+    print("roll  : segments: %s" % list(roll_writer.segments))
+    print("roll  : vCal retained: %s" % ('val.NO2.vCal' in header(roll_writer.segments[-1])))
+    print("-")
+
+    print("peak RSS: %d kB" % resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+finally:
+    for filename in [legacy_path, union_path] + ([] if roll_writer is None else list(roll_writer.segments)):
+        if os.path.exists(filename):
+            os.remove(filename)
+
+    os.rmdir(directory)
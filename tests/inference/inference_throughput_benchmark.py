@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Measures the throughput of an S1PMxInferenceClient against a local UDSServer stand-in for the model server, for
+replay / back-fill - one request per message, and batches - and for live sampling - synchronous, and asynchronous,
+with the inference of one sample overlapping the acquisition of the next. The stand-in has a fixed latency per
+message, plus a latency per request. Inferences are compared with those of the one-request-per-message client.
+
+Replay is also measured for an InferencePool - as used by inference_replay - with connections to several model
+server stand-ins.
+
+The live tests are repeated with a model server that stalls: the longest time that the sampling loop is held up is
+reported. The asynchronous test is then repeated with a model server that hangs until its session is restarted.
+
+example:
+./inference_throughput_benchmark.py 1000
+"""
+
+import json
+import os
+import socket
+import sys
+import tempfile
+import time
+
+from collections import OrderedDict
+from threading import Event, Thread
+
+from scs_core.climate.sht_datum import SHTDatum
+
+from scs_core.comms.uds_client import UDSClient
+from scs_core.comms.uds_server import UDSServer
+
+from scs_core.data.json import JSONify
+
+from scs_core.model.pmx.s1.pmx_request import PMxRequest
+from scs_core.model.pmx.s1.s1_pmx_inference_client import S1PMxInferenceClient
+
+from scs_core.sample.sample import Sample
+
+from scs_dev.inference.async_inference_client import AsyncInferenceClient
+from scs_dev.inference.batch_inference_client import BatchInferenceClient
+from scs_dev.inference.inference_pool import InferencePool
+from scs_dev.inference.inference_socket import InferenceSocket
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+MESSAGE_LATENCY = 0.004                     # seconds per message
+REQUEST_LATENCY = 0.0002                    # seconds per request
+
+ACQUISITION_TIME = 0.020                    # seconds per live sample
+LIVE_SAMPLES = 50
+LIVE_TIMEOUT = 0.100                        # seconds
+STALL_TIME = 0.5                            # seconds
+
+POOL_SERVERS = 4
+
+RECEIVE_SIZE = 65536
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# newline-framed Unix domain socket stand-ins...
+
+class StandInSocket(object):
+    def __init__(self, path):
+        self.path = path
+        self._connection = None
+        self.__buffer = b''
+
+    def _send(self, message):
+        self._connection.sendall(message.encode() + b'\n')
+
+    def _receive(self):
+        while b'\n' not in self.__buffer:
+            data = self._connection.recv(RECEIVE_SIZE)
+
+            if not data:
+                return UDSClient.EOS
+
+            self.__buffer += data
+
+        message, self.__buffer = self.__buffer.split(b'\n', 1)
+
+        return message.decode()
+
+    def close(self):
+        if self._connection:
+            self._connection.close()
+            self._connection = None
+
+        self.__buffer = b''
+
+
+class StandInClientSocket(StandInSocket):
+    def connect(self, wait_for_availability=True):
+        while True:
+            try:
+                self._connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                self._connection.connect(self.path)
+                return
+
+            except (FileNotFoundError, ConnectionRefusedError):
+                self._connection.close()
+                time.sleep(0.01)
+
+    def client_send(self, message):
+        self._send(message)
+
+    def client_receive(self):
+        return self._receive()
+
+
+class StandInServerSocket(StandInSocket):
+    def __init__(self, path):
+        super().__init__(path)
+        self.__listener = None
+
+    def connect(self):
+        self.__listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.__listener.bind(self.path)
+        self.__listener.listen(1)
+
+    def accept(self):
+        self._connection, _ = self.__listener.accept()
+        hung.clear()                        # the hang lasts for the session
+
+        self.__listener.close()             # one session at a time
+        self.__listener = None
+
+    def server_receive(self):
+        return self._receive()
+
+    def server_send(self, message):
+        self._send(message)
+
+    def close(self):
+        super().close()
+
+        if self.__listener:
+            self.__listener.close()
+            self.__listener = None
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# model server stand-in...
+
+batches_accepted = Event()
+batches_accepted.set()
+
+stalled = Event()
+hung = Event()
+
+
+def infer(request):
+    if request is None or request == '?':
+        return request
+
+    sample = request['sample']
+    bins = sample['val']['bin']
+    humid = request['sht-datum']['hmd']
+
+    sample['exg'] = OrderedDict([('src', 'stand-in'),
+                                 ('val', OrderedDict([('pm1', round(sum(bins[:3]) * 0.01, 1)),
+                                                      ('pm2p5', round(sum(bins[:8]) * 0.01 + humid * 0.1, 1)),
+                                                      ('pm10', round(sum(bins) * 0.01 + humid * 0.2, 1))]))])
+    return sample
+
+
+def serve(server):
+    server.start()
+
+    for message in server.requests():
+        if hung.is_set():
+            continue
+
+        request = json.loads(message)
+        batch = isinstance(request, list)
+
+        if stalled.is_set():
+            time.sleep(STALL_TIME)
+            stalled.clear()
+
+        time.sleep(MESSAGE_LATENCY + REQUEST_LATENCY * (len(request) if batch else 1))
+
+        if batch and not batches_accepted.is_set():
+            response = None
+
+        elif batch:
+            response = [infer(item) for item in request]
+
+        else:
+            response = infer(request)
+
+        server.respond(json.dumps(response))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def requests(count):
+    for i in range(count):
+        jdict = OrderedDict([('tag', 'scs-be2-3'), ('src', 'N3'), ('rec', '2026-10-18T10:00:%02dZ' % (i % 60)),
+                             ('val', OrderedDict([('per', 4.9), ('bin', [(i * 7 + j * 13) % 97 for j in range(24)]),
+                                                  ('mtf1', 32), ('mtf3', 36), ('mtf5', 42), ('mtf7', 43),
+                                                  ('sfr', 3.0)]))])
+
+        yield Sample.construct_from_jdict(jdict), SHTDatum(40.0 + i % 20, 10.0 + i % 15)
+
+
+def acquired(count):
+    for request in requests(count):
+        time.sleep(ACQUISITION_TIME)
+        yield request
+
+
+def batch_client(path, batch_size):
+    def inference_socket(uds_path):
+        sockets.append(InferenceSocket(StandInClientSocket(uds_path)))
+        return sockets[-1]
+
+    sockets = []
+    client = S1PMxInferenceClient.construct(inference_socket, path)
+
+    return BatchInferenceClient(client, sockets[0], batch_size=batch_size)
+
+
+def report(label, count, elapsed, matches=None):
+    print("%-24s %6.0f requests/s %7.2f ms/request%s" %
+          (label, count / elapsed, elapsed * 1000 / count, '' if matches is None else " matches: %s" % matches))
+    sys.stdout.flush()
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+request_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+uds_dir = tempfile.mkdtemp()
+uds_paths = [os.path.join(uds_dir, 'lambda-model-pmx-stand-in-%d.uds' % i) for i in range(POOL_SERVERS)]
+
+for path in uds_paths:
+    Thread(target=serve, args=(UDSServer(StandInServerSocket, path),), daemon=True).start()
+
+uds_path = uds_paths[0]
+
+
+# replay - one request per message...
+sequential_client = S1PMxInferenceClient.construct(StandInClientSocket, uds_path)
+sequential_client.wait_for_server()
+
+start = time.time()
+expected = [sequential_client.infer(*request) for request in requests(request_count)]
+sequential_elapsed = time.time() - start
+
+sequential_client.close()
+
+report("replay, single:", request_count, sequential_elapsed)
+
+
+# replay - batches...
+for size in (10, 50):
+    batched = batch_client(uds_path, size)
+    batched.wait_for_server()
+
+    start = time.time()
+    inferences = [inference for _, inference in batched.inferences(requests(request_count))]
+    elapsed = time.time() - start
+
+    batched.close()
+
+    report("replay, batch %d:" % size, request_count, elapsed, matches=inferences == expected)
+
+print("-")
+
+
+# replay - pool...
+for servers in (1, 2, POOL_SERVERS):
+    for size in (1, 20):
+        pool = InferencePool(StandInClientSocket, uds_paths[:servers], batch_size=size)
+        pool.start()
+
+        messages = ((None, JSONify.dumps(PMxRequest(*request).as_json())) for request in requests(request_count))
+
+        start = time.time()
+        inferences = [json.loads(response) for _, response in pool.inferences(messages)]
+        elapsed = time.time() - start
+
+        pool.stop()
+
+        report("pool, %d x batch %d:" % (servers, size), request_count, elapsed, matches=inferences == expected)
+
+        print("%-24s p50: %0.4f s p99: %0.4f s" % ('', pool.latency(50), pool.latency(99)))
+        sys.stdout.flush()
+
+print("-")
+
+
+# replay - batches not accepted by the model server...
+batches_accepted.clear()
+
+batched = batch_client(uds_path, 50)
+batched.wait_for_server()
+
+inferences = [inference for _, inference in batched.inferences(requests(100))]
+
+batched.close()
+batches_accepted.set()
+
+print("batches not accepted:    batch_supported: %s matches: %s" %
+      (batched.batch_supported, inferences == expected[:100]))
+print("-")
+
+
+# live - synchronous...
+live_client = S1PMxInferenceClient.construct(StandInClientSocket, uds_path)
+live_client.wait_for_server()
+
+start = time.time()
+inferences = [live_client.infer(*request) for request in acquired(LIVE_SAMPLES)]
+sync_elapsed = time.time() - start
+
+report("live, synchronous:", LIVE_SAMPLES, sync_elapsed, matches=inferences == expected[:LIVE_SAMPLES])
+
+
+# live - asynchronous...
+async_client = AsyncInferenceClient(live_client, LIVE_TIMEOUT)
+async_client.start()
+
+start = time.time()
+inferences = [inference for _, inference in async_client.inferences(acquired(LIVE_SAMPLES))]
+async_elapsed = time.time() - start
+
+report("live, asynchronous:", LIVE_SAMPLES, async_elapsed, matches=inferences == expected[:LIVE_SAMPLES])
+
+print("live wall time saved: %0.0f%%" % (100.0 * (1.0 - async_elapsed / sync_elapsed)))
+print("-")
+
+
+# live - stalled model server...
+def held_up(inferences):
+    longest = 0.0
+    reported = 0
+    last = time.time()
+
+    for _, inference in inferences:
+        now = time.time()
+        longest = max(longest, now - last)
+        last = now
+
+        if inference is not None:
+            reported += 1
+
+    return longest, reported
+
+
+stalled.set()
+longest, reported = held_up(async_client.inferences(acquired(LIVE_SAMPLES)))
+
+print("stalled, asynchronous:   longest hold-up: %0.3f s reported: %d / %d" % (longest, reported, LIVE_SAMPLES))
+
+async_client.stop()
+time.sleep(STALL_TIME)                      # the stalled request completes
+
+stalled.set()
+longest, reported = held_up((request, live_client.infer(*request)) for request in acquired(LIVE_SAMPLES))
+
+print("stalled, synchronous:    longest hold-up: %0.3f s reported: %d / %d" % (longest, reported, LIVE_SAMPLES))
+
+
+# live - hung model server...
+async_client = AsyncInferenceClient(live_client, LIVE_TIMEOUT)
+async_client.start()
+
+hung.set()
+longest, reported = held_up(async_client.inferences(acquired(LIVE_SAMPLES)))
+
+print("hung, asynchronous:      longest hold-up: %0.3f s reported: %d / %d restarts: %d" %
+      (longest, reported, LIVE_SAMPLES, async_client.restart_count))
+
+async_client.stop()
+
+live_client.close()
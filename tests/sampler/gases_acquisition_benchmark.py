@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Compares the per-sample wall time, and the time skew between sensors, of serial acquisition - the barometer, then the
+SCD30, then the SHT, then the electrochemical interface - with GasesSampler's scheduled acquisition, for simulated
+sensors on a shared bus. The simulated SCD30 has a fresh measurement SCD30_INTERVAL seconds after its periodic
+measurement is started, and a read blocks until the measurement is ready.
+
+example:
+./gases_acquisition_benchmark.py 1.0 20
+"""
+
+import sys
+import time
+
+from collections import namedtuple
+from threading import Lock
+
+from scs_core.sync.timed_runner import TimedRunner
+
+from scs_dev.sampler.gases_sampler import GasesSampler
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+BAROMETER_LATENCY = 0.030
+SCD30_LATENCY = 0.040
+SHT_LATENCY = 0.020
+ELECTROCHEM_LATENCY = 0.300
+
+SCD30_INTERVAL = 2.0
+
+PressureDatum = namedtuple('PressureDatum', 'actual_press')
+SCD30Datum = namedtuple('SCD30Datum', 'co2 acquired')
+SHTDatum = namedtuple('SHTDatum', 'hmd tmp acquired')
+ElectrochemDatum = namedtuple('ElectrochemDatum', 'sht acquired')
+
+BUS = Lock()                                                # the shared I2C bus - reads must never overlap
+
+
+class SimulatedSensor(object):
+    def __init__(self, latency):
+        self.latency = latency
+
+    def read(self):
+        if not BUS.acquire(blocking=False):
+            raise RuntimeError("bus collision")
+
+        try:
+            time.sleep(self.latency)
+        finally:
+            BUS.release()
+
+        return time.time()
+
+    def init(self):
+        pass
+
+    def null_datum(self):
+        return None
+
+
+class SimulatedBarometer(SimulatedSensor):
+    def sample(self):
+        self.read()
+        return PressureDatum(101.3)
+
+
+class SimulatedSCD30(SimulatedSensor):
+    def __init__(self, latency):
+        super().__init__(latency)
+        self.start = time.time()
+
+    def sample(self):
+        time.sleep(max(0.0, self.start + SCD30_INTERVAL - time.time()))       # until a measurement is ready
+        return SCD30Datum(415.0, self.read())
+
+    def start_periodic_measurement(self, ambient_pressure_kpa=None):
+        self.start = time.time()
+
+    def stop_periodic_measurement(self):
+        pass
+
+    def set_auto_self_calib(self, on):
+        pass
+
+    def set_measurement_interval(self, interval):
+        pass
+
+
+class SimulatedSHT(SimulatedSensor):
+    def sample(self):
+        return SHTDatum(50.0, 20.0, self.read())
+
+
+class SimulatedElectrochem(SimulatedSensor):
+    def sample(self, sht_datum):
+        return ElectrochemDatum(sht_datum, self.read())
+
+    @staticmethod
+    def src():
+        return 'SIM'
+
+
+SCD30Conf = namedtuple('SCD30Conf', 'sample_interval')
+
+
+def serial_sample(barometer, scd30, sht, electrochem):
+    start = time.time()
+
+    barometer.sample()
+    scd30_datum = scd30.sample()
+    scd30.start_periodic_measurement(ambient_pressure_kpa=101.3)
+    sht_datum = sht.sample()
+    electrochem_datum = electrochem.sample(sht_datum)
+
+    end = time.time()
+
+    return end - start, electrochem_datum.acquired - start, end - scd30_datum.acquired
+
+
+def report(label, timings, interval, elapsed, count):
+    walls = sorted(timing[0] for timing in timings)
+    skews = sorted(timing[1] for timing in timings)
+    ages = sorted(timing[2] for timing in timings)
+
+    print("%-10s wall p50: %0.3f max: %0.3f  skew p50: %0.3f  CO2 age max: %0.3f  interval: %0.1f achieved: %0.2f s" %
+          (label, walls[len(walls) // 2], walls[-1], skews[len(skews) // 2], ages[-1], interval, elapsed / count))
+    sys.stdout.flush()
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+sampling_interval = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+sample_count = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+# serial...
+sensors = (SimulatedBarometer(BAROMETER_LATENCY), SimulatedSCD30(SCD30_LATENCY), SimulatedSHT(SHT_LATENCY),
+           SimulatedElectrochem(ELECTROCHEM_LATENCY))
+
+serial_timings = []
+begin = time.time()
+
+for i in range(sample_count):
+    due = begin + i * sampling_interval
+    time.sleep(max(0.0, due - time.time()))
+    serial_timings.append(serial_sample(*sensors))
+
+report("serial:", serial_timings, sampling_interval, time.time() - begin, sample_count)
+
+# scheduled...
+barometer, scd30, sht, electrochem = (SimulatedBarometer(BAROMETER_LATENCY), SimulatedSCD30(SCD30_LATENCY),
+                                      SimulatedSHT(SHT_LATENCY), SimulatedElectrochem(ELECTROCHEM_LATENCY))
+
+sampler = GasesSampler(TimedRunner(sampling_interval, sample_count), None, barometer, scd30, sht, electrochem,
+                       barometer_interval=10.0)
+sampler.init(SCD30Conf(SCD30_INTERVAL))
+
+scheduled_timings = []
+begin = time.time()
+
+try:
+    for i in range(sample_count):
+        due = begin + i * sampling_interval
+        time.sleep(max(0.0, due - time.time()))
+
+        start = time.time()
+        sample = sampler.sample()
+        end = time.time()
+
+        acquisitions = sampler.acquisitions
+        scheduled_timings.append((end - start, acquisitions['electrochem'].acquired - start,
+                                  end - acquisitions['scd30'].acquired))
+
+finally:
+    sampler.stop()
+
+report("scheduled:", scheduled_timings, sampling_interval, time.time() - begin, sample_count)
+
+print("-")
+print("wall time saved: %0.0f%%" % (100.0 * (1.0 - sum(timing[0] for timing in scheduled_timings) /
+                                            sum(timing[0] for timing in serial_timings))))
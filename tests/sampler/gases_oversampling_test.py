@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Reads a simulated electrochemical interface - a constant concentration, with Gaussian noise and occasional spikes -
+with GasesSampler, first once per report, then oversampled OVERSAMPLES times per report with each aggregate. Reports
+the RMS error of the reported concentration, and the first oversampled document.
+
+example:
+./gases_oversampling_test.py 0.5 20 10
+"""
+
+import math
+import random
+import sys
+import time
+
+from collections import namedtuple
+
+from scs_core.climate.sht_datum import SHTDatum
+
+from scs_core.data.json import JSONify
+
+from scs_core.gas.a4.a4_calibrated_datum import A4CalibratedDatum
+from scs_core.gas.afe.afe_datum import AFEDatum
+
+from scs_dev.sampler.gases_oversampler import GasesOversampler
+from scs_dev.sampler.gases_sampler import GasesSampler
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+TRUE_CNC = 20.0
+NOISE = 4.0                                                 # standard deviation
+SPIKE = 80.0
+SPIKE_PROBABILITY = 0.02
+
+READ_LATENCY = 0.002
+
+SCD30Conf = namedtuple('SCD30Conf', 'sample_interval')
+
+
+class SimulatedSHT(object):
+    def sample(self):
+        return SHTDatum(50.0, 20.0)
+
+    def null_datum(self):
+        return None
+
+
+class SimulatedInterface(object):
+    def __init__(self):
+        self.reads = 0
+
+    def sample(self, sht_datum):
+        time.sleep(READ_LATENCY)
+        self.reads += 1
+
+        cnc = TRUE_CNC + random.gauss(0.0, NOISE) + (SPIKE if random.random() < SPIKE_PROBABILITY else 0.0)
+        we_v = 0.28 + cnc * 0.0003
+
+        return AFEDatum(None, ('NO2', A4CalibratedDatum(round(we_v, 5), 0.276, round(we_v - 0.276, 5), round(cnc, 1),
+                                                        15.4)))
+
+    def null_datum(self):
+        return None
+
+    @staticmethod
+    def src():
+        return 'AFE'
+
+
+def run(label, interval, reports, oversamples, aggregate=GasesOversampler.TRIMMED_MEAN):
+    random.seed(3)
+
+    interface = SimulatedInterface()
+    oversample_interval = None if oversamples is None else interval / oversamples
+
+    sampler = GasesSampler(None, 'scs-sim-1', None, None, SimulatedSHT(), interface,
+                           oversample_interval=oversample_interval, aggregate=aggregate)
+    sampler.init(SCD30Conf(5))
+
+    errors = []
+    first = None
+
+    begin = time.time() + interval
+
+    try:
+        for i in range(reports):
+            time.sleep(max(0.0, begin + i * interval - time.time()))
+
+            sample = sampler.sample()
+            errors.append(sample.electrochem_datum.sns['NO2'].cnc if oversamples is None else
+                          sample.electrochem_datum.sns['NO2'].values['cnc'])
+
+            if first is None:
+                first = sample
+
+    finally:
+        sampler.stop()
+
+    rms = math.sqrt(sum((value - TRUE_CNC) ** 2 for value in errors) / len(errors))
+
+    print("%-22s reports: %3d reads: %4d  RMS error: %5.2f ppb" % (label, reports, interface.reads, rms))
+    sys.stdout.flush()
+
+    return first
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+report_interval = float(sys.argv[1]) if len(sys.argv) > 1 else 0.5
+report_count = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+oversample_count = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+
+run("single reading:", report_interval, report_count, None)
+
+documents = []
+
+for name in GasesOversampler.AGGREGATES:
+    documents.append(run("oversampled %s:" % name, report_interval, report_count, oversample_count, aggregate=name))
+
+print("-")
+print(JSONify.dumps(documents[-1]))
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Compares the jitter of ClimateSampler sample times, with synchronous reads and with background pre-sampling. A
+simulated SHT and barometer share a bus with another process, which holds the bus for up to CONTENTION_MAX seconds at
+random. For each schedule tick, reports the delay from the tick to the sample's rec, the jitter of the intervals
+between recs, and - for pre-sampling - the age of the data served.
+
+example:
+./pre_sample_jitter_test.py 0.25 100 0.5
+"""
+
+import random
+import statistics
+import sys
+import time
+
+from collections import namedtuple
+from threading import Event, Lock, Thread
+
+from scs_dev.sampler.climate_sampler import ClimateSampler
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+SHT_LATENCY = 0.015
+BAROMETER_LATENCY = 0.025
+
+CONTENTION_MAX = 0.080
+CONTENTION_GAP = 0.050
+
+SHTDatum = namedtuple('SHTDatum', 'hmd tmp')
+PressureDatum = namedtuple('PressureDatum', 'actual_press')
+
+BUS = Lock()                                                # the I2C bus, shared with other processes
+
+
+class SimulatedSHT(object):
+    def sample(self):
+        with BUS:
+            time.sleep(SHT_LATENCY)
+
+        return SHTDatum(50.0, 20.0)
+
+    def reset(self):
+        pass
+
+
+class SimulatedBarometer(object):
+    def sample(self, altitude=None, include_temp=True):
+        with BUS:
+            time.sleep(BAROMETER_LATENCY)
+
+        return PressureDatum(101.3)
+
+
+def contend(stopping):
+    while not stopping.is_set():
+        with BUS:
+            time.sleep(random.uniform(0.0, CONTENTION_MAX))
+
+        time.sleep(random.uniform(0.0, CONTENTION_GAP))
+
+
+def run(label, tick_interval, tick_count, pre_sample_interval):
+    random.seed(1)
+
+    sampler = ClimateSampler(None, None, SimulatedSHT(), SimulatedBarometer(), pre_sample_interval=pre_sample_interval)
+    sampler.start()
+
+    stopping = Event()
+    contender = Thread(target=contend, args=(stopping,), daemon=True)
+    contender.start()
+
+    delays = []
+    recs = []
+    ages = []
+
+    begin = time.time() + tick_interval
+
+    try:
+        for i in range(tick_count):
+            tick = begin + i * tick_interval
+            time.sleep(max(0.0, tick - time.time()))
+
+            sample = sampler.sample()
+            rec = sample.rec.timestamp()
+
+            delays.append(rec - tick)
+            recs.append(rec)
+            ages.append(max(rec - acquisition.acquired for acquisition in sampler.acquisitions.values()))
+
+    finally:
+        stopping.set()
+        contender.join()
+        sampler.stop()
+
+    intervals = [recs[i] - recs[i - 1] for i in range(1, len(recs))]
+    delays.sort()
+
+    print("%-12s delay p50: %0.3f p99: %0.3f max: %0.3f  interval stdev: %0.4f  data age max: %0.3f s" %
+          (label, delays[len(delays) // 2], delays[int(len(delays) * 0.99)], delays[-1],
+           statistics.stdev(intervals), max(ages)))
+    sys.stdout.flush()
+
+    return max(ages)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+interval = float(sys.argv[1]) if len(sys.argv) > 1 else 0.25
+count = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+pre_sample = float(sys.argv[3]) if len(sys.argv) > 3 else 0.5
+
+run("synchronous:", interval, count, None)
+max_age = run("pre-sample:", interval, count, pre_sample)
+
+print("-")
+print("data age bound: %0.3f s within bound: %s" %
+      (pre_sample * ClimateSampler.MAX_AGE_INTERVALS, max_age <= pre_sample * ClimateSampler.MAX_AGE_INTERVALS))
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Reduces a synthetic one-hour, 1 Hz gases stream to one-minute windows with a NodeAggregate, and compares the reports
+with those computed from buffered windows. Reports the reduction in output volume.
+"""
+
+import json
+import random
+
+from collections import OrderedDict
+
+from scs_core.data.datetime import LocalizedDatetime
+from scs_core.data.json import JSONify
+
+from scs_dev.transform.node_aggregate import NodeAggregate
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def gases(i):
+    val = OrderedDict()
+    val['NO2'] = OrderedDict([('weV', round(random.uniform(0.29, 0.31), 6)), ('cnc', round(random.uniform(5, 50), 1))])
+    val['Ox'] = OrderedDict([('weV', round(random.uniform(0.39, 0.41), 6)), ('cnc', round(random.uniform(5, 80), 1))])
+    val['sht'] = OrderedDict([('hmd', round(random.uniform(40, 60), 1)), ('tmp', round(random.uniform(15, 25), 1))])
+
+    jdict = OrderedDict()
+    jdict['tag'] = 'scs-bgx-431'
+    jdict['rec'] = '2023-07-14T10:%02d:%02dZ' % (i // 60, i % 60)
+    jdict['val'] = val
+
+    return jdict
+
+
+def buffered(window):
+    report = OrderedDict()
+
+    for path in ('val.NO2.cnc', 'val.Ox.cnc', 'val.sht.tmp'):
+        group, node, field = path.split('.')
+        values = [document[group][node][field] for document in window]
+
+        report[path] = {'mean': round(sum(values) / len(values), 1), 'min': min(values), 'max': max(values),
+                        'count': len(values), 'last': values[-1]}
+
+    return report
+
+
+def flattened(report):
+    operations = NodeAggregate.OPERATIONS
+
+    return OrderedDict((path, {operation: report.node(path + '.' + operation) for operation in operations})
+                       for path in ('val.NO2.cnc', 'val.Ox.cnc', 'val.sht.tmp'))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+random.seed(1)
+
+documents = [gases(i) for i in range(3600)]
+
+aggregate = NodeAggregate(60, list(NodeAggregate.OPERATIONS))
+reports = []
+
+for document in documents:
+    rec = LocalizedDatetime.construct_from_iso8601(document['rec'])
+    selected = OrderedDict([('val', OrderedDict((key, document['val'][key]) for key in ('NO2', 'Ox', 'sht')))])
+
+    report = aggregate.append(rec, selected)
+
+    if report is not None:
+        reports.append(report)
+
+reports.append(aggregate.report())
+
+expected = [buffered(documents[start:start + 60]) for start in range(0, 3600, 60)]
+
+input_bytes = sum(len(json.dumps(document)) + 1 for document in documents)
+output_bytes = sum(len(JSONify.dumps(report)) + 1 for report in reports)
+
+print("documents: %d windows: %d" % (len(documents), len(reports)))
+print("first: %s" % JSONify.dumps(reports[0]))
+print("last rec: %s" % reports[-1].node('rec'))
+print("match: %s" % ([flattened(report) for report in reports] == expected))
+print("bytes: input: %d output: %d reduction: %0.1fx" % (input_bytes, output_bytes, input_bytes / output_bytes))
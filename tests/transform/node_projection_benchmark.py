@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Compares documents / second for the PathDict method and the NodeProjection (batch) method of node, over a synthetic
+stream of status documents - 1000 distinct documents, repeated - in include and exclude modes. The PathDict method is
+timed over the first SAMPLE documents only, and its output compared with that of the NodeProjection. Output is written
+to /dev/null.
+
+example:
+./node_projection_benchmark.py 1000000 20000
+"""
+
+import json
+import os
+import random
+import sys
+import time
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONify
+from scs_core.data.path_dict import PathDict
+
+from scs_dev.transform.node_projection import NodeProjection
+from scs_dev.writer.output_buffer import OutputBuffer
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+INCLUDE = ['rec', 'val.tmp.brd', 'val.sch.scs-gases', 'val.gps.pos', 'val.psu.prt.v', 'val.up.load']
+EXCLUDE = ['val.sch', 'val.net', 'val.gps.pos:1', 'val.psu.prt']
+
+
+def status(i):
+    schedule = OrderedDict((name, OrderedDict([('interval', 10.0), ('tally', 1)]))
+                           for name in ('scs-climate', 'scs-gases', 'scs-particulates', 'scs-status'))
+
+    val = OrderedDict()
+    val['tmp'] = OrderedDict([('brd', round(random.uniform(20, 40), 1)), ('hst', round(random.uniform(30, 60), 1))])
+    val['airnow'] = None
+    val['tz'] = OrderedDict([('name', 'Europe/London'), ('utc-offset', '+01:00')])
+    val['sch'] = schedule
+    val['gps'] = OrderedDict([('pos', [50.823 + random.uniform(0, 1e-3), -0.123 + random.uniform(0, 1e-3)]),
+                              ('elv', 45.1), ('qual', 1)])
+    val['up'] = OrderedDict([('period', '00-01:%02d:00' % (i % 60)), ('users', 0),
+                             ('load', OrderedDict([('av1', 0.1), ('av5', 0.2), ('av15', 0.25)]))])
+    val['psu'] = OrderedDict([('standby', False), ('in', True), ('pwr-in', 12.1),
+                              ('prt', OrderedDict([('v', 12.3), ('p', 0.75), ('ch', 0.91)]))])
+    val['net'] = OrderedDict(('iface%d' % n, OrderedDict([('rx', random.randint(0, 10 ** 9)),
+                                                          ('tx', random.randint(0, 10 ** 9))])) for n in range(4))
+    val['sd'] = [random.randint(0, 100) for _ in range(8)]
+
+    jdict = OrderedDict()
+    jdict['tag'] = 'scs-bgx-431'
+    jdict['rec'] = '2023-07-14T%02d:%02d:%02dZ' % ((i // 3600) % 24, (i // 60) % 60, i % 60)
+    jdict['val'] = val
+
+    return json.dumps(jdict)
+
+
+def run_legacy(lines, sub_paths, exclude, sink):
+    outputs = []
+
+    for line in lines:
+        datum = PathDict.construct_from_jstr(line)
+        target = PathDict()
+
+        if exclude:
+            for path in datum.paths():
+                if not any(PathDict.sub_path_includes_path(sub_path, path) for sub_path in sub_paths):
+                    target.append(path, datum.node(path))
+
+        else:
+            for sub_path in sub_paths:
+                if datum.has_sub_path(sub_path):
+                    target.append(sub_path, datum.node(sub_path))
+
+        jstr = JSONify.dumps(target)
+        outputs.append(jstr)
+
+        print(jstr, file=sink)
+        sink.flush()
+
+    return outputs
+
+
+def run_projection(lines, sub_paths, exclude, sink):
+    projection = NodeProjection.construct(sub_paths, exclude=exclude)
+    encode = JSONify(ensure_ascii=False).encode
+    output = OutputBuffer(sink, max_count=10000)
+
+    outputs = []
+
+    for line in lines:
+        target = projection.project(json.loads(line))
+        jstr = encode(target)
+
+        if len(outputs) < sample_count:
+            outputs.append(jstr)
+
+        output.print(jstr)
+
+    output.flush()
+
+    return outputs
+
+
+def timed(func, lines, sub_paths, exclude, sink):
+    start_time = time.time()
+    outputs = func(lines, sub_paths, exclude, sink)
+
+    return outputs, time.time() - start_time
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+document_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+sample_count = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+
+random.seed(1)
+
+print("documents: %d sample: %d" % (document_count, sample_count))
+
+documents = [status(i) for i in range(1000)]
+
+with open(os.devnull, 'w') as devnull:
+    for mode_exclude, mode_paths in ((False, INCLUDE), (True, EXCLUDE)):
+        name = 'exclude' if mode_exclude else 'include'
+
+        sample = (documents[i % len(documents)] for i in range(sample_count))
+        stream = (documents[i % len(documents)] for i in range(document_count))
+
+        legacy, legacy_elapsed = timed(run_legacy, sample, mode_paths, mode_exclude, devnull)
+        compiled, compiled_elapsed = timed(run_projection, stream, mode_paths, mode_exclude, devnull)
+
+        legacy_rate = sample_count / legacy_elapsed
+        compiled_rate = document_count / compiled_elapsed
+
+        print("-")
+        print("%s: PathDict: %0.0f docs/s" % (name, legacy_rate))
+        print("%s: NodeProjection: %0.0f docs/s (%0.1f s) speedup: %0.1fx" %
+              (name, compiled_rate, compiled_elapsed, compiled_rate / legacy_rate))
+        print("%s: match: %s" % (name, legacy == compiled[:sample_count]))
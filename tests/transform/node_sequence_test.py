@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Checks the JSONArrayReader used by node -s: members are compared with json.loads over small chunk sizes, so that
+numbers, strings and multi-byte characters are divided between chunks. Reports the latency of the first member on a
+slow pipe, and the peak memory used to read a large array, compared with the json.loads method.
+"""
+
+import io
+import json
+import os
+import random
+import threading
+import time
+import tracemalloc
+
+from scs_dev.reader.json_array_reader import JSONArrayReader
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ArrayStream(io.RawIOBase):
+    """
+    a generated JSON array of count members, that is never held in memory
+    """
+
+    def __init__(self, count):
+        self.__chunks = self.__generate(count)
+        self.__pending = b''
+
+
+    @staticmethod
+    def __generate(count):
+        yield b'[\n'
+
+        for i in range(count):
+            member = {'tag': 'scs-bgx-431', 'rec': '2023-07-14T00:00:%02dZ' % (i % 60),
+                      'val': {'hmd': 50.0 + i % 100 / 10, 'tmp': 20.0 + i % 50 / 10, 'bar': None}}
+
+            yield (',\n' if i else '').encode() + json.dumps(member).encode()
+
+        yield b'\n]\n'
+
+
+    def readable(self):
+        return True
+
+
+    def readinto(self, buffer):
+        while not self.__pending:
+            try:
+                self.__pending = next(self.__chunks)
+            except StopIteration:
+                return 0
+
+        count = min(len(buffer), len(self.__pending))
+        buffer[:count] = self.__pending[:count]
+        self.__pending = self.__pending[count:]
+
+        return count
+
+
+def random_value(depth=0):
+    kind = random.randint(0, 7 if depth < 3 else 4)
+
+    if kind == 0:
+        return random.randint(-10 ** 12, 10 ** 12)
+
+    if kind == 1:
+        return random.uniform(-1e6, 1e6)
+
+    if kind == 2:
+        return ''.join(random.choice('ab "\\é€\U0001f600\n') for _ in range(random.randint(0, 12)))
+
+    if kind == 3:
+        return random.choice([True, False, None])
+
+    if kind == 4:
+        return random.randint(0, 9)
+
+    if kind == 5:
+        return [random_value(depth + 1) for _ in range(random.randint(0, 4))]
+
+    return {'k%d' % n: random_value(depth + 1) for n in range(random.randint(0, 4))}
+
+
+def slow_writer(fd, members):
+    with os.fdopen(fd, 'wb') as pipe:
+        pipe.write(('[%s' % json.dumps(members[0])).encode())
+        pipe.flush()
+
+        for member in members[1:]:
+            time.sleep(0.5)
+            pipe.write((', %s' % json.dumps(member)).encode())
+            pipe.flush()
+
+        pipe.write(b']')
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# correctness...
+
+random.seed(1)
+
+failures = 0
+cases = 0
+
+for _ in range(2000):
+    array = [random_value() for _ in range(random.randint(0, 6))]
+    text = json.dumps(array, ensure_ascii=random.choice([True, False]), indent=random.choice([None, 1]))
+
+    for chunk_size in (1, 2, 3, 7, 64):
+        reader = JSONArrayReader(io.BufferedReader(io.BytesIO(text.encode())), chunk_size=chunk_size)
+        cases += 1
+
+        if list(reader.items()) != array:
+            failures += 1
+            print("mismatch: chunk_size: %d text: %s" % (chunk_size, text))
+
+print("cases: %d failures: %d" % (cases, failures))
+
+for invalid in ('[1, 2', '[1 2]', '[1,]', '{"a": 1}', '[{"a": }]'):
+    try:
+        list(JSONArrayReader(io.BufferedReader(io.BytesIO(invalid.encode())), chunk_size=2).items())
+        print("invalid: %s accepted" % invalid)
+
+    except ValueError as ex:
+        print("invalid: %s rejected: %s" % (invalid, ex))
+
+print("-")
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# latency...
+
+read_fd, write_fd = os.pipe()
+writer = threading.Thread(target=slow_writer, args=(write_fd, [{'rec': i} for i in range(4)]))
+
+start_time = time.time()
+writer.start()
+
+with os.fdopen(read_fd, 'rb') as file:
+    for item in JSONArrayReader(file).items():
+        print("latency: member %d: %0.3f s" % (item['rec'], time.time() - start_time))
+
+writer.join()
+print("-")
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# memory...
+
+document_count = 100000
+
+tracemalloc.start()
+
+start_time = time.time()
+reader = JSONArrayReader(io.BufferedReader(ArrayStream(document_count)))
+count = sum(1 for _ in reader.items())
+elapsed = time.time() - start_time
+
+_, streamed_peak = tracemalloc.get_traced_memory()
+tracemalloc.reset_peak()
+
+start_time = time.time()
+loaded = [json.dumps(item) for item in json.loads(io.BufferedReader(ArrayStream(document_count)).read())]
+loaded_elapsed = time.time() - start_time
+
+_, loaded_peak = tracemalloc.get_traced_memory()
+tracemalloc.stop()
+
+print("streamed: members: %d elapsed: %0.1f s peak: %0.1f MB" % (count, elapsed, streamed_peak / 2 ** 20))
+print("loaded: members: %d elapsed: %0.1f s peak: %0.1f MB" % (len(loaded), loaded_elapsed, loaded_peak / 2 ** 20))